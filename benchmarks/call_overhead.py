@@ -0,0 +1,179 @@
+"""
+Benchmark the Python-side overhead of SDK calls, up to the point where a request would leave the process.
+
+Runs offline: the session of the request context has a stub transport adapter mounted, which answers every
+request with an empty 200 response without opening a connection.  Each case reports the best time per call and
+the peak memory allocated while a call runs (measured with tracemalloc in a separate pass, since tracing slows
+calls down).  The cases cover the steps of a call one at a time, then representative methods with the client
+stubbed out (method overhead only) and through client.call and requests (the full overhead).
+
+Results can be saved and compared against a previous run to catch regressions:
+
+    python benchmarks/call_overhead.py --save baseline.json
+    python benchmarks/call_overhead.py --compare baseline.json [--tolerance 0.3]
+
+--compare exits with status 1 if a case got slower or allocates more than the tolerance allows.
+"""
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+
+import requests
+from requests.adapters import BaseAdapter
+
+from canvas_sdk import client, engine, utils
+from canvas_sdk.client import RequestContext
+from canvas_sdk.client.base import build_response, merge_or_create_key_value_for_dictionary
+from canvas_sdk.methods import assignments, courses, submissions
+
+BASE_API_URL = 'https://canvas.example.edu/api'
+
+
+class StubAdapter(BaseAdapter):
+
+    """
+    Transport adapter that answers every request with an empty json list instead of sending it
+    """
+
+    def send(self, request, **kwargs):
+        response = build_response(200, {'Content-Type': 'application/json'}, b'[]', request.url)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def create_request_context():
+    request_context = RequestContext('token', BASE_API_URL, per_page=100, backoff=None)
+    request_context.session.mount('https://', StubAdapter())
+    return request_context
+
+
+def get_method_cases(request_context):
+    """
+    Return (name, callable) pairs that call representative methods
+    """
+    return [
+        ('courses.create_new_course', lambda: courses.create_new_course(
+            request_context, 1, course_name='Biology 101', course_course_code='BIO101',
+            course_start_at='2020-09-01T00:00:00Z', course_is_public=False, course_license='private',
+            enroll_me=True)),
+        ('assignments.create_assignment', lambda: assignments.create_assignment(
+            request_context, 1234, 'Essay 1', assignment_submission_types=['online_upload'],
+            assignment_points_possible=100, assignment_grading_type='points',
+            assignment_due_at='2020-10-01T23:59:00Z', assignment_published=True)),
+        ('submissions.list_submissions_for_multiple_assignments_courses',
+         lambda: submissions.list_submissions_for_multiple_assignments_courses(
+             request_context, 1234, student_ids=['1', '2', '3'], assignment_ids=['10', '11'], grouped=True,
+             include='assignment')),
+    ]
+
+
+def get_step_cases(request_context):
+    """
+    Return (name, callable) pairs that each time one step of a call
+    """
+    session = request_context.session
+    payload = {'course[name]': 'Biology 101', 'course[course_code]': 'BIO101', 'enroll_me': True}
+    choices = frozenset(('students', 'avatar_url'))
+    path = '/v1/courses/{course_id}/assignments'
+    url = BASE_API_URL + '/v1/courses/1/courses'
+    return [
+        ('step: utils.validate_attr_is_acceptable',
+         lambda: utils.validate_attr_is_acceptable('students', ('students', 'avatar_url'))),
+        ('step: engine.validate_choice',
+         lambda: engine.validate_choice('students', choices, ('students', 'avatar_url'))),
+        ('step: merge_or_create_key_value_for_dictionary',
+         lambda: merge_or_create_key_value_for_dictionary({'timeout': 30}, 'data', payload)),
+        ('step: url formatting with str.format', lambda: BASE_API_URL + path.format(course_id=1234)),
+        ('step: requests preparation', lambda: session.prepare_request(requests.Request('POST', url, data=payload))),
+    ]
+
+
+def measure_time(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e9
+
+
+def measure_memory(function, number):
+    function()  # Warm up caches so they don't count against the first call
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(number):
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            function()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - start)
+        return peak
+    finally:
+        tracemalloc.stop()
+
+
+def run(number):
+    request_context = create_request_context()
+    results = {}
+    cases = get_step_cases(request_context)
+    method_cases = get_method_cases(request_context)
+    cases.extend(('method: ' + name, function) for name, function in method_cases)
+    stub = lambda request_ctx, url, payload=None, **optional_request_params: None  # noqa: E731
+    originals = {method: getattr(client, method) for method in ('get', 'put', 'post', 'delete')}
+    for method in originals:
+        setattr(client, method, stub)
+    try:
+        for name, function in cases:
+            results[name] = {'ns': measure_time(function, number), 'bytes': measure_memory(function, 100)}
+    finally:
+        for method, function in originals.items():
+            setattr(client, method, function)
+    for name, function in method_cases:
+        name = 'call: ' + name
+        results[name] = {'ns': measure_time(function, number // 10), 'bytes': measure_memory(function, 100)}
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Print the changes from the baseline and return the names of the cases that regressed
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        ratios = [result[key] / before[key] if before[key] else 1.0 for key in ('ns', 'bytes')]
+        print('%-72s %+6.0f%% time %+6.0f%% memory' % (name, (ratios[0] - 1) * 100, (ratios[1] - 1) * 100))
+        if any(ratio > 1 + tolerance for ratio in ratios):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000, help='calls per timing round (default: 20000)')
+    parser.add_argument('--save', metavar='FILE', help='save the results as json')
+    parser.add_argument('--compare', metavar='FILE', help='compare the results with those saved in FILE')
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='relative increase over the baseline reported as a regression (default: 0.3)')
+    args = parser.parse_args(argv)
+    results = run(args.number)
+    for name, result in results.items():
+        print('%-72s %9.0f ns/call %9d bytes/call' % (name, result['ns'], result['bytes']))
+    if args.save:
+        with open(args.save, 'w') as results_file:
+            json.dump(results, results_file, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        print()
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print('Regressions: %s' % ', '.join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Benchmark pagination and retries end to end, over HTTP against the fake Canvas server in canvas_sdk.testing.
+
+Pagination: the enrollments of a course are fetched with utils.get_all_list_data, walking the "next" links, with a
+pool of page workers and with pages prefetched in the background, and streamed with utils.iter_list_data.  Each
+case reports the throughput in items and requests per second and the peak memory allocated while it runs (measured
+with tracemalloc in a separate pass, since tracing slows the client down).  The server runs in the same process,
+so the peak includes the page being served.
+
+Time sharding: the grade change events of a course, which are paginated with bookmark cursors, are fetched by
+walking their pages one after another and with utils.iter_time_sharded_list_data, ordered and unordered.
+
+Retries: single objects are fetched through client.call while the server fails a share of the requests with 409
+and 5xx errors.  The case reports the calls per second, the requests sent per call and the calls that still failed
+after max_retries.
+
+Usage:
+
+    python benchmarks/end_to_end.py [--enrollments N] [--events N] [--per-page N] [--windows N] [--latency SECONDS]
+        [--error-rate RATE]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from functools import partial
+from itertools import chain
+
+from canvas_sdk import utils
+from canvas_sdk.client import Backoff, RequestContext
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import courses, enrollments, grade_change_log
+from canvas_sdk.testing import FakeCanvasServer
+
+
+def measure(function):
+    """
+    Run function and return its result, the seconds it took and the peak memory it allocated in a second run
+    """
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def benchmark_pagination(server, per_page, page_workers, prefetch_pages):
+    request_context = RequestContext('token', server.base_api_url, per_page=per_page, page_workers=page_workers,
+                                     pool_maxsize=max(10, page_workers or 0))
+
+    def get_all():
+        return len(utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1))
+
+    def iterate():
+        return sum(1 for _ in utils.iter_list_data(request_context, enrollments.list_enrollments_courses, 1))
+
+    cases = [
+        ('get_all_list_data, serial', None, None, get_all),
+        ('get_all_list_data, %d page workers' % page_workers, page_workers, None, get_all),
+        ('get_all_list_data, prefetch %d pages' % prefetch_pages, None, prefetch_pages, get_all),
+        ('iter_list_data', None, None, iterate),
+        ('iter_list_data, prefetch %d pages' % prefetch_pages, None, prefetch_pages, iterate),
+    ]
+    for name, workers, prefetch, function in cases:
+        request_context.page_workers = workers
+        request_context.prefetch_pages = prefetch
+        server.reset_stats()
+        items, seconds, peak = measure(function)
+        requests = server.stats['requests'] // 2  # measure runs the case twice
+        print('    %-40s %9.0f items/s %7.0f requests/s %8.2f MB peak' % (
+            name, items / seconds, requests / seconds, peak / 1e6))
+
+
+def benchmark_time_sharding(server, per_page, windows):
+    request_context = RequestContext('token', server.base_api_url, per_page=per_page,
+                                     pool_maxsize=max(10, windows))
+
+    def walk():
+        response = grade_change_log.query_by_course(request_context, 1)
+        return sum(len(page.json()['events']) for page in chain([response], utils.get_next(request_context, response)))
+
+    def shard(ordered):
+        return sum(1 for _ in utils.iter_time_sharded_list_data(
+            request_context, grade_change_log.query_by_course, '2020-09-01T00:00:00Z', '2020-12-01T00:00:00Z', 1,
+            windows=windows, max_workers=windows, ordered=ordered))
+
+    cases = [
+        ('bookmark pages, serial', walk),
+        ('time sharded, %d windows, ordered' % windows, partial(shard, True)),
+        ('time sharded, %d windows, unordered' % windows, partial(shard, False)),
+    ]
+    for name, function in cases:
+        server.reset_stats()
+        items, seconds, peak = measure(function)
+        requests = server.stats['requests'] // 2  # measure runs the case twice
+        print('    %-40s %9.0f items/s %7.0f requests/s %8.2f MB peak' % (
+            name, items / seconds, requests / seconds, peak / 1e6))
+
+
+def benchmark_retries(server, calls, max_retries):
+    request_context = RequestContext('token', server.base_api_url, max_retries=max_retries,
+                                     backoff=Backoff(base_delay=0.001, max_delay=0.01))
+    server.reset_stats()
+    failures = 0
+    start = time.perf_counter()
+    for course_id in range(calls):
+        try:
+            courses.get_single_course_courses(request_context, course_id % server.courses_per_account + 1)
+        except CanvasAPIError:
+            failures += 1
+    seconds = time.perf_counter() - start
+    print('    %-40s %9.0f calls/s %7.2f requests/call %6d failed' % (
+        'client.call, max_retries=%d' % max_retries, calls / seconds, server.stats['requests'] / calls, failures))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--enrollments', type=int, default=5000, help='enrollments in the course (default: 5000)')
+    parser.add_argument('--per-page', type=int, default=100, help='page size (default: 100)')
+    parser.add_argument('--page-workers', type=int, default=4, help='concurrent page fetches (default: 4)')
+    parser.add_argument('--prefetch-pages', type=int, default=2,
+                        help='pages fetched ahead in the background (default: 2)')
+    parser.add_argument('--latency', type=float, default=0.005,
+                        help='seconds the server adds to every response (default: 0.005)')
+    parser.add_argument('--events', type=int, default=5000, help='grade change events in the course (default: 5000)')
+    parser.add_argument('--windows', type=int, default=8, help='time windows fetched at once (default: 8)')
+    parser.add_argument('--calls', type=int, default=500, help='calls for the retry benchmark (default: 500)')
+    parser.add_argument('--error-rate', type=float, default=0.2,
+                        help='share of requests failed by the server in the retry benchmark (default: 0.2)')
+    parser.add_argument('--max-retries', type=int, default=3, help='retries per call (default: 3)')
+    args = parser.parse_args(argv)
+    with FakeCanvasServer(courses_per_account=1, enrollments_per_course=args.enrollments,
+                          latency=args.latency) as server:
+        print('pagination of %d enrollments, %d per page, %.0f ms latency:' % (
+            args.enrollments, args.per_page, args.latency * 1000))
+        benchmark_pagination(server, args.per_page, args.page_workers, args.prefetch_pages)
+    with FakeCanvasServer(courses_per_account=1, events_per_course=args.events, latency=args.latency) as server:
+        print('time sharding of %d events, %d per page, %.0f ms latency:' % (
+            args.events, args.per_page, args.latency * 1000))
+        benchmark_time_sharding(server, args.per_page, args.windows)
+    with FakeCanvasServer(latency=args.latency, error_rate=args.error_rate, seed=0) as server:
+        print('retries with %.0f%% of requests failing, %.0f ms latency:' % (args.error_rate * 100, args.latency * 1000))
+        benchmark_retries(server, args.calls, args.max_retries)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Benchmark the cold-start cost of importing the SDK methods.
+
+Each scenario runs in a fresh interpreter (so nothing is cached in sys.modules) and reports the median time spent
+importing, measured inside the child process, and the number of canvas_sdk.methods modules it loaded.  The time to
+import canvas_sdk itself (mostly requests) is reported separately, since every scenario pays it:
+
+    eager: every method module is imported up front, as tools that import the whole package used to do
+    lazy: canvas_sdk.methods is imported and a single module is accessed as an attribute, as a worker would
+    from-import: ``from canvas_sdk.methods import courses``
+
+Usage:
+
+    python benchmarks/import_time.py [--runs N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+"""
+Code run by the child interpreter for each scenario
+"""
+SCENARIOS = [
+    ('eager', 'import importlib, canvas_sdk.methods\n'
+              'for name in canvas_sdk.methods.__all__:\n'
+              '    importlib.import_module("canvas_sdk.methods." + name)'),
+    ('lazy', 'import canvas_sdk.methods\n'
+             'canvas_sdk.methods.courses.list_your_courses'),
+    ('from-import', 'from canvas_sdk.methods import courses'),
+]
+
+"""
+Wraps a scenario to time it and count the method modules it loaded
+"""
+TEMPLATE = '''import sys, time
+start = time.perf_counter()
+import canvas_sdk
+sdk_elapsed = time.perf_counter() - start
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(sdk_elapsed, elapsed, sum(1 for m in sys.modules if m.startswith("canvas_sdk.methods.")))
+'''
+
+
+def time_scenario(code, runs):
+    sdk_timings = []
+    timings = []
+    modules = None
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', TEMPLATE.format(code=code)],
+                                         universal_newlines=True)
+        sdk_elapsed, elapsed, modules = output.split()
+        sdk_timings.append(float(sdk_elapsed))
+        timings.append(float(elapsed))
+    return statistics.median(sdk_timings), statistics.median(timings), int(modules)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='fresh interpreters per scenario (default: 10)')
+    args = parser.parse_args(argv)
+    baseline = None
+    print('%-12s %12s %12s %20s %8s' % ('scenario', 'canvas_sdk', 'methods', '', 'speedup'))
+    for name, code in SCENARIOS:
+        sdk_seconds, seconds, modules = time_scenario(code, args.runs)
+        baseline = baseline or seconds
+        print('%-12s %9.1f ms %9.1f ms  %3d method modules %7.1fx' % (
+            name, sdk_seconds * 1000, seconds * 1000, modules, baseline / seconds))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
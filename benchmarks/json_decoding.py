@@ -0,0 +1,135 @@
+"""
+Benchmark decoding of representative Canvas list payloads with each available json decoder.
+
+Compares ``requests.Response.json()`` (what the SDK used before RequestContext.json_decoder existed) with
+``json.loads``, ``ujson.loads`` and ``orjson.loads`` applied to the raw response body, on pages shaped like
+the submissions and page views exports that dominate large syncs.  Decoders that aren't installed are skipped.
+
+Usage:
+
+    python benchmarks/json_decoding.py [--pages N] [--repeat N]
+"""
+import argparse
+import json
+import random
+import sys
+import timeit
+
+from canvas_sdk.client.base import build_response
+from canvas_sdk.client.decoder import decode_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+"""
+Number of items on a page; the SDK asks for the Canvas maximum when streaming exports
+"""
+PER_PAGE = 100
+
+
+def make_submission(rng, submission_id):
+    return {
+        'id': submission_id,
+        'assignment_id': rng.randint(1, 10 ** 6),
+        'user_id': rng.randint(1, 10 ** 7),
+        'submitted_at': '2020-09-%02dT14:%02d:00Z' % (rng.randint(1, 28), rng.randint(0, 59)),
+        'graded_at': '2020-10-01T09:00:00Z',
+        'grade': str(rng.randint(0, 100)),
+        'score': rng.random() * 100,
+        'attempt': rng.randint(1, 3),
+        'workflow_state': 'graded',
+        'late': rng.random() < 0.1,
+        'missing': False,
+        'excused': None,
+        'submission_type': 'online_upload',
+        'preview_url': 'https://canvas.example.edu/courses/1/assignments/2/submissions/%d?preview=1' % submission_id,
+        'attachments': [{
+            'id': rng.randint(1, 10 ** 8),
+            'display_name': 'essay draft – révisé.pdf',
+            'content-type': 'application/pdf',
+            'size': rng.randint(10 ** 4, 10 ** 7),
+            'url': 'https://canvas.example.edu/files/%d/download' % rng.randint(1, 10 ** 8),
+        }],
+        'submission_comments': [{
+            'id': rng.randint(1, 10 ** 8),
+            'author_id': rng.randint(1, 10 ** 7),
+            'author_name': 'Teaching Fellow',
+            'comment': 'Good argument, but see my notes on section %d.' % rng.randint(1, 9),
+            'created_at': '2020-10-01T09:00:00Z',
+        } for _ in range(rng.randint(0, 3))],
+    }
+
+
+def make_page_view(rng, index):
+    return {
+        'id': '%032x' % rng.getrandbits(128),
+        'url': 'https://canvas.example.edu/courses/%d/modules/items/%d' % (rng.randint(1, 5000), index),
+        'context_type': 'Course',
+        'asset_type': 'content_tag',
+        'controller': 'context_modules',
+        'action': 'item_redirect',
+        'interaction_seconds': rng.random() * 300,
+        'created_at': '2020-10-%02dT%02d:%02d:%02dZ' % (
+            rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59)),
+        'user_request': True,
+        'render_time': rng.random(),
+        'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 Safari/605.1.15',
+        'participated': False,
+        'http_method': 'get',
+        'remote_ip': '10.%d.%d.%d' % (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)),
+        'links': {'user': rng.randint(1, 10 ** 7), 'context': rng.randint(1, 5000), 'asset': None},
+    }
+
+
+def make_pages(make_item, pages, rng):
+    return [json.dumps([make_item(rng, page * PER_PAGE + i) for i in range(PER_PAGE)]).encode('utf-8')
+            for page in range(pages)]
+
+
+def get_decoders():
+    decoders = [('response.json()', None), ('json.loads', json.loads)]
+    if ujson is not None:
+        decoders.append(('ujson.loads', ujson.loads))
+    if orjson is not None:
+        decoders.append(('orjson.loads', orjson.loads))
+    return decoders
+
+
+def run(pages, repeat):
+    rng = random.Random(0)
+    payloads = [('submissions', make_pages(make_submission, pages, rng)),
+                ('page_views', make_pages(make_page_view, pages, rng))]
+    for name, bodies in payloads:
+        size = sum(len(body) for body in bodies)
+        print('%s: %d pages of %d items, %.1f MB' % (name, pages, PER_PAGE, size / 1e6))
+        baseline = None
+        for decoder_name, decoder in get_decoders():
+
+            def decode_all():
+                # Build fresh responses so requests can't reuse text decoded by an earlier round
+                for body in bodies:
+                    response = build_response(200, {'Content-Type': 'application/json'}, body, 'http://canvas/api')
+                    decode_json(response, decoder)
+            seconds = min(timeit.repeat(decode_all, number=1, repeat=repeat))
+            baseline = baseline or seconds
+            print('    %-16s %8.1f ms  %6.1f MB/s  %5.2fx' % (
+                decoder_name, seconds * 1000, size / 1e6 / seconds, baseline / seconds))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=50, help='number of pages of each payload (default: 50)')
+    parser.add_argument('--repeat', type=int, default=5, help='timing rounds, the best is reported (default: 5)')
+    args = parser.parse_args(argv)
+    run(args.pages, args.repeat)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
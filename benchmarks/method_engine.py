@@ -0,0 +1,84 @@
+"""
+Benchmark the cost of the SDK methods in canvas_sdk.methods: loading every method module, the memory they hold
+and the Python-side time of a call up to the point where it hands off to the client.
+
+Import time and memory are measured in fresh interpreters; calls are timed with client.get, client.post, etc.
+replaced by a stub, so no request is prepared or sent.
+
+Usage:
+
+    python benchmarks/method_engine.py [--runs N] [--calls N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import timeit
+
+"""
+Imports every method module and prints the time taken, or with an argument the memory still allocated by the
+imports, which is measured separately because tracing allocations slows the imports down
+"""
+IMPORT_SCRIPT = '''import importlib, sys, time, tracemalloc
+import canvas_sdk.methods, canvas_sdk.utils
+if len(sys.argv) > 1:
+    tracemalloc.start()
+start = time.perf_counter()
+for name in canvas_sdk.methods.__all__:
+    importlib.import_module('canvas_sdk.methods.' + name)
+elapsed = time.perf_counter() - start
+print(tracemalloc.get_traced_memory()[0] if len(sys.argv) > 1 else elapsed)
+'''
+
+"""
+Representative calls: a listing with a validated include, a create with a large form payload and a listing with
+array parameters
+"""
+CALLS = [
+    ('sections.list_course_sections', 'sections.list_course_sections(ctx, 1234, include="students")'),
+    ('courses.create_new_course', 'courses.create_new_course(ctx, 1, course_name="Biology 101", '
+                                  'course_course_code="BIO101", course_start_at="2020-09-01T00:00:00Z", '
+                                  'course_is_public=False, course_license="private", enroll_me=True)'),
+    ('submissions.list_submissions_for_multiple_assignments_courses',
+     'submissions.list_submissions_for_multiple_assignments_courses('
+     'ctx, 1234, student_ids=["1", "2", "3"], assignment_ids=["10", "11"], grouped=True, include="assignment")'),
+]
+
+
+def time_imports(runs):
+    timings = [float(subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT], universal_newlines=True))
+               for _ in range(runs)]
+    memory = int(subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT, 'memory'], universal_newlines=True))
+    return statistics.median(timings), memory
+
+
+def time_calls(number):
+    from canvas_sdk import client
+    from canvas_sdk.client import RequestContext
+    from canvas_sdk.methods import courses, sections, submissions
+
+    def stub(request_ctx, url, payload=None, **optional_request_params):
+        return None
+
+    for method in ('get', 'put', 'post', 'delete'):
+        setattr(client, method, stub)
+    namespace = {'ctx': RequestContext('token', 'https://canvas.example.edu/api', per_page=50),
+                 'courses': courses, 'sections': sections, 'submissions': submissions}
+    for name, statement in CALLS:
+        seconds = min(timeit.repeat(statement, globals=namespace, number=number, repeat=5))
+        print('    %-64s %8.0f ns/call' % (name, seconds / number * 1e9))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters for the import (default: 5)')
+    parser.add_argument('--calls', type=int, default=20000, help='calls per timing round (default: 20000)')
+    args = parser.parse_args(argv)
+    seconds, memory = time_imports(args.runs)
+    print('import of every method module: %.1f ms, %.2f MB allocated' % (seconds * 1000, memory / 1e6))
+    print('calls with a stubbed client:')
+    time_calls(args.calls)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
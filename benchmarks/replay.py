@@ -0,0 +1,103 @@
+"""
+Benchmark a bulk workflow replayed from a cassette, so that it runs offline and deterministically with real payloads.
+
+The workflow fetches every enrollment and assignment of a course, then the submissions of every assignment, with
+utils.get_all_list_data.  Record it once against a Canvas instance (or, without --base-api-url, the fake Canvas
+server in canvas_sdk.testing), then replay it as often as needed:
+
+    python benchmarks/replay.py record cassette.jsonl.gz --base-api-url https://canvas.example.edu/api \\
+        --token TOKEN --course-id 1234
+    python benchmarks/replay.py run cassette.jsonl.gz --course-id 1234 [--latency recorded] [--page-workers 4]
+
+The run reports the time, requests, bytes and the peak memory allocated by the workflow (measured with tracemalloc
+in a separate pass, since tracing slows the client down).
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+from canvas_sdk import utils
+from canvas_sdk.client import Cassette, RequestContext
+from canvas_sdk.methods import assignments, enrollments, submissions
+from canvas_sdk.testing import FakeCanvasServer
+
+
+def run_workflow(request_context, course_id):
+    """
+    Fetch the enrollments, assignments and submissions of a course and return the number of objects fetched
+    """
+    count = len(utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, course_id))
+    course_assignments = utils.get_all_list_data(request_context, assignments.list_assignments, course_id, None)
+    count += len(course_assignments)
+    for assignment in course_assignments:
+        # The method has no per_page argument, so the page size is passed as a request param
+        count += len(utils.get_all_list_data(
+            request_context, submissions.list_assignment_submissions_courses, course_id, assignment['id'], None,
+            params={'per_page': request_context.per_page}))
+    return count
+
+
+def record(args):
+    with Cassette(args.cassette, mode='record') as cassette:
+        if args.base_api_url:
+            request_context = RequestContext(args.token, args.base_api_url, per_page=args.per_page, cassette=cassette)
+            count = run_workflow(request_context, args.course_id)
+        else:
+            with FakeCanvasServer(enrollments_per_course=200, assignments_per_course=20) as server:
+                request_context = RequestContext('token', server.base_api_url, per_page=args.per_page,
+                                                 cassette=cassette)
+                count = run_workflow(request_context, args.course_id)
+    print('recorded %d objects in %d responses to %s (%.1f kB)' % (
+        count, len(cassette.interactions), args.cassette, os.path.getsize(args.cassette) / 1e3))
+
+
+def run(args):
+    latency = args.latency if args.latency in (None, 'recorded') else float(args.latency)
+
+    def replay():
+        cassette = Cassette(args.cassette, latency=latency)
+        request_context = RequestContext('token', 'https://canvas.example.edu/api', per_page=args.per_page,
+                                         page_workers=args.page_workers, cassette=cassette)
+        return run_workflow(request_context, args.course_id), cassette
+
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        count, cassette = replay()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        replay()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    size = sum(len(interaction.get('text', interaction.get('base64', ''))) for interaction in cassette.interactions)
+    print('replayed %d objects from %d responses (%.1f MB of bodies): best of %d runs %.3f s, %.2f MB peak' % (
+        count, len(cassette.interactions), size / 1e6, args.runs, min(timings), peak / 1e6))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+    record_parser = subparsers.add_parser('record', help='record the workflow to a cassette')
+    record_parser.add_argument('--base-api-url', help='the Canvas api to record from (default: a fake server)')
+    record_parser.add_argument('--token', help='the access token for --base-api-url')
+    record_parser.set_defaults(function=record)
+    run_parser = subparsers.add_parser('run', help='replay the workflow from a cassette')
+    run_parser.add_argument('--latency', help="seconds to wait for each response, or 'recorded' (default: none)")
+    run_parser.add_argument('--page-workers', type=int, help='concurrent page fetches (default: none)')
+    run_parser.add_argument('--runs', type=int, default=5, help='timed runs (default: 5)')
+    run_parser.set_defaults(function=run)
+    for subparser in (record_parser, run_parser):
+        subparser.add_argument('cassette', help='the cassette file, gzipped if it ends with .gz')
+        subparser.add_argument('--course-id', type=int, default=1, help='the course of the workflow (default: 1)')
+        subparser.add_argument('--per-page', type=int, default=100, help='page size (default: 100)')
+    args = parser.parse_args(argv)
+    args.function(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
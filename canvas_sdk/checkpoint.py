@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+
+"""
+Checkpoints record how far a long crawl of a paged list has got, so that a crawl that is interrupted (by an error
+that isn't retried, a crash or a redeploy) can be resumed from the page after the last one it finished, instead of
+starting over.  See :py:func:`canvas_sdk.utils.iter_list_data_with_checkpoint`.
+
+The state of a checkpoint is a dict of json-serializable values; for a paged list it holds:
+
+* ``key``: identifies the list crawled, so that a checkpoint isn't resumed by a different crawl
+* ``next_url``: the url of the first page that hasn't been finished
+* ``item_count`` and ``page_count``: the items and pages finished so far
+"""
+
+
+class Checkpoint(object):
+
+    """
+    A checkpoint kept in memory.  Every change of its state is handed to the on_save callback, if given, which
+    can persist it wherever the application keeps its job state (a database row, a key-value store...), and a
+    state persisted that way is resumed by passing it back in::
+
+        checkpoint = Checkpoint(state=job.load_state(), on_save=job.save_state)
+
+    :param dict state: (optional) The state to resume from.  Defaults to None, starting from the beginning.
+    :param on_save: (optional) A callable called with the new state every time it is saved, or with None when the
+        checkpoint is cleared
+    """
+
+    def __init__(self, state=None, on_save=None):
+        self.state = dict(state) if state is not None else None
+        self.on_save = on_save
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Return the saved state, or None if there is nothing to resume from
+        """
+        with self._lock:
+            return dict(self.state) if self.state is not None else None
+
+    def save(self, state):
+        with self._lock:
+            self.state = dict(state)
+            self.write(self.state)
+        if self.on_save is not None:
+            self.on_save(dict(state))
+
+    def clear(self):
+        """
+        Forget the saved state, once the crawl is complete, so the next crawl starts from the beginning
+        """
+        with self._lock:
+            self.state = None
+            self.write(None)
+        if self.on_save is not None:
+            self.on_save(None)
+
+    def write(self, state):
+        """
+        Persist the state, or its removal if it is None.  Called with the lock held; a no-op in memory.
+        """
+
+
+class FileCheckpoint(Checkpoint):
+
+    """
+    A checkpoint saved to a small json file, which is replaced atomically on every save so that a crash never
+    leaves a partly written state behind, and removed when the checkpoint is cleared.  The state in the file, if
+    any, is resumed from.
+
+    :param str path: The file the state is saved to
+    :param on_save: (optional) A callable called with the new state every time it is saved, as with
+        :class:`Checkpoint`
+    """
+
+    def __init__(self, path, on_save=None):
+        self.path = path
+        state = None
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as checkpoint_file:
+                state = json.load(checkpoint_file)
+        super(FileCheckpoint, self).__init__(state, on_save)
+
+    def write(self, state):
+        if state is None:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        temporary_path = '%s.%d.tmp' % (self.path, os.getpid())
+        with open(temporary_path, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(state, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temporary_path, self.path)
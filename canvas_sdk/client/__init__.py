@@ -1,3 +1,12 @@
 from .request_context import RequestContext
 from .auth import OAuth2Bearer
 from .base import get, put, post, delete
+from .backoff import Backoff
+from .throttle import Throttle
+from .cache import ETagCache, ResponseCache
+from .coalesce import SingleFlight
+from .decoder import decode_json
+from .hooks import RequestObserver
+from .metrics import MetricsCollector
+from .cassette import Cassette
+from .paging import PageSizePolicy
@@ -0,0 +1,236 @@
+"""
+Asyncio transport for the Canvas API.  The coroutines in this module mirror the
+blocking helpers in :py:mod:`client.base` (``get``, ``put``, ``post``,
+``delete`` and ``call``) and share their retry semantics and error mapping, but
+send requests through an ``aiohttp.ClientSession`` so that many requests can be
+in flight on a single event loop.  Requires the optional ``aiohttp`` dependency
+(``pip install canvas_python_sdk[aio]``).
+
+Responses are returned as regular :class:`requests.Response` objects with their
+content already read, so ``json()``, ``links`` and the helpers in
+:py:mod:`canvas_sdk.utils` work unchanged on them.
+"""
+import asyncio
+import logging
+import ssl
+import time
+
+import requests
+from requests.exceptions import HTTPError
+
+from .auth import OAuth2Bearer
+from .base import build_response, get_api_error, get_cache_key, is_retryable, merge_or_create_key_value_for_dictionary
+from .hooks import notify
+from .tracing import end_call_span, start_call_span
+from .request_context import RequestContext
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+log = logging.getLogger(__name__)
+
+
+class AsyncRequestContext(RequestContext):
+
+    """
+    A :class:`RequestContext <RequestContext>` that also manages an ``aiohttp.ClientSession``
+    for use with the coroutines in this module.  All of the parameters of :class:`RequestContext`
+    are accepted, plus the following:
+
+    :param int limit: (optional) Maximum number of simultaneous connections in the pool.  Requests
+        beyond this limit wait for a free connection instead of opening a new one.  Defaults to 100.
+    :param int limit_per_host: (optional) Maximum number of simultaneous connections to the same
+        host.  Defaults to 0 (no per-host limit beyond ``limit``).
+
+    The session must be closed when it is no longer needed, either with ``await context.close()`` or
+    by using the context as an async context manager::
+
+        async with AsyncRequestContext(token, url, limit=50) as ctx:
+            response = await aio.get(ctx, ctx.base_api_url + '/v1/courses')
+    """
+
+    def __init__(self, auth_token, base_api_url, limit=100, limit_per_host=0, **kwargs):
+        if aiohttp is None:
+            raise ImportError("The aiohttp package is required to use the asyncio client.")
+        super(AsyncRequestContext, self).__init__(auth_token, base_api_url, **kwargs)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._async_session = None
+
+    def get_ssl_context(self):
+        """
+        Translate the requests-style ``verify`` and ``cert`` values of the context into the ``ssl``
+        argument expected by aiohttp.
+        """
+        if self.verify is False:
+            return False
+        if not isinstance(self.verify, str) and not self.cert:
+            return None  # aiohttp default verification
+        ssl_context = ssl.create_default_context(
+            cafile=self.verify if isinstance(self.verify, str) else None)
+        if isinstance(self.cert, (tuple, list)):
+            ssl_context.load_cert_chain(*self.cert)
+        elif self.cert:
+            ssl_context.load_cert_chain(self.cert)
+        return ssl_context
+
+    @property
+    def async_session(self):
+        """
+        Get or set the ``aiohttp.ClientSession`` used by this context.  The session is created on
+        first access, so this must happen from within a running event loop.
+        """
+        if self._async_session is None or self._async_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host, ssl=self.get_ssl_context())
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers or {},
+                cookies=self.cookies,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._async_session
+
+    @async_session.setter
+    def async_session(self, sess):
+        self._async_session = sess
+
+    async def close(self):
+        """
+        Close the underlying ``aiohttp.ClientSession`` and release its connections.
+        """
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+async def get(request_context, url, payload=None, **optional_request_params):
+    """
+    Shortcut for making a GET call to the API.  Data is passed as url params.
+    """
+    merge_or_create_key_value_for_dictionary(optional_request_params, 'params', payload)
+    return await call("GET", url, request_context, **optional_request_params)
+
+
+async def put(request_context, url, payload=None, **optional_request_params):
+    """
+    Shortcut for making a PUT call to the API
+    """
+    merge_or_create_key_value_for_dictionary(optional_request_params, 'data', payload)
+    return await call("PUT", url, request_context, **optional_request_params)
+
+
+async def post(request_context, url, payload=None, **optional_request_params):
+    """
+    Shortcut for making a POST call to the API
+    """
+    merge_or_create_key_value_for_dictionary(optional_request_params, 'data', payload)
+    return await call("POST", url, request_context, **optional_request_params)
+
+
+async def delete(request_context, url, payload=None, **optional_request_params):
+    """
+    Shortcut for making a DELETE call to the API
+    """
+    merge_or_create_key_value_for_dictionary(optional_request_params, 'data', payload)
+    return await call("DELETE", url, request_context, **optional_request_params)
+
+
+async def call(action, url, request_context, params=None, data=None, max_retries=None,
+               auth_token=None, files=None, headers=None, cookies=None, timeout=None,
+               proxies=None, verify=None, cert=None, allow_redirects=True):
+    """Coroutine counterpart of :py:func:`client.base.call`.  The request is encoded with the
+    requests library (so params and form data are serialized exactly as in the blocking client)
+    and sent through the ``aiohttp.ClientSession`` of an :class:`AsyncRequestContext`.  Returns a
+    :class:`requests.Response <Response>` object.
+
+    Requests that fail with one of the status codes in ``client.base.RETRY_ERROR_CODES`` or that
+    were rate limited are retried up to ``max_retries`` times, and failures are raised as
+    :class:`CanvasAPIError` or :class:`InvalidOAuthTokenError` as they are by the blocking client.
+    Identical GET requests are coalesced when the context has a single flight group.  The
+    ``verify`` and ``cert`` arguments are accepted for signature compatibility; TLS settings are
+    taken from the request context when its session is created.
+    """
+    aio_session = request_context.async_session
+    # Default back to value in request_context
+    retries = max_retries or request_context.max_retries
+    if retries is None:
+        retries = 0  # Fall back if max_retries in context is explicitly None
+    auth = OAuth2Bearer(auth_token) if auth_token else request_context.auth
+    prepared = requests.Request(
+        action, url, params=params, data=data, files=files, headers=headers, auth=auth).prepare()
+    proxy = (proxies or request_context.proxies or {}).get(prepared.url.split(':', 1)[0])
+    request_timeout = timeout if timeout is not None else request_context.timeout
+    throttle = request_context.throttle
+    observers = request_context.observers
+    tracer = request_context.tracer
+
+    async def send():
+        # try the request until max_retries is reached.  we need to account for the
+        # fact that the first iteration through isn't a retry, so add 1 to max_retries
+        for retry in range(retries + 1):
+            if throttle:
+                delay = throttle.reserve()
+                if delay:
+                    await asyncio.sleep(delay)
+            if observers:
+                notify(observers, 'before_request', action, url, retry)
+            span = start_call_span(tracer, action, url, retry) if tracer is not None else None
+            st = time.perf_counter()
+            try:
+                async with aio_session.request(
+                        action, prepared.url, data=prepared.body, headers=dict(prepared.headers),
+                        cookies=cookies, proxy=proxy, allow_redirects=allow_redirects,
+                        timeout=aiohttp.ClientTimeout(total=request_timeout)) as aio_response:
+                    content = await aio_response.read()
+                    response = build_response(
+                        aio_response.status,
+                        ((key, ', '.join(aio_response.headers.getall(key)))
+                         for key in set(aio_response.headers.keys())),
+                        content, str(aio_response.url), aio_response.reason)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                if span is not None:
+                    end_call_span(span, error=error)
+                if observers:
+                    notify(observers, 'on_error', action, url, error, retry)
+                raise
+            elapsed = time.perf_counter() - st
+            if span is not None:
+                end_call_span(span, response)
+            if throttle:
+                throttle.update(response)
+            if observers:
+                notify(observers, 'after_response', action, url, response, elapsed, retry)
+            try:
+                # raise an http exception if one occured
+                response.raise_for_status()
+            except HTTPError as http_error:
+                log.info("Caught an API Error returned by Canvas: %s", str(http_error))
+                # If we can't retry the request, raise the mapped SDK exception
+                if not is_retryable(response) or retry >= retries:
+                    error = get_api_error(response, request_context.json_decoder)
+                    if observers:
+                        notify(observers, 'on_error', action, url, error, retry)
+                    raise error
+                delay = request_context.backoff.get_delay(retry, response) if request_context.backoff else 0
+                if observers:
+                    notify(observers, 'on_retry', action, url, response, retry, delay)
+                if delay:
+                    await asyncio.sleep(delay)
+            else:
+                # Formatted lazily, only when debug logging is enabled
+                log.debug('API_CALL_DURATION %s %s', url, elapsed)
+                return response
+
+    if action == 'GET' and request_context.single_flight is not None:
+        key = get_cache_key(prepared.url, auth_token=auth_token or request_context.auth_token)
+        return await request_context.single_flight.do_async(key, send)
+    return await send()
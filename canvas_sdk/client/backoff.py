@@ -0,0 +1,77 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+
+class Backoff(object):
+
+    """
+    An exponential backoff policy that determines how long :py:func:`client.base.call` waits before
+    retrying a request that failed with a retriable error.  The delay before retry ``n`` (starting at 0)
+    is ``base_delay * multiplier ** n``, capped at ``max_delay``.  With full jitter enabled, the actual
+    delay is drawn uniformly between 0 and that value so that many clients retrying at once spread their
+    requests out instead of hitting Canvas in lockstep.
+
+    :param float base_delay: (optional) The delay in seconds before the first retry.  Defaults to 1.
+    :param float multiplier: (optional) The factor the delay grows by with each retry.  Defaults to 2.
+    :param float max_delay: (optional) The longest delay in seconds between two attempts, including delays
+        requested by a Retry-After header.  Defaults to 60.
+    :param bool jitter: (optional) Whether to apply full jitter to the exponential delay.  Defaults to True.
+    :param bool respect_retry_after: (optional) Whether a Retry-After header on the failed response takes
+        precedence over the exponential delay.  Defaults to True.
+    """
+
+    def __init__(self, base_delay=1.0, multiplier=2.0, max_delay=60.0, jitter=True, respect_retry_after=True):
+        if base_delay < 0 or multiplier < 1 or max_delay < 0:
+            raise ValueError("Backoff delays must not be negative and multiplier must be at least 1.")
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    @staticmethod
+    def get_retry_after(response):
+        """
+        Return the number of seconds requested by the Retry-After header of a response, which may be
+        given either in seconds or as an HTTP date.  Returns None if the header is missing or invalid.
+        """
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def get_delay(self, retry, response=None):
+        """
+        Return the number of seconds to wait before the given retry.
+
+        :param int retry: The zero-based number of the retry about to be made
+        :param response: (optional) The :class:`requests.Response` of the failed attempt
+        :rtype: float
+        """
+        if self.respect_retry_after:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_delay)
+        # Bound the exponent so that very long retry chains can't overflow the float
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** min(retry, 64))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+"""
+The policy used by a RequestContext when no backoff is given
+"""
+DEFAULT_BACKOFF = Backoff()
@@ -1,10 +1,17 @@
+import hashlib
 import logging
 
 import requests
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, ReadTimeout, RequestException
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 import time
 
 from .auth import OAuth2Bearer
+from .decoder import decode_json
+from .hooks import notify
+from .paging import PAGE_SIZE_ERROR_CODES, can_resize_page, get_page_size, set_page_size
+from .tracing import end_call_span, start_call_span
 from canvas_sdk.exceptions import (CanvasAPIError, InvalidOAuthTokenError)
 
 log = logging.getLogger(__name__)
@@ -17,6 +24,9 @@ RETRY_ERROR_CODES = (
     requests.codes['gateway_timeout']  # 504
 )
 
+# Body of the 403 response Canvas returns when a token exceeds its rate limit
+RATE_LIMIT_EXCEEDED_MESSAGE = 'Rate Limit Exceeded'
+
 
 def merge_or_create_key_value_for_dictionary(target, key, value=None):
     """
@@ -38,6 +48,87 @@ def merge_or_create_key_value_for_dictionary(target, key, value=None):
             target.update({key: value})
 
 
+def build_response(status_code, headers, content, url, reason=None):
+    """
+    Build a :class:`requests.Response` from the parts of a response that was received by another
+    transport or restored from a cache, so that it can be consumed exactly like one returned by
+    :py:func:`call`.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.url = url
+    response.reason = reason
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
+
+
+def get_cache_key(url, params=None, auth_token=None):
+    """
+    Build the key a GET request is cached under from its url, its query params
+    (serialized the way requests sends them) and the access token it is made
+    with, so that users never see each other's cached data.
+    """
+    full_url = requests.Request('GET', url, params=params).prepare().url
+    token_hash = hashlib.sha1((auth_token or '').encode('utf-8')).hexdigest()
+    return '%s %s' % (token_hash, full_url)
+
+
+def is_rate_limited(response):
+    """
+    Return True if a response is the 403 Canvas sends once the rate limit of
+    the access token has been exceeded.  See
+    https://canvas.instructure.com/doc/api/file.throttling.html
+
+    :param response: The :class:`requests.Response` of a failed request
+    :rtype: bool
+    """
+    return (response.status_code == requests.codes['forbidden']
+            and RATE_LIMIT_EXCEEDED_MESSAGE in response.text)
+
+
+def is_retryable(response):
+    """
+    Return True if the error status of a response is one that can be retried.
+    See ``RETRY_ERROR_CODES`` for the list of retriable status codes; rate
+    limited requests (see is_rate_limited) can be retried as well.
+
+    :param response: The :class:`requests.Response` of a failed request
+    :rtype: bool
+    """
+    return response.status_code in RETRY_ERROR_CODES or is_rate_limited(response)
+
+
+def get_api_error(response, json_decoder=None):
+    """
+    Map a failed response onto the SDK exception that should be raised back to
+    the caller.  A 401 with a WWW-Authenticate header indicates an invalid token
+    (per https://canvas.instructure.com/doc/api/file.oauth.html); every other
+    error becomes a :class:`CanvasAPIError` carrying the status code and any
+    json error body returned by Canvas.
+
+    :param response: The :class:`requests.Response` of a failed request
+    :param json_decoder: (optional) The decoder of the error body, see :py:func:`client.decoder.decode_json`
+    :rtype: SDKException
+    """
+    status_code = response.status_code
+    if status_code == 401 and 'WWW-Authenticate' in response.headers:
+        return InvalidOAuthTokenError(
+            "OAuth Token used to make request to %s is invalid" % response.url)
+    try:
+        error_json = decode_json(response, json_decoder)
+        message = str(error_json)
+    except ValueError:  # no json object could be decoded, e.g. 404
+        error_json = None
+        message = response.text.strip()
+    return CanvasAPIError(
+        status_code=status_code,
+        msg=message,
+        error_json=error_json,
+    )
+
+
 def get(request_context, url, payload=None, **optional_request_params):
     """
     Shortcut for making a GET call to the API.  Data is passed as url params.
@@ -119,45 +210,140 @@ def call(action, url, request_context, params=None, data=None, max_retries=None,
     auth = None
     if auth_token:
         auth = OAuth2Bearer(auth_token)
-    # try the request until max_retries is reached.  we need to account for the
-    # fact that the first iteration through isn't a retry, so add 1 to max_retries
-    for retry in range(retries + 1):
-        st = time.time()
-        try:
-            # build and send the request
-            response = canvas_session.request(
-                action, url, params=params, data=data, headers=headers,
-                cookies=cookies, files=files, auth=auth, timeout=timeout,
-                proxies=proxies, verify=verify, cert=cert,
-                allow_redirects=allow_redirects)
-
-            # raise an http exception if one occured
-            response.raise_for_status()
-
-        except HTTPError as http_error:
-            log.info("Caught an API Error returned by Canvas: %s", str(http_error))
-            # Need to check its an error code that can be retried
-            status_code = response.status_code
-
-            # Check to see if this is an invalid token error per
-            # https://canvas.instructure.com/doc/api/file.oauth.html
-            if status_code == 401 and 'WWW-Authenticate' in response.headers:
-                raise InvalidOAuthTokenError(
-                    "OAuth Token used to make request to %s is invalid" % response.url)
-
-            # If we can't retry the request, raise a CanvasAPIError
-            if status_code not in RETRY_ERROR_CODES or retry >= retries:
-                try:
-                    error_json = response.json()
-                    message = str(error_json)
-                except ValueError:  # no json object could be decoded, e.g. 404
-                    error_json = None
-                    message = response.text.strip()
-                raise CanvasAPIError(
-                    status_code=status_code,
-                    msg=message,
-                    error_json=error_json,
-                )
+    throttle = request_context.throttle
+    observers = request_context.observers
+    tracer = request_context.tracer
+    # GET requests may be answered from the context's caches or coalesced with
+    # an identical request that is already in flight
+    response_cache = etag_cache = single_flight = cached = None
+    if action == 'GET':
+        response_cache = request_context.response_cache
+        etag_cache = request_context.etag_cache
+        single_flight = request_context.single_flight
+    if response_cache is not None or etag_cache is not None or single_flight is not None:
+        cache_key = get_cache_key(url, params, auth_token or request_context.auth_token)
+    if response_cache is not None:
+        ttl = response_cache.get_ttl(url)
+        if not ttl:
+            response_cache = None  # The endpoint isn't cached
         else:
-            log.debug('API_CALL_DURATION {} {}'.format(url, time.time()-st))
-            return response
+            fresh = response_cache.get(cache_key)
+            if fresh is not None:
+                return fresh.to_response()
+    # Send a conditional request if an earlier response for the url is cached
+    if etag_cache is not None:
+        cached = etag_cache.get(cache_key)
+        if cached:
+            headers = dict(headers or {}, **{'If-None-Match': cached.etag})
+    # The page size of list requests is learned, and shrunk when a page fails, by the page size policy
+    page_size_policy = per_page = None
+    if action == 'GET' and request_context.page_size_policy is not None:
+        page_size_policy = request_context.page_size_policy
+        per_page = get_page_size(url, params)
+
+    resized = False
+
+    def resize_page(can_retry):
+        """
+        Shrink the page the request asks for after a failure the size of the page may have caused, and return
+        True if the request should be retried for the smaller page.  The policy learns the smaller size even when
+        no retries are left, so that the next list asks for it.
+        """
+        nonlocal url, params, per_page, headers, cached, resized
+        if per_page is None:
+            return False
+        smaller = page_size_policy.shrink(url, per_page)
+        if smaller is None or not can_retry or not can_resize_page(url, params):
+            return False
+        log.info("Asking for pages of %d items instead of %d from %s", smaller, per_page, url)
+        url, params = set_page_size(url, params, smaller)
+        per_page = smaller
+        # The smaller page isn't the response the caches hold, or would hold, for the request
+        resized = True
+        if cached:
+            headers = dict(headers)
+            del headers['If-None-Match']
+            cached = None
+        return True
+
+    def send():
+        # try the request until max_retries is reached.  the first attempt isn't a retry
+        retry = 0
+        while True:
+            attempt = retry
+            if throttle:
+                delay = throttle.reserve()
+                if delay:
+                    time.sleep(delay)
+            if observers:
+                notify(observers, 'before_request', action, url, attempt)
+            span = start_call_span(tracer, action, url, attempt) if tracer is not None else None
+            st = time.perf_counter()
+            try:
+                # build and send the request
+                try:
+                    response = canvas_session.request(
+                        action, url, params=params, data=data, headers=headers,
+                        cookies=cookies, files=files, auth=auth, timeout=timeout,
+                        proxies=proxies, verify=verify, cert=cert,
+                        allow_redirects=allow_redirects)
+                except RequestException as error:
+                    if span is not None:
+                        end_call_span(span, error=error)
+                    failed_url = url
+                    if isinstance(error, ReadTimeout) and resize_page(retry < retries):
+                        delay = request_context.backoff.get_delay(retry, None) if request_context.backoff else 0
+                        if observers:
+                            notify(observers, 'on_retry', action, failed_url, None, attempt, delay)
+                        if delay:
+                            time.sleep(delay)
+                        retry += 1
+                        continue
+                    if observers:
+                        notify(observers, 'on_error', action, url, error, attempt)
+                    raise
+                elapsed = time.perf_counter() - st
+                if span is not None:
+                    end_call_span(span, response)
+                if throttle:
+                    throttle.update(response)
+                if etag_cache is not None:
+                    if cached and response.status_code == requests.codes['not_modified']:
+                        response = cached.to_response(response.headers)
+                    elif not resized:
+                        etag_cache.set(cache_key, response)
+                if observers:
+                    notify(observers, 'after_response', action, url, response, elapsed, attempt)
+
+                # raise an http exception if one occured
+                response.raise_for_status()
+
+            except HTTPError as http_error:
+                log.info("Caught an API Error returned by Canvas: %s", str(http_error))
+                failed_url = url
+                # A page that failed in a way a smaller page may avoid is retried for a smaller page
+                resizing = response.status_code in PAGE_SIZE_ERROR_CODES and resize_page(retry < retries)
+                # If we can't retry the request, raise the mapped SDK exception
+                if not resizing and (not is_retryable(response) or retry >= retries):
+                    error = get_api_error(response, request_context.json_decoder)
+                    if observers:
+                        notify(observers, 'on_error', action, url, error, attempt)
+                    raise error
+                delay = request_context.backoff.get_delay(retry, response) if request_context.backoff else 0
+                if observers:
+                    notify(observers, 'on_retry', action, failed_url, response, attempt, delay)
+                if delay:
+                    time.sleep(delay)
+                retry += 1
+            else:
+                # Formatted lazily, only when debug logging is enabled
+                log.debug('API_CALL_DURATION %s %s', url, elapsed)
+                if per_page is not None:
+                    page_size_policy.record_page(url, per_page, response)
+                if response_cache is not None and not resized:
+                    response_cache.set(cache_key, response, ttl)
+                return response
+
+    if single_flight is not None:
+        return single_flight.do(cache_key, send)
+    return send()
@@ -0,0 +1,309 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from urllib.parse import urlparse
+
+import requests
+
+from .base import build_response, get_cache_key
+
+"""
+Headers of a 304 response that describe the (empty) body of that response rather than the cached
+resource, so they must not replace the cached values
+"""
+ENTITY_HEADERS = frozenset(('content-length', 'content-type', 'content-encoding', 'transfer-encoding'))
+
+
+class CachedResponse(namedtuple('CachedResponse', 'status_code headers content url etag')):
+
+    """
+    The parts of a :class:`requests.Response` that are kept in a cache
+    """
+
+    @classmethod
+    def from_response(cls, response):
+        return cls(response.status_code, dict(response.headers), response.content, response.url,
+                   response.headers.get('ETag'))
+
+    @property
+    def size(self):
+        """
+        Approximate number of bytes held by the entry
+        """
+        return len(self.content or b'') + sum(len(k) + len(v) for k, v in self.headers.items())
+
+    def to_response(self, headers=None):
+        """
+        Build a new :class:`requests.Response` from the entry.  Any headers given (e.g. those of a 304
+        response revalidating the entry) take precedence over the cached ones, except for the headers
+        that describe the body.
+        """
+        response_headers = dict(self.headers)
+        if headers:
+            response_headers.update(
+                (k, v) for k, v in headers.items() if k.lower() not in ENTITY_HEADERS)
+        return build_response(self.status_code, response_headers, self.content, self.url)
+
+
+class MemoryBackend(object):
+
+    """
+    In-process cache backend that keeps :class:`CachedResponse` entries in memory and evicts the least
+    recently used entries once their total size exceeds ``max_bytes``.  Safe to share between threads.
+
+    :param int max_bytes: (optional) The maximum total size of the cached entries.  Defaults to 50MB.
+    """
+
+    def __init__(self, max_bytes=50 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()  # key -> (expires_at, entry)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return the unexpired entry stored for the key, or None
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at is not None and expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, ttl=None):
+        """
+        Store an entry under the key for ttl seconds (or until evicted if ttl is None).  Entries that
+        are larger than the whole cache are not stored.
+        """
+        if entry.size > self.max_bytes:
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires_at, entry)
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self.size -= item[1].size
+
+
+class SQLiteBackend(object):
+
+    """
+    Cache backend that stores entries in a SQLite database file, so that several worker processes on the
+    same host can share cached responses.  Each thread uses its own connection to the database.
+
+    :param str path: The path of the database file; it is created if it doesn't exist
+    :param float timeout: (optional) How long to wait, in seconds, for a lock held by another process.
+        Defaults to 30.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with self.connection as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL, '
+                'status_code INTEGER, headers TEXT, url TEXT, content BLOB)')
+            conn.execute('CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)')
+
+    @property
+    def connection(self):
+        """
+        The database connection of the current thread
+        """
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            # Write-ahead logging lets readers in other processes proceed while an entry is written
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = conn
+        return conn
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def get(self, key):
+        """
+        Return the unexpired entry stored for the key, or None
+        """
+        row = self.connection.execute(
+            'SELECT status_code, headers, content, url FROM responses '
+            'WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)', (key, time.time())).fetchone()
+        if row is None:
+            return None
+        headers = json.loads(row[1])
+        return CachedResponse(row[0], headers, bytes(row[2]), row[3], headers.get('ETag'))
+
+    def set(self, key, entry, ttl=None):
+        """
+        Store an entry under the key for ttl seconds (or indefinitely if ttl is None)
+        """
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self.connection as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (key, expires_at, status_code, headers, url, content) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, expires_at, entry.status_code, json.dumps(entry.headers), entry.url,
+                 sqlite3.Binary(entry.content or b'')))
+
+    def delete(self, key):
+        with self.connection as conn:
+            conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def clear(self):
+        with self.connection as conn:
+            conn.execute('DELETE FROM responses')
+
+    def close(self):
+        """
+        Close the database connection of the current thread
+        """
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+
+    def purge_expired(self):
+        """
+        Remove expired entries from the database
+        """
+        with self.connection as conn:
+            conn.execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(),))
+
+
+def compile_endpoint_template(template):
+    """
+    Compile an endpoint template such as '/v1/accounts/{account_id}/roles' into a regular expression
+    that matches the path of a request url ending with that endpoint.
+    """
+    pattern = ''.join('[^/]+' if part.startswith('{') else re.escape(part)
+                      for part in re.split(r'(\{[^}]*\})', template.rstrip('/')))
+    return re.compile(pattern + '/?$')
+
+
+class ResponseCache(object):
+
+    """
+    A time-to-live cache of GET responses for slow-changing, read-only endpoints.  When a context has a
+    response cache, :py:func:`client.base.call` returns an unexpired cached response without contacting
+    Canvas at all, and stores successful responses of cached endpoints.  Which endpoints are cached, and
+    for how long, is decided by ``policies``: a mapping of endpoint templates to TTLs in seconds.  The
+    first matching template wins; urls that match no template use ``default_ttl``.  For example::
+
+        ResponseCache(SQLiteBackend('/tmp/canvas-cache.db'), policies={
+            '/v1/accounts/{account_id}/terms': 3600,
+            '/v1/accounts/{account_id}/roles': 600,
+        })
+
+    :param backend: (optional) Where entries are stored.  Defaults to a new :class:`MemoryBackend`.
+    :type backend: :class:`MemoryBackend` or :class:`SQLiteBackend`
+    :param dict policies: (optional) Mapping of endpoint templates to TTLs in seconds
+    :param float default_ttl: (optional) TTL of urls that match no policy.  Defaults to None, meaning that
+        only endpoints listed in ``policies`` are cached.
+    """
+
+    def __init__(self, backend=None, policies=None, default_ttl=None):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.default_ttl = default_ttl
+        self.policies = [(compile_endpoint_template(template), ttl)
+                         for template, ttl in (policies or {}).items()]
+
+    get_key = staticmethod(get_cache_key)
+
+    def get_ttl(self, url):
+        """
+        Return the TTL in seconds that applies to a url, or None if it shouldn't be cached
+        """
+        path = urlparse(url).path
+        for pattern, ttl in self.policies:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key):
+        """
+        Return the unexpired :class:`CachedResponse` stored for the key, or None
+        """
+        return self.backend.get(key)
+
+    def set(self, key, response, ttl):
+        """
+        Store a successful response under the key for ttl seconds
+        """
+        if response.status_code == requests.codes['ok']:
+            self.backend.set(key, CachedResponse.from_response(response), ttl)
+
+    def clear(self):
+        self.backend.clear()
+
+
+class ETagCache(object):
+
+    """
+    A bounded in-memory cache of GET responses that carry an ETag.  When a context has an ETag cache,
+    :py:func:`client.base.call` sends an If-None-Match header for cached urls and returns the cached body
+    when Canvas answers 304 Not Modified, saving the transfer and decoding of unchanged data.  Entries are
+    evicted least recently used first once the cached bodies exceed ``max_bytes``.  A single cache is safe
+    to share between threads and request contexts.
+
+    :param int max_bytes: (optional) The maximum total size of the cached entries.  Defaults to 50MB.
+    """
+
+    def __init__(self, max_bytes=50 * 1024 * 1024):
+        self.backend = MemoryBackend(max_bytes)
+
+    def __len__(self):
+        return len(self.backend)
+
+    get_key = staticmethod(get_cache_key)
+
+    @property
+    def size(self):
+        return self.backend.size
+
+    def get(self, key):
+        """
+        Return the :class:`CachedResponse` stored for the key, or None
+        """
+        return self.backend.get(key)
+
+    def set(self, key, response):
+        """
+        Store a successful response under the key if it has an ETag and fits in the cache, evicting the
+        least recently used entries as needed.
+        """
+        if response.status_code != requests.codes['ok'] or not response.headers.get('ETag'):
+            return
+        self.backend.set(key, CachedResponse.from_response(response))
+
+    def clear(self):
+        """
+        Remove all entries from the cache
+        """
+        self.backend.clear()
@@ -0,0 +1,212 @@
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError
+
+from .base import build_response
+
+"""
+Response headers that aren't recorded: the body is stored decoded and its length recomputed on replay, and cookies
+and connection management don't belong in a cassette
+"""
+SKIPPED_HEADERS = frozenset(('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive',
+                             'set-cookie', 'date'))
+
+"""
+The modes of a Cassette
+"""
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+class CassetteMissError(ConnectionError):
+
+    """
+    Raised on replay for a request the cassette holds no response to
+    """
+
+
+class Cassette(object):
+
+    """
+    Request and response pairs of the Canvas API, recorded to a file and replayed from it, so that tests and
+    benchmarks can run offline against real data volumes and page layouts.  A cassette is used by giving it to a
+    :class:`RequestContext` with ``cassette=``: in record mode the requests the context sends go out as usual and
+    each response (status, headers including Link and the rate limiting headers, body and the time it took) is
+    recorded; in replay mode nothing is sent and the responses are served from the cassette.  Only the blocking
+    client uses cassettes.
+
+    Requests are matched on their method, path, query and a hash of their body; the host isn't matched, so a
+    cassette can be replayed with any base_api_url.  Identical requests get the recorded responses in the order
+    they were recorded, and the last one once those are used up, so a replayed workflow can be run repeatedly.
+    Request headers, including the access token, are never recorded.
+
+    The cassette is written by save(), or on leaving a ``with`` block in record mode, as JSON lines, gzipped when
+    the path ends with ``.gz``::
+
+        with Cassette('enrollments.jsonl.gz', mode='record') as cassette:
+            request_context = RequestContext(token, url, cassette=cassette)
+            utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, course_id)
+
+        request_context = RequestContext(token, url, cassette=Cassette('enrollments.jsonl.gz', latency='recorded'))
+
+    :param str path: The file the cassette is saved to and loaded from
+    :param str mode: (optional) 'replay' to serve recorded responses (the default), or 'record' to record new ones
+    :param latency: (optional) On replay, the seconds to wait before serving each response, or 'recorded' to wait
+        as long as the recorded response took.  Defaults to None, no waiting.
+    :type latency: float or str
+    """
+
+    def __init__(self, path, mode=REPLAY, latency=None):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError("mode must be '%s' or '%s'." % (RECORD, REPLAY))
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.interactions = []
+        self._queues = {}
+        self._lock = threading.Lock()
+        if mode == REPLAY:
+            self.load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.mode == RECORD:
+            self.save()
+
+    @staticmethod
+    def get_key(method, url, body=None):
+        """
+        Return the key a request is matched on: its method, the path and query of its url and a hash of its body
+        """
+        parts = urlsplit(url)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        body_hash = hashlib.sha1(body).hexdigest() if body else None
+        return '%s %s?%s %s' % (method, parts.path, parts.query, body_hash)
+
+    def open(self, mode):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, mode + 't', encoding='utf-8')
+        return open(self.path, mode, encoding='utf-8')
+
+    def load(self):
+        with self.open('r') as cassette_file:
+            interactions = [json.loads(line) for line in cassette_file if line.strip()]
+        with self._lock:
+            self.interactions = interactions
+            self._queues = {}
+            for interaction in interactions:
+                self._queues.setdefault(interaction['key'], deque()).append(interaction)
+
+    def save(self):
+        with self._lock:
+            interactions = list(self.interactions)
+        with self.open('w') as cassette_file:
+            for interaction in interactions:
+                cassette_file.write(json.dumps(interaction, separators=(',', ':')) + '\n')
+
+    def record(self, request, response, elapsed):
+        """
+        Record the response to a prepared request
+        """
+        interaction = {
+            'key': self.get_key(request.method, request.url, request.body),
+            'url': response.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {key: value for key, value in response.headers.items() if key.lower() not in SKIPPED_HEADERS},
+            'elapsed': round(elapsed, 6),
+        }
+        content = response.content or b''
+        try:
+            interaction['text'] = content.decode('utf-8')
+        except UnicodeDecodeError:
+            interaction['base64'] = base64.b64encode(content).decode('ascii')
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def play(self, request):
+        """
+        Return the recorded interaction that answers a prepared request
+
+        :raises CassetteMissError: if no response to the request was recorded
+        """
+        key = self.get_key(request.method, request.url, request.body)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteMissError("No response to %s %s was recorded in %s" % (
+                    request.method, request.url, self.path), request=request)
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def get_adapter(self, adapter):
+        """
+        Return the transport adapter a session mounts in place of adapter: one that records what adapter sends, or
+        one that replays the cassette without sending anything
+        """
+        if self.mode == RECORD:
+            return RecordingAdapter(self, adapter)
+        return ReplayAdapter(self)
+
+
+class RecordingAdapter(BaseAdapter):
+
+    """
+    Transport adapter that sends requests with another adapter and records the responses to a cassette
+    """
+
+    def __init__(self, cassette, adapter):
+        super(RecordingAdapter, self).__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        response.content  # Read the body, so its transfer counts towards the recorded latency
+        self.cassette.record(request, response, time.perf_counter() - start)
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+
+    """
+    Transport adapter that answers requests with the responses recorded in a cassette
+    """
+
+    def __init__(self, cassette):
+        super(ReplayAdapter, self).__init__()
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        interaction = self.cassette.play(request)
+        latency = self.cassette.latency
+        if latency == 'recorded':
+            latency = interaction['elapsed']
+        if latency:
+            time.sleep(latency)
+        if 'base64' in interaction:
+            content = base64.b64decode(interaction['base64'])
+        else:
+            content = interaction['text'].encode('utf-8')
+        response = build_response(interaction['status'], interaction['headers'], content, interaction['url'],
+                                  interaction['reason'])
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
@@ -0,0 +1,85 @@
+import threading
+from functools import partial
+
+
+class _Call(object):
+    """
+    A request in flight and the outcome shared with every caller waiting on it
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+
+    """
+    Coalesces identical requests that are in flight at the same time, so that only one of them goes out
+    over the network and every caller receives its result (or its exception).  When a context has a
+    single flight group, :py:func:`client.base.call` and :py:func:`client.aio.call` coalesce concurrent
+    GET requests with the same url, params and access token.  Note that the waiting callers all receive
+    the same :class:`requests.Response` object.  A group is safe to share between threads and request
+    contexts; asyncio callers are coalesced with other callers on the same event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._futures = {}
+
+    def do(self, key, function):
+        """
+        Call function and return its result, unless a call for the same key is already in flight, in
+        which case wait for that call and return its result or raise its exception instead.
+
+        :param str key: Identifies requests that can share a result
+        :param function: A callable that makes the request
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key, coroutine_function):
+        """
+        Coroutine counterpart of do: await coroutine_function() unless a call for the same key is already
+        in flight on the running event loop, in which case wait for its outcome instead.
+
+        :param str key: Identifies requests that can share a result
+        :param coroutine_function: A callable that returns the awaitable making the request
+        """
+        # Imported here so that blocking clients don't pay for importing asyncio
+        import asyncio
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        task = self._futures.get(loop_key)
+        if task is None:
+            # The call runs as a task of its own, so that cancelling any caller, the first one included, leaves it
+            # running for the others
+            task = self._futures[loop_key] = asyncio.ensure_future(coroutine_function())
+            task.add_done_callback(partial(self._forget_task, loop_key))
+        return await asyncio.shield(task)
+
+    def _forget_task(self, loop_key, task):
+        if self._futures.get(loop_key) is task:
+            del self._futures[loop_key]
+        if not task.cancelled():
+            task.exception()  # Mark the exception as retrieved in case every caller was cancelled
@@ -0,0 +1,44 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+def get_default_decoder():
+    """
+    Return the fastest json decoder that is installed: ``orjson.loads``, then ``ujson.loads``, falling back to
+    the standard library's ``json.loads``.  Every one of them accepts the raw bytes of a response body and
+    raises a ValueError when the body isn't valid json.
+    """
+    if orjson is not None:
+        return orjson.loads
+    if ujson is not None:
+        return ujson.loads
+    return json.loads
+
+
+"""
+The decoder used by a RequestContext when no json_decoder is given
+"""
+DEFAULT_JSON_DECODER = get_default_decoder()
+
+
+def decode_json(response, decoder=None):
+    """
+    Decode the json body of a response.  The raw body is handed to decoder, skipping the text decoding done by
+    :py:meth:`requests.Response.json`; if decoder is None, ``response.json()`` is used instead.
+
+    :param response: A :class:`requests.Response`
+    :param decoder: (optional) A callable that takes the response body as bytes and returns the decoded json
+    :raises ValueError: If the body is not valid json
+    """
+    if decoder is None:
+        return response.json()
+    return decoder(response.content)
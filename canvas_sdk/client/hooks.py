@@ -0,0 +1,189 @@
+import logging
+import re
+import threading
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+log = logging.getLogger(__name__)
+
+"""
+Path segments that identify an object rather than name a resource: numeric ids, prefixed ids such as
+sis_course_id:ABC or hex:... (with the colon percent-encoded or not), and the 'self' alias of the current user
+"""
+ID_SEGMENT = re.compile(r'^(\d+|self|[a-z_]+(:|%3[aA]).+)$')
+
+"""
+Path segments after which a segment is an object's name rather than a resource (wiki pages are addressed by their
+url), and after which the rest of the path is (folders are resolved by their full path)
+"""
+NAME_SEGMENTS = {'pages': '{url}'}
+PATH_SEGMENTS = {'by_path': '{full_path}'}
+
+# The path templates of the endpoints of the SDK methods, registered by the engine, by the resource they start
+# with: templates not matched against yet, and the (pattern, template) pairs compiled from them
+_pending_path_templates = {}
+_path_templates = {}
+_path_templates_lock = threading.Lock()
+
+
+class RequestObserver(object):
+
+    """
+    Base class of the observers of the requests made by :py:func:`client.base.call` and
+    :py:func:`client.aio.call`.  Observers are given to a :class:`RequestContext` with ``observers=[...]`` and
+    are notified of every attempt of every request made with it; override the events you are interested in.
+    Responses answered from a :class:`ResponseCache` are not requests and aren't observed.
+
+    Observers are called synchronously by the thread (or event loop) making the request, so they should be fast
+    and, if the context is shared between threads, thread-safe.  An exception raised by an observer is logged
+    and doesn't affect the request.
+    """
+
+    def before_request(self, action, url, attempt):
+        """
+        Called before each attempt of a request is sent.
+
+        :param str action: The HTTP method, e.g. 'GET'
+        :param str url: The url of the request, without the params passed separately to call
+        :param int attempt: The zero-based number of the attempt
+        """
+
+    def after_response(self, action, url, response, elapsed, attempt):
+        """
+        Called when a response is received, whether it succeeded or failed.
+
+        :param response: The :class:`requests.Response` received
+        :param float elapsed: The seconds between sending the request and receiving the response
+        """
+
+    def on_retry(self, action, url, response, attempt, delay):
+        """
+        Called when a failed attempt is going to be retried, before waiting for the backoff delay.
+
+        :param response: The :class:`requests.Response` of the failed attempt
+        :param float delay: The seconds that will be waited before the next attempt
+        """
+
+    def on_error(self, action, url, error, attempt):
+        """
+        Called when a request fails for good, with the exception about to be raised to the caller: the
+        SDKException an error response is mapped onto, or the exception of a request that got no response.
+        """
+
+
+def notify(observers, event, *args):
+    """
+    Call the given event method of every observer with args, logging the exceptions they raise
+    """
+    for observer in observers:
+        try:
+            getattr(observer, event)(*args)
+        except Exception:
+            log.exception("Request observer %r failed in %s", observer, event)
+
+
+def register_path_templates(templates):
+    """
+    Register the path templates of endpoints, such as the paths of the endpoint specs the engine builds the SDK
+    methods from, so that get_path_template returns the template a path matches rather than one derived from the
+    segments of the path.  A placeholder matches a single segment, except a {full_path} placeholder after
+    by_path, which matches the rest of the path.  Templates are only compiled once a path of their resource is
+    looked up, so registering them costs little.
+
+    :param templates: The templates, relative to the /api path of Canvas, e.g. '/v1/courses/{course_id}/pages/{url}'
+    """
+    with _path_templates_lock:
+        for template in templates:
+            segments = template.split('/')
+            if len(segments) > 2 and '{' not in segments[2]:
+                _pending_path_templates.setdefault(segments[2], []).append(template)
+        get_path_template.cache_clear()
+
+
+def compile_path_template(template):
+    """
+    Return the pattern that matches the paths of a template
+    """
+    segments = template.split('/')
+    parts = []
+    for index, segment in enumerate(segments):
+        if index > 0 and segments[index - 1] in PATH_SEGMENTS and segment.startswith('{'):
+            parts.append('.+')
+        else:
+            parts.append(''.join('[^/]+' if part.startswith('{') else re.escape(part)
+                                 for part in re.split(r'(\{[^}]*\})', segment) if part))
+    return re.compile('/'.join(parts) + '$')
+
+
+def get_path_templates(resource):
+    """
+    Return the (pattern, template) pairs of the registered templates of a resource, compiling the ones registered
+    since the last lookup.  The templates with the most literal segments come first, so that a path such as
+    /v1/courses/1/pages/front_page matches /pages/front_page rather than /pages/{url}.
+    """
+    with _path_templates_lock:
+        pending = _pending_path_templates.pop(resource, None)
+        templates = _path_templates.get(resource, [])
+        if pending:
+            known = set(template for _, template in templates)
+            templates = templates + [(compile_path_template(template), template)
+                                     for template in sorted(set(pending) - known)]
+            templates.sort(key=lambda item: -sum(1 for segment in item[1].split('/') if '{' not in segment))
+            _path_templates[resource] = templates
+        return templates
+
+
+@lru_cache(maxsize=2048)
+def get_path_template(path):
+    """
+    Return the endpoint template of the path of a request url, used to name metrics and spans and to key page
+    sizes (see get_endpoint_template).  Cached, as a client calls the same few paths over and over.
+    """
+    if '/api/' in path:
+        path = path[path.index('/api/') + len('/api'):]
+    segments = path.split('/')
+    if len(segments) > 2:
+        for pattern, template in get_path_templates(segments[2]):
+            if pattern.match(path):
+                return template
+    for index in range(2, len(segments)):
+        previous = segments[index - 1]
+        if previous in PATH_SEGMENTS:
+            return '/'.join(segments[:index] + [PATH_SEGMENTS[previous]])
+        if previous in NAME_SEGMENTS:
+            segments[index] = NAME_SEGMENTS[previous]
+        elif ID_SEGMENT.match(segments[index]) and not previous.startswith('{'):
+            if index == len(segments) - 1:
+                segments[index] = '{id}'
+            else:
+                segments[index] = '{%s_id}' % get_singular(previous)
+    return '/'.join(segments)
+
+
+def get_endpoint_template(url):
+    """
+    Return the template of the endpoint a url calls, with its ids replaced by placeholders named after the
+    resource they identify, the way the Canvas API documents its endpoints.  A trailing id becomes {id}.  The
+    template is relative to the /api path of Canvas, and query params are dropped.  For example
+    ``https://canvas.example.edu/api/v1/courses/123/assignments/45/submissions?page=2`` becomes
+    ``/v1/courses/{course_id}/assignments/{assignment_id}/submissions``.
+
+    Templates keep the number of distinct endpoints low enough to label metrics with.  The paths of the endpoints
+    of the SDK methods get the template of their endpoint spec (see register_path_templates).  Other paths get
+    placeholders named after the preceding path segment, which can differ from those in the Canvas documentation
+    (e.g. {discussion_topic_id} for {topic_id}); the names of wiki pages become {url} and the paths of folders
+    resolved by_path become {full_path}.
+    """
+    return get_path_template(urlsplit(url).path)
+
+
+def get_singular(name):
+    if name.endswith('ies'):
+        return name[:-3] + 'y'
+    if name.endswith('zzes'):  # quizzes
+        return name[:-3]
+    if name.endswith(('sses', 'xes')):
+        return name[:-2]
+    if name.endswith('s'):
+        return name[:-1]
+    return name
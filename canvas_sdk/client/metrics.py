@@ -0,0 +1,150 @@
+import bisect
+import threading
+from collections import Counter
+
+from .hooks import RequestObserver, get_endpoint_template
+
+"""
+Upper bounds, in seconds, of the latency histogram buckets of a MetricsCollector.  Latencies above the last bound
+fall in a final +Inf bucket.
+"""
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class EndpointMetrics(object):
+
+    """
+    The metrics a :class:`MetricsCollector` keeps for one endpoint template and HTTP method.  The latency
+    histogram counts the responses in each bucket, not cumulatively; the last count is the +Inf bucket.
+    """
+
+    __slots__ = ('responses', 'latency_counts', 'latency_sum', 'bytes', 'statuses', 'retries', 'errors')
+
+    def __init__(self, bucket_count):
+        self.responses = 0
+        self.latency_counts = [0] * (bucket_count + 1)
+        self.latency_sum = 0.0
+        self.bytes = 0
+        self.statuses = Counter()
+        self.retries = 0
+        self.errors = 0
+
+
+class MetricsCollector(RequestObserver):
+
+    """
+    A request observer that aggregates response latencies, response sizes, status codes, retries and errors
+    per HTTP method and endpoint template (see :py:func:`client.hooks.get_endpoint_template`), e.g.
+    ``('GET', '/v1/courses/{course_id}/enrollments')``, so that they can be exported to a monitoring system
+    without a label for every course.  Safe to share between threads and request contexts::
+
+        metrics = MetricsCollector()
+        request_context = RequestContext(token, url, observers=[metrics])
+        ...
+        print(metrics.render_prometheus())
+
+    :param buckets: (optional) The ascending upper bounds, in seconds, of the latency histogram buckets.
+        Defaults to DEFAULT_LATENCY_BUCKETS.
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def get_endpoint_metrics(self, action, url):
+        key = (action, get_endpoint_template(url))
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints.setdefault(key, EndpointMetrics(len(self.buckets)))
+        return metrics
+
+    def after_response(self, action, url, response, elapsed, attempt):
+        bucket = bisect.bisect_left(self.buckets, elapsed)
+        size = len(response.content or b'')
+        with self._lock:
+            metrics = self.get_endpoint_metrics(action, url)
+            metrics.responses += 1
+            metrics.latency_counts[bucket] += 1
+            metrics.latency_sum += elapsed
+            metrics.bytes += size
+            metrics.statuses[response.status_code] += 1
+
+    def on_retry(self, action, url, response, attempt, delay):
+        with self._lock:
+            self.get_endpoint_metrics(action, url).retries += 1
+
+    def on_error(self, action, url, error, attempt):
+        with self._lock:
+            self.get_endpoint_metrics(action, url).errors += 1
+
+    def get_metrics(self):
+        """
+        Return a snapshot of the metrics, as a dict mapping (action, endpoint template) pairs to dicts with the
+        keys responses, latency_sum, latency_buckets (a list of (upper bound, cumulative count) pairs ending with
+        the +Inf bucket), bytes, statuses (a dict of counts by status code), retries and errors.
+        """
+        with self._lock:
+            snapshot = {}
+            for key, metrics in self._endpoints.items():
+                cumulative, latency_buckets = 0, []
+                for bound, count in zip(self.buckets + (float('inf'),), metrics.latency_counts):
+                    cumulative += count
+                    latency_buckets.append((bound, cumulative))
+                snapshot[key] = {
+                    'responses': metrics.responses,
+                    'latency_sum': metrics.latency_sum,
+                    'latency_buckets': latency_buckets,
+                    'bytes': metrics.bytes,
+                    'statuses': dict(metrics.statuses),
+                    'retries': metrics.retries,
+                    'errors': metrics.errors,
+                }
+            return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def render_prometheus(self, prefix='canvas_sdk'):
+        """
+        Return the metrics in the Prometheus text exposition format, labelled with method and endpoint
+        """
+        snapshot = sorted(self.get_metrics().items())
+        lines = []
+
+        def add_metric(name, metric_type, help_text, samples):
+            lines.append('# HELP %s_%s %s' % (prefix, name, help_text))
+            lines.append('# TYPE %s_%s %s' % (prefix, name, metric_type))
+            lines.extend('%s_%s%s %s' % (prefix, suffix, format_labels(labels), format_value(value))
+                         for suffix, labels, value in samples)
+
+        histogram = []
+        for (action, template), metrics in snapshot:
+            labels = [('method', action), ('endpoint', template)]
+            for bound, count in metrics['latency_buckets']:
+                histogram.append(('request_duration_seconds_bucket', labels + [('le', format_value(bound))], count))
+            histogram.append(('request_duration_seconds_sum', labels, metrics['latency_sum']))
+            histogram.append(('request_duration_seconds_count', labels, metrics['responses']))
+        add_metric('request_duration_seconds', 'histogram', 'Latency of Canvas API responses.', histogram)
+        add_metric('responses_total', 'counter', 'Canvas API responses by status code.', [
+            ('responses_total', [('method', action), ('endpoint', template), ('status', str(status))], count)
+            for (action, template), metrics in snapshot for status, count in sorted(metrics['statuses'].items())])
+        for name, key, help_text in (('response_bytes_total', 'bytes', 'Bytes received in Canvas API responses.'),
+                                     ('retries_total', 'retries', 'Canvas API requests retried.'),
+                                     ('errors_total', 'errors', 'Canvas API requests that failed.')):
+            add_metric(name, 'counter', help_text, [
+                (name, [('method', action), ('endpoint', template)], metrics[key])
+                for (action, template), metrics in snapshot])
+        return '\n'.join(lines) + '\n'
+
+
+def format_labels(labels):
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{%s}' % ','.join('%s="%s"' % (name, value) for (name, _), value in zip(labels, escaped))
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,166 @@
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from .hooks import get_endpoint_template
+
+"""
+The largest page size Canvas honors for paginated list endpoints
+"""
+MAX_PER_PAGE = 100
+
+"""
+Statuses of a failed page that asking for a smaller page may avoid: the server erred or timed out building it
+"""
+PAGE_SIZE_ERROR_CODES = (
+    requests.codes['internal_server_error'],  # 500
+    requests.codes['bad_gateway'],  # 502
+    requests.codes['service_unavailable'],  # 503
+    requests.codes['gateway_timeout'],  # 504
+)
+
+
+def get_page_size(url, params=None):
+    """
+    Return the per_page a GET request asks for, from its params or the query of its url (as in the "next" links
+    of Canvas), or None if it doesn't ask for one
+    """
+    per_page = params.get('per_page') if isinstance(params, dict) else None
+    if per_page is None:
+        per_page = dict(parse_qsl(urlsplit(url).query)).get('per_page')
+    try:
+        return int(per_page) if per_page is not None else None
+    except ValueError:
+        return None
+
+
+def can_resize_page(url, params=None):
+    """
+    Return True if a request for a page can ask for a different page size and still get the items that follow
+    the previous page: the first page of a list, or a page of a bookmark cursor.  Numbered pages can't, since the
+    page numbers of the rest of the list (e.g. those computed by utils.get_remaining_page_urls) depend on the page
+    size.
+    """
+    page = params.get('page') if isinstance(params, dict) else None
+    if page is None:
+        page = dict(parse_qsl(urlsplit(url).query)).get('page')
+    return page is None or str(page) == '1' or str(page).startswith('bookmark:')
+
+
+def set_page_size(url, params, per_page):
+    """
+    Return the url and params of a request changed to ask for pages of per_page items
+    """
+    if isinstance(params, dict) and 'per_page' in params:
+        return url, dict(params, per_page=per_page)
+    parts = urlsplit(url)
+    query = [(key, str(per_page) if key == 'per_page' else value)
+             for key, value in parse_qsl(parts.query, keep_blank_values=True)]
+    return urlunsplit(parts._replace(query=urlencode(query))), params
+
+
+class PageSizePolicy(object):
+
+    """
+    Chooses the page size of the list requests of a :class:`RequestContext`, per endpoint template (see
+    :py:func:`client.hooks.get_endpoint_template`), so that lists are fetched in as few round trips as Canvas
+    allows.  The SDK methods of paginated endpoints ask for max_per_page items unless per_page is passed, and
+    the policy adapts the size it asks for as it learns:
+
+    * When Canvas caps the page size (its "next" and "current" links carry the per_page it actually used), the
+      cap is remembered and asked for from then on.
+    * When a page fails with a 5xx error or a read timeout, the size of the endpoint is shrunk by shrink_factor
+      and, if the request has retries left (see max_retries), it is retried with the smaller size after the
+      backoff delay.  Only the first page of a list, or a page of a bookmark cursor, is retried that way; a
+      numbered page is retried as usual, and the smaller size is used by the next list, as it is when no
+      retries are left.
+    * After grow_after pages of an endpoint have succeeded in a row at a shrunk size, the size is grown back
+      towards the cap.
+
+    A policy is safe to share between threads and request contexts.  Only the blocking client uses it.
+
+    :param int max_per_page: (optional) The page size asked for at first.  Defaults to 100, the most Canvas
+        allows by default.
+    :param int min_per_page: (optional) The smallest size pages are shrunk to.  Defaults to 10.
+    :param float shrink_factor: (optional) How much smaller a page gets after a failure.  Defaults to 0.5.
+    :param int grow_after: (optional) The successful pages after which a shrunk size is grown again, or None to
+        never grow.  Defaults to 50.
+    """
+
+    def __init__(self, max_per_page=MAX_PER_PAGE, min_per_page=10, shrink_factor=0.5, grow_after=50):
+        if not 0 < shrink_factor < 1:
+            raise ValueError("shrink_factor must be between 0 and 1.")
+        self.max_per_page = max_per_page
+        self.min_per_page = min_per_page
+        self.shrink_factor = shrink_factor
+        self.grow_after = grow_after
+        self._sizes = {}
+        self._caps = {}
+        self._streaks = {}
+        self._lock = threading.Lock()
+
+    def get_per_page(self, url):
+        """
+        Return the page size to ask for from the endpoint a url calls
+        """
+        return self._sizes.get(get_endpoint_template(url), self.max_per_page)
+
+    def get_sizes(self):
+        """
+        Return the page sizes learned so far, by endpoint template
+        """
+        with self._lock:
+            return dict(self._sizes)
+
+    def get_caps(self):
+        """
+        Return the page size caps detected so far, by endpoint template
+        """
+        with self._lock:
+            return dict(self._caps)
+
+    def record_page(self, url, per_page, response):
+        """
+        Learn from the successful response to a request for a page of per_page items
+        """
+        template = get_endpoint_template(url)
+        links = response.links
+        link = links.get('current') or links.get('next')
+        used = get_page_size(link['url']) if link else None
+        with self._lock:
+            if used is not None and used < per_page:
+                self._caps[template] = used
+                self._sizes[template] = min(used, self._sizes.get(template, used))
+                self._streaks.pop(template, None)
+                return
+            size = self._sizes.get(template)
+            if size is None or self.grow_after is None:
+                return
+            cap = self._caps.get(template, self.max_per_page)
+            if size >= cap:
+                return
+            streak = self._streaks.get(template, 0) + 1
+            if streak < self.grow_after:
+                self._streaks[template] = streak
+                return
+            self._streaks.pop(template, None)
+            grown = min(cap, int(size / self.shrink_factor))
+            if grown >= self.max_per_page and template not in self._caps:
+                del self._sizes[template]
+            else:
+                self._sizes[template] = grown
+
+    def shrink(self, url, per_page):
+        """
+        Learn that a request for a page of per_page items failed in a way a smaller page may avoid, and return
+        the smaller page size to ask for, or None if the page can't get any smaller
+        """
+        template = get_endpoint_template(url)
+        smaller = max(self.min_per_page, int(per_page * self.shrink_factor))
+        if smaller >= per_page:
+            return None
+        with self._lock:
+            self._sizes[template] = min(smaller, self._sizes.get(template, smaller))
+            self._streaks.pop(template, None)
+        return smaller
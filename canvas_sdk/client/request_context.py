@@ -1,6 +1,11 @@
 # request_context.py
+import threading
+
 import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 from .auth import OAuth2Bearer
+from .backoff import DEFAULT_BACKOFF
+from .decoder import DEFAULT_JSON_DECODER
 from urllib.parse import urlparse
 
 
@@ -26,6 +31,49 @@ class RequestContext(object):
     :type verify: boolean or str
     :param cert: (optional) if String, path to ssl client cert file (.pem).  If Tuple, ('cert', 'key') pair.
     :type cert: str or Tuple
+    :param int page_workers: (optional) When greater than 1, paged list data whose "last" link carries a numeric page number is
+        fetched by a pool of this many threads instead of walking the "next" links one page at a time.
+    :param int prefetch_pages: (optional) When set, paged list data walked through "next" links is fetched this many pages
+        ahead by a background thread, so that downloading the next page overlaps with processing the current one.  See
+        :py:func:`canvas_sdk.utils.prefetch_next`.
+    :param page_size_policy: (optional) Chooses the page size of list requests: the SDK methods of paginated endpoints ask
+        for the largest page Canvas allows instead of per_page, and the policy learns the caps and shrinks the pages of
+        endpoints whose large pages fail.
+    :type page_size_policy: :class:`PageSizePolicy <canvas_sdk.client.paging.PageSizePolicy>` or None
+    :param backoff: (optional) The policy that determines how long to wait before retrying a failed request.  Defaults to
+        exponential backoff with full jitter that honors Retry-After headers; None retries immediately.
+    :type backoff: :class:`Backoff <canvas_sdk.client.backoff.Backoff>` or None
+    :param throttle: (optional) A throttle that tracks the Canvas rate limit headers and delays requests before the quota
+        of the access token runs out.  May be shared by contexts that use the same token.
+    :type throttle: :class:`Throttle <canvas_sdk.client.throttle.Throttle>` or None
+    :param int pool_connections: (optional) The number of connection pools (one per host) to cache.  Defaults to 10.
+    :param int pool_maxsize: (optional) The maximum number of connections kept open per host.  Should be at least the
+        number of threads sharing the context, or connections get discarded and re-opened.  Defaults to 10.
+    :param bool pool_block: (optional) Whether a request waits for a free connection when the pool is exhausted,
+        rather than opening an extra connection that is discarded afterwards.  Defaults to False.
+    :param bool keep_alive: (optional) Whether connections are kept open and reused between requests.  Defaults to True.
+    :param bool session_per_thread: (optional) Whether each thread using the context gets its own requests.Session
+        instead of sharing one.  Defaults to False.
+    :param etag_cache: (optional) A cache of GET responses used to make conditional requests with If-None-Match.  Cached
+        bodies are returned when Canvas answers 304 Not Modified.
+    :type etag_cache: :class:`ETagCache <canvas_sdk.client.cache.ETagCache>` or None
+    :param response_cache: (optional) A time-to-live cache that answers GET requests for the endpoints it is configured
+        for without contacting Canvas.
+    :type response_cache: :class:`ResponseCache <canvas_sdk.client.cache.ResponseCache>` or None
+    :param single_flight: (optional) Coalesces concurrent GET requests with the same url, params and token into a single
+        request whose result is shared by every caller.
+    :type single_flight: :class:`SingleFlight <canvas_sdk.client.coalesce.SingleFlight>` or None
+    :param json_decoder: (optional) A callable that decodes the body of a response, given as bytes, into json.  Used by the
+        pagination helpers in :py:mod:`canvas_sdk.utils` and when parsing API errors.  Defaults to orjson or ujson when one
+        of them is installed, else the standard library json module; None uses ``response.json()``.
+    :param observers: (optional) Objects notified before every request attempt and of its response, retry or error, such as
+        a :class:`MetricsCollector <canvas_sdk.client.metrics.MetricsCollector>`.
+    :type observers: list of :class:`RequestObserver <canvas_sdk.client.hooks.RequestObserver>`
+    :param tracer: (optional) An OpenTelemetry tracer, e.g. from :py:func:`canvas_sdk.client.tracing.get_tracer`, that records a
+        span for every request attempt and for the paged lists fetched by :py:mod:`canvas_sdk.utils`.  Defaults to None, no tracing.
+    :param cassette: (optional) Records the responses to the requests sent with the session of the context to a file, or in
+        replay mode serves recorded responses instead of sending the requests.
+    :type cassette: :class:`Cassette <canvas_sdk.client.cassette.Cassette>` or None
     """
 
     @classmethod
@@ -39,8 +87,16 @@ class RequestContext(object):
         }
         return default_headers
 
-    def __init__(self, auth_token, base_api_url, max_retries=0, per_page=None, headers=None, cookies=None, timeout=None, proxies=None, verify=True, cert=None):
+    def __init__(self, auth_token, base_api_url, max_retries=0, per_page=None, headers=None, cookies=None, timeout=None, proxies=None, verify=True, cert=None,
+                 page_workers=None, backoff=DEFAULT_BACKOFF, throttle=None, pool_connections=DEFAULT_POOLSIZE,
+                 pool_maxsize=DEFAULT_POOLSIZE, pool_block=DEFAULT_POOLBLOCK, keep_alive=True, session_per_thread=False,
+                 etag_cache=None, response_cache=None, single_flight=None, json_decoder=DEFAULT_JSON_DECODER,
+                 observers=None, tracer=None, cassette=None, prefetch_pages=None,
+                 page_size_policy=None):
         self._session = None
+        self._session_lock = threading.Lock()
+        self._session_generation = 0
+        self._thread_local = threading.local()
         self.auth_token = auth_token
         self.per_page = per_page
         parsed_url = urlparse(base_api_url)
@@ -58,6 +114,40 @@ class RequestContext(object):
         self.verify = verify
         self.cert = cert
         self.max_retries = max_retries
+        self.page_workers = page_workers
+        self.prefetch_pages = prefetch_pages
+        self.page_size_policy = page_size_policy
+        self.backoff = backoff
+        self.throttle = throttle
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.session_per_thread = session_per_thread
+        self.etag_cache = etag_cache
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.json_decoder = json_decoder
+        self.observers = list(observers or ())
+        self.tracer = tracer
+        self.cassette = cassette
+
+    def __getstate__(self):
+        """
+        Pickle and deepcopy the configuration of the context without its sessions and locks, which a copy
+        creates anew
+        """
+        state = self.__dict__.copy()
+        for name in ('_session', '_session_lock', '_thread_local'):
+            state.pop(name, None)
+        state['_session_generation'] = 0
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._thread_local = threading.local()
 
     @property
     def auth(self):
@@ -66,6 +156,37 @@ class RequestContext(object):
         """
         return OAuth2Bearer(self.auth_token)
 
+    def create_session(self):
+        """
+        Create a new requests.Session instance configured with the session related values of the context,
+        with an adapter whose connection pool is sized by pool_connections, pool_maxsize and pool_block.
+        """
+        session = requests.Session()
+        # Streaming is disabled by default when creating a requests.Session
+        # object, but let's be explicit here to prevent connections from staying
+        # open indefinitely
+        session.stream = False
+        session.auth = self.auth
+        session.headers.update(self.headers or {})
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        session.timeout = self.timeout
+        session.cert = self.cert
+        session.verify = self.verify
+        # We only need to set proxies and cookies if not None or empty since the
+        # defaults are empty dicts
+        if self.proxies:
+            session.proxies = self.proxies
+        if self.cookies:
+            session.cookies = self.cookies
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                              pool_block=self.pool_block)
+        if self.cassette is not None:
+            adapter = self.cassette.get_adapter(adapter)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     @property
     def session(self):
         """
@@ -75,32 +196,37 @@ class RequestContext(object):
         the session object: http://docs.python-requests.org/
         NOTE: Refer to the setup.py file to match up the version of the Requests library the SDK uses
         with the right doc version.
+
+        The session is created lazily and the creation is thread-safe, so a single context can be shared
+        by a pool of threads.  If session_per_thread is set, each thread gets (and the setter sets) its
+        own session instead.
         """
+        if self.session_per_thread:
+            thread_session = getattr(self._thread_local, 'session', None)
+            if thread_session is None or self._thread_local.generation != self._session_generation:
+                self._thread_local.session = self.create_session()
+                self._thread_local.generation = self._session_generation
+            return self._thread_local.session
         if not self._session:
-            self._session = requests.Session()
-            # Streaming is disabled by default when creating a requests.Session
-            # object, but let's be explicit here to prevent connections from staying
-            # open indefinitely
-            self._session.stream = False
-            self._session.auth = self.auth
-            self._session.headers.update(self.headers or {})
-            self._session.timeout = self.timeout
-            self._session.cert = self.cert
-            self._session.verify = self.verify
-            # We only need to set proxies and cookies if not None or empty since the
-            # defaults are empty dicts
-            if self.proxies:
-                self._session.proxies = self.proxies
-            if self.cookies:
-                self._session.cookies = self.cookies
+            with self._session_lock:
+                # Check again now that we hold the lock, another thread may have won the race
+                if not self._session:
+                    self._session = self.create_session()
         return self._session
 
     @session.setter
     def session(self, sess):
-        self._session = sess
+        if self.session_per_thread:
+            self._thread_local.session = sess
+            self._thread_local.generation = self._session_generation
+        else:
+            self._session = sess
 
     def expire_session(self):
         """
-        To expire a session, it just needs to be set to None according to requests doc.
+        To expire a session, it just needs to be set to None according to requests doc.  When using
+        per-thread sessions, the sessions of all threads are expired and recreated on next access.
         """
-        self.session = None
+        with self._session_lock:
+            self._session_generation += 1
+            self._session = None
@@ -0,0 +1,97 @@
+import threading
+import time
+
+"""
+Canvas reports its rate limiting state in these response headers.  See
+https://canvas.instructure.com/doc/api/file.throttling.html
+"""
+RATE_LIMIT_REMAINING_HEADER = 'X-Rate-Limit-Remaining'
+REQUEST_COST_HEADER = 'X-Request-Cost'
+
+
+class Throttle(object):
+
+    """
+    Client side throttle that tracks the Canvas rate limiting bucket from the ``X-Rate-Limit-Remaining``
+    and ``X-Request-Cost`` response headers and slows callers down before the quota runs out.  Canvas
+    refills the bucket at a steady rate, so the throttle projects the remaining quota forward in time and
+    reserves the expected cost of every request it lets through.  When the projected quota drops below
+    ``min_remaining`` callers are delayed until enough of the bucket has refilled.  A single throttle is
+    safe to share between threads (and between request contexts that use the same access token).
+
+    :param float min_remaining: (optional) The quota that should be left in the bucket.  Requests that would
+        take the projected quota below this value are delayed.  Defaults to 100.
+    :param float refill_rate: (optional) The rate, in quota units per second, at which Canvas refills the
+        bucket.  Defaults to 10.
+    :param float capacity: (optional) The size of the bucket.  Defaults to 700, the Canvas default.
+    :param float max_wait: (optional) The longest delay in seconds that is applied to a single request.
+        Defaults to 30.
+    """
+
+    def __init__(self, min_remaining=100.0, refill_rate=10.0, capacity=700.0, max_wait=30.0):
+        if refill_rate <= 0:
+            raise ValueError("refill_rate must be a positive number.")
+        self.min_remaining = min_remaining
+        self.refill_rate = refill_rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self.remaining = None  # Unknown until Canvas reports it
+        self.request_cost = 1.0  # Running estimate of the cost of a request
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def get_available(self, now=None):
+        """
+        Return the projected quota at the given monotonic time (defaults to now), or None if Canvas
+        has not reported the quota yet.
+        """
+        if self.remaining is None:
+            return None
+        if now is None:
+            now = time.monotonic()
+        return min(self.capacity, self.remaining + (now - self._updated_at) * self.refill_rate)
+
+    def reserve(self):
+        """
+        Reserve quota for a request that is about to be sent and return the number of seconds the
+        caller should wait before sending it.  The caller is responsible for waiting, which allows the
+        throttle to be used by both blocking and asyncio clients.
+
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            available = self.get_available(now)
+            if available is None:
+                return 0.0
+            delay = 0.0
+            if available - self.request_cost < self.min_remaining:
+                delay = min(self.max_wait,
+                            (self.min_remaining + self.request_cost - available) / self.refill_rate)
+            # Book the request at the time it will actually be sent, so that concurrent callers queue
+            # up behind it instead of all being released at once
+            self.remaining = available + delay * self.refill_rate - self.request_cost
+            self._updated_at = now + delay
+            return delay
+
+    def update(self, response):
+        """
+        Update the bucket from the rate limiting headers of a response.  Responses without the headers
+        leave the throttle unchanged.
+
+        :param response: The :class:`requests.Response` of a completed request
+        """
+        try:
+            remaining = float(response.headers[RATE_LIMIT_REMAINING_HEADER])
+        except (KeyError, TypeError, ValueError):
+            return
+        try:
+            cost = float(response.headers[REQUEST_COST_HEADER])
+        except (KeyError, TypeError, ValueError):
+            cost = None
+        with self._lock:
+            self.remaining = remaining
+            self._updated_at = time.monotonic()
+            if cost is not None:
+                # Exponential moving average so a single expensive request doesn't dominate
+                self.request_cost = 0.8 * self.request_cost + 0.2 * cost
@@ -0,0 +1,120 @@
+"""
+Optional OpenTelemetry tracing of Canvas API requests.  A :class:`RequestContext` given a tracer (e.g.
+``tracing.get_tracer()``) records a client span for every attempt of every request made by
+:py:func:`client.base.call` and :py:func:`client.aio.call`, and the pagination helpers in :py:mod:`canvas_sdk.utils`
+wrap the requests of a paged list in a parent span counting its pages and bytes.  Without a tracer nothing is
+recorded and no tracing code runs.  Requires the optional ``opentelemetry-api`` dependency
+(``pip install canvas_python_sdk[tracing]``) and an OpenTelemetry SDK configured to export the spans.
+
+Span attributes follow the OpenTelemetry semantic conventions where one applies:
+
+* ``http.request.method``, ``url.full`` and ``url.template`` (the endpoint template, see
+  :py:func:`client.hooks.get_endpoint_template`)
+* ``http.response.status_code`` and ``error.type`` for failed attempts
+* ``http.request.resend_count``: the zero-based number of the attempt
+* ``canvas.request_cost``: the ``X-Request-Cost`` Canvas charged against the rate limit
+* ``canvas.page_count`` and ``canvas.bytes`` on the spans of paged lists
+"""
+from contextlib import contextmanager
+
+from .hooks import get_endpoint_template
+from .throttle import REQUEST_COST_HEADER
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None
+
+
+def get_tracer(name='canvas_sdk'):
+    """
+    Return the OpenTelemetry tracer of the SDK, from the globally configured tracer provider
+    """
+    if trace is None:
+        raise ImportError("The opentelemetry-api package is required for tracing.")
+    return trace.get_tracer(name)
+
+
+def start_call_span(tracer, action, url, attempt):
+    """
+    Start the span of an attempt of a request.  The span isn't made current; end it with end_call_span.
+    """
+    template = get_endpoint_template(url)
+    attributes = {
+        'http.request.method': action,
+        'url.full': url,
+        'url.template': template,
+        'http.request.resend_count': attempt,
+    }
+    if trace is not None:
+        return tracer.start_span('%s %s' % (action, template), kind=trace.SpanKind.CLIENT, attributes=attributes)
+    return tracer.start_span('%s %s' % (action, template), attributes=attributes)
+
+
+def end_call_span(span, response=None, error=None):
+    """
+    End the span of an attempt with the response received, or the error raised if there was no response
+    """
+    if response is not None:
+        span.set_attribute('http.response.status_code', response.status_code)
+        request_cost = response.headers.get(REQUEST_COST_HEADER)
+        if request_cost:
+            try:
+                span.set_attribute('canvas.request_cost', float(request_cost))
+            except ValueError:
+                pass
+        if response.status_code >= 400:
+            set_error(span, str(response.status_code))
+    if error is not None:
+        span.record_exception(error)
+        set_error(span, type(error).__name__)
+    span.end()
+
+
+def set_error(span, error_type):
+    span.set_attribute('error.type', error_type)
+    if trace is not None:
+        span.set_status(trace.Status(trace.StatusCode.ERROR))
+
+
+def start_list_span(tracer, name, function=None):
+    """
+    Start the parent span of the requests of a paged list, named after the pagination helper.  The span isn't
+    made current; see use_span.
+    """
+    attributes = {'code.function': getattr(function, '__name__', repr(function))} if function is not None else {}
+    return tracer.start_span('canvas_sdk.%s' % name, attributes=attributes)
+
+
+def end_list_span(span, page_count, byte_count):
+    span.set_attribute('canvas.page_count', page_count)
+    span.set_attribute('canvas.bytes', byte_count)
+    span.end()
+
+
+@contextmanager
+def use_span(span):
+    """
+    Make span the current span while the block runs, so that the spans started in it (from any thread) are its
+    children.  Exceptions raised by the block are recorded on the span.
+    """
+    if trace is not None:
+        with trace.use_span(span, end_on_exit=False):
+            yield span
+        return
+    try:
+        yield span
+    except Exception as error:
+        span.record_exception(error)
+        set_error(span, type(error).__name__)
+        raise
+
+
+def get_current_span():
+    """
+    Return the current span, or None if no span is current or OpenTelemetry isn't installed
+    """
+    if trace is None:
+        return None
+    span = trace.get_current_span()
+    return span if span.get_span_context().is_valid else None
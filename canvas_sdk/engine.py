@@ -0,0 +1,302 @@
+import inspect
+import keyword
+import sys
+import threading
+from collections import namedtuple
+from string import Formatter
+
+from canvas_sdk import client, utils
+from canvas_sdk.client.hooks import register_path_templates
+
+"""
+The engine builds the SDK methods in :py:mod:`canvas_sdk.methods` from a table of endpoint specs, emitted by
+scripts/generate_sdk_methods.py, instead of the methods being written out one function at a time.  Everything
+a method needs that doesn't depend on its arguments (the path template, the payload keys and the sets of
+acceptable values) is worked out once, when the method is first used, and each method is compiled with the exact
+signature its spec declares, so methods are called, introspected and documented as if they were written out.
+
+Every paginated endpoint (one whose spec has a per_page argument, which the generator adds to the endpoints that
+return arrays) also gets an iter_<name> companion that streams the items of all its pages.
+"""
+
+"""
+The prefix of the names of the streaming companions of paginated endpoints
+"""
+ITER_PREFIX = 'iter_'
+
+
+class Endpoint(namedtuple('Endpoint', 'name method path args payload choices doc')):
+
+    """
+    The spec of a Canvas API endpoint, from which build_methods builds the SDK method that calls it.  For example::
+
+        Endpoint(
+            'list_course_sections', 'GET', '/v1/courses/{course_id}/sections',
+            'course_id, include=None, per_page=None',
+            payload=('include[]', 'per_page'),
+            choices={'include': ('students', 'avatar_url')},
+            doc=\"\"\"Returns the list of sections for this course.\"\"\")
+
+    :param str name: The name of the method
+    :param str method: The HTTP method of the endpoint, e.g. 'GET'
+    :param str path: The path of the endpoint relative to the base_api_url of the request context.  Its
+        {placeholders} are filled in with the arguments of the same name.
+    :param str args: The arguments of the method following request_ctx, as written in its signature.  Required
+        arguments come first; optional arguments default to None.  A per_page argument defaults to the size the
+        page size policy of the request context picks, if it has one, else to the per_page of the context.
+    :param payload: (optional) The payload keys, in the order they are sent.  A key is sent with the value of the
+        argument named by get_argument_name, or a (key, argument) pair names the argument explicitly.  Keys
+        whose argument is None are left out of the payload.
+    :param dict choices: (optional) Mapping of arguments to the tuple of values they accept
+    :param str doc: (optional) The docstring of the method
+    """
+
+    __slots__ = ()
+
+    @property
+    def arg_names(self):
+        """
+        The names of the arguments of the method following request_ctx, in order
+        """
+        return [arg.split('=')[0].strip() for arg in self.args.split(',') if arg.strip()]
+
+    @property
+    def paginated(self):
+        """
+        Whether the endpoint returns pages of results, and so gets an iter_<name> companion
+        """
+        return 'per_page' in self.arg_names
+
+    @property
+    def payload_args(self):
+        """
+        The (key, argument) pairs of the payload, in order
+        """
+        return [(item, get_argument_name(item)) if isinstance(item, str) else tuple(item) for item in self.payload]
+
+
+Endpoint.__new__.__defaults__ = ((), None, None)
+
+
+def get_argument_name(key):
+    """
+    Return the name of the argument that holds the value of a payload key, the way the generator names it:
+    brackets are flattened into underscores, so 'course[name]' is sent from course_name, a trailing '[]' (an
+    array parameter) is dropped and python keywords are prefixed with 'var_'.
+    """
+    if key.endswith('[]'):
+        key = key[:-2]
+    name = key.replace('<', '').replace('>', '').replace(']', '').replace('[', '_')
+    if name.startswith('_'):
+        name = name[1:]
+    return 'var_' + name if keyword.iskeyword(name) else name
+
+
+def validate_choice(value, choices, acceptable_values):
+    """
+    Fast path of utils.validate_attr_is_acceptable for a frozenset of choices.  Values it can't accept (or can't
+    hash) are handed to utils.validate_attr_is_acceptable, which raises the usual AttributeError.
+    """
+    values = value if type(value) in (list, tuple) else (value,)
+    try:
+        for v in values:
+            if v is not None and v not in choices:
+                break
+        else:
+            return
+    except TypeError:  # An unhashable value, e.g. a dict
+        pass
+    utils.validate_attr_is_acceptable(value, acceptable_values)
+
+
+def get_per_page(request_ctx, url):
+    """
+    Return the per_page of a call to a paginated endpoint that wasn't given one: the size the page size policy of
+    the request context picks for the url, or else the per_page of the context
+    """
+    # Looked up leniently, as the methods have only ever needed the base_api_url and per_page of a context
+    policy = getattr(request_ctx, 'page_size_policy', None)
+    if policy is None:
+        return request_ctx.per_page
+    return policy.get_per_page(url)
+
+
+def get_method_source(endpoint, index):
+    """
+    Return the source of the method of an endpoint.  Constants are referenced as globals named after the index of
+    the endpoint, which build_methods defines.  Names the method uses besides its arguments start with an
+    underscore, so they can't clash with an argument.
+    """
+    arg_names = endpoint.arg_names
+    for _, field, _, _ in Formatter().parse(endpoint.path):
+        if field is not None and field not in arg_names:
+            raise ValueError("Path %r of %s has no argument %r" % (endpoint.path, endpoint.name, field))
+    args = ''.join(arg.strip() + ', ' for arg in endpoint.args.split(',') if arg.strip())
+    lines = ['def %s(request_ctx, %s**request_kwargs):' % (endpoint.name, args)]
+    # The path becomes an f-string, so it is formatted without parsing the template on every call
+    url = 'request_ctx.base_api_url + f%r' % endpoint.path
+    if endpoint.paginated:
+        # The page size policy of the context needs the url to pick the per_page of the endpoint
+        lines.append('    _url = %s' % url)
+        lines.append('    if per_page is None:')
+        lines.append('        per_page = _get_per_page(request_ctx, _url)')
+        url = '_url'
+    for arg in endpoint.choices or ():
+        lines.append('    if %s is not None:' % arg)
+        lines.append('        _validate_choice(%s, _choices_%d_%s, _values_%d_%s)' % (arg, index, arg, index, arg))
+    payload = ''
+    if endpoint.payload:
+        lines.append('    _payload = {}')
+        for key, arg in endpoint.payload_args:
+            lines.append('    if %s is not None:' % arg)
+            lines.append('        _payload[%r] = %s' % (key, arg))
+        payload = ', payload=_payload'
+    lines.append('    return _client.%s(request_ctx, %s%s, **request_kwargs)' % (endpoint.method.lower(), url, payload))
+    return '\n'.join(lines) + '\n'
+
+
+def get_iter_method_source(endpoint, index):
+    """
+    Return the source of the iter_<name> companion of a paginated endpoint.  It takes the arguments of the
+    method, which is referenced as a global named after the index of the endpoint, and hands them to
+    utils.iter_list_data, so no request is made until the items are iterated over.
+    """
+    args = ''.join(arg.strip() + ', ' for arg in endpoint.args.split(',') if arg.strip())
+    lines = [
+        'def %s%s(request_ctx, %s**request_kwargs):' % (ITER_PREFIX, endpoint.name, args),
+        "    if per_page is None and getattr(request_ctx, 'page_size_policy', None) is None:",
+        '        per_page = _MAX_PER_PAGE',
+        '    return _iter_list_data(request_ctx, _method_%d, %s**request_kwargs)' % (
+            index, ''.join(name + ', ' for name in endpoint.arg_names)),
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def build_method(endpoint, index, method_globals):
+    """
+    Compile the method of an endpoint in method_globals, along with the constants it references, and return it
+    """
+    for arg, values in (endpoint.choices or {}).items():
+        method_globals['_choices_%d_%s' % (index, arg)] = frozenset(values)
+        method_globals['_values_%d_%s' % (index, arg)] = tuple(values)
+    code = compile(get_method_source(endpoint, index), '<%s endpoints>' % method_globals['__name__'], 'exec')
+    exec(code, method_globals)
+    method = method_globals[endpoint.name]
+    method.__doc__ = endpoint.doc
+    return method
+
+
+def build_iter_method(endpoint, index, method, method_globals):
+    """
+    Compile the iter_<name> companion of a paginated endpoint, which streams the pages of method, in
+    method_globals and return it
+    """
+    method_globals['_method_%d' % index] = method
+    code = compile(get_iter_method_source(endpoint, index), '<%s endpoints>' % method_globals['__name__'], 'exec')
+    exec(code, method_globals)
+    iter_method = method_globals[ITER_PREFIX + endpoint.name]
+    iter_method.__doc__ = """
+        Stream the items of every page of %s: pages are requested one at a time as the items are consumed (see
+        :py:func:`canvas_sdk.utils.iter_list_data`), so leaving the loop early fetches no further pages.  Takes
+        the arguments of %s; per_page defaults to the size the page size policy of the request context picks, if
+        it has one, else to utils.MAX_PER_PAGE rather than the per_page of the context.
+
+        :return: The json objects of every page
+        :rtype: iterator
+        """ % (endpoint.name, endpoint.name)
+    return iter_method
+
+
+def get_method_globals(namespace):
+    """
+    Return the globals the methods of a module are compiled in, holding the names their source references
+    """
+    return {
+        '__name__': namespace.get('__name__', __name__),
+        '_client': client,
+        '_validate_choice': validate_choice,
+        '_get_per_page': get_per_page,
+        '_iter_list_data': utils.iter_list_data,
+        '_MAX_PER_PAGE': utils.MAX_PER_PAGE,
+    }
+
+
+def get_function_endpoint(function):
+    """
+    Return an Endpoint standing for a method written out in a module rather than built from a spec, with the
+    arguments of its signature, so that its iter_<name> companion can be built
+    """
+    parameters = list(inspect.signature(function).parameters.values())[1:]  # request_ctx
+    args = ', '.join(str(parameter) for parameter in parameters if parameter.kind == parameter.POSITIONAL_OR_KEYWORD)
+    endpoint = Endpoint(function.__name__, 'GET', '', args, doc=function.__doc__)
+    if not endpoint.paginated:
+        raise ValueError("%s has no per_page argument" % function.__name__)
+    return endpoint
+
+
+def build_iter_methods(names, namespace):
+    """
+    Define in namespace the iter_<name> companion of each of the paginated methods written out in the module
+    itself, whose names are given; build_methods only knows of the endpoints of the spec table.  Called at the end
+    of the module, once the methods are defined.  The companions are built up front, as there are only a few.
+
+    :param names: The names of the methods, which must have a per_page argument
+    :param dict namespace: The globals() of the module defining the methods
+    """
+    method_globals = get_method_globals(namespace)
+    for index, name in enumerate(names):
+        method = namespace[name]
+        namespace[ITER_PREFIX + name] = build_iter_method(get_function_endpoint(method), index, method,
+                                                          method_globals)
+
+
+def build_methods(endpoints, namespace):
+    """
+    Define the method of every endpoint in namespace, the globals() of the module holding the endpoint specs.
+    Methods are built lazily: the module gets a __getattr__ (PEP 562) that compiles a method the first time it is
+    looked up, so importing a module only costs reading its spec table, and a __dir__ that lists the methods.
+    Paginated endpoints also get their iter_<name> companion, built the same way.
+    Functions defined in the module itself take precedence over endpoints of the same name (the paginated ones get
+    their companions from build_iter_methods).  The methods look
+    up client.get, client.post, etc. when they are called, so that those can be patched in tests.
+
+    :param endpoints: The :class:`Endpoint` specs
+    :param dict namespace: Where the methods are defined; its __name__ becomes the __module__ of the methods
+    """
+    # A later endpoint replaces an earlier one of the same name, as a later def would
+    indexes = {endpoint.name: index for index, endpoint in enumerate(endpoints)}
+    iter_indexes = {ITER_PREFIX + name: index for name, index in indexes.items() if endpoints[index].paginated}
+    method_globals = get_method_globals(namespace)
+    lock = threading.RLock()
+    # Metrics, spans and page sizes are keyed by the templates of the endpoints rather than ones guessed from urls
+    register_path_templates(endpoint.path for endpoint in endpoints)
+
+    def __getattr__(name):
+        index = indexes.get(name)
+        if index is not None:
+            with lock:
+                if name not in namespace:
+                    namespace[name] = build_method(endpoints[index], index, method_globals)
+            return namespace[name]
+        index = iter_indexes.get(name)
+        if index is not None:
+            with lock:
+                if name not in namespace:
+                    # The companion streams whatever the module calls the method, a function of its own included
+                    method = namespace.get(endpoints[index].name) or __getattr__(endpoints[index].name)
+                    namespace[name] = build_iter_method(endpoints[index], index, method, method_globals)
+            return namespace[name]
+        if name == '__all__':
+            # Star imports get the methods along with everything else the module defines
+            return sorted(set(indexes) | set(iter_indexes) | set(key for key in namespace if not key.startswith('_')))
+        raise AttributeError("module %r has no attribute %r" % (method_globals['__name__'], name))
+
+    def __dir__():
+        return sorted(set(namespace) | set(indexes) | set(iter_indexes))
+
+    namespace['__getattr__'] = __getattr__
+    namespace['__dir__'] = __dir__
+    if sys.version_info < (3, 7):
+        # Module __getattr__ needs PEP 562, so older versions build every method up front
+        for name in list(indexes) + list(iter_indexes):
+            __getattr__(name)
@@ -0,0 +1,25 @@
+"""
+The generated SDK methods, one module per Canvas API resource.  Modules are imported lazily (PEP 562): importing
+this package loads none of them, and ``canvas_sdk.methods.courses`` or ``from canvas_sdk.methods import courses``
+imports only the courses module, on first access.
+"""
+import importlib
+import os
+
+"""
+Names of the method modules in this package.  Listed with os rather than pkgutil, which would import inspect and
+cost more than the lazy loading saves.
+"""
+__all__ = sorted(filename[:-3] for filename in os.listdir(os.path.dirname(__file__))
+                 if filename.endswith('.py') and filename != '__init__.py')
+
+
+def __getattr__(name):
+    if name in __all__:
+        # import_module binds the module on this package, so later lookups don't come back here
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_authorization_configs(request_ctx, account_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_authorization_configs', 'GET', '/v1/accounts/{account_id}/account_authorization_configs',
+        'account_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of authorization configs
 
         :param request_ctx: The request context
@@ -13,22 +18,11 @@ def list_authorization_configs(request_ctx, account_id, per_page=None, **request
         :return: List Authorization Configs
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/account_authorization_configs'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_authorization_config(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_authorization_config', 'POST', '/v1/accounts/{account_id}/account_authorization_configs',
+        'account_id',
+        doc="""
     Add external account authentication service(s) for the account.
     Services may be CAS, SAML, or LDAP.
     
@@ -210,17 +204,11 @@ def create_authorization_config(request_ctx, account_id, **request_kwargs):
         :return: Create Authorization Config
         :rtype: requests.Response (with AccountAuthorizationConfig data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/account_authorization_configs'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_authorization_config(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_authorization_config', 'PUT', '/v1/accounts/{account_id}/account_authorization_configs/{id}',
+        'account_id, id',
+        doc="""
     Update an authorization config using the same options as the create endpoint.
     You can not update an existing configuration to a new authentication type.
 
@@ -233,17 +221,11 @@ def update_authorization_config(request_ctx, account_id, id, **request_kwargs):
         :return: Update Authorization Config
         :rtype: requests.Response (with AccountAuthorizationConfig data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/account_authorization_configs/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_authorization_config(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_authorization_config', 'GET', '/v1/accounts/{account_id}/account_authorization_configs/{id}',
+        'account_id, id',
+        doc="""
     Get the specified authorization config
 
         :param request_ctx: The request context
@@ -255,17 +237,11 @@ def get_authorization_config(request_ctx, account_id, id, **request_kwargs):
         :return: Get Authorization Config
         :rtype: requests.Response (with AccountAuthorizationConfig data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/account_authorization_configs/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_authorization_config(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_authorization_config', 'DELETE', '/v1/accounts/{account_id}/account_authorization_configs/{id}',
+        'account_id, id',
+        doc="""
     Delete the config
 
         :param request_ctx: The request context
@@ -277,17 +253,11 @@ def delete_authorization_config(request_ctx, account_id, id, **request_kwargs):
         :return: Delete Authorization Config
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/account_authorization_configs/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_discovery_url(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_discovery_url', 'GET', '/v1/accounts/{account_id}/account_authorization_configs/discovery_url',
+        'account_id',
+        doc="""
     Get the discovery url
 
         :param request_ctx: The request context
@@ -297,17 +267,11 @@ def get_discovery_url(request_ctx, account_id, **request_kwargs):
         :return: GET discovery url
         :rtype: requests.Response (with DiscoveryUrl data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/account_authorization_configs/discovery_url'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def set_discovery_url(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'set_discovery_url', 'PUT', '/v1/accounts/{account_id}/account_authorization_configs/discovery_url',
+        'account_id',
+        doc="""
     If you have multiple IdPs configured, you can set a `discovery_url`.
     If that is set, canvas will forward all users to that URL when they need to
     be authenticated. That page will need to then help the user figure out where
@@ -323,17 +287,11 @@ def set_discovery_url(request_ctx, account_id, **request_kwargs):
         :return: Set discovery url
         :rtype: requests.Response (with DiscoveryUrl data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/account_authorization_configs/discovery_url'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_discovery_url(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_discovery_url', 'DELETE', '/v1/accounts/{account_id}/account_authorization_configs/discovery_url',
+        'account_id',
+        doc="""
     Clear discovery url
 
         :param request_ctx: The request context
@@ -343,12 +301,7 @@ def delete_discovery_url(request_ctx, account_id, **request_kwargs):
         :return: Delete discovery url
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/account_authorization_configs/discovery_url'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def search_account_domains(request_ctx, name=None, domain=None, latitude=None, longitude=None, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'search_account_domains', 'GET', '/v1/accounts/search',
+        'name=None, domain=None, latitude=None, longitude=None',
+        payload=('name', 'domain', 'latitude', 'longitude'),
+        doc="""
     Returns a list of up to 5 matching account domains
     
     Partial match on name / domain are supported
@@ -19,18 +24,7 @@ def search_account_domains(request_ctx, name=None, domain=None, latitude=None, l
         :return: 
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/search'
-    payload = {
-        'name' : name,
-        'domain' : domain,
-        'latitude' : latitude,
-        'longitude' : longitude,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
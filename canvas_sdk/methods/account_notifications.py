@@ -1,7 +1,16 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def create_global_notification(request_ctx, account_id, account_notification_subject=None, account_notification_message=None, account_notification_start_at=None, account_notification_end_at=None, account_notification_icon=None, account_notification_roles=None, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'create_global_notification', 'POST', '/v1/accounts/{account_id}/account_notifications',
+        'account_id, account_notification_subject=None, account_notification_message=None, account_notification_start_at=None, account_notification_end_at=None, account_notification_icon=None, account_notification_roles=None',
+        payload=(
+            'account_notification[subject]', 'account_notification[message]', 'account_notification[start_at]',
+            'account_notification[end_at]', 'account_notification[icon]', 'account_notification_roles',
+        ),
+        choices={'account_notification_icon': ('warning', 'information', 'question', 'error', 'calendar')},
+        doc="""
     Create and return a new global notification for an account.
 
         :param request_ctx: The request context
@@ -23,22 +32,7 @@ def create_global_notification(request_ctx, account_id, account_notification_sub
         :return: Create a global notification
         :rtype: requests.Response (with void data)
 
-    """
-
-    account_notification_icon_types = ('warning', 'information', 'question', 'error', 'calendar')
-    utils.validate_attr_is_acceptable(account_notification_icon, account_notification_icon_types)
-    path = '/v1/accounts/{account_id}/account_notifications'
-    payload = {
-        'account_notification[subject]' : account_notification_subject,
-        'account_notification[message]' : account_notification_message,
-        'account_notification[start_at]' : account_notification_start_at,
-        'account_notification[end_at]' : account_notification_end_at,
-        'account_notification[icon]' : account_notification_icon,
-        'account_notification_roles' : account_notification_roles,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
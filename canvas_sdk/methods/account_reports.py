@@ -1,9 +1,12 @@
 from canvas_sdk import client, utils
 import re
+from canvas_sdk.engine import Endpoint, build_methods
 
-
-def list_available_reports(request_ctx, account_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'list_available_reports', 'GET', '/v1/accounts/{account_id}/reports',
+        'account_id',
+        doc="""
     Returns the list of reports for the current context.
 
         :param request_ctx: The request context
@@ -13,47 +16,12 @@ def list_available_reports(request_ctx, account_id, **request_kwargs):
         :return: List Available Reports
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/reports'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def start_report(request_ctx, account_id, report, parameters, **request_kwargs):
-    """
-    Generates a report instance for the account.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param account_id: (required) ID
-        :type account_id: string
-        :param report: (required) ID
-        :type report: string
-        :param parameters: (required) The parameters will vary for each report
-        :type parameters: dict
-        :return: Start a Report
-        :rtype: requests.Response (with Report data)
-
-    """
-
-    path = '/v1/accounts/{account_id}/reports/{report}'
-
-    # if the parameters dict has keys like 'enrollments', 'xlist', 'include_deleted'
-    # we need to translate them to be like 'parameters[enrollments]'
-    ppat = re.compile('parameters\[.+\]')
-    fix_key = lambda k_v: (k_v[0] if ppat.match(str(k_v[0])) else 'parameters[{}]'.format(k_v[0]), k_v[1])
-    payload = list(map(fix_key, list(parameters.items())))
-    url = request_ctx.base_api_url + path.format(account_id=account_id, report=report)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def index_of_reports(request_ctx, account_id, report, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'index_of_reports', 'GET', '/v1/accounts/{account_id}/reports/{report}',
+        'account_id, report, per_page=None',
+        payload=('per_page',),
+        doc="""
     Shows all reports that have been run for the account of a specific type.
 
         :param request_ctx: The request context
@@ -67,22 +35,11 @@ def index_of_reports(request_ctx, account_id, report, per_page=None, **request_k
         :return: Index of Reports
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/reports/{report}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, report=report)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def status_of_report(request_ctx, account_id, report, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'status_of_report', 'GET', '/v1/accounts/{account_id}/reports/{report}/{id}',
+        'account_id, report, id',
+        doc="""
     Returns the status of a report.
 
         :param request_ctx: The request context
@@ -96,18 +53,33 @@ def status_of_report(request_ctx, account_id, report, id, **request_kwargs):
         :return: Status of a Report
         :rtype: requests.Response (with Report data)
 
-    """
+    """),
+    Endpoint(
+        'delete_report', 'DELETE', '/v1/accounts/{account_id}/reports/{report}/{id}',
+        'account_id, report, id',
+        doc="""
+    Deletes a generated report instance.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param account_id: (required) ID
+        :type account_id: string
+        :param report: (required) ID
+        :type report: string
+        :param id: (required) ID
+        :type id: string
+        :return: Delete a Report
+        :rtype: requests.Response (with Report data)
 
-    path = '/v1/accounts/{account_id}/reports/{report}/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, report=report, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
+    """),
+]
 
-    return response
+build_methods(ENDPOINTS, globals())
 
 
-def delete_report(request_ctx, account_id, report, id, **request_kwargs):
+def start_report(request_ctx, account_id, report, parameters, **request_kwargs):
     """
-    Deletes a generated report instance.
+    Generates a report instance for the account.
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -115,15 +87,21 @@ def delete_report(request_ctx, account_id, report, id, **request_kwargs):
         :type account_id: string
         :param report: (required) ID
         :type report: string
-        :param id: (required) ID
-        :type id: string
-        :return: Delete a Report
+        :param parameters: (required) The parameters will vary for each report
+        :type parameters: dict
+        :return: Start a Report
         :rtype: requests.Response (with Report data)
 
     """
 
-    path = '/v1/accounts/{account_id}/reports/{report}/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, report=report, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
+    path = '/v1/accounts/{account_id}/reports/{report}'
+
+    # if the parameters dict has keys like 'enrollments', 'xlist', 'include_deleted'
+    # we need to translate them to be like 'parameters[enrollments]'
+    ppat = re.compile('parameters\[.+\]')
+    fix_key = lambda k_v: (k_v[0] if ppat.match(str(k_v[0])) else 'parameters[{}]'.format(k_v[0]), k_v[1])
+    payload = list(map(fix_key, list(parameters.items())))
+    url = request_ctx.base_api_url + path.format(account_id=account_id, report=report)
+    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
 
     return response
@@ -1,38 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_iter_methods, build_methods, get_per_page
 
-def list_accounts(request_ctx, per_page=None, as_user_id=None, **request_kwargs):
-    """
-    List accounts that the current user can view or manage.  Typically,
-    students and even teachers will get an empty list in response, only
-    account admins can view the accounts that they are in.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE
-        :type per_page: integer or None
-        :param as_user_id: (optional) Masquerade as the given canvas user
-        :type as_user_id: integer or None
-        :return: List accounts
-        :rtype: requests.Response (with array data)
-
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts'
-    payload = {
-        'per_page': per_page,
-    }
-    if as_user_id:
-        payload['as_user_id'] = as_user_id
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_account(request_ctx, id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'get_single_account', 'GET', '/v1/accounts/{id}',
+        'id',
+        doc="""
     Retrieve information on an individual account, given by id or sis
     sis_account_id.
 
@@ -43,49 +16,19 @@ def get_single_account(request_ctx, id, **request_kwargs):
         :return: Get a single account
         :rtype: requests.Response (with Account data)
 
-    """
-
-    path = '/v1/accounts/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_sub_accounts_of_account(request_ctx, account_id, recursive=None, per_page=None, as_user_id=None, **request_kwargs):
-    """
-    List accounts that are sub-accounts of the given account.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param account_id: (required) ID
-        :type account_id: string
-        :param recursive: (optional) If true, the entire account tree underneath this account will be returned (though still paginated). If false, only direct sub-accounts of this account will be returned. Defaults to false.
-        :type recursive: boolean or None
-        :param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE
-        :type per_page: integer or None
-        :return: Get the sub-accounts of an account
-        :rtype: requests.Response (with array data)
-
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/sub_accounts'
-    payload = {
-        'recursive': recursive,
-        'per_page': per_page,
-    }
-    if as_user_id:
-        payload['as_user_id'] = as_user_id
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_active_courses_in_account(request_ctx, account_id, with_enrollments=None, published=None, completed=None, by_teachers=None, by_subaccounts=None, hide_enrollmentless_courses=None, state=None, enrollment_term_id=None, search_term=None, include=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_active_courses_in_account', 'GET', '/v1/accounts/{account_id}/courses',
+        'account_id, with_enrollments=None, published=None, completed=None, by_teachers=None, by_subaccounts=None, hide_enrollmentless_courses=None, state=None, enrollment_term_id=None, search_term=None, include=None, per_page=None',
+        payload=(
+            'with_enrollments', 'published', 'completed', 'by_teachers', 'by_subaccounts',
+            'hide_enrollmentless_courses', 'state', 'enrollment_term_id', 'search_term', 'include', 'per_page',
+        ),
+        choices={
+            'state': ('created', 'claimed', 'available', 'completed', 'deleted', 'all'),
+            'include': ('syllabus_body', 'term', 'course_progress', 'storage_quota_used_mb', 'total_students', 'teachers'),
+        },
+        doc="""
     Retrieve the list of courses in this account.
 
         :param request_ctx: The request context
@@ -117,36 +60,15 @@ def list_active_courses_in_account(request_ctx, account_id, with_enrollments=Non
         :return: List active courses in an account
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('created', 'claimed', 'available', 'completed', 'deleted', 'all')
-    include_types = ('syllabus_body', 'term', 'course_progress', 'storage_quota_used_mb', 'total_students', 'teachers')
-    utils.validate_attr_is_acceptable(state, state_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/accounts/{account_id}/courses'
-    payload = {
-        'with_enrollments' : with_enrollments,
-        'published' : published,
-        'completed' : completed,
-        'by_teachers' : by_teachers,
-        'by_subaccounts' : by_subaccounts,
-        'hide_enrollmentless_courses' : hide_enrollmentless_courses,
-        'state' : state,
-        'enrollment_term_id' : enrollment_term_id,
-        'search_term' : search_term,
-        'include' : include,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_account(request_ctx, id, account_name=None, account_default_time_zone=None, account_default_storage_quota_mb=None, account_default_user_storage_quota_mb=None, account_default_group_storage_quota_mb=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_account', 'PUT', '/v1/accounts/{id}',
+        'id, account_name=None, account_default_time_zone=None, account_default_storage_quota_mb=None, account_default_user_storage_quota_mb=None, account_default_group_storage_quota_mb=None',
+        payload=(
+            'account[name]', 'account[default_time_zone]', 'account[default_storage_quota_mb]',
+            'account[default_user_storage_quota_mb]', 'account[default_group_storage_quota_mb]',
+        ),
+        doc="""
     Update an existing account.
 
         :param request_ctx: The request context
@@ -166,24 +88,15 @@ def update_account(request_ctx, id, account_name=None, account_default_time_zone
         :return: Update an account
         :rtype: requests.Response (with Account data)
 
-    """
-
-    path = '/v1/accounts/{id}'
-    payload = {
-        'account[name]' : account_name,
-        'account[default_time_zone]' : account_default_time_zone,
-        'account[default_storage_quota_mb]' : account_default_storage_quota_mb,
-        'account[default_user_storage_quota_mb]' : account_default_user_storage_quota_mb,
-        'account[default_group_storage_quota_mb]' : account_default_group_storage_quota_mb,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_new_sub_account(request_ctx, account_id, account_name, account_default_storage_quota_mb=None, account_default_user_storage_quota_mb=None, account_default_group_storage_quota_mb=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_new_sub_account', 'POST', '/v1/accounts/{account_id}/sub_accounts',
+        'account_id, account_name, account_default_storage_quota_mb=None, account_default_user_storage_quota_mb=None, account_default_group_storage_quota_mb=None, per_page=None',
+        payload=(
+            'account[name]', 'account[default_storage_quota_mb]', 'account[default_user_storage_quota_mb]',
+            'account[default_group_storage_quota_mb]', 'per_page',
+        ),
+        doc="""
     Add a new sub-account to a given account.
 
         :param request_ctx: The request context
@@ -203,19 +116,73 @@ def create_new_sub_account(request_ctx, account_id, account_name, account_defaul
         :return: Create a new sub-account
         :rtype: requests.Response (with array data)
 
+    """),
+]
+
+build_methods(ENDPOINTS, globals())
+
+
+def list_accounts(request_ctx, per_page=None, as_user_id=None, **request_kwargs):
+    """
+    List accounts that the current user can view or manage.  Typically,
+    students and even teachers will get an empty list in response, only
+    account admins can view the accounts that they are in.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE
+        :type per_page: integer or None
+        :param as_user_id: (optional) Masquerade as the given canvas user
+        :type as_user_id: integer or None
+        :return: List accounts
+        :rtype: requests.Response (with array data)
+
     """
 
+    path = '/v1/accounts'
+    url = request_ctx.base_api_url + path.format()
     if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/sub_accounts'
+        per_page = get_per_page(request_ctx, url)
     payload = {
-        'account[name]' : account_name,
-        'account[default_storage_quota_mb]' : account_default_storage_quota_mb,
-        'account[default_user_storage_quota_mb]' : account_default_user_storage_quota_mb,
-        'account[default_group_storage_quota_mb]' : account_default_group_storage_quota_mb,
-        'per_page' : per_page,
+        'per_page': per_page,
     }
+    if as_user_id:
+        payload['as_user_id'] = as_user_id
+    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
+
+    return response
+
+
+def get_sub_accounts_of_account(request_ctx, account_id, recursive=None, per_page=None, as_user_id=None, **request_kwargs):
+    """
+    List accounts that are sub-accounts of the given account.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param account_id: (required) ID
+        :type account_id: string
+        :param recursive: (optional) If true, the entire account tree underneath this account will be returned (though still paginated). If false, only direct sub-accounts of this account will be returned. Defaults to false.
+        :type recursive: boolean or None
+        :param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE
+        :type per_page: integer or None
+        :return: Get the sub-accounts of an account
+        :rtype: requests.Response (with array data)
+
+    """
+
+    path = '/v1/accounts/{account_id}/sub_accounts'
     url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
+    if per_page is None:
+        per_page = get_per_page(request_ctx, url)
+    payload = {
+        'recursive': recursive,
+        'per_page': per_page,
+    }
+    if as_user_id:
+        payload['as_user_id'] = as_user_id
+    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
 
     return response
+
+
+build_iter_methods(('list_accounts', 'get_sub_accounts_of_account'), globals())
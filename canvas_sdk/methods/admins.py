@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def make_account_admin(request_ctx, account_id, user_id, role=None, role_id=None, send_confirmation=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'make_account_admin', 'POST', '/v1/accounts/{account_id}/admins',
+        'account_id, user_id, role=None, role_id=None, send_confirmation=None',
+        payload=('user_id', 'role', 'role_id', 'send_confirmation'),
+        doc="""
     Flag an existing user as an admin within the account.
 
         :param request_ctx: The request context
@@ -23,23 +28,12 @@ the new admin if true. Default is true.
         :return: Make an account admin
         :rtype: requests.Response (with Admin data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/admins'
-    payload = {
-        'user_id' : user_id,
-        'role' : role,
-        'role_id' : role_id,
-        'send_confirmation' : send_confirmation,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def remove_account_admin(request_ctx, account_id, user_id, role=None, role_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'remove_account_admin', 'DELETE', '/v1/accounts/{account_id}/admins/{user_id}',
+        'account_id, user_id, role=None, role_id=None',
+        payload=('role', 'role_id'),
+        doc="""
     Remove the rights associated with an account admin role from a user.
 
         :param request_ctx: The request context
@@ -58,21 +52,12 @@ given role. Defaults to the built-in role for 'AccountAdmin'.
         :return: Remove account admin
         :rtype: requests.Response (with Admin data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/admins/{user_id}'
-    payload = {
-        'role' : role,
-        'role_id' : role_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, user_id=user_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_account_admins(request_ctx, account_id, user_id=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_account_admins', 'GET', '/v1/accounts/{account_id}/admins',
+        'account_id, user_id=None, per_page=None',
+        payload=('user_id', 'per_page'),
+        doc="""
     List the admins in the account
 
         :param request_ctx: The request context
@@ -86,18 +71,7 @@ def list_account_admins(request_ctx, account_id, user_id=None, per_page=None, **
         :return: List account admins
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/admins'
-    payload = {
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
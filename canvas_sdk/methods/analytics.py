@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def get_department_level_participation_data_terms(request_ctx, account_id, term_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'get_department_level_participation_data_terms', 'GET', '/v1/accounts/{account_id}/analytics/terms/{term_id}/activity',
+        'account_id, term_id',
+        doc="""
     Returns page view hits summed across all courses in the department. Two
     groupings of these counts are returned; one by day (+by_date+), the other
     by category (+by_category+). The possible categories are announcements,
@@ -35,17 +39,11 @@ def get_department_level_participation_data_terms(request_ctx, account_id, term_
         :return: Get department-level participation data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/terms/{term_id}/activity'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, term_id=term_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_department_level_participation_data_current(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_department_level_participation_data_current', 'GET', '/v1/accounts/{account_id}/analytics/current/activity',
+        'account_id',
+        doc="""
     Returns page view hits summed across all courses in the department. Two
     groupings of these counts are returned; one by day (+by_date+), the other
     by category (+by_category+). The possible categories are announcements,
@@ -77,17 +75,11 @@ def get_department_level_participation_data_current(request_ctx, account_id, **r
         :return: Get department-level participation data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/current/activity'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_department_level_participation_data_completed(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_department_level_participation_data_completed', 'GET', '/v1/accounts/{account_id}/analytics/completed/activity',
+        'account_id',
+        doc="""
     Returns page view hits summed across all courses in the department. Two
     groupings of these counts are returned; one by day (+by_date+), the other
     by category (+by_category+). The possible categories are announcements,
@@ -119,17 +111,11 @@ def get_department_level_participation_data_completed(request_ctx, account_id, *
         :return: Get department-level participation data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/completed/activity'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_department_level_grade_data_terms(request_ctx, account_id, term_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_department_level_grade_data_terms', 'GET', '/v1/accounts/{account_id}/analytics/terms/{term_id}/grades',
+        'account_id, term_id',
+        doc="""
     Returns the distribution of grades for students in courses in the
     department.  Each data point is one student's current grade in one course;
     if a student is in multiple courses, he contributes one value per course,
@@ -151,17 +137,11 @@ def get_department_level_grade_data_terms(request_ctx, account_id, term_id, **re
         :return: Get department-level grade data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/terms/{term_id}/grades'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, term_id=term_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_department_level_grade_data_current(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_department_level_grade_data_current', 'GET', '/v1/accounts/{account_id}/analytics/current/grades',
+        'account_id',
+        doc="""
     Returns the distribution of grades for students in courses in the
     department.  Each data point is one student's current grade in one course;
     if a student is in multiple courses, he contributes one value per course,
@@ -181,17 +161,11 @@ def get_department_level_grade_data_current(request_ctx, account_id, **request_k
         :return: Get department-level grade data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/current/grades'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_department_level_grade_data_completed(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_department_level_grade_data_completed', 'GET', '/v1/accounts/{account_id}/analytics/completed/grades',
+        'account_id',
+        doc="""
     Returns the distribution of grades for students in courses in the
     department.  Each data point is one student's current grade in one course;
     if a student is in multiple courses, he contributes one value per course,
@@ -211,17 +185,11 @@ def get_department_level_grade_data_completed(request_ctx, account_id, **request
         :return: Get department-level grade data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/completed/grades'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_department_level_statistics_terms(request_ctx, account_id, term_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_department_level_statistics_terms', 'GET', '/v1/accounts/{account_id}/analytics/terms/{term_id}/statistics',
+        'account_id, term_id',
+        doc="""
     Returns numeric statistics about the department and term (or filter).
     
     Shares the same variations on endpoint as the participation data.
@@ -235,17 +203,11 @@ def get_department_level_statistics_terms(request_ctx, account_id, term_id, **re
         :return: Get department-level statistics
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/terms/{term_id}/statistics'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, term_id=term_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_department_level_statistics_current(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_department_level_statistics_current', 'GET', '/v1/accounts/{account_id}/analytics/current/statistics',
+        'account_id',
+        doc="""
     Returns numeric statistics about the department and term (or filter).
     
     Shares the same variations on endpoint as the participation data.
@@ -257,17 +219,11 @@ def get_department_level_statistics_current(request_ctx, account_id, **request_k
         :return: Get department-level statistics
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/current/statistics'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_department_level_statistics_completed(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_department_level_statistics_completed', 'GET', '/v1/accounts/{account_id}/analytics/completed/statistics',
+        'account_id',
+        doc="""
     Returns numeric statistics about the department and term (or filter).
     
     Shares the same variations on endpoint as the participation data.
@@ -279,17 +235,11 @@ def get_department_level_statistics_completed(request_ctx, account_id, **request
         :return: Get department-level statistics
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/analytics/completed/statistics'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_course_level_participation_data(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_course_level_participation_data', 'GET', '/v1/courses/{course_id}/analytics/activity',
+        'course_id',
+        doc="""
     Returns page view hits and participation numbers grouped by day through the
     entire history of the course. Page views is returned as a hash, where the
     hash keys are dates in the format "YYYY-MM-DD". The page_views result set
@@ -303,17 +253,12 @@ def get_course_level_participation_data(request_ctx, course_id, **request_kwargs
         :return: Get course-level participation data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/analytics/activity'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_course_level_assignment_data(request_ctx, course_id, async, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_course_level_assignment_data', 'GET', '/v1/courses/{course_id}/analytics/assignments',
+        'course_id, var_async',
+        payload=('async',),
+        doc="""
     Returns a list of assignments for the course sorted by due date. For
     each assignment returns basic assignment information, the grade breakdown,
     and a breakdown of on-time/late status of homework submissions.
@@ -322,25 +267,16 @@ def get_course_level_assignment_data(request_ctx, course_id, async, **request_kw
         :type request_ctx: :class:RequestContext
         :param course_id: (required) ID
         :type course_id: string
-        :param async: (required) If async is true, then the course_assignments call can happen asynch- ronously and MAY return a response containing a progress_url key instead of an assignments array. If it does, then it is the caller's responsibility to poll the API again to see if the progress is complete. If the data is ready (possibly even on the first async call) then it will be passed back normally, as documented in the example response.
-        :type async: boolean
+        :param var_async: (required) If async is true, then the course_assignments call can happen asynch- ronously and MAY return a response containing a progress_url key instead of an assignments array. If it does, then it is the caller's responsibility to poll the API again to see if the progress is complete. If the data is ready (possibly even on the first async call) then it will be passed back normally, as documented in the example response.
+        :type var_async: boolean
         :return: Get course-level assignment data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/analytics/assignments'
-    payload = {
-        'async' : async,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_course_level_student_summary_data(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_course_level_student_summary_data', 'GET', '/v1/courses/{course_id}/analytics/student_summaries',
+        'course_id',
+        doc="""
     Returns a summary of per-user access information for all students in
     a course. This includes total page views, total participations, and a
     breakdown of on-time/late status for all homework submissions in the course.
@@ -358,17 +294,11 @@ def get_course_level_student_summary_data(request_ctx, course_id, **request_kwar
         :return: Get course-level student summary data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/analytics/student_summaries'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_user_in_a_course_level_participation_data(request_ctx, course_id, student_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_user_in_a_course_level_participation_data', 'GET', '/v1/courses/{course_id}/analytics/users/{student_id}/activity',
+        'course_id, student_id',
+        doc="""
     Returns page view hits and participation numbers grouped by day through the
     entire history of the course. Two hashes are returned, one for page views
     and one for participations, where the hash keys are dates in the format
@@ -383,17 +313,11 @@ def get_user_in_a_course_level_participation_data(request_ctx, course_id, studen
         :return: Get user-in-a-course-level participation data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/analytics/users/{student_id}/activity'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, student_id=student_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_user_in_a_course_level_assignment_data(request_ctx, course_id, student_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_user_in_a_course_level_assignment_data', 'GET', '/v1/courses/{course_id}/analytics/users/{student_id}/assignments',
+        'course_id, student_id',
+        doc="""
     Returns a list of assignments for the course sorted by due date. For
     each assignment returns basic assignment information, the grade breakdown
     (including the student's actual grade), and the basic submission
@@ -408,17 +332,11 @@ def get_user_in_a_course_level_assignment_data(request_ctx, course_id, student_i
         :return: Get user-in-a-course-level assignment data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/analytics/users/{student_id}/assignments'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, student_id=student_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_user_in_a_course_level_messaging_data(request_ctx, course_id, student_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_user_in_a_course_level_messaging_data', 'GET', '/v1/courses/{course_id}/analytics/users/{student_id}/communication',
+        'course_id, student_id',
+        doc="""
     Returns messaging "hits" grouped by day through the entire history of the
     course. Returns a hash containing the number of instructor-to-student messages,
     and student-to-instructor messages, where the hash keys are dates
@@ -434,12 +352,7 @@ def get_user_in_a_course_level_messaging_data(request_ctx, course_id, student_id
         :return: Get user-in-a-course-level messaging data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/analytics/users/{student_id}/communication'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, student_id=student_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_external_feeds_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_external_feeds_courses', 'GET', '/v1/courses/{course_id}/external_feeds',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of External Feeds this course or group.
 
         :param request_ctx: The request context
@@ -13,22 +18,12 @@ def list_external_feeds_courses(request_ctx, course_id, per_page=None, **request
         :return: List external feeds
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/external_feeds'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_external_feeds_groups(request_ctx, group_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_external_feeds_groups', 'GET', '/v1/groups/{group_id}/external_feeds',
+        'group_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of External Feeds this course or group.
 
         :param request_ctx: The request context
@@ -40,22 +35,13 @@ def list_external_feeds_groups(request_ctx, group_id, per_page=None, **request_k
         :return: List external feeds
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/external_feeds'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_external_feed_courses(request_ctx, course_id, url, verbosity, header_match=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_external_feed_courses', 'POST', '/v1/courses/{course_id}/external_feeds',
+        'course_id, url, verbosity, header_match=None',
+        payload=('url', 'header_match', 'verbosity'),
+        choices={'verbosity': ('full', 'truncate', 'link_only')},
+        doc="""
     Create a new external feed for the course or group.
 
         :param request_ctx: The request context
@@ -71,24 +57,13 @@ def create_external_feed_courses(request_ctx, course_id, url, verbosity, header_
         :return: Create an external feed
         :rtype: requests.Response (with ExternalFeed data)
 
-    """
-
-    verbosity_types = ('full', 'truncate', 'link_only')
-    utils.validate_attr_is_acceptable(verbosity, verbosity_types)
-    path = '/v1/courses/{course_id}/external_feeds'
-    payload = {
-        'url' : url,
-        'header_match' : header_match,
-        'verbosity' : verbosity,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_external_feed_groups(request_ctx, group_id, url, verbosity, header_match=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_external_feed_groups', 'POST', '/v1/groups/{group_id}/external_feeds',
+        'group_id, url, verbosity, header_match=None',
+        payload=('url', 'header_match', 'verbosity'),
+        choices={'verbosity': ('full', 'truncate', 'link_only')},
+        doc="""
     Create a new external feed for the course or group.
 
         :param request_ctx: The request context
@@ -104,24 +79,11 @@ def create_external_feed_groups(request_ctx, group_id, url, verbosity, header_ma
         :return: Create an external feed
         :rtype: requests.Response (with ExternalFeed data)
 
-    """
-
-    verbosity_types = ('full', 'truncate', 'link_only')
-    utils.validate_attr_is_acceptable(verbosity, verbosity_types)
-    path = '/v1/groups/{group_id}/external_feeds'
-    payload = {
-        'url' : url,
-        'header_match' : header_match,
-        'verbosity' : verbosity,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_external_feed_courses(request_ctx, course_id, external_feed_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_external_feed_courses', 'DELETE', '/v1/courses/{course_id}/external_feeds/{external_feed_id}',
+        'course_id, external_feed_id',
+        doc="""
     Deletes the external feed.
 
         :param request_ctx: The request context
@@ -133,17 +95,11 @@ def delete_external_feed_courses(request_ctx, course_id, external_feed_id, **req
         :return: Delete an external feed
         :rtype: requests.Response (with ExternalFeed data)
 
-    """
-
-    path = '/v1/courses/{course_id}/external_feeds/{external_feed_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, external_feed_id=external_feed_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_external_feed_groups(request_ctx, group_id, external_feed_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_external_feed_groups', 'DELETE', '/v1/groups/{group_id}/external_feeds/{external_feed_id}',
+        'group_id, external_feed_id',
+        doc="""
     Deletes the external feed.
 
         :param request_ctx: The request context
@@ -155,12 +111,7 @@ def delete_external_feed_groups(request_ctx, group_id, external_feed_id, **reque
         :return: Delete an external feed
         :rtype: requests.Response (with ExternalFeed data)
 
-    """
-
-    path = '/v1/groups/{group_id}/external_feeds/{external_feed_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, external_feed_id=external_feed_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
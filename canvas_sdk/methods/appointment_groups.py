@@ -1,7 +1,16 @@
 from canvas_sdk import client, utils
-
-def list_appointment_groups(request_ctx, scope=None, context_codes=None, include_past_appointments=None, include=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_appointment_groups', 'GET', '/v1/appointment_groups',
+        'scope=None, context_codes=None, include_past_appointments=None, include=None',
+        payload=('scope', 'context_codes', 'include_past_appointments', 'include'),
+        choices={
+            'scope': ('reservable', 'manageable'),
+            'include': ('appointments', 'child_events', 'participant_count', 'reserved_times'),
+        },
+        doc="""
     Retrieve the list of appointment groups that can be reserved or managed by
     the current user.
 
@@ -18,27 +27,20 @@ def list_appointment_groups(request_ctx, scope=None, context_codes=None, include
         :return: List appointment groups
         :rtype: requests.Response (with void data)
 
-    """
-
-    scope_types = ('reservable', 'manageable')
-    include_types = ('appointments', 'child_events', 'participant_count', 'reserved_times')
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/appointment_groups'
-    payload = {
-        'scope' : scope,
-        'context_codes' : context_codes,
-        'include_past_appointments' : include_past_appointments,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_appointment_group(request_ctx, appointment_group_context_codes, appointment_group_sub_context_codes=None, appointment_group_title=None, appointment_group_description=None, appointment_group_location_name=None, appointment_group_location_address=None, appointment_group_publish=None, appointment_group_participants_per_appointment=None, appointment_group_min_appointments_per_participant=None, appointment_group_max_appointments_per_participant=None, appointment_group_new_appointments_X=None, appointment_group_participant_visibility=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_appointment_group', 'POST', '/v1/appointment_groups',
+        'appointment_group_context_codes, appointment_group_sub_context_codes=None, appointment_group_title=None, appointment_group_description=None, appointment_group_location_name=None, appointment_group_location_address=None, appointment_group_publish=None, appointment_group_participants_per_appointment=None, appointment_group_min_appointments_per_participant=None, appointment_group_max_appointments_per_participant=None, appointment_group_new_appointments_X=None, appointment_group_participant_visibility=None',
+        payload=(
+            'appointment_group[context_codes]', 'appointment_group[sub_context_codes]', 'appointment_group[title]',
+            'appointment_group[description]', 'appointment_group[location_name]', 'appointment_group[location_address]',
+            'appointment_group[publish]', 'appointment_group[participants_per_appointment]',
+            'appointment_group[min_appointments_per_participant]',
+            'appointment_group[max_appointments_per_participant]', 'appointment_group[new_appointments][X]',
+            'appointment_group[participant_visibility]',
+        ),
+        choices={'appointment_group_participant_visibility': ('private', 'protected')},
+        doc="""
     Create and return a new appointment group. If new_appointments are
     specified, the response will return a new_appointments array (same format
     as appointments array, see "List appointment groups" action)
@@ -72,33 +74,13 @@ def create_appointment_group(request_ctx, appointment_group_context_codes, appoi
         :return: Create an appointment group
         :rtype: requests.Response (with void data)
 
-    """
-
-    appointment_group_participant_visibility_types = ('private', 'protected')
-    utils.validate_attr_is_acceptable(appointment_group_participant_visibility, appointment_group_participant_visibility_types)
-    path = '/v1/appointment_groups'
-    payload = {
-        'appointment_group[context_codes]' : appointment_group_context_codes,
-        'appointment_group[sub_context_codes]' : appointment_group_sub_context_codes,
-        'appointment_group[title]' : appointment_group_title,
-        'appointment_group[description]' : appointment_group_description,
-        'appointment_group[location_name]' : appointment_group_location_name,
-        'appointment_group[location_address]' : appointment_group_location_address,
-        'appointment_group[publish]' : appointment_group_publish,
-        'appointment_group[participants_per_appointment]' : appointment_group_participants_per_appointment,
-        'appointment_group[min_appointments_per_participant]' : appointment_group_min_appointments_per_participant,
-        'appointment_group[max_appointments_per_participant]' : appointment_group_max_appointments_per_participant,
-        'appointment_group[new_appointments][X]' : appointment_group_new_appointments_X,
-        'appointment_group[participant_visibility]' : appointment_group_participant_visibility,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_appointment_group(request_ctx, id, include=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_appointment_group', 'GET', '/v1/appointment_groups/{id}',
+        'id, include=None',
+        payload=('include',),
+        choices={'include': ('child_events', 'appointments')},
+        doc="""
     Returns information for a single appointment group
 
         :param request_ctx: The request context
@@ -110,22 +92,20 @@ def get_single_appointment_group(request_ctx, id, include=None, **request_kwargs
         :return: Get a single appointment group
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('child_events', 'appointments')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/appointment_groups/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_appointment_group(request_ctx, id, appointment_group_context_codes, appointment_group_sub_context_codes=None, appointment_group_title=None, appointment_group_description=None, appointment_group_location_name=None, appointment_group_location_address=None, appointment_group_publish=None, appointment_group_participants_per_appointment=None, appointment_group_min_appointments_per_participant=None, appointment_group_max_appointments_per_participant=None, appointment_group_new_appointments_X=None, appointment_group_participant_visibility=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_appointment_group', 'PUT', '/v1/appointment_groups/{id}',
+        'id, appointment_group_context_codes, appointment_group_sub_context_codes=None, appointment_group_title=None, appointment_group_description=None, appointment_group_location_name=None, appointment_group_location_address=None, appointment_group_publish=None, appointment_group_participants_per_appointment=None, appointment_group_min_appointments_per_participant=None, appointment_group_max_appointments_per_participant=None, appointment_group_new_appointments_X=None, appointment_group_participant_visibility=None',
+        payload=(
+            'appointment_group[context_codes]', 'appointment_group[sub_context_codes]', 'appointment_group[title]',
+            'appointment_group[description]', 'appointment_group[location_name]', 'appointment_group[location_address]',
+            'appointment_group[publish]', 'appointment_group[participants_per_appointment]',
+            'appointment_group[min_appointments_per_participant]',
+            'appointment_group[max_appointments_per_participant]', 'appointment_group[new_appointments][X]',
+            'appointment_group[participant_visibility]',
+        ),
+        choices={'appointment_group_participant_visibility': ('private', 'protected')},
+        doc="""
     Update and return an appointment group. If new_appointments are specified,
     the response will return a new_appointments array (same format as
     appointments array, see "List appointment groups" action).
@@ -161,33 +141,12 @@ def update_appointment_group(request_ctx, id, appointment_group_context_codes, a
         :return: Update an appointment group
         :rtype: requests.Response (with void data)
 
-    """
-
-    appointment_group_participant_visibility_types = ('private', 'protected')
-    utils.validate_attr_is_acceptable(appointment_group_participant_visibility, appointment_group_participant_visibility_types)
-    path = '/v1/appointment_groups/{id}'
-    payload = {
-        'appointment_group[context_codes]' : appointment_group_context_codes,
-        'appointment_group[sub_context_codes]' : appointment_group_sub_context_codes,
-        'appointment_group[title]' : appointment_group_title,
-        'appointment_group[description]' : appointment_group_description,
-        'appointment_group[location_name]' : appointment_group_location_name,
-        'appointment_group[location_address]' : appointment_group_location_address,
-        'appointment_group[publish]' : appointment_group_publish,
-        'appointment_group[participants_per_appointment]' : appointment_group_participants_per_appointment,
-        'appointment_group[min_appointments_per_participant]' : appointment_group_min_appointments_per_participant,
-        'appointment_group[max_appointments_per_participant]' : appointment_group_max_appointments_per_participant,
-        'appointment_group[new_appointments][X]' : appointment_group_new_appointments_X,
-        'appointment_group[participant_visibility]' : appointment_group_participant_visibility,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_appointment_group(request_ctx, id, cancel_reason=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_appointment_group', 'DELETE', '/v1/appointment_groups/{id}',
+        'id, cancel_reason=None',
+        payload=('cancel_reason',),
+        doc="""
     Delete an appointment group (and associated time slots and reservations)
     and return the deleted group
 
@@ -200,20 +159,13 @@ def delete_appointment_group(request_ctx, id, cancel_reason=None, **request_kwar
         :return: Delete an appointment group
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/appointment_groups/{id}'
-    payload = {
-        'cancel_reason' : cancel_reason,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_user_participants(request_ctx, id, registration_status=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_user_participants', 'GET', '/v1/appointment_groups/{id}/users',
+        'id, registration_status=None',
+        payload=('registration_status',),
+        choices={'registration_status': ('all', 'registered', 'registered')},
+        doc="""
     List users that are (or may be) participating in this appointment group.
     Refer to the Users API for the response fields. Returns no results for
     appointment groups with the "Group" participant_type.
@@ -227,22 +179,13 @@ def list_user_participants(request_ctx, id, registration_status=None, **request_
         :return: List user participants
         :rtype: requests.Response (with void data)
 
-    """
-
-    registration_status_types = ('all', 'registered', 'registered')
-    utils.validate_attr_is_acceptable(registration_status, registration_status_types)
-    path = '/v1/appointment_groups/{id}/users'
-    payload = {
-        'registration_status' : registration_status,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_student_group_participants(request_ctx, id, registration_status=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_student_group_participants', 'GET', '/v1/appointment_groups/{id}/groups',
+        'id, registration_status=None',
+        payload=('registration_status',),
+        choices={'registration_status': ('all', 'registered', 'registered')},
+        doc="""
     List student groups that are (or may be) participating in this appointment
     group. Refer to the Groups API for the response fields. Returns no results
     for appointment groups with the "User" participant_type.
@@ -256,17 +199,7 @@ def list_student_group_participants(request_ctx, id, registration_status=None, *
         :return: List student group participants
         :rtype: requests.Response (with void data)
 
-    """
-
-    registration_status_types = ('all', 'registered', 'registered')
-    utils.validate_attr_is_acceptable(registration_status, registration_status_types)
-    path = '/v1/appointment_groups/{id}/groups'
-    payload = {
-        'registration_status' : registration_status,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
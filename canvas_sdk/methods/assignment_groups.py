@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_assignment_groups(request_ctx, course_id, include, override_assignment_dates=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_assignment_groups', 'GET', '/v1/courses/{course_id}/assignment_groups',
+        'course_id, include, override_assignment_dates=None, per_page=None',
+        payload=('include', 'override_assignment_dates', 'per_page'),
+        choices={'include': ('assignments', 'discussion_topic', 'all_dates')},
+        doc="""
     Returns the list of assignment groups for the current context. The returned
     groups are sorted by their position field.
 
@@ -18,26 +24,13 @@ def list_assignment_groups(request_ctx, course_id, include, override_assignment_
         :return: List assignment groups
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('assignments', 'discussion_topic', 'all_dates')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignment_groups'
-    payload = {
-        'include' : include,
-        'override_assignment_dates' : override_assignment_dates,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_assignment_group(request_ctx, course_id, assignment_group_id, include, override_assignment_dates=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_assignment_group', 'GET', '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}',
+        'course_id, assignment_group_id, include, override_assignment_dates=None',
+        payload=('include', 'override_assignment_dates'),
+        choices={'include': ('assignments', 'discussion_topic')},
+        doc="""
     Returns the assignment group with the given id.
 
         :param request_ctx: The request context
@@ -53,23 +46,12 @@ def get_assignment_group(request_ctx, course_id, assignment_group_id, include, o
         :return: Get an Assignment Group
         :rtype: requests.Response (with AssignmentGroup data)
 
-    """
-
-    include_types = ('assignments', 'discussion_topic')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}'
-    payload = {
-        'include' : include,
-        'override_assignment_dates' : override_assignment_dates,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_group_id=assignment_group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_assignment_group(request_ctx, course_id, name=None, position=None, group_weight=None, rules=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_assignment_group', 'POST', '/v1/courses/{course_id}/assignment_groups',
+        'course_id, name=None, position=None, group_weight=None, rules=None',
+        payload=('name', 'position', 'group_weight', 'rules'),
+        doc="""
     Create a new assignment group for this course.
 
         :param request_ctx: The request context
@@ -87,23 +69,11 @@ def create_assignment_group(request_ctx, course_id, name=None, position=None, gr
         :return: Create an Assignment Group
         :rtype: requests.Response (with AssignmentGroup data)
 
-    """
-
-    path = '/v1/courses/{course_id}/assignment_groups'
-    payload = {
-        'name' : name,
-        'position' : position,
-        'group_weight' : group_weight,
-        'rules' : rules,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def edit_assignment_group(request_ctx, course_id, assignment_group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_assignment_group', 'PUT', '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}',
+        'course_id, assignment_group_id',
+        doc="""
     Modify an existing Assignment Group.
     Accepts the same parameters as Assignment Group creation
 
@@ -116,17 +86,12 @@ def edit_assignment_group(request_ctx, course_id, assignment_group_id, **request
         :return: Edit an Assignment Group
         :rtype: requests.Response (with AssignmentGroup data)
 
-    """
-
-    path = '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_group_id=assignment_group_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def destroy_assignment_group(request_ctx, course_id, assignment_group_id, move_assignment_to, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'destroy_assignment_group', 'DELETE', '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}',
+        'course_id, assignment_group_id, move_assignment_to',
+        payload=('move_assignment_to',),
+        doc="""
     Deletes the assignment group with the given id.
 
         :param request_ctx: The request context
@@ -140,15 +105,7 @@ def destroy_assignment_group(request_ctx, course_id, assignment_group_id, move_a
         :return: Destroy an Assignment Group
         :rtype: requests.Response (with AssignmentGroup data)
 
-    """
-
-    path = '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}'
-    payload = {
-        'move_assignment_to' : move_assignment_to,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_group_id=assignment_group_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
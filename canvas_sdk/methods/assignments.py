@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def delete_assignment(request_ctx, course_id, id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'delete_assignment', 'DELETE', '/v1/courses/{course_id}/assignments/{id}',
+        'course_id, id',
+        doc="""
     Delete the given assignment.
 
         :param request_ctx: The request context
@@ -13,17 +17,13 @@ def delete_assignment(request_ctx, course_id, id, **request_kwargs):
         :return: Delete an assignment
         :rtype: requests.Response (with Assignment data)
 
-    """
-
-    path = '/v1/courses/{course_id}/assignments/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_assignments(request_ctx, course_id, include, search_term=None, override_assignment_dates=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_assignments', 'GET', '/v1/courses/{course_id}/assignments',
+        'course_id, include, search_term=None, override_assignment_dates=None, per_page=None',
+        payload=('include', 'search_term', 'override_assignment_dates', 'per_page'),
+        choices={'include': ('submission',)},
+        doc="""
     Returns the list of assignments for the current context.
 
         :param request_ctx: The request context
@@ -41,27 +41,13 @@ def list_assignments(request_ctx, course_id, include, search_term=None, override
         :return: List assignments
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('submission')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignments'
-    payload = {
-        'include' : include,
-        'search_term' : search_term,
-        'override_assignment_dates' : override_assignment_dates,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_assignment(request_ctx, course_id, id, include, override_assignment_dates=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_assignment', 'GET', '/v1/courses/{course_id}/assignments/{id}',
+        'course_id, id, include, override_assignment_dates=None',
+        payload=('include', 'override_assignment_dates'),
+        choices={'include': ('submission',)},
+        doc="""
     Returns the assignment with the given id.
 
         :param request_ctx: The request context
@@ -77,19 +63,174 @@ def get_single_assignment(request_ctx, course_id, id, include, override_assignme
         :return: Get a single assignment
         :rtype: requests.Response (with Assignment data)
 
-    """
+    """),
+    Endpoint(
+        'list_assignment_overrides', 'GET', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides',
+        'course_id, assignment_id, per_page=None',
+        payload=('per_page',),
+        doc="""
+    Returns the list of overrides for this assignment that target
+    sections/groups/students visible to the current user.
 
-    include_types = ('submission')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignments/{id}'
-    payload = {
-        'include' : include,
-        'override_assignment_dates' : override_assignment_dates,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param assignment_id: (required) ID
+        :type assignment_id: string
+        :param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE
+        :type per_page: integer or None
+        :return: List assignment overrides
+        :rtype: requests.Response (with array data)
 
-    return response
+    """),
+    Endpoint(
+        'get_single_assignment_override', 'GET', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}',
+        'course_id, assignment_id, id',
+        doc="""
+    Returns details of the the override with the given id.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param assignment_id: (required) ID
+        :type assignment_id: string
+        :param id: (required) ID
+        :type id: string
+        :return: Get a single assignment override
+        :rtype: requests.Response (with AssignmentOverride data)
+
+    """),
+    Endpoint(
+        'redirect_to_assignment_override_for_group', 'GET', '/v1/groups/{group_id}/assignments/{assignment_id}/override',
+        'group_id, assignment_id',
+        doc="""
+    Responds with a redirect to the override for the given group, if any
+    (404 otherwise).
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param group_id: (required) ID
+        :type group_id: string
+        :param assignment_id: (required) ID
+        :type assignment_id: string
+        :return: Redirect to the assignment override for a group
+        :rtype: requests.Response (with void data)
+
+    """),
+    Endpoint(
+        'redirect_to_assignment_override_for_section', 'GET', '/v1/sections/{course_section_id}/assignments/{assignment_id}/override',
+        'course_section_id, assignment_id',
+        doc="""
+    Responds with a redirect to the override for the given section, if any
+    (404 otherwise).
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_section_id: (required) ID
+        :type course_section_id: string
+        :param assignment_id: (required) ID
+        :type assignment_id: string
+        :return: Redirect to the assignment override for a section
+        :rtype: requests.Response (with void data)
+
+    """),
+    Endpoint(
+        'create_assignment_override', 'POST', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides',
+        'course_id, assignment_id, assignment_override_student_ids=None, assignment_override_title=None, assignment_override_group_id=None, assignment_override_course_section_id=None, assignment_override_due_at=None, assignment_override_unlock_at=None, assignment_override_lock_at=None',
+        payload=(
+            'assignment_override[student_ids]', 'assignment_override[title]', 'assignment_override[group_id]',
+            'assignment_override[course_section_id]', 'assignment_override[due_at]', 'assignment_override[unlock_at]',
+            'assignment_override[lock_at]',
+        ),
+        doc="""
+    One of student_ids, group_id, or course_section_id must be present. At most
+    one should be present; if multiple are present only the most specific
+    (student_ids first, then group_id, then course_section_id) is used and any
+    others are ignored.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param assignment_id: (required) ID
+        :type assignment_id: string
+        :param assignment_override_student_ids: (optional) The IDs of the override's target students. If present, the IDs must each identify a user with an active student enrollment in the course that is not already targetted by a different adhoc override.
+        :type assignment_override_student_ids: integer or None
+        :param assignment_override_title: (optional) The title of the adhoc assignment override. Required if student_ids is present, ignored otherwise (the title is set to the name of the targetted group or section instead).
+        :type assignment_override_title: string or None
+        :param assignment_override_group_id: (optional) The ID of the override's target group. If present, the following conditions must be met for the override to be successful: 1. the assignment MUST be a group assignment (a group_category_id is assigned to it) 2. the ID must identify an active group in the group set the assignment is in 3. the ID must not be targetted by a different override See {Appendix: Group assignments} for more info.
+        :type assignment_override_group_id: integer or None
+        :param assignment_override_course_section_id: (optional) The ID of the override's target section. If present, must identify an active section of the assignment's course not already targetted by a different override.
+        :type assignment_override_course_section_id: integer or None
+        :param assignment_override_due_at: (optional) The day/time the overridden assignment is due. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect due date. May be present but null to indicate the override removes any previous due date.
+        :type assignment_override_due_at: timestamp or None
+        :param assignment_override_unlock_at: (optional) The day/time the overridden assignment becomes unlocked. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect the unlock date. May be present but null to indicate the override removes any previous unlock date.
+        :type assignment_override_unlock_at: timestamp or None
+        :param assignment_override_lock_at: (optional) The day/time the overridden assignment becomes locked. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect the lock date. May be present but null to indicate the override removes any previous lock date.
+        :type assignment_override_lock_at: timestamp or None
+        :return: Create an assignment override
+        :rtype: requests.Response (with AssignmentOverride data)
+
+    """),
+    Endpoint(
+        'update_assignment_override', 'PUT', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}',
+        'course_id, assignment_id, id, assignment_override_student_ids=None, assignment_override_title=None, assignment_override_due_at=None, assignment_override_unlock_at=None, assignment_override_lock_at=None',
+        payload=(
+            'assignment_override[student_ids]', 'assignment_override[title]', 'assignment_override[due_at]',
+            'assignment_override[unlock_at]', 'assignment_override[lock_at]',
+        ),
+        doc="""
+    All current overridden values must be supplied if they are to be retained;
+    e.g. if due_at was overridden, but this PUT omits a value for due_at,
+    due_at will no longer be overridden. If the override is adhoc and
+    student_ids is not supplied, the target override set is unchanged. Target
+    override sets cannot be changed for group or section overrides.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param assignment_id: (required) ID
+        :type assignment_id: string
+        :param id: (required) ID
+        :type id: string
+        :param assignment_override_student_ids: (optional) The IDs of the override's target students. If present, the IDs must each identify a user with an active student enrollment in the course that is not already targetted by a different adhoc override. Ignored unless the override being updated is adhoc.
+        :type assignment_override_student_ids: integer or None
+        :param assignment_override_title: (optional) The title of an adhoc assignment override. Ignored unless the override being updated is adhoc.
+        :type assignment_override_title: string or None
+        :param assignment_override_due_at: (optional) The day/time the overridden assignment is due. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect due date. May be present but null to indicate the override removes any previous due date.
+        :type assignment_override_due_at: timestamp or None
+        :param assignment_override_unlock_at: (optional) The day/time the overridden assignment becomes unlocked. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect the unlock date. May be present but null to indicate the override removes any previous unlock date.
+        :type assignment_override_unlock_at: timestamp or None
+        :param assignment_override_lock_at: (optional) The day/time the overridden assignment becomes locked. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect the lock date. May be present but null to indicate the override removes any previous lock date.
+        :type assignment_override_lock_at: timestamp or None
+        :return: Update an assignment override
+        :rtype: requests.Response (with AssignmentOverride data)
+
+    """),
+    Endpoint(
+        'delete_assignment_override', 'DELETE', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}',
+        'course_id, assignment_id, id',
+        doc="""
+    Deletes an override and returns its former details.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param assignment_id: (required) ID
+        :type assignment_id: string
+        :param id: (required) ID
+        :type id: string
+        :return: Delete an assignment override
+        :rtype: requests.Response (with AssignmentOverride data)
+
+    """),
+]
+
+build_methods(ENDPOINTS, globals())
 
 
 def create_assignment(request_ctx, course_id, assignment_name, assignment_submission_types, assignment_position=None, assignment_allowed_extensions=None, assignment_turnitin_enabled=None, assignment_integration_data=None, assignment_integration_id=None, assignment_turnitin_settings=None, assignment_peer_reviews=None, assignment_automatic_peer_reviews=None, assignment_notify_of_update=None, assignment_group_category_id=None, assignment_grade_group_students_individually=None, assignment_external_tool_tag_attributes=None, assignment_points_possible=None, assignment_grading_type=None, assignment_due_at=None, assignment_lock_at=None, assignment_unlock_at=None, assignment_description=None, assignment_assignment_group_id=None, assignment_muted=None, assignment_assignment_overrides=None, assignment_only_visible_to_overrides=None, assignment_published=None, assignment_grading_standard_id=None, **request_kwargs):
@@ -304,222 +445,3 @@ def edit_assignment(request_ctx, course_id, id, assignment_name=None, assignment
     response = client.put(request_ctx, url, payload=payload, **request_kwargs)
 
     return response
-
-
-def list_assignment_overrides(request_ctx, course_id, assignment_id, per_page=None, **request_kwargs):
-    """
-    Returns the list of overrides for this assignment that target
-    sections/groups/students visible to the current user.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param assignment_id: (required) ID
-        :type assignment_id: string
-        :param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE
-        :type per_page: integer or None
-        :return: List assignment overrides
-        :rtype: requests.Response (with array data)
-
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_assignment_override(request_ctx, course_id, assignment_id, id, **request_kwargs):
-    """
-    Returns details of the the override with the given id.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param assignment_id: (required) ID
-        :type assignment_id: string
-        :param id: (required) ID
-        :type id: string
-        :return: Get a single assignment override
-        :rtype: requests.Response (with AssignmentOverride data)
-
-    """
-
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def redirect_to_assignment_override_for_group(request_ctx, group_id, assignment_id, **request_kwargs):
-    """
-    Responds with a redirect to the override for the given group, if any
-    (404 otherwise).
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param group_id: (required) ID
-        :type group_id: string
-        :param assignment_id: (required) ID
-        :type assignment_id: string
-        :return: Redirect to the assignment override for a group
-        :rtype: requests.Response (with void data)
-
-    """
-
-    path = '/v1/groups/{group_id}/assignments/{assignment_id}/override'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def redirect_to_assignment_override_for_section(request_ctx, course_section_id, assignment_id, **request_kwargs):
-    """
-    Responds with a redirect to the override for the given section, if any
-    (404 otherwise).
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_section_id: (required) ID
-        :type course_section_id: string
-        :param assignment_id: (required) ID
-        :type assignment_id: string
-        :return: Redirect to the assignment override for a section
-        :rtype: requests.Response (with void data)
-
-    """
-
-    path = '/v1/sections/{course_section_id}/assignments/{assignment_id}/override'
-    url = request_ctx.base_api_url + path.format(course_section_id=course_section_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_assignment_override(request_ctx, course_id, assignment_id, assignment_override_student_ids=None, assignment_override_title=None, assignment_override_group_id=None, assignment_override_course_section_id=None, assignment_override_due_at=None, assignment_override_unlock_at=None, assignment_override_lock_at=None, **request_kwargs):
-    """
-    One of student_ids, group_id, or course_section_id must be present. At most
-    one should be present; if multiple are present only the most specific
-    (student_ids first, then group_id, then course_section_id) is used and any
-    others are ignored.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param assignment_id: (required) ID
-        :type assignment_id: string
-        :param assignment_override_student_ids: (optional) The IDs of the override's target students. If present, the IDs must each identify a user with an active student enrollment in the course that is not already targetted by a different adhoc override.
-        :type assignment_override_student_ids: integer or None
-        :param assignment_override_title: (optional) The title of the adhoc assignment override. Required if student_ids is present, ignored otherwise (the title is set to the name of the targetted group or section instead).
-        :type assignment_override_title: string or None
-        :param assignment_override_group_id: (optional) The ID of the override's target group. If present, the following conditions must be met for the override to be successful: 1. the assignment MUST be a group assignment (a group_category_id is assigned to it) 2. the ID must identify an active group in the group set the assignment is in 3. the ID must not be targetted by a different override See {Appendix: Group assignments} for more info.
-        :type assignment_override_group_id: integer or None
-        :param assignment_override_course_section_id: (optional) The ID of the override's target section. If present, must identify an active section of the assignment's course not already targetted by a different override.
-        :type assignment_override_course_section_id: integer or None
-        :param assignment_override_due_at: (optional) The day/time the overridden assignment is due. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect due date. May be present but null to indicate the override removes any previous due date.
-        :type assignment_override_due_at: timestamp or None
-        :param assignment_override_unlock_at: (optional) The day/time the overridden assignment becomes unlocked. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect the unlock date. May be present but null to indicate the override removes any previous unlock date.
-        :type assignment_override_unlock_at: timestamp or None
-        :param assignment_override_lock_at: (optional) The day/time the overridden assignment becomes locked. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect the lock date. May be present but null to indicate the override removes any previous lock date.
-        :type assignment_override_lock_at: timestamp or None
-        :return: Create an assignment override
-        :rtype: requests.Response (with AssignmentOverride data)
-
-    """
-
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides'
-    payload = {
-        'assignment_override[student_ids]' : assignment_override_student_ids,
-        'assignment_override[title]' : assignment_override_title,
-        'assignment_override[group_id]' : assignment_override_group_id,
-        'assignment_override[course_section_id]' : assignment_override_course_section_id,
-        'assignment_override[due_at]' : assignment_override_due_at,
-        'assignment_override[unlock_at]' : assignment_override_unlock_at,
-        'assignment_override[lock_at]' : assignment_override_lock_at,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_assignment_override(request_ctx, course_id, assignment_id, id, assignment_override_student_ids=None, assignment_override_title=None, assignment_override_due_at=None, assignment_override_unlock_at=None, assignment_override_lock_at=None, **request_kwargs):
-    """
-    All current overridden values must be supplied if they are to be retained;
-    e.g. if due_at was overridden, but this PUT omits a value for due_at,
-    due_at will no longer be overridden. If the override is adhoc and
-    student_ids is not supplied, the target override set is unchanged. Target
-    override sets cannot be changed for group or section overrides.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param assignment_id: (required) ID
-        :type assignment_id: string
-        :param id: (required) ID
-        :type id: string
-        :param assignment_override_student_ids: (optional) The IDs of the override's target students. If present, the IDs must each identify a user with an active student enrollment in the course that is not already targetted by a different adhoc override. Ignored unless the override being updated is adhoc.
-        :type assignment_override_student_ids: integer or None
-        :param assignment_override_title: (optional) The title of an adhoc assignment override. Ignored unless the override being updated is adhoc.
-        :type assignment_override_title: string or None
-        :param assignment_override_due_at: (optional) The day/time the overridden assignment is due. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect due date. May be present but null to indicate the override removes any previous due date.
-        :type assignment_override_due_at: timestamp or None
-        :param assignment_override_unlock_at: (optional) The day/time the overridden assignment becomes unlocked. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect the unlock date. May be present but null to indicate the override removes any previous unlock date.
-        :type assignment_override_unlock_at: timestamp or None
-        :param assignment_override_lock_at: (optional) The day/time the overridden assignment becomes locked. Accepts times in ISO 8601 format, e.g. 2014-10-21T18:48:00Z. If absent, this override will not affect the lock date. May be present but null to indicate the override removes any previous lock date.
-        :type assignment_override_lock_at: timestamp or None
-        :return: Update an assignment override
-        :rtype: requests.Response (with AssignmentOverride data)
-
-    """
-
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}'
-    payload = {
-        'assignment_override[student_ids]' : assignment_override_student_ids,
-        'assignment_override[title]' : assignment_override_title,
-        'assignment_override[due_at]' : assignment_override_due_at,
-        'assignment_override[unlock_at]' : assignment_override_unlock_at,
-        'assignment_override[lock_at]' : assignment_override_lock_at,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_assignment_override(request_ctx, course_id, assignment_id, id, **request_kwargs):
-    """
-    Deletes an override and returns its former details.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param assignment_id: (required) ID
-        :type assignment_id: string
-        :param id: (required) ID
-        :type id: string
-        :return: Delete an assignment override
-        :rtype: requests.Response (with AssignmentOverride data)
-
-    """
-
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def query_by_login(request_ctx, login_id, start_time=None, end_time=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'query_by_login', 'GET', '/v1/audit/authentication/logins/{login_id}',
+        'login_id, start_time=None, end_time=None',
+        payload=('start_time', 'end_time'),
+        doc="""
     List authentication events for a given login.
 
         :param request_ctx: The request context
@@ -15,21 +20,12 @@ def query_by_login(request_ctx, login_id, start_time=None, end_time=None, **requ
         :return: Query by login.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/audit/authentication/logins/{login_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-    }
-    url = request_ctx.base_api_url + path.format(login_id=login_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def query_by_account(request_ctx, account_id, start_time=None, end_time=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'query_by_account', 'GET', '/v1/audit/authentication/accounts/{account_id}',
+        'account_id, start_time=None, end_time=None',
+        payload=('start_time', 'end_time'),
+        doc="""
     List authentication events for a given account.
 
         :param request_ctx: The request context
@@ -43,21 +39,12 @@ def query_by_account(request_ctx, account_id, start_time=None, end_time=None, **
         :return: Query by account.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/audit/authentication/accounts/{account_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def query_by_user(request_ctx, user_id, start_time=None, end_time=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'query_by_user', 'GET', '/v1/audit/authentication/users/{user_id}',
+        'user_id, start_time=None, end_time=None',
+        payload=('start_time', 'end_time'),
+        doc="""
     List authentication events for a given user.
 
         :param request_ctx: The request context
@@ -71,16 +58,7 @@ def query_by_user(request_ctx, user_id, start_time=None, end_time=None, **reques
         :return: Query by user.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/audit/authentication/users/{user_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
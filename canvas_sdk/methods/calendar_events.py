@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_calendar_events(request_ctx, type=None, start_date=None, end_date=None, undated=None, all_events=None, context_codes=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_calendar_events', 'GET', '/v1/calendar_events',
+        'type=None, start_date=None, end_date=None, undated=None, all_events=None, context_codes=None, per_page=None',
+        payload=('type', 'start_date', 'end_date', 'undated', 'all_events', 'context_codes', 'per_page'),
+        choices={'type': ('event', 'assignment')},
+        doc="""
     Retrieve the list of calendar events or assignments for the current user
 
         :param request_ctx: The request context
@@ -23,30 +29,18 @@ def list_calendar_events(request_ctx, type=None, start_date=None, end_date=None,
         :return: List calendar events
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    type_types = ('event', 'assignment')
-    utils.validate_attr_is_acceptable(type, type_types)
-    path = '/v1/calendar_events'
-    payload = {
-        'type' : type,
-        'start_date' : start_date,
-        'end_date' : end_date,
-        'undated' : undated,
-        'all_events' : all_events,
-        'context_codes' : context_codes,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_calendar_event(request_ctx, calendar_event_context_code, calendar_event_title=None, calendar_event_description=None, calendar_event_start_at=None, calendar_event_end_at=None, calendar_event_location_name=None, calendar_event_location_address=None, calendar_event_time_zone_edited=None, calendar_event_child_event_data_X_start_at=None, calendar_event_child_event_data_X_end_at=None, calendar_event_child_event_data_X_context_code=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_calendar_event', 'POST', '/v1/calendar_events',
+        'calendar_event_context_code, calendar_event_title=None, calendar_event_description=None, calendar_event_start_at=None, calendar_event_end_at=None, calendar_event_location_name=None, calendar_event_location_address=None, calendar_event_time_zone_edited=None, calendar_event_child_event_data_X_start_at=None, calendar_event_child_event_data_X_end_at=None, calendar_event_child_event_data_X_context_code=None',
+        payload=(
+            'calendar_event[context_code]', 'calendar_event[title]', 'calendar_event[description]',
+            'calendar_event[start_at]', 'calendar_event[end_at]', 'calendar_event[location_name]',
+            'calendar_event[location_address]', 'calendar_event[time_zone_edited]',
+            'calendar_event[child_event_data][X][start_at]', 'calendar_event[child_event_data][X][end_at]',
+            'calendar_event[child_event_data][X][context_code]',
+        ),
+        doc="""
     Create and return a new calendar event
 
         :param request_ctx: The request context
@@ -76,30 +70,11 @@ def create_calendar_event(request_ctx, calendar_event_context_code, calendar_eve
         :return: Create a calendar event
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/calendar_events'
-    payload = {
-        'calendar_event[context_code]' : calendar_event_context_code,
-        'calendar_event[title]' : calendar_event_title,
-        'calendar_event[description]' : calendar_event_description,
-        'calendar_event[start_at]' : calendar_event_start_at,
-        'calendar_event[end_at]' : calendar_event_end_at,
-        'calendar_event[location_name]' : calendar_event_location_name,
-        'calendar_event[location_address]' : calendar_event_location_address,
-        'calendar_event[time_zone_edited]' : calendar_event_time_zone_edited,
-        'calendar_event[child_event_data][X][start_at]' : calendar_event_child_event_data_X_start_at,
-        'calendar_event[child_event_data][X][end_at]' : calendar_event_child_event_data_X_end_at,
-        'calendar_event[child_event_data][X][context_code]' : calendar_event_child_event_data_X_context_code,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_calendar_event_or_assignment(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_calendar_event_or_assignment', 'GET', '/v1/calendar_events/{id}',
+        'id',
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -108,17 +83,12 @@ def get_single_calendar_event_or_assignment(request_ctx, id, **request_kwargs):
         :return: Get a single calendar event or assignment
         :rtype: requests.Response (with CalendarEvent data)
 
-    """
-
-    path = '/v1/calendar_events/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def reserve_time_slot(request_ctx, id, participant_id=None, cancel_existing=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reserve_time_slot', 'POST', '/v1/calendar_events/{id}/reservations',
+        'id, participant_id=None, cancel_existing=None',
+        payload=('participant_id', 'cancel_existing'),
+        doc="""
     Reserves a particular time slot and return the new reservation
 
         :param request_ctx: The request context
@@ -132,21 +102,12 @@ def reserve_time_slot(request_ctx, id, participant_id=None, cancel_existing=None
         :return: Reserve a time slot
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/calendar_events/{id}/reservations'
-    payload = {
-        'participant_id' : participant_id,
-        'cancel_existing' : cancel_existing,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def reserve_time_slot_participant_id(request_ctx, id, participant_id=None, cancel_existing=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reserve_time_slot_participant_id', 'POST', '/v1/calendar_events/{id}/reservations/{participant_id}',
+        'id, participant_id=None, cancel_existing=None',
+        payload=('cancel_existing',),
+        doc="""
     Reserves a particular time slot and return the new reservation
 
         :param request_ctx: The request context
@@ -160,20 +121,18 @@ def reserve_time_slot_participant_id(request_ctx, id, participant_id=None, cance
         :return: Reserve a time slot
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/calendar_events/{id}/reservations/{participant_id}'
-    payload = {
-        'cancel_existing' : cancel_existing,
-    }
-    url = request_ctx.base_api_url + path.format(id=id, participant_id=participant_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_calendar_event(request_ctx, id, calendar_event_context_code, calendar_event_title=None, calendar_event_description=None, calendar_event_start_at=None, calendar_event_end_at=None, calendar_event_location_name=None, calendar_event_location_address=None, calendar_event_time_zone_edited=None, calendar_event_child_event_data_X_start_at=None, calendar_event_child_event_data_X_end_at=None, calendar_event_child_event_data_X_context_code=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_calendar_event', 'PUT', '/v1/calendar_events/{id}',
+        'id, calendar_event_context_code, calendar_event_title=None, calendar_event_description=None, calendar_event_start_at=None, calendar_event_end_at=None, calendar_event_location_name=None, calendar_event_location_address=None, calendar_event_time_zone_edited=None, calendar_event_child_event_data_X_start_at=None, calendar_event_child_event_data_X_end_at=None, calendar_event_child_event_data_X_context_code=None',
+        payload=(
+            'calendar_event[context_code]', 'calendar_event[title]', 'calendar_event[description]',
+            'calendar_event[start_at]', 'calendar_event[end_at]', 'calendar_event[location_name]',
+            'calendar_event[location_address]', 'calendar_event[time_zone_edited]',
+            'calendar_event[child_event_data][X][start_at]', 'calendar_event[child_event_data][X][end_at]',
+            'calendar_event[child_event_data][X][context_code]',
+        ),
+        doc="""
     Update and return a calendar event
 
         :param request_ctx: The request context
@@ -205,30 +164,12 @@ def update_calendar_event(request_ctx, id, calendar_event_context_code, calendar
         :return: Update a calendar event
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/calendar_events/{id}'
-    payload = {
-        'calendar_event[context_code]' : calendar_event_context_code,
-        'calendar_event[title]' : calendar_event_title,
-        'calendar_event[description]' : calendar_event_description,
-        'calendar_event[start_at]' : calendar_event_start_at,
-        'calendar_event[end_at]' : calendar_event_end_at,
-        'calendar_event[location_name]' : calendar_event_location_name,
-        'calendar_event[location_address]' : calendar_event_location_address,
-        'calendar_event[time_zone_edited]' : calendar_event_time_zone_edited,
-        'calendar_event[child_event_data][X][start_at]' : calendar_event_child_event_data_X_start_at,
-        'calendar_event[child_event_data][X][end_at]' : calendar_event_child_event_data_X_end_at,
-        'calendar_event[child_event_data][X][context_code]' : calendar_event_child_event_data_X_context_code,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_calendar_event(request_ctx, id, cancel_reason=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_calendar_event', 'DELETE', '/v1/calendar_events/{id}',
+        'id, cancel_reason=None',
+        payload=('cancel_reason',),
+        doc="""
     Delete an event from the calendar and return the deleted event
 
         :param request_ctx: The request context
@@ -240,15 +181,7 @@ def delete_calendar_event(request_ctx, id, cancel_reason=None, **request_kwargs)
         :return: Delete a calendar event
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/calendar_events/{id}'
-    payload = {
-        'cancel_reason' : cancel_reason,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def list_members_of_collaboration(request_ctx, id, per_page=None, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'list_members_of_collaboration', 'GET', '/v1/collaborations/{id}/members',
+        'id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Examples
     
       curl https://<canvas>/api/v1/courses/1/collaborations/1/members
@@ -15,17 +20,7 @@ def list_members_of_collaboration(request_ctx, id, per_page=None, **request_kwar
         :return: List members of a collaboration.
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/collaborations/{id}/members'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def list_of_commmessages_for_user(request_ctx, user_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'list_of_commmessages_for_user', 'GET', '/v1/comm_messages',
+        'user_id, start_time=None, end_time=None, per_page=None',
+        payload=('user_id', 'start_time', 'end_time', 'per_page'),
+        doc="""
     Retrieve messages sent to a user.
 
         :param request_ctx: The request context
@@ -17,20 +22,7 @@ def list_of_commmessages_for_user(request_ctx, user_id, start_time=None, end_tim
         :return: List of CommMessages for a user
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/comm_messages'
-    payload = {
-        'user_id' : user_id,
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_user_communication_channels(request_ctx, user_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_user_communication_channels', 'GET', '/v1/users/{user_id}/communication_channels',
+        'user_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns a list of communication channels for the specified user, sorted by
     position.
 
@@ -14,22 +19,13 @@ def list_user_communication_channels(request_ctx, user_id, per_page=None, **requ
         :return: List user communication channels
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/communication_channels'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_communication_channel(request_ctx, user_id, communication_channel_address, communication_channel_type, skip_confirmation=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_communication_channel', 'POST', '/v1/users/{user_id}/communication_channels',
+        'user_id, communication_channel_address, communication_channel_type, skip_confirmation=None',
+        payload=('communication_channel[address]', 'communication_channel[type]', 'skip_confirmation'),
+        choices={'communication_channel_type': ('email', 'sms', 'push')},
+        doc="""
     Creates a new communication channel for the specified user.
 
         :param request_ctx: The request context
@@ -45,24 +41,11 @@ def create_communication_channel(request_ctx, user_id, communication_channel_add
         :return: Create a communication channel
         :rtype: requests.Response (with CommunicationChannel data)
 
-    """
-
-    communication_channel_type_types = ('email', 'sms', 'push')
-    utils.validate_attr_is_acceptable(communication_channel_type, communication_channel_type_types)
-    path = '/v1/users/{user_id}/communication_channels'
-    payload = {
-        'communication_channel[address]' : communication_channel_address,
-        'communication_channel[type]' : communication_channel_type,
-        'skip_confirmation' : skip_confirmation,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_communication_channel_id(request_ctx, user_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_communication_channel_id', 'DELETE', '/v1/users/{user_id}/communication_channels/{id}',
+        'user_id, id',
+        doc="""
     Delete an existing communication channel.
 
         :param request_ctx: The request context
@@ -74,17 +57,11 @@ def delete_communication_channel_id(request_ctx, user_id, id, **request_kwargs):
         :return: Delete a communication channel
         :rtype: requests.Response (with CommunicationChannel data)
 
-    """
-
-    path = '/v1/users/{user_id}/communication_channels/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_communication_channel_type(request_ctx, user_id, type, address, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_communication_channel_type', 'DELETE', '/v1/users/{user_id}/communication_channels/{type}/{address}',
+        'user_id, type, address',
+        doc="""
     Delete an existing communication channel.
 
         :param request_ctx: The request context
@@ -98,12 +75,7 @@ def delete_communication_channel_type(request_ctx, user_id, type, address, **req
         :return: Delete a communication channel
         :rtype: requests.Response (with CommunicationChannel data)
 
-    """
-
-    path = '/v1/users/{user_id}/communication_channels/{type}/{address}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, type=type, address=address)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
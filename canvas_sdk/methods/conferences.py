@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_conferences_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_conferences_courses', 'GET', '/v1/courses/{course_id}/conferences',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Retrieve the list of conferences for this context
     
     This API returns a JSON object containing the list of conferences,
@@ -23,22 +28,12 @@ def list_conferences_courses(request_ctx, course_id, per_page=None, **request_kw
         :return: List conferences
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/conferences'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_conferences_groups(request_ctx, group_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_conferences_groups', 'GET', '/v1/groups/{group_id}/conferences',
+        'group_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Retrieve the list of conferences for this context
     
     This API returns a JSON object containing the list of conferences,
@@ -60,17 +55,7 @@ def list_conferences_groups(request_ctx, group_id, per_page=None, **request_kwar
         :return: List conferences
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/conferences'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
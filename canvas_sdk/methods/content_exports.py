@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_content_exports(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_content_exports', 'GET', '/v1/courses/{course_id}/content_exports',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the past and pending content export jobs for a course.
     Exports are returned newest first.
 
@@ -14,22 +19,11 @@ def list_content_exports(request_ctx, course_id, per_page=None, **request_kwargs
         :return: List content exports
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/content_exports'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_content_export(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_content_export', 'GET', '/v1/courses/{course_id}/content_exports/{id}',
+        'course_id, id',
+        doc="""
     Get information about a single content export.
 
         :param request_ctx: The request context
@@ -41,17 +35,13 @@ def show_content_export(request_ctx, course_id, id, **request_kwargs):
         :return: Show content export
         :rtype: requests.Response (with ContentExport data)
 
-    """
-
-    path = '/v1/courses/{course_id}/content_exports/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def export_course_content(request_ctx, course_id, export_type, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'export_course_content', 'POST', '/v1/courses/{course_id}/content_exports',
+        'course_id, export_type',
+        payload=('export_type',),
+        choices={'export_type': ('common_cartridge', 'qti')},
+        doc="""
     Begin a content export job for a course.
     
     You can use the `ProgressController#show <https://github.com/instructure/canvas-lms/blob/master/app/controllers/progress_controller.rb>`_ to track the
@@ -70,17 +60,7 @@ def export_course_content(request_ctx, course_id, export_type, **request_kwargs)
         :return: Export course content
         :rtype: requests.Response (with ContentExport data)
 
-    """
-
-    export_type_types = ('common_cartridge', 'qti')
-    utils.validate_attr_is_acceptable(export_type, export_type_types)
-    path = '/v1/courses/{course_id}/content_exports'
-    payload = {
-        'export_type' : export_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_migration_issues_accounts(request_ctx, account_id, content_migration_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_migration_issues_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues',
+        'account_id, content_migration_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns paginated migration issues
 
         :param request_ctx: The request context
@@ -15,22 +20,12 @@ def list_migration_issues_accounts(request_ctx, account_id, content_migration_id
         :return: List migration issues
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, content_migration_id=content_migration_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_migration_issues_courses(request_ctx, course_id, content_migration_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_migration_issues_courses', 'GET', '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues',
+        'course_id, content_migration_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns paginated migration issues
 
         :param request_ctx: The request context
@@ -44,22 +39,12 @@ def list_migration_issues_courses(request_ctx, course_id, content_migration_id,
         :return: List migration issues
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, content_migration_id=content_migration_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_migration_issues_groups(request_ctx, group_id, content_migration_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_migration_issues_groups', 'GET', '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues',
+        'group_id, content_migration_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns paginated migration issues
 
         :param request_ctx: The request context
@@ -73,22 +58,12 @@ def list_migration_issues_groups(request_ctx, group_id, content_migration_id, pe
         :return: List migration issues
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, content_migration_id=content_migration_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_migration_issues_users(request_ctx, user_id, content_migration_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_migration_issues_users', 'GET', '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues',
+        'user_id, content_migration_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns paginated migration issues
 
         :param request_ctx: The request context
@@ -102,22 +77,11 @@ def list_migration_issues_users(request_ctx, user_id, content_migration_id, per_
         :return: List migration issues
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, content_migration_id=content_migration_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_migration_issue_accounts(request_ctx, account_id, content_migration_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_migration_issue_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues/{id}',
+        'account_id, content_migration_id, id',
+        doc="""
     Returns data on an individual migration issue
 
         :param request_ctx: The request context
@@ -131,17 +95,11 @@ def get_migration_issue_accounts(request_ctx, account_id, content_migration_id,
         :return: Get a migration issue
         :rtype: requests.Response (with MigrationIssue data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, content_migration_id=content_migration_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_migration_issue_courses(request_ctx, course_id, content_migration_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_migration_issue_courses', 'GET', '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues/{id}',
+        'course_id, content_migration_id, id',
+        doc="""
     Returns data on an individual migration issue
 
         :param request_ctx: The request context
@@ -155,17 +113,11 @@ def get_migration_issue_courses(request_ctx, course_id, content_migration_id, id
         :return: Get a migration issue
         :rtype: requests.Response (with MigrationIssue data)
 
-    """
-
-    path = '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, content_migration_id=content_migration_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_migration_issue_groups(request_ctx, group_id, content_migration_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_migration_issue_groups', 'GET', '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues/{id}',
+        'group_id, content_migration_id, id',
+        doc="""
     Returns data on an individual migration issue
 
         :param request_ctx: The request context
@@ -179,17 +131,11 @@ def get_migration_issue_groups(request_ctx, group_id, content_migration_id, id,
         :return: Get a migration issue
         :rtype: requests.Response (with MigrationIssue data)
 
-    """
-
-    path = '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, content_migration_id=content_migration_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_migration_issue_users(request_ctx, user_id, content_migration_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_migration_issue_users', 'GET', '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues/{id}',
+        'user_id, content_migration_id, id',
+        doc="""
     Returns data on an individual migration issue
 
         :param request_ctx: The request context
@@ -203,17 +149,13 @@ def get_migration_issue_users(request_ctx, user_id, content_migration_id, id, **
         :return: Get a migration issue
         :rtype: requests.Response (with MigrationIssue data)
 
-    """
-
-    path = '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, content_migration_id=content_migration_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_migration_issue_accounts(request_ctx, account_id, content_migration_id, id, workflow_state, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_migration_issue_accounts', 'PUT', '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues/{id}',
+        'account_id, content_migration_id, id, workflow_state',
+        payload=('workflow_state',),
+        choices={'workflow_state': ('active', 'resolved')},
+        doc="""
     Update the workflow_state of a migration issue
 
         :param request_ctx: The request context
@@ -229,22 +171,13 @@ def update_migration_issue_accounts(request_ctx, account_id, content_migration_i
         :return: Update a migration issue
         :rtype: requests.Response (with MigrationIssue data)
 
-    """
-
-    workflow_state_types = ('active', 'resolved')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    payload = {
-        'workflow_state' : workflow_state,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, content_migration_id=content_migration_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_migration_issue_courses(request_ctx, course_id, content_migration_id, id, workflow_state, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_migration_issue_courses', 'PUT', '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues/{id}',
+        'course_id, content_migration_id, id, workflow_state',
+        payload=('workflow_state',),
+        choices={'workflow_state': ('active', 'resolved')},
+        doc="""
     Update the workflow_state of a migration issue
 
         :param request_ctx: The request context
@@ -260,22 +193,13 @@ def update_migration_issue_courses(request_ctx, course_id, content_migration_id,
         :return: Update a migration issue
         :rtype: requests.Response (with MigrationIssue data)
 
-    """
-
-    workflow_state_types = ('active', 'resolved')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    payload = {
-        'workflow_state' : workflow_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, content_migration_id=content_migration_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_migration_issue_groups(request_ctx, group_id, content_migration_id, id, workflow_state, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_migration_issue_groups', 'PUT', '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues/{id}',
+        'group_id, content_migration_id, id, workflow_state',
+        payload=('workflow_state',),
+        choices={'workflow_state': ('active', 'resolved')},
+        doc="""
     Update the workflow_state of a migration issue
 
         :param request_ctx: The request context
@@ -291,22 +215,13 @@ def update_migration_issue_groups(request_ctx, group_id, content_migration_id, i
         :return: Update a migration issue
         :rtype: requests.Response (with MigrationIssue data)
 
-    """
-
-    workflow_state_types = ('active', 'resolved')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    payload = {
-        'workflow_state' : workflow_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, content_migration_id=content_migration_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_migration_issue_users(request_ctx, user_id, content_migration_id, id, workflow_state, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_migration_issue_users', 'PUT', '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues/{id}',
+        'user_id, content_migration_id, id, workflow_state',
+        payload=('workflow_state',),
+        choices={'workflow_state': ('active', 'resolved')},
+        doc="""
     Update the workflow_state of a migration issue
 
         :param request_ctx: The request context
@@ -322,22 +237,12 @@ def update_migration_issue_users(request_ctx, user_id, content_migration_id, id,
         :return: Update a migration issue
         :rtype: requests.Response (with MigrationIssue data)
 
-    """
-
-    workflow_state_types = ('active', 'resolved')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    payload = {
-        'workflow_state' : workflow_state,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, content_migration_id=content_migration_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_content_migrations_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_content_migrations_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations',
+        'account_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns paginated content migrations
 
         :param request_ctx: The request context
@@ -349,22 +254,12 @@ def list_content_migrations_accounts(request_ctx, account_id, per_page=None, **r
         :return: List content migrations
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/content_migrations'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_content_migrations_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_content_migrations_courses', 'GET', '/v1/courses/{course_id}/content_migrations',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns paginated content migrations
 
         :param request_ctx: The request context
@@ -376,22 +271,12 @@ def list_content_migrations_courses(request_ctx, course_id, per_page=None, **req
         :return: List content migrations
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/content_migrations'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_content_migrations_groups(request_ctx, group_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_content_migrations_groups', 'GET', '/v1/groups/{group_id}/content_migrations',
+        'group_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns paginated content migrations
 
         :param request_ctx: The request context
@@ -403,22 +288,12 @@ def list_content_migrations_groups(request_ctx, group_id, per_page=None, **reque
         :return: List content migrations
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/content_migrations'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_content_migrations_users(request_ctx, user_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_content_migrations_users', 'GET', '/v1/users/{user_id}/content_migrations',
+        'user_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns paginated content migrations
 
         :param request_ctx: The request context
@@ -430,22 +305,11 @@ def list_content_migrations_users(request_ctx, user_id, per_page=None, **request
         :return: List content migrations
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/content_migrations'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_content_migration_accounts(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_content_migration_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations/{id}',
+        'account_id, id',
+        doc="""
     Returns data on an individual content migration
 
         :param request_ctx: The request context
@@ -457,17 +321,11 @@ def get_content_migration_accounts(request_ctx, account_id, id, **request_kwargs
         :return: Get a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_content_migration_courses(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_content_migration_courses', 'GET', '/v1/courses/{course_id}/content_migrations/{id}',
+        'course_id, id',
+        doc="""
     Returns data on an individual content migration
 
         :param request_ctx: The request context
@@ -479,17 +337,11 @@ def get_content_migration_courses(request_ctx, course_id, id, **request_kwargs):
         :return: Get a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/courses/{course_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_content_migration_groups(request_ctx, group_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_content_migration_groups', 'GET', '/v1/groups/{group_id}/content_migrations/{id}',
+        'group_id, id',
+        doc="""
     Returns data on an individual content migration
 
         :param request_ctx: The request context
@@ -501,17 +353,11 @@ def get_content_migration_groups(request_ctx, group_id, id, **request_kwargs):
         :return: Get a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/groups/{group_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_content_migration_users(request_ctx, user_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_content_migration_users', 'GET', '/v1/users/{user_id}/content_migrations/{id}',
+        'user_id, id',
+        doc="""
     Returns data on an individual content migration
 
         :param request_ctx: The request context
@@ -523,17 +369,20 @@ def get_content_migration_users(request_ctx, user_id, id, **request_kwargs):
         :return: Get a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/users/{user_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_content_migration_accounts(request_ctx, account_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_content_migration_accounts', 'POST', '/v1/accounts/{account_id}/content_migrations',
+        'account_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None',
+        payload=(
+            'migration_type', 'pre_attachment[name]', 'pre_attachment[content_type]',
+            'pre_attachment[parent_folder_id]', 'pre_attachment[parent_folder_path]', 'pre_attachment[folder]',
+            'pre_attachment[on_duplicate]', 'settings[file_url]', 'settings[source_course_id]', 'settings[folder_id]',
+            'settings[overwrite_quizzes]', 'settings[question_bank_id]', 'settings[question_bank_name]',
+            'date_shift_options[shift_dates]', 'date_shift_options[old_start_date]', 'date_shift_options[old_end_date]',
+            'date_shift_options[new_start_date]', 'date_shift_options[new_end_date]',
+            'date_shift_options[day_substitutions][X]', 'date_shift_options[remove_dates]',
+        ),
+        doc="""
     Create a content migration. If the migration requires a file to be uploaded
     the actual processing of the file will start once the file upload process is completed.
     File uploading works as described in the {file:file_uploads.html File Upload Documentation}
@@ -609,39 +458,20 @@ def create_content_migration_accounts(request_ctx, account_id, migration_type, p
         :return: Create a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/content_migrations'
-    payload = {
-        'migration_type' : migration_type,
-        'pre_attachment[name]' : pre_attachment_name,
-        'pre_attachment[content_type]' : pre_attachment_content_type,
-        'pre_attachment[parent_folder_id]' : pre_attachment_parent_folder_id,
-        'pre_attachment[parent_folder_path]' : pre_attachment_parent_folder_path,
-        'pre_attachment[folder]' : pre_attachment_folder,
-        'pre_attachment[on_duplicate]' : pre_attachment_on_duplicate,
-        'settings[file_url]' : settings_file_url,
-        'settings[source_course_id]' : settings_source_course_id,
-        'settings[folder_id]' : settings_folder_id,
-        'settings[overwrite_quizzes]' : settings_overwrite_quizzes,
-        'settings[question_bank_id]' : settings_question_bank_id,
-        'settings[question_bank_name]' : settings_question_bank_name,
-        'date_shift_options[shift_dates]' : date_shift_options_shift_dates,
-        'date_shift_options[old_start_date]' : date_shift_options_old_start_date,
-        'date_shift_options[old_end_date]' : date_shift_options_old_end_date,
-        'date_shift_options[new_start_date]' : date_shift_options_new_start_date,
-        'date_shift_options[new_end_date]' : date_shift_options_new_end_date,
-        'date_shift_options[day_substitutions][X]' : date_shift_options_day_substitutions_X,
-        'date_shift_options[remove_dates]' : date_shift_options_remove_dates,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_content_migration_courses(request_ctx, course_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_content_migration_courses', 'POST', '/v1/courses/{course_id}/content_migrations',
+        'course_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None',
+        payload=(
+            'migration_type', 'pre_attachment[name]', 'pre_attachment[content_type]',
+            'pre_attachment[parent_folder_id]', 'pre_attachment[parent_folder_path]', 'pre_attachment[folder]',
+            'pre_attachment[on_duplicate]', 'settings[file_url]', 'settings[source_course_id]', 'settings[folder_id]',
+            'settings[overwrite_quizzes]', 'settings[question_bank_id]', 'settings[question_bank_name]',
+            'date_shift_options[shift_dates]', 'date_shift_options[old_start_date]', 'date_shift_options[old_end_date]',
+            'date_shift_options[new_start_date]', 'date_shift_options[new_end_date]',
+            'date_shift_options[day_substitutions][X]', 'date_shift_options[remove_dates]',
+        ),
+        doc="""
     Create a content migration. If the migration requires a file to be uploaded
     the actual processing of the file will start once the file upload process is completed.
     File uploading works as described in the {file:file_uploads.html File Upload Documentation}
@@ -717,39 +547,20 @@ def create_content_migration_courses(request_ctx, course_id, migration_type, pre
         :return: Create a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/courses/{course_id}/content_migrations'
-    payload = {
-        'migration_type' : migration_type,
-        'pre_attachment[name]' : pre_attachment_name,
-        'pre_attachment[content_type]' : pre_attachment_content_type,
-        'pre_attachment[parent_folder_id]' : pre_attachment_parent_folder_id,
-        'pre_attachment[parent_folder_path]' : pre_attachment_parent_folder_path,
-        'pre_attachment[folder]' : pre_attachment_folder,
-        'pre_attachment[on_duplicate]' : pre_attachment_on_duplicate,
-        'settings[file_url]' : settings_file_url,
-        'settings[source_course_id]' : settings_source_course_id,
-        'settings[folder_id]' : settings_folder_id,
-        'settings[overwrite_quizzes]' : settings_overwrite_quizzes,
-        'settings[question_bank_id]' : settings_question_bank_id,
-        'settings[question_bank_name]' : settings_question_bank_name,
-        'date_shift_options[shift_dates]' : date_shift_options_shift_dates,
-        'date_shift_options[old_start_date]' : date_shift_options_old_start_date,
-        'date_shift_options[old_end_date]' : date_shift_options_old_end_date,
-        'date_shift_options[new_start_date]' : date_shift_options_new_start_date,
-        'date_shift_options[new_end_date]' : date_shift_options_new_end_date,
-        'date_shift_options[day_substitutions][X]' : date_shift_options_day_substitutions_X,
-        'date_shift_options[remove_dates]' : date_shift_options_remove_dates,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_content_migration_groups(request_ctx, group_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_content_migration_groups', 'POST', '/v1/groups/{group_id}/content_migrations',
+        'group_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None',
+        payload=(
+            'migration_type', 'pre_attachment[name]', 'pre_attachment[content_type]',
+            'pre_attachment[parent_folder_id]', 'pre_attachment[parent_folder_path]', 'pre_attachment[folder]',
+            'pre_attachment[on_duplicate]', 'settings[file_url]', 'settings[source_course_id]', 'settings[folder_id]',
+            'settings[overwrite_quizzes]', 'settings[question_bank_id]', 'settings[question_bank_name]',
+            'date_shift_options[shift_dates]', 'date_shift_options[old_start_date]', 'date_shift_options[old_end_date]',
+            'date_shift_options[new_start_date]', 'date_shift_options[new_end_date]',
+            'date_shift_options[day_substitutions][X]', 'date_shift_options[remove_dates]',
+        ),
+        doc="""
     Create a content migration. If the migration requires a file to be uploaded
     the actual processing of the file will start once the file upload process is completed.
     File uploading works as described in the {file:file_uploads.html File Upload Documentation}
@@ -825,39 +636,20 @@ def create_content_migration_groups(request_ctx, group_id, migration_type, pre_a
         :return: Create a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/groups/{group_id}/content_migrations'
-    payload = {
-        'migration_type' : migration_type,
-        'pre_attachment[name]' : pre_attachment_name,
-        'pre_attachment[content_type]' : pre_attachment_content_type,
-        'pre_attachment[parent_folder_id]' : pre_attachment_parent_folder_id,
-        'pre_attachment[parent_folder_path]' : pre_attachment_parent_folder_path,
-        'pre_attachment[folder]' : pre_attachment_folder,
-        'pre_attachment[on_duplicate]' : pre_attachment_on_duplicate,
-        'settings[file_url]' : settings_file_url,
-        'settings[source_course_id]' : settings_source_course_id,
-        'settings[folder_id]' : settings_folder_id,
-        'settings[overwrite_quizzes]' : settings_overwrite_quizzes,
-        'settings[question_bank_id]' : settings_question_bank_id,
-        'settings[question_bank_name]' : settings_question_bank_name,
-        'date_shift_options[shift_dates]' : date_shift_options_shift_dates,
-        'date_shift_options[old_start_date]' : date_shift_options_old_start_date,
-        'date_shift_options[old_end_date]' : date_shift_options_old_end_date,
-        'date_shift_options[new_start_date]' : date_shift_options_new_start_date,
-        'date_shift_options[new_end_date]' : date_shift_options_new_end_date,
-        'date_shift_options[day_substitutions][X]' : date_shift_options_day_substitutions_X,
-        'date_shift_options[remove_dates]' : date_shift_options_remove_dates,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_content_migration_users(request_ctx, user_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_content_migration_users', 'POST', '/v1/users/{user_id}/content_migrations',
+        'user_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None',
+        payload=(
+            'migration_type', 'pre_attachment[name]', 'pre_attachment[content_type]',
+            'pre_attachment[parent_folder_id]', 'pre_attachment[parent_folder_path]', 'pre_attachment[folder]',
+            'pre_attachment[on_duplicate]', 'settings[file_url]', 'settings[source_course_id]', 'settings[folder_id]',
+            'settings[overwrite_quizzes]', 'settings[question_bank_id]', 'settings[question_bank_name]',
+            'date_shift_options[shift_dates]', 'date_shift_options[old_start_date]', 'date_shift_options[old_end_date]',
+            'date_shift_options[new_start_date]', 'date_shift_options[new_end_date]',
+            'date_shift_options[day_substitutions][X]', 'date_shift_options[remove_dates]',
+        ),
+        doc="""
     Create a content migration. If the migration requires a file to be uploaded
     the actual processing of the file will start once the file upload process is completed.
     File uploading works as described in the {file:file_uploads.html File Upload Documentation}
@@ -933,39 +725,11 @@ def create_content_migration_users(request_ctx, user_id, migration_type, pre_att
         :return: Create a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/users/{user_id}/content_migrations'
-    payload = {
-        'migration_type' : migration_type,
-        'pre_attachment[name]' : pre_attachment_name,
-        'pre_attachment[content_type]' : pre_attachment_content_type,
-        'pre_attachment[parent_folder_id]' : pre_attachment_parent_folder_id,
-        'pre_attachment[parent_folder_path]' : pre_attachment_parent_folder_path,
-        'pre_attachment[folder]' : pre_attachment_folder,
-        'pre_attachment[on_duplicate]' : pre_attachment_on_duplicate,
-        'settings[file_url]' : settings_file_url,
-        'settings[source_course_id]' : settings_source_course_id,
-        'settings[folder_id]' : settings_folder_id,
-        'settings[overwrite_quizzes]' : settings_overwrite_quizzes,
-        'settings[question_bank_id]' : settings_question_bank_id,
-        'settings[question_bank_name]' : settings_question_bank_name,
-        'date_shift_options[shift_dates]' : date_shift_options_shift_dates,
-        'date_shift_options[old_start_date]' : date_shift_options_old_start_date,
-        'date_shift_options[old_end_date]' : date_shift_options_old_end_date,
-        'date_shift_options[new_start_date]' : date_shift_options_new_start_date,
-        'date_shift_options[new_end_date]' : date_shift_options_new_end_date,
-        'date_shift_options[day_substitutions][X]' : date_shift_options_day_substitutions_X,
-        'date_shift_options[remove_dates]' : date_shift_options_remove_dates,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_content_migration_accounts(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_content_migration_accounts', 'PUT', '/v1/accounts/{account_id}/content_migrations/{id}',
+        'account_id, id',
+        doc="""
     Update a content migration. Takes same arguments as create except that you
     can't change the migration type. However, changing most settings after the
     migration process has started will not do anything. Generally updating the
@@ -982,17 +746,11 @@ def update_content_migration_accounts(request_ctx, account_id, id, **request_kwa
         :return: Update a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_content_migration_courses(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_content_migration_courses', 'PUT', '/v1/courses/{course_id}/content_migrations/{id}',
+        'course_id, id',
+        doc="""
     Update a content migration. Takes same arguments as create except that you
     can't change the migration type. However, changing most settings after the
     migration process has started will not do anything. Generally updating the
@@ -1009,17 +767,11 @@ def update_content_migration_courses(request_ctx, course_id, id, **request_kwarg
         :return: Update a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/courses/{course_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_content_migration_groups(request_ctx, group_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_content_migration_groups', 'PUT', '/v1/groups/{group_id}/content_migrations/{id}',
+        'group_id, id',
+        doc="""
     Update a content migration. Takes same arguments as create except that you
     can't change the migration type. However, changing most settings after the
     migration process has started will not do anything. Generally updating the
@@ -1036,17 +788,11 @@ def update_content_migration_groups(request_ctx, group_id, id, **request_kwargs)
         :return: Update a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/groups/{group_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_content_migration_users(request_ctx, user_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_content_migration_users', 'PUT', '/v1/users/{user_id}/content_migrations/{id}',
+        'user_id, id',
+        doc="""
     Update a content migration. Takes same arguments as create except that you
     can't change the migration type. However, changing most settings after the
     migration process has started will not do anything. Generally updating the
@@ -1063,17 +809,12 @@ def update_content_migration_users(request_ctx, user_id, id, **request_kwargs):
         :return: Update a content migration
         :rtype: requests.Response (with ContentMigration data)
 
-    """
-
-    path = '/v1/users/{user_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_migration_systems_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_migration_systems_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations/migrators',
+        'account_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Lists the currently available migration types. These values may change.
 
         :param request_ctx: The request context
@@ -1085,22 +826,12 @@ def list_migration_systems_accounts(request_ctx, account_id, per_page=None, **re
         :return: List Migration Systems
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/content_migrations/migrators'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_migration_systems_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_migration_systems_courses', 'GET', '/v1/courses/{course_id}/content_migrations/migrators',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Lists the currently available migration types. These values may change.
 
         :param request_ctx: The request context
@@ -1112,22 +843,12 @@ def list_migration_systems_courses(request_ctx, course_id, per_page=None, **requ
         :return: List Migration Systems
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/content_migrations/migrators'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_migration_systems_groups(request_ctx, group_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_migration_systems_groups', 'GET', '/v1/groups/{group_id}/content_migrations/migrators',
+        'group_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Lists the currently available migration types. These values may change.
 
         :param request_ctx: The request context
@@ -1139,22 +860,12 @@ def list_migration_systems_groups(request_ctx, group_id, per_page=None, **reques
         :return: List Migration Systems
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/content_migrations/migrators'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_migration_systems_users(request_ctx, user_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_migration_systems_users', 'GET', '/v1/users/{user_id}/content_migrations/migrators',
+        'user_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Lists the currently available migration types. These values may change.
 
         :param request_ctx: The request context
@@ -1166,17 +877,7 @@ def list_migration_systems_users(request_ctx, user_id, per_page=None, **request_
         :return: List Migration Systems
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/content_migrations/migrators'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,16 @@
 from canvas_sdk import client, utils
-
-def list_conversations(request_ctx, interleave_submissions, include_all_conversation_ids, scope=None, filter=None, filter_mode=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_conversations', 'GET', '/v1/conversations',
+        'interleave_submissions, include_all_conversation_ids, scope=None, filter=None, filter_mode=None, per_page=None',
+        payload=('scope', 'filter', 'filter_mode', 'interleave_submissions', 'include_all_conversation_ids', 'per_page'),
+        choices={
+            'scope': ('unread', 'starred', 'archived'),
+            'filter_mode': ('and', 'or', 'default or] When filter[] contains multiple filters', 'filtering conversations that at have at least all of the contexts (and) or at least one of the contexts (or)'),
+        },
+        doc="""
     Returns the list of conversations for the current user, most recent ones first.
 
         :param request_ctx: The request context
@@ -21,31 +30,21 @@ def list_conversations(request_ctx, interleave_submissions, include_all_conversa
         :return: List conversations
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    scope_types = ('unread', 'starred', 'archived')
-    filter_mode_types = ('and', 'or', 'default or] When filter[] contains multiple filters', 'filtering conversations that at have at least all of the contexts (and) or at least one of the contexts (or)')
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(filter_mode, filter_mode_types)
-    path = '/v1/conversations'
-    payload = {
-        'scope' : scope,
-        'filter' : filter,
-        'filter_mode' : filter_mode,
-        'interleave_submissions' : interleave_submissions,
-        'include_all_conversation_ids' : include_all_conversation_ids,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_conversation(request_ctx, recipients, body, group_conversation, attachment_ids, media_comment_id, media_comment_type, mode, subject=None, user_note=None, scope=None, filter=None, filter_mode=None, context_code=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_conversation', 'POST', '/v1/conversations',
+        'recipients, body, group_conversation, attachment_ids, media_comment_id, media_comment_type, mode, subject=None, user_note=None, scope=None, filter=None, filter_mode=None, context_code=None',
+        payload=(
+            'recipients', 'subject', 'body', 'group_conversation', 'attachment_ids', 'media_comment_id',
+            'media_comment_type', 'user_note', 'mode', 'scope', 'filter', 'filter_mode', 'context_code',
+        ),
+        choices={
+            'media_comment_type': ('audio', 'video'),
+            'mode': ('sync', 'async'),
+            'scope': ('unread', 'starred', 'archived'),
+            'filter_mode': ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}'),
+        },
+        doc="""
     Create a new conversation with one or more recipients. If there is already
     an existing private conversation with the given recipients, it will be
     reused.
@@ -81,40 +80,11 @@ def create_conversation(request_ctx, recipients, body, group_conversation, attac
         :return: Create a conversation
         :rtype: requests.Response (with void data)
 
-    """
-
-    media_comment_type_types = ('audio', 'video')
-    mode_types = ('sync', 'async')
-    scope_types = ('unread', 'starred', 'archived')
-    filter_mode_types = ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')
-    utils.validate_attr_is_acceptable(media_comment_type, media_comment_type_types)
-    utils.validate_attr_is_acceptable(mode, mode_types)
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(filter_mode, filter_mode_types)
-    path = '/v1/conversations'
-    payload = {
-        'recipients' : recipients,
-        'subject' : subject,
-        'body' : body,
-        'group_conversation' : group_conversation,
-        'attachment_ids' : attachment_ids,
-        'media_comment_id' : media_comment_id,
-        'media_comment_type' : media_comment_type,
-        'user_note' : user_note,
-        'mode' : mode,
-        'scope' : scope,
-        'filter' : filter,
-        'filter_mode' : filter_mode,
-        'context_code' : context_code,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_running_batches(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_running_batches', 'GET', '/v1/conversations/batches',
+        '',
+        doc="""
     Returns any currently running conversation batches for the current user.
     Conversation batches are created when a bulk private message is sent
     asynchronously (see the mode argument to the `ConversationsController#create <https://github.com/instructure/canvas-lms/blob/master/app/controllers/conversations_controller.rb>`_).
@@ -124,17 +94,16 @@ def get_running_batches(request_ctx, **request_kwargs):
         :return: Get running batches
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/conversations/batches'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_single_conversation(request_ctx, id, interleave_submissions, auto_mark_as_read, scope=None, filter=None, filter_mode=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_conversation', 'GET', '/v1/conversations/{id}',
+        'id, interleave_submissions, auto_mark_as_read, scope=None, filter=None, filter_mode=None',
+        payload=('interleave_submissions', 'scope', 'filter', 'filter_mode', 'auto_mark_as_read'),
+        choices={
+            'scope': ('unread', 'starred', 'archived'),
+            'filter_mode': ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}'),
+        },
+        doc="""
     Returns information for a single conversation. Response includes all
     fields that are present in the list/index action as well as messages
     and extended participant information.
@@ -156,28 +125,20 @@ def get_single_conversation(request_ctx, id, interleave_submissions, auto_mark_a
         :return: Get a single conversation
         :rtype: requests.Response (with void data)
 
-    """
-
-    scope_types = ('unread', 'starred', 'archived')
-    filter_mode_types = ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(filter_mode, filter_mode_types)
-    path = '/v1/conversations/{id}'
-    payload = {
-        'interleave_submissions' : interleave_submissions,
-        'scope' : scope,
-        'filter' : filter,
-        'filter_mode' : filter_mode,
-        'auto_mark_as_read' : auto_mark_as_read,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def edit_conversation(request_ctx, id, conversation_subject, conversation_workflow_state, conversation_subscribed, conversation_starred, scope=None, filter=None, filter_mode=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_conversation', 'PUT', '/v1/conversations/{id}',
+        'id, conversation_subject, conversation_workflow_state, conversation_subscribed, conversation_starred, scope=None, filter=None, filter_mode=None',
+        payload=(
+            'conversation[subject]', 'conversation[workflow_state]', 'conversation[subscribed]',
+            'conversation[starred]', 'scope', 'filter', 'filter_mode',
+        ),
+        choices={
+            'conversation_workflow_state': ('read', 'unread', 'archived'),
+            'scope': ('unread', 'starred', 'archived'),
+            'filter_mode': ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}'),
+        },
+        doc="""
     Updates attributes for a single conversation.
 
         :param request_ctx: The request context
@@ -201,32 +162,11 @@ def edit_conversation(request_ctx, id, conversation_subject, conversation_workfl
         :return: Edit a conversation
         :rtype: requests.Response (with void data)
 
-    """
-
-    conversation_workflow_state_types = ('read', 'unread', 'archived')
-    scope_types = ('unread', 'starred', 'archived')
-    filter_mode_types = ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')
-    utils.validate_attr_is_acceptable(conversation_workflow_state, conversation_workflow_state_types)
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(filter_mode, filter_mode_types)
-    path = '/v1/conversations/{id}'
-    payload = {
-        'conversation[subject]' : conversation_subject,
-        'conversation[workflow_state]' : conversation_workflow_state,
-        'conversation[subscribed]' : conversation_subscribed,
-        'conversation[starred]' : conversation_starred,
-        'scope' : scope,
-        'filter' : filter,
-        'filter_mode' : filter_mode,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_all_as_read(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_all_as_read', 'POST', '/v1/conversations/mark_all_as_read',
+        '',
+        doc="""
     Mark all conversations as read.
 
         :param request_ctx: The request context
@@ -234,17 +174,11 @@ def mark_all_as_read(request_ctx, **request_kwargs):
         :return: Mark all as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/conversations/mark_all_as_read'
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_conversation(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_conversation', 'DELETE', '/v1/conversations/{id}',
+        'id',
+        doc="""
     Delete this conversation and its messages. Note that this only deletes
     this user's view of the conversation.
     
@@ -257,17 +191,12 @@ def delete_conversation(request_ctx, id, **request_kwargs):
         :return: Delete a conversation
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/conversations/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def add_recipients(request_ctx, id, recipients, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'add_recipients', 'POST', '/v1/conversations/{id}/add_recipients',
+        'id, recipients',
+        payload=('recipients',),
+        doc="""
     Add recipients to an existing group conversation. Response is similar to
     the GET/show action, except that only includes the
     latest message (e.g. "joe was added to the conversation by bob")
@@ -281,20 +210,16 @@ def add_recipients(request_ctx, id, recipients, **request_kwargs):
         :return: Add recipients
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/conversations/{id}/add_recipients'
-    payload = {
-        'recipients' : recipients,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def add_message(request_ctx, id, body, attachment_ids, media_comment_id, media_comment_type, recipients=None, included_messages=None, user_note=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'add_message', 'POST', '/v1/conversations/{id}/add_message',
+        'id, body, attachment_ids, media_comment_id, media_comment_type, recipients=None, included_messages=None, user_note=None',
+        payload=(
+            'body', 'attachment_ids', 'media_comment_id', 'media_comment_type', 'recipients', 'included_messages',
+            'user_note',
+        ),
+        choices={'media_comment_type': ('audio', 'video')},
+        doc="""
     Add a message to an existing conversation. Response is similar to the
     GET/show action, except that only includes the
     latest message (i.e. what we just sent)
@@ -328,28 +253,12 @@ def add_message(request_ctx, id, body, attachment_ids, media_comment_id, media_c
         :return: Add a message
         :rtype: requests.Response (with void data)
 
-    """
-
-    media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(media_comment_type, media_comment_type_types)
-    path = '/v1/conversations/{id}/add_message'
-    payload = {
-        'body' : body,
-        'attachment_ids' : attachment_ids,
-        'media_comment_id' : media_comment_id,
-        'media_comment_type' : media_comment_type,
-        'recipients' : recipients,
-        'included_messages' : included_messages,
-        'user_note' : user_note,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_message(request_ctx, id, remove, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_message', 'POST', '/v1/conversations/{id}/remove_messages',
+        'id, remove',
+        payload=('remove',),
+        doc="""
     Delete messages from this conversation. Note that this only affects this
     user's view of the conversation. If all messages are deleted, the
     conversation will be as well (equivalent to DELETE)
@@ -363,20 +272,13 @@ def delete_message(request_ctx, id, remove, **request_kwargs):
         :return: Delete a message
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/conversations/{id}/remove_messages'
-    payload = {
-        'remove' : remove,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def batch_update_conversations(request_ctx, conversation_ids, event, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'batch_update_conversations', 'PUT', '/v1/conversations',
+        'conversation_ids, event',
+        payload=('conversation_ids', 'event'),
+        choices={'event': ('mark_as_read', 'mark_as_unread', 'star', 'unstar', 'archive', 'destroy')},
+        doc="""
     Perform a change on a set of conversations. Operates asynchronously; use the `ProgressController#show <https://github.com/instructure/canvas-lms/blob/master/app/controllers/progress_controller.rb>`_
     to query the status of an operation.
 
@@ -389,23 +291,11 @@ def batch_update_conversations(request_ctx, conversation_ids, event, **request_k
         :return: Batch update conversations
         :rtype: requests.Response (with Progress data)
 
-    """
-
-    event_types = ('mark_as_read', 'mark_as_unread', 'star', 'unstar', 'archive', 'destroy')
-    utils.validate_attr_is_acceptable(event, event_types)
-    path = '/v1/conversations'
-    payload = {
-        'conversation_ids' : conversation_ids,
-        'event' : event,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def find_recipients(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'find_recipients', 'GET', '/v1/conversations/find_recipients',
+        '',
+        doc="""
     Deprecated, see the `SearchController#recipients <https://github.com/instructure/canvas-lms/blob/master/app/controllers/search_controller.rb>`_ in the Search API
 
         :param request_ctx: The request context
@@ -413,17 +303,11 @@ def find_recipients(request_ctx, **request_kwargs):
         :return: Find recipients
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/conversations/find_recipients'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def unread_count(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'unread_count', 'GET', '/v1/conversations/unread_count',
+        '',
+        doc="""
     Get the number of unread conversations for the current user
 
         :param request_ctx: The request context
@@ -431,12 +315,7 @@ def unread_count(request_ctx, **request_kwargs):
         :return: Unread count
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/conversations/unread_count'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
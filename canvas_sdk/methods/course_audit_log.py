@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def query_by_course(request_ctx, course_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'query_by_course', 'GET', '/v1/audit/course/courses/{course_id}',
+        'course_id, start_time=None, end_time=None, per_page=None',
+        payload=('start_time', 'end_time', 'per_page'),
+        doc="""
     List course change events for a given course.
 
         :param request_ctx: The request context
@@ -17,19 +22,7 @@ def query_by_course(request_ctx, course_id, start_time=None, end_time=None, per_
         :return: Query by course.
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/course/courses/{course_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
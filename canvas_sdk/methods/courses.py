@@ -1,53 +1,20 @@
 from canvas_sdk import client, utils
-
-
-def list_your_courses(request_ctx, include, enrollment_type=None, enrollment_role=None, state=None, per_page=None, as_user_id=None, **request_kwargs):
-    """
-    Returns the list of active courses for the current user.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param include: (required) - "needs_grading_count": Optional information to include with each Course. When needs_grading_count is given, and the current user has grading rights, the total number of submissions needing grading for all assignments is returned. - "syllabus_body": Optional information to include with each Course. When syllabus_body is given the user-generated html for the course syllabus is returned. - "total_scores": Optional information to include with each Course. When total_scores is given, any enrollments with type 'student' will also include the fields 'calculated_current_score', 'calculated_final_score', 'calculated_current_grade', and 'calculated_final_grade'. calculated_current_score is the student's score in the course, ignoring ungraded assignments. calculated_final_score is the student's score in the course including ungraded assignments with a score of 0. calculated_current_grade is the letter grade equivalent of calculated_current_score (if available). calculated_final_grade is the letter grade equivalent of calculated_final_score (if available). This argument is ignored if the course is configured to hide final grades. - "term": Optional information to include with each Course. When term is given, the information for the enrollment term for each course is returned. - "course_progress": Optional information to include with each Course. When course_progress is given, each course will include a 'course_progress' object with the fields: 'requirement_count', an integer specifying the total number of requirements in the course, 'requirement_completed_count', an integer specifying the total number of requirements in this course that have been completed, and 'next_requirement_url', a string url to the next requirement item, and 'completed_at', the date the course was completed (null if incomplete). 'next_requirement_url' will be null if all requirements have been completed or the current module does not require sequential progress. "course_progress" will return an error message if the course is not module based or the user is not enrolled as a student in the course. - "sections": Section enrollment information to include with each Course. Returns an array of hashes containing the section ID (id), section name (name), start and end dates (start_at, end_at), as well as the enrollment type (enrollment_role, e.g. 'StudentEnrollment').
-        :type include: string
-        :param enrollment_type: (optional) When set, only return courses where the user is enrolled as this type. For example, set to "teacher" to return only courses where the user is enrolled as a Teacher. This argument is ignored if enrollment_role is given.
-        :type enrollment_type: string or None
-        :param enrollment_role: (optional) When set, only return courses where the user is enrolled with the specified course-level role. This can be a role created with the {api:RoleOverridesController#add_role Add Role API} or a base role type of 'StudentEnrollment', 'TeacherEnrollment', 'TaEnrollment', 'ObserverEnrollment', or 'DesignerEnrollment'.
-        :type enrollment_role: string or None
-        :param state: (optional) If set, only return courses that are in the given state(s). By default, "available" is returned for students and observers, and anything except "deleted", for all other enrollment types
-        :type state: string or None
-        :param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE
-        :type per_page: integer or None
-        :return: List your courses
-        :rtype: requests.Response (with array data)
-
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    enrollment_type_types = ('teacher', 'student', 'ta', 'observer', 'designer')
-    include_types = ('needs_grading_count', 'syllabus_body', 'total_scores', 'term', 'course_progress', 'sections')
-    state_types = ('unpublished', 'available', 'completed', 'deleted')
-    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/courses'
-    payload = {
-        'enrollment_type' : enrollment_type,
-        'enrollment_role' : enrollment_role,
-        'include[]' : include,
-        'state[]' : state,
-        'per_page' : per_page,
-    }
-    if as_user_id:
-        payload['as_user_id'] = as_user_id
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_new_course(request_ctx, account_id, course_name=None, course_course_code=None, course_start_at=None, course_end_at=None, course_license=None, course_is_public=None, course_is_public_to_auth_users=None, course_public_syllabus=None, course_public_description=None, course_allow_student_wiki_edits=None, course_allow_wiki_comments=None, course_allow_student_forum_attachments=None, course_open_enrollment=None, course_self_enrollment=None, course_restrict_enrollments_to_course_dates=None, course_term_id=None, course_sis_course_id=None, course_integration_id=None, course_hide_final_grades=None, course_apply_assignment_group_weights=None, offer=None, enroll_me=None, course_syllabus_body=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_iter_methods, build_methods, get_per_page
+
+ENDPOINTS = [
+    Endpoint(
+        'create_new_course', 'POST', '/v1/accounts/{account_id}/courses',
+        'account_id, course_name=None, course_course_code=None, course_start_at=None, course_end_at=None, course_license=None, course_is_public=None, course_is_public_to_auth_users=None, course_public_syllabus=None, course_public_description=None, course_allow_student_wiki_edits=None, course_allow_wiki_comments=None, course_allow_student_forum_attachments=None, course_open_enrollment=None, course_self_enrollment=None, course_restrict_enrollments_to_course_dates=None, course_term_id=None, course_sis_course_id=None, course_integration_id=None, course_hide_final_grades=None, course_apply_assignment_group_weights=None, offer=None, enroll_me=None, course_syllabus_body=None',
+        payload=(
+            'course[name]', 'course[course_code]', 'course[start_at]', 'course[end_at]', 'course[license]',
+            'course[is_public]', 'course[is_public_to_auth_users]', 'course[public_syllabus]',
+            'course[public_description]', 'course[allow_student_wiki_edits]', 'course[allow_wiki_comments]',
+            'course[allow_student_forum_attachments]', 'course[open_enrollment]', 'course[self_enrollment]',
+            'course[restrict_enrollments_to_course_dates]', 'course[term_id]', 'course[sis_course_id]',
+            'course[integration_id]', 'course[hide_final_grades]', 'course[apply_assignment_group_weights]', 'offer',
+            'enroll_me', 'course[syllabus_body]',
+        ),
+        doc="""
     Create a new course
 
         :param request_ctx: The request context
@@ -103,42 +70,11 @@ def create_new_course(request_ctx, account_id, course_name=None, course_course_c
         :return: Create a new course
         :rtype: requests.Response (with Course data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/courses'
-    payload = {
-        'course[name]' : course_name,
-        'course[course_code]' : course_course_code,
-        'course[start_at]' : course_start_at,
-        'course[end_at]' : course_end_at,
-        'course[license]' : course_license,
-        'course[is_public]' : course_is_public,
-        'course[is_public_to_auth_users]' : course_is_public_to_auth_users,
-        'course[public_syllabus]' : course_public_syllabus,
-        'course[public_description]' : course_public_description,
-        'course[allow_student_wiki_edits]' : course_allow_student_wiki_edits,
-        'course[allow_wiki_comments]' : course_allow_wiki_comments,
-        'course[allow_student_forum_attachments]' : course_allow_student_forum_attachments,
-        'course[open_enrollment]' : course_open_enrollment,
-        'course[self_enrollment]' : course_self_enrollment,
-        'course[restrict_enrollments_to_course_dates]' : course_restrict_enrollments_to_course_dates,
-        'course[term_id]' : course_term_id,
-        'course[sis_course_id]' : course_sis_course_id,
-        'course[integration_id]' : course_integration_id,
-        'course[hide_final_grades]' : course_hide_final_grades,
-        'course[apply_assignment_group_weights]' : course_apply_assignment_group_weights,
-        'offer' : offer,
-        'enroll_me' : enroll_me,
-        'course[syllabus_body]' : course_syllabus_body,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def upload_file(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'upload_file', 'POST', '/v1/courses/{course_id}/files',
+        'course_id',
+        doc="""
     Upload a file to the course.
 
     This API endpoint is the first step in uploading a file to a course.
@@ -155,17 +91,12 @@ def upload_file(request_ctx, course_id, **request_kwargs):
         :return: Upload a file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/files'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_students(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_students', 'GET', '/v1/courses/{course_id}/students',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of students enrolled in this course.
 
     DEPRECATED: Please use the `CoursesController#users <https://github.com/instructure/canvas-lms/blob/master/app/controllers/courses_controller.rb>`_ endpoint
@@ -180,22 +111,16 @@ def list_students(request_ctx, course_id, per_page=None, **request_kwargs):
         :return: List students
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/students'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_users_in_course_users(request_ctx, course_id, include, search_term=None, enrollment_type=None, enrollment_role=None, user_id=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_users_in_course_users', 'GET', '/v1/courses/{course_id}/users',
+        'course_id, include, search_term=None, enrollment_type=None, enrollment_role=None, user_id=None, per_page=None',
+        payload=('search_term', 'enrollment_type', 'enrollment_role', 'include[]', 'user_id', 'per_page'),
+        choices={
+            'enrollment_type': ('teacher', 'student', 'ta', 'observer', 'designer'),
+            'include': ('email', 'enrollments', 'locked', 'avatar_url', 'test_student'),
+        },
+        doc="""
     Returns the list of users in this course. And optionally the user's enrollments in the course.
 
         :param request_ctx: The request context
@@ -217,31 +142,16 @@ def list_users_in_course_users(request_ctx, course_id, include, search_term=None
         :return: List users in course
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    enrollment_type_types = ('teacher', 'student', 'ta', 'observer', 'designer')
-    include_types = ('email', 'enrollments', 'locked', 'avatar_url', 'test_student')
-    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/users'
-    payload = {
-        'search_term' : search_term,
-        'enrollment_type' : enrollment_type,
-        'enrollment_role' : enrollment_role,
-        'include[]' : include,
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_users_in_course_search_users(request_ctx, course_id, include, search_term=None, enrollment_type=None, enrollment_role=None, user_id=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_users_in_course_search_users', 'GET', '/v1/courses/{course_id}/search_users',
+        'course_id, include, search_term=None, enrollment_type=None, enrollment_role=None, user_id=None, per_page=None',
+        payload=('search_term', 'enrollment_type', 'enrollment_role', 'include[]', 'user_id', 'per_page'),
+        choices={
+            'enrollment_type': ('teacher', 'student', 'ta', 'observer', 'designer'),
+            'include': ('email', 'enrollments', 'locked', 'avatar_url', 'test_student'),
+        },
+        doc="""
     Returns the list of users in this course. And optionally the user's enrollments in the course.
 
         :param request_ctx: The request context
@@ -263,31 +173,12 @@ def list_users_in_course_search_users(request_ctx, course_id, include, search_te
         :return: List users in course
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    enrollment_type_types = ('teacher', 'student', 'ta', 'observer', 'designer')
-    include_types = ('email', 'enrollments', 'locked', 'avatar_url', 'test_student')
-    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/search_users'
-    payload = {
-        'search_term' : search_term,
-        'enrollment_type' : enrollment_type,
-        'enrollment_role' : enrollment_role,
-        'include[]' : include,
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_recently_logged_in_students(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_recently_logged_in_students', 'GET', '/v1/courses/{course_id}/recent_students',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of users in this course, ordered by how recently they have
     logged in. The records include the 'last_login' field which contains
     a timestamp of the last time that user logged into canvas.  The querying
@@ -302,22 +193,11 @@ def list_recently_logged_in_students(request_ctx, course_id, per_page=None, **re
         :return: List recently logged in students
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/recent_students'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_user(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_user', 'GET', '/v1/courses/{course_id}/users/{id}',
+        'course_id, id',
+        doc="""
     Return information on a single user.
 
     Accepts the same include[] parameters as the :users: action, and returns a
@@ -332,17 +212,12 @@ def get_single_user(request_ctx, course_id, id, **request_kwargs):
         :return: Get single user
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/courses/{course_id}/users/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def preview_processed_html(request_ctx, course_id, html, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'preview_processed_html', 'POST', '/v1/courses/{course_id}/preview_html',
+        'course_id, html',
+        payload=('html',),
+        doc="""
     Preview html content processed for this course
 
         :param request_ctx: The request context
@@ -354,20 +229,11 @@ def preview_processed_html(request_ctx, course_id, html, **request_kwargs):
         :return: Preview processed html
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/preview_html'
-    payload = {
-        'html' : html,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def course_activity_stream(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'course_activity_stream', 'GET', '/v1/courses/{course_id}/activity_stream',
+        'course_id',
+        doc="""
     Returns the current user's course-specific activity stream, paginated.
 
     For full documentation, see the API documentation for the user activity
@@ -380,17 +246,11 @@ def course_activity_stream(request_ctx, course_id, **request_kwargs):
         :return: Course activity stream
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/activity_stream'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def course_activity_stream_summary(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'course_activity_stream_summary', 'GET', '/v1/courses/{course_id}/activity_stream/summary',
+        'course_id',
+        doc="""
     Returns a summary of the current user's course-specific activity stream.
 
     For full documentation, see the API documentation for the user activity
@@ -403,17 +263,11 @@ def course_activity_stream_summary(request_ctx, course_id, **request_kwargs):
         :return: Course activity stream summary
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/activity_stream/summary'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def course_todo_items(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'course_todo_items', 'GET', '/v1/courses/{course_id}/todo',
+        'course_id',
+        doc="""
     Returns the current user's course-specific todo items.
 
     For full documentation, see the API documentation for the user todo items, in the user api.
@@ -425,17 +279,13 @@ def course_todo_items(request_ctx, course_id, **request_kwargs):
         :return: Course TODO items
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/todo'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def conclude_course(request_ctx, id, event, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'conclude_course', 'DELETE', '/v1/courses/{id}',
+        'id, event',
+        payload=('event',),
+        choices={'event': ('delete', 'conclude')},
+        doc="""
     Delete or conclude an existing course
 
         :param request_ctx: The request context
@@ -447,22 +297,11 @@ def conclude_course(request_ctx, id, event, **request_kwargs):
         :return: Conclude a course
         :rtype: requests.Response (with void data)
 
-    """
-
-    event_types = ('delete', 'conclude')
-    utils.validate_attr_is_acceptable(event, event_types)
-    path = '/v1/courses/{id}'
-    payload = {
-        'event' : event,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_course_settings(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_course_settings', 'GET', '/v1/courses/{course_id}/settings',
+        'course_id',
+        doc="""
     Returns some of a course's settings.
 
         :param request_ctx: The request context
@@ -472,17 +311,14 @@ def get_course_settings(request_ctx, course_id, **request_kwargs):
         :return: Get course settings
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/settings'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_course_settings(request_ctx, course_id, allow_student_discussion_topics, allow_student_forum_attachments, allow_student_discussion_editing, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_course_settings', 'PUT', '/v1/courses/{course_id}/settings',
+        'course_id, allow_student_discussion_topics, allow_student_forum_attachments, allow_student_discussion_editing',
+        payload=(
+            'allow_student_discussion_topics', 'allow_student_forum_attachments', 'allow_student_discussion_editing',
+        ),
+        doc="""
     Can update the following course settings:
 
         :param request_ctx: The request context
@@ -498,22 +334,15 @@ def update_course_settings(request_ctx, course_id, allow_student_discussion_topi
         :return: Update course settings
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/settings'
-    payload = {
-        'allow_student_discussion_topics' : allow_student_discussion_topics,
-        'allow_student_forum_attachments' : allow_student_forum_attachments,
-        'allow_student_discussion_editing' : allow_student_discussion_editing,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_course_courses(request_ctx, id, include=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_course_courses', 'GET', '/v1/courses/{id}',
+        'id, include=None',
+        payload=('include',),
+        choices={
+            'include': ('needs_grading_count', 'syllabus_body', 'public_description', 'total_scores', 'current_grading_period_scores', 'term', 'course_progress', 'sections', 'storage_quota_used_mb', 'total_students', 'passback_status', 'favorites', 'teachers', 'observed_users', 'all_courses', 'permissions', 'observed_users'),
+        },
+        doc="""
     Return information on a single course.
 
     Accepts the same include[] parameters as the list action plus:
@@ -531,27 +360,13 @@ def get_single_course_courses(request_ctx, id, include=None, **request_kwargs):
         :return: Get a single course
         :rtype: requests.Response (with Course data)
 
-    """
-
-    include_types = (
-        'needs_grading_count', 'syllabus_body', 'public_description',
-        'total_scores', 'current_grading_period_scores', 'term',
-        'course_progress', 'sections', 'storage_quota_used_mb',
-        'total_students', 'passback_status', 'favorites', 'teachers',
-        'observed_users', 'all_courses', 'permissions', 'observed_users')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{id}'
-    payload = {
-        'include': include,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_course_accounts(request_ctx, account_id, id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_course_accounts', 'GET', '/v1/accounts/{account_id}/courses/{id}',
+        'account_id, id, include',
+        payload=('include[]',),
+        choices={'include': ('all_courses', 'permissions')},
+        doc="""
     Return information on a single course.
 
     Accepts the same include[] parameters as the list action plus:
@@ -567,15 +382,121 @@ def get_single_course_accounts(request_ctx, account_id, id, include, **request_k
         :return: Get a single course
         :rtype: requests.Response (with Course data)
 
+    """),
+    Endpoint(
+        'update_courses', 'PUT', '/v1/accounts/{account_id}/courses',
+        'account_id, course_ids, event',
+        payload=('course_ids[]', 'event'),
+        doc="""
+    Update multiple courses in an account.  Operates asynchronously; use the `ProgressController#show <https://github.com/instructure/canvas-lms/blob/master/app/controllers/progress_controller.rb>`_
+    to query the status of an operation.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param account_id: (required) ID
+        :type account_id: string
+        :param course_ids: (required) List of ids of courses to update. At most 500 courses may be updated in one call.
+        :type course_ids: string
+        :param event: (required) The action to take on each course. Must be one of 'offer', 'conclude', 'delete', or 'undelete'. * 'offer' makes a course visible to students. This action is also called "publish" on the web site. * 'conclude' prevents future enrollments and makes a course read-only for all participants. The course still appears in prior-enrollment lists. * 'delete' completely removes the course from the web site (including course menus and prior-enrollment lists). All enrollments are deleted. Course content may be physically deleted at a future date. * 'undelete' attempts to recover a course that has been deleted. (Recovery is not guaranteed; please conclude rather than delete a course if there is any possibility the course will be used again.) The recovered course will be unpublished. Deleted enrollments will not be recovered.
+        :type event: string
+        :return: Update courses
+        :rtype: requests.Response (with Progress data)
+
+    """),
+    Endpoint(
+        'get_course_copy_status', 'GET', '/v1/courses/{course_id}/course_copy/{id}',
+        'course_id, id',
+        doc="""
+    DEPRECATED: Please use the `ContentMigrationsController#create <https://github.com/instructure/canvas-lms/blob/master/app/controllers/content_migrations_controller.rb>`_
+
+    Retrieve the status of a course copy
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param id: (required) ID
+        :type id: string
+        :return: Get course copy status
+        :rtype: requests.Response (with void data)
+
+    """),
+    Endpoint(
+        'copy_course_content', 'POST', '/v1/courses/{course_id}/course_copy',
+        'course_id, source_course, var_except, only',
+        payload=('source_course', 'except[]', 'only[]'),
+        choices={
+            'var_except': ('course_settings', 'assignments', 'external_tools', 'files', 'topics', 'calendar_events', 'quizzes', 'wiki_pages', 'modules', 'outcomes'),
+            'only': ('course_settings', 'assignments', 'external_tools', 'files', 'topics', 'calendar_events', 'quizzes', 'wiki_pages', 'modules', 'outcomes'),
+        },
+        doc="""
+    DEPRECATED: Please use the `ContentMigrationsController#create <https://github.com/instructure/canvas-lms/blob/master/app/controllers/content_migrations_controller.rb>`_
+
+    Copies content from one course into another. The default is to copy all course
+    content. You can control specific types to copy by using either the 'except' option
+    or the 'only' option.
+
+    The response is the same as the course copy status endpoint
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param source_course: (required) ID or SIS-ID of the course to copy the content from
+        :type source_course: string
+        :param var_except: (required) A list of the course content types to exclude, all areas not listed will be copied.
+        :type var_except: string
+        :param only: (required) A list of the course content types to copy, all areas not listed will not be copied.
+        :type only: string
+        :return: Copy course content
+        :rtype: requests.Response (with void data)
+
+    """),
+]
+
+build_methods(ENDPOINTS, globals())
+
+
+def list_your_courses(request_ctx, include, enrollment_type=None, enrollment_role=None, state=None, per_page=None, as_user_id=None, **request_kwargs):
     """
+    Returns the list of active courses for the current user.
 
-    include_types = ('all_courses', 'permissions')
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param include: (required) - "needs_grading_count": Optional information to include with each Course. When needs_grading_count is given, and the current user has grading rights, the total number of submissions needing grading for all assignments is returned. - "syllabus_body": Optional information to include with each Course. When syllabus_body is given the user-generated html for the course syllabus is returned. - "total_scores": Optional information to include with each Course. When total_scores is given, any enrollments with type 'student' will also include the fields 'calculated_current_score', 'calculated_final_score', 'calculated_current_grade', and 'calculated_final_grade'. calculated_current_score is the student's score in the course, ignoring ungraded assignments. calculated_final_score is the student's score in the course including ungraded assignments with a score of 0. calculated_current_grade is the letter grade equivalent of calculated_current_score (if available). calculated_final_grade is the letter grade equivalent of calculated_final_score (if available). This argument is ignored if the course is configured to hide final grades. - "term": Optional information to include with each Course. When term is given, the information for the enrollment term for each course is returned. - "course_progress": Optional information to include with each Course. When course_progress is given, each course will include a 'course_progress' object with the fields: 'requirement_count', an integer specifying the total number of requirements in the course, 'requirement_completed_count', an integer specifying the total number of requirements in this course that have been completed, and 'next_requirement_url', a string url to the next requirement item, and 'completed_at', the date the course was completed (null if incomplete). 'next_requirement_url' will be null if all requirements have been completed or the current module does not require sequential progress. "course_progress" will return an error message if the course is not module based or the user is not enrolled as a student in the course. - "sections": Section enrollment information to include with each Course. Returns an array of hashes containing the section ID (id), section name (name), start and end dates (start_at, end_at), as well as the enrollment type (enrollment_role, e.g. 'StudentEnrollment').
+        :type include: string
+        :param enrollment_type: (optional) When set, only return courses where the user is enrolled as this type. For example, set to "teacher" to return only courses where the user is enrolled as a Teacher. This argument is ignored if enrollment_role is given.
+        :type enrollment_type: string or None
+        :param enrollment_role: (optional) When set, only return courses where the user is enrolled with the specified course-level role. This can be a role created with the {api:RoleOverridesController#add_role Add Role API} or a base role type of 'StudentEnrollment', 'TeacherEnrollment', 'TaEnrollment', 'ObserverEnrollment', or 'DesignerEnrollment'.
+        :type enrollment_role: string or None
+        :param state: (optional) If set, only return courses that are in the given state(s). By default, "available" is returned for students and observers, and anything except "deleted", for all other enrollment types
+        :type state: string or None
+        :param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE
+        :type per_page: integer or None
+        :return: List your courses
+        :rtype: requests.Response (with array data)
+
+    """
+
+    enrollment_type_types = ('teacher', 'student', 'ta', 'observer', 'designer')
+    include_types = ('needs_grading_count', 'syllabus_body', 'total_scores', 'term', 'course_progress', 'sections')
+    state_types = ('unpublished', 'available', 'completed', 'deleted')
+    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
     utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/accounts/{account_id}/courses/{id}'
+    utils.validate_attr_is_acceptable(state, state_types)
+    path = '/v1/courses'
+    url = request_ctx.base_api_url + path.format()
+    if per_page is None:
+        per_page = get_per_page(request_ctx, url)
     payload = {
+        'enrollment_type' : enrollment_type,
+        'enrollment_role' : enrollment_role,
         'include[]' : include,
+        'state[]' : state,
+        'per_page' : per_page,
     }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
+    if as_user_id:
+        payload['as_user_id'] = as_user_id
     response = client.get(request_ctx, url, payload=payload, **request_kwargs)
 
     return response
@@ -717,95 +638,4 @@ def update_course(request_ctx, id, course_account_id=None, course_name=None, cou
     return response
 
 
-def update_courses(request_ctx, account_id, course_ids, event, **request_kwargs):
-    """
-    Update multiple courses in an account.  Operates asynchronously; use the `ProgressController#show <https://github.com/instructure/canvas-lms/blob/master/app/controllers/progress_controller.rb>`_
-    to query the status of an operation.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param account_id: (required) ID
-        :type account_id: string
-        :param course_ids: (required) List of ids of courses to update. At most 500 courses may be updated in one call.
-        :type course_ids: string
-        :param event: (required) The action to take on each course. Must be one of 'offer', 'conclude', 'delete', or 'undelete'. * 'offer' makes a course visible to students. This action is also called "publish" on the web site. * 'conclude' prevents future enrollments and makes a course read-only for all participants. The course still appears in prior-enrollment lists. * 'delete' completely removes the course from the web site (including course menus and prior-enrollment lists). All enrollments are deleted. Course content may be physically deleted at a future date. * 'undelete' attempts to recover a course that has been deleted. (Recovery is not guaranteed; please conclude rather than delete a course if there is any possibility the course will be used again.) The recovered course will be unpublished. Deleted enrollments will not be recovered.
-        :type event: string
-        :return: Update courses
-        :rtype: requests.Response (with Progress data)
-
-    """
-
-    path = '/v1/accounts/{account_id}/courses'
-    payload = {
-        'course_ids[]' : course_ids,
-        'event' : event,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_course_copy_status(request_ctx, course_id, id, **request_kwargs):
-    """
-    DEPRECATED: Please use the `ContentMigrationsController#create <https://github.com/instructure/canvas-lms/blob/master/app/controllers/content_migrations_controller.rb>`_
-
-    Retrieve the status of a course copy
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param id: (required) ID
-        :type id: string
-        :return: Get course copy status
-        :rtype: requests.Response (with void data)
-
-    """
-
-    path = '/v1/courses/{course_id}/course_copy/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def copy_course_content(request_ctx, course_id, source_course, var_except, only, **request_kwargs):
-    """
-    DEPRECATED: Please use the `ContentMigrationsController#create <https://github.com/instructure/canvas-lms/blob/master/app/controllers/content_migrations_controller.rb>`_
-
-    Copies content from one course into another. The default is to copy all course
-    content. You can control specific types to copy by using either the 'except' option
-    or the 'only' option.
-
-    The response is the same as the course copy status endpoint
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param source_course: (required) ID or SIS-ID of the course to copy the content from
-        :type source_course: string
-        :param var_except: (required) A list of the course content types to exclude, all areas not listed will be copied.
-        :type var_except: string
-        :param only: (required) A list of the course content types to copy, all areas not listed will not be copied.
-        :type only: string
-        :return: Copy course content
-        :rtype: requests.Response (with void data)
-
-    """
-
-    var_except_types = ('course_settings', 'assignments', 'external_tools', 'files', 'topics', 'calendar_events', 'quizzes', 'wiki_pages', 'modules', 'outcomes')
-    only_types = ('course_settings', 'assignments', 'external_tools', 'files', 'topics', 'calendar_events', 'quizzes', 'wiki_pages', 'modules', 'outcomes')
-    utils.validate_attr_is_acceptable(var_except, var_except_types)
-    utils.validate_attr_is_acceptable(only, only_types)
-    path = '/v1/courses/{course_id}/course_copy'
-    payload = {
-        'source_course' : source_course,
-        'except[]' : var_except,
-        'only[]' : only,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+build_iter_methods(('list_your_courses',), globals())
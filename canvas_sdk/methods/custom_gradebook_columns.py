@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_custom_gradebook_columns(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_custom_gradebook_columns', 'GET', '/v1/courses/{course_id}/custom_gradebook_columns',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List all custom gradebook columns for a course
 
         :param request_ctx: The request context
@@ -13,22 +18,12 @@ def list_custom_gradebook_columns(request_ctx, course_id, per_page=None, **reque
         :return: List custom gradebook columns
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/custom_gradebook_columns'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_custom_gradebook_column(request_ctx, course_id, column_title, column_position, column_hidden=None, column_teacher_notes=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_custom_gradebook_column', 'POST', '/v1/courses/{course_id}/custom_gradebook_columns',
+        'course_id, column_title, column_position, column_hidden=None, column_teacher_notes=None',
+        payload=('column[title]', 'column[position]', 'column[hidden]', 'column[teacher_notes]'),
+        doc="""
     Create a custom gradebook column
 
         :param request_ctx: The request context
@@ -46,23 +41,11 @@ def create_custom_gradebook_column(request_ctx, course_id, column_title, column_
         :return: Create a custom gradebook column
         :rtype: requests.Response (with CustomColumn data)
 
-    """
-
-    path = '/v1/courses/{course_id}/custom_gradebook_columns'
-    payload = {
-        'column[title]' : column_title,
-        'column[position]' : column_position,
-        'column[hidden]' : column_hidden,
-        'column[teacher_notes]' : column_teacher_notes,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_custom_gradebook_column(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_custom_gradebook_column', 'PUT', '/v1/courses/{course_id}/custom_gradebook_columns/{id}',
+        'course_id, id',
+        doc="""
     Accepts the same parameters as custom gradebook column creation
 
         :param request_ctx: The request context
@@ -74,17 +57,11 @@ def update_custom_gradebook_column(request_ctx, course_id, id, **request_kwargs)
         :return: Update a custom gradebook column
         :rtype: requests.Response (with CustomColumn data)
 
-    """
-
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_custom_gradebook_column(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_custom_gradebook_column', 'DELETE', '/v1/courses/{course_id}/custom_gradebook_columns/{id}',
+        'course_id, id',
+        doc="""
     Permanently deletes a custom column and its associated data
 
         :param request_ctx: The request context
@@ -96,17 +73,12 @@ def delete_custom_gradebook_column(request_ctx, course_id, id, **request_kwargs)
         :return: Delete a custom gradebook column
         :rtype: requests.Response (with CustomColumn data)
 
-    """
-
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def reorder_custom_columns(request_ctx, course_id, order, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reorder_custom_columns', 'POST', '/v1/courses/{course_id}/custom_gradebook_columns/reorder',
+        'course_id, order',
+        payload=('order',),
+        doc="""
     Puts the given columns in the specified order
     
     <b>200 OK</b> is returned if successful
@@ -120,20 +92,12 @@ def reorder_custom_columns(request_ctx, course_id, order, **request_kwargs):
         :return: Reorder custom columns
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/reorder'
-    payload = {
-        'order' : order,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_entries_for_column(request_ctx, course_id, id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_entries_for_column', 'GET', '/v1/courses/{course_id}/custom_gradebook_columns/{id}/data',
+        'course_id, id, per_page=None',
+        payload=('per_page',),
+        doc="""
     This does not list entries for students without associated data.
 
         :param request_ctx: The request context
@@ -147,22 +111,12 @@ def list_entries_for_column(request_ctx, course_id, id, per_page=None, **request
         :return: List entries for a column
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/{id}/data'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_column_data(request_ctx, course_id, id, user_id, column_data_content, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_column_data', 'PUT', '/v1/courses/{course_id}/custom_gradebook_columns/{id}/data/{user_id}',
+        'course_id, id, user_id, column_data_content',
+        payload=('column_data[content]',),
+        doc="""
     Set the content of a custom column
 
         :param request_ctx: The request context
@@ -178,15 +132,7 @@ def update_column_data(request_ctx, course_id, id, user_id, column_data_content,
         :return: Update column data
         :rtype: requests.Response (with ColumnDatum data)
 
-    """
-
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/{id}/data/{user_id}'
-    payload = {
-        'column_data[content]' : column_data_content,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id, user_id=user_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
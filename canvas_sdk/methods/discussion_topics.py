@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_discussion_topics_courses(request_ctx, course_id, order_by=None, scope=None, only_announcements=None, search_term=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_discussion_topics_courses', 'GET', '/v1/courses/{course_id}/discussion_topics',
+        'course_id, order_by=None, scope=None, only_announcements=None, search_term=None',
+        payload=('order_by', 'scope', 'only_announcements', 'search_term'),
+        choices={'order_by': ('position', 'recent_activity'), 'scope': ('locked', 'unlocked', 'pinned', 'unpinned')},
+        doc="""
     Returns the paginated list of discussion topics for this course or group.
 
         :param request_ctx: The request context
@@ -19,27 +25,13 @@ def list_discussion_topics_courses(request_ctx, course_id, order_by=None, scope=
         :return: List discussion topics
         :rtype: requests.Response (with void data)
 
-    """
-
-    order_by_types = ('position', 'recent_activity')
-    scope_types = ('locked', 'unlocked', 'pinned', 'unpinned')
-    utils.validate_attr_is_acceptable(order_by, order_by_types)
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    path = '/v1/courses/{course_id}/discussion_topics'
-    payload = {
-        'order_by' : order_by,
-        'scope' : scope,
-        'only_announcements' : only_announcements,
-        'search_term' : search_term,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_discussion_topics_groups(request_ctx, group_id, order_by=None, scope=None, only_announcements=None, search_term=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_discussion_topics_groups', 'GET', '/v1/groups/{group_id}/discussion_topics',
+        'group_id, order_by=None, scope=None, only_announcements=None, search_term=None',
+        payload=('order_by', 'scope', 'only_announcements', 'search_term'),
+        choices={'order_by': ('position', 'recent_activity'), 'scope': ('locked', 'unlocked', 'pinned', 'unpinned')},
+        doc="""
     Returns the paginated list of discussion topics for this course or group.
 
         :param request_ctx: The request context
@@ -57,27 +49,17 @@ def list_discussion_topics_groups(request_ctx, group_id, order_by=None, scope=No
         :return: List discussion topics
         :rtype: requests.Response (with void data)
 
-    """
-
-    order_by_types = ('position', 'recent_activity')
-    scope_types = ('locked', 'unlocked', 'pinned', 'unpinned')
-    utils.validate_attr_is_acceptable(order_by, order_by_types)
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    path = '/v1/groups/{group_id}/discussion_topics'
-    payload = {
-        'order_by' : order_by,
-        'scope' : scope,
-        'only_announcements' : only_announcements,
-        'search_term' : search_term,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_new_discussion_topic_courses(request_ctx, course_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_new_discussion_topic_courses', 'POST', '/v1/courses/{course_id}/discussion_topics',
+        'course_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None',
+        payload=(
+            'title', 'message', 'discussion_type', 'published', 'delayed_post_at', 'lock_at', 'podcast_enabled',
+            'podcast_has_student_posts', 'require_initial_post', 'assignment', 'is_announcement', 'position_after',
+            'group_category_id',
+        ),
+        choices={'discussion_type': ('side_comment', 'threaded')},
+        doc="""
     Create an new discussion topic for the course or group.
 
         :param request_ctx: The request context
@@ -113,34 +95,17 @@ def create_new_discussion_topic_courses(request_ctx, course_id, title, message,
         :return: Create a new discussion topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    discussion_type_types = ('side_comment', 'threaded')
-    utils.validate_attr_is_acceptable(discussion_type, discussion_type_types)
-    path = '/v1/courses/{course_id}/discussion_topics'
-    payload = {
-        'title' : title,
-        'message' : message,
-        'discussion_type' : discussion_type,
-        'published' : published,
-        'delayed_post_at' : delayed_post_at,
-        'lock_at' : lock_at,
-        'podcast_enabled' : podcast_enabled,
-        'podcast_has_student_posts' : podcast_has_student_posts,
-        'require_initial_post' : require_initial_post,
-        'assignment' : assignment,
-        'is_announcement' : is_announcement,
-        'position_after' : position_after,
-        'group_category_id' : group_category_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_new_discussion_topic_groups(request_ctx, group_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_new_discussion_topic_groups', 'POST', '/v1/groups/{group_id}/discussion_topics',
+        'group_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None',
+        payload=(
+            'title', 'message', 'discussion_type', 'published', 'delayed_post_at', 'lock_at', 'podcast_enabled',
+            'podcast_has_student_posts', 'require_initial_post', 'assignment', 'is_announcement', 'position_after',
+            'group_category_id',
+        ),
+        choices={'discussion_type': ('side_comment', 'threaded')},
+        doc="""
     Create an new discussion topic for the course or group.
 
         :param request_ctx: The request context
@@ -176,34 +141,17 @@ def create_new_discussion_topic_groups(request_ctx, group_id, title, message, re
         :return: Create a new discussion topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    discussion_type_types = ('side_comment', 'threaded')
-    utils.validate_attr_is_acceptable(discussion_type, discussion_type_types)
-    path = '/v1/groups/{group_id}/discussion_topics'
-    payload = {
-        'title' : title,
-        'message' : message,
-        'discussion_type' : discussion_type,
-        'published' : published,
-        'delayed_post_at' : delayed_post_at,
-        'lock_at' : lock_at,
-        'podcast_enabled' : podcast_enabled,
-        'podcast_has_student_posts' : podcast_has_student_posts,
-        'require_initial_post' : require_initial_post,
-        'assignment' : assignment,
-        'is_announcement' : is_announcement,
-        'position_after' : position_after,
-        'group_category_id' : group_category_id,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_new_discussion_topic_collection_items(request_ctx, collection_item_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_new_discussion_topic_collection_items', 'POST', '/v1/collection_items/{collection_item_id}/discussion_topics',
+        'collection_item_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None',
+        payload=(
+            'title', 'message', 'discussion_type', 'published', 'delayed_post_at', 'lock_at', 'podcast_enabled',
+            'podcast_has_student_posts', 'require_initial_post', 'assignment', 'is_announcement', 'position_after',
+            'group_category_id',
+        ),
+        choices={'discussion_type': ('side_comment', 'threaded')},
+        doc="""
     Create an new discussion topic for the course or group.
 
         :param request_ctx: The request context
@@ -239,34 +187,11 @@ def create_new_discussion_topic_collection_items(request_ctx, collection_item_id
         :return: Create a new discussion topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    discussion_type_types = ('side_comment', 'threaded')
-    utils.validate_attr_is_acceptable(discussion_type, discussion_type_types)
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics'
-    payload = {
-        'title' : title,
-        'message' : message,
-        'discussion_type' : discussion_type,
-        'published' : published,
-        'delayed_post_at' : delayed_post_at,
-        'lock_at' : lock_at,
-        'podcast_enabled' : podcast_enabled,
-        'podcast_has_student_posts' : podcast_has_student_posts,
-        'require_initial_post' : require_initial_post,
-        'assignment' : assignment,
-        'is_announcement' : is_announcement,
-        'position_after' : position_after,
-        'group_category_id' : group_category_id,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_topic_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}',
+        'course_id, topic_id',
+        doc="""
     Accepts the same parameters as create
 
         :param request_ctx: The request context
@@ -278,17 +203,11 @@ def update_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
         :return: Update a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_topic_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}',
+        'group_id, topic_id',
+        doc="""
     Accepts the same parameters as create
 
         :param request_ctx: The request context
@@ -300,17 +219,11 @@ def update_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
         :return: Update a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_topic_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}',
+        'collection_item_id, topic_id',
+        doc="""
     Accepts the same parameters as create
 
         :param request_ctx: The request context
@@ -322,17 +235,11 @@ def update_topic_collection_items(request_ctx, collection_item_id, topic_id, **r
         :return: Update a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_topic_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}',
+        'course_id, topic_id',
+        doc="""
     Deletes the discussion topic. This will also delete the assignment, if it's
     an assignment discussion.
 
@@ -345,17 +252,11 @@ def delete_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
         :return: Delete a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_topic_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}',
+        'group_id, topic_id',
+        doc="""
     Deletes the discussion topic. This will also delete the assignment, if it's
     an assignment discussion.
 
@@ -368,17 +269,11 @@ def delete_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
         :return: Delete a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_topic_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}',
+        'collection_item_id, topic_id',
+        doc="""
     Deletes the discussion topic. This will also delete the assignment, if it's
     an assignment discussion.
 
@@ -391,17 +286,12 @@ def delete_topic_collection_items(request_ctx, collection_item_id, topic_id, **r
         :return: Delete a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def reorder_pinned_topics_courses(request_ctx, course_id, order=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reorder_pinned_topics_courses', 'POST', '/v1/courses/{course_id}/discussion_topics/reorder',
+        'course_id, order=None',
+        payload=('order',),
+        doc="""
     Puts the pinned discussion topics in the specified order.
     All pinned topics should be included.
 
@@ -414,20 +304,12 @@ def reorder_pinned_topics_courses(request_ctx, course_id, order=None, **request_
         :return: Reorder pinned topics
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/reorder'
-    payload = {
-        'order' : order,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def reorder_pinned_topics_groups(request_ctx, group_id, order=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reorder_pinned_topics_groups', 'POST', '/v1/groups/{group_id}/discussion_topics/reorder',
+        'group_id, order=None',
+        payload=('order',),
+        doc="""
     Puts the pinned discussion topics in the specified order.
     All pinned topics should be included.
 
@@ -440,20 +322,12 @@ def reorder_pinned_topics_groups(request_ctx, group_id, order=None, **request_kw
         :return: Reorder pinned topics
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/reorder'
-    payload = {
-        'order' : order,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def reorder_pinned_topics_collection_items(request_ctx, collection_item_id, order=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reorder_pinned_topics_collection_items', 'POST', '/v1/collection_items/{collection_item_id}/discussion_topics/reorder',
+        'collection_item_id, order=None',
+        payload=('order',),
+        doc="""
     Puts the pinned discussion topics in the specified order.
     All pinned topics should be included.
 
@@ -466,20 +340,12 @@ def reorder_pinned_topics_collection_items(request_ctx, collection_item_id, orde
         :return: Reorder pinned topics
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/reorder'
-    payload = {
-        'order' : order,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_entry_courses(request_ctx, course_id, topic_id, id, message, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_entry_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{id}',
+        'course_id, topic_id, id, message',
+        payload=('message',),
+        doc="""
     Update an existing discussion entry.
     
     The entry must have been created by the current user, or the current user
@@ -498,20 +364,12 @@ def update_entry_courses(request_ctx, course_id, topic_id, id, message, **reques
         :return: Update an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{id}'
-    payload = {
-        'message' : message,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_entry_groups(request_ctx, group_id, topic_id, id, message, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_entry_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{id}',
+        'group_id, topic_id, id, message',
+        payload=('message',),
+        doc="""
     Update an existing discussion entry.
     
     The entry must have been created by the current user, or the current user
@@ -530,20 +388,12 @@ def update_entry_groups(request_ctx, group_id, topic_id, id, message, **request_
         :return: Update an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{id}'
-    payload = {
-        'message' : message,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_entry_collection_items(request_ctx, collection_item_id, topic_id, id, message, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_entry_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{id}',
+        'collection_item_id, topic_id, id, message',
+        payload=('message',),
+        doc="""
     Update an existing discussion entry.
     
     The entry must have been created by the current user, or the current user
@@ -562,20 +412,11 @@ def update_entry_collection_items(request_ctx, collection_item_id, topic_id, id,
         :return: Update an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{id}'
-    payload = {
-        'message' : message,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_entry_courses(request_ctx, course_id, topic_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_entry_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{id}',
+        'course_id, topic_id, id',
+        doc="""
     Delete a discussion entry.
     
     The entry must have been created by the current user, or the current user
@@ -594,17 +435,11 @@ def delete_entry_courses(request_ctx, course_id, topic_id, id, **request_kwargs)
         :return: Delete an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_entry_groups(request_ctx, group_id, topic_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_entry_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{id}',
+        'group_id, topic_id, id',
+        doc="""
     Delete a discussion entry.
     
     The entry must have been created by the current user, or the current user
@@ -623,17 +458,11 @@ def delete_entry_groups(request_ctx, group_id, topic_id, id, **request_kwargs):
         :return: Delete an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_entry_collection_items(request_ctx, collection_item_id, topic_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_entry_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{id}',
+        'collection_item_id, topic_id, id',
+        doc="""
     Delete a discussion entry.
     
     The entry must have been created by the current user, or the current user
@@ -652,17 +481,11 @@ def delete_entry_collection_items(request_ctx, collection_item_id, topic_id, id,
         :return: Delete an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{id}'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_single_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_topic_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}',
+        'course_id, topic_id',
+        doc="""
     Returns data on an individual discussion topic. See the List action for the response formatting.
 
         :param request_ctx: The request context
@@ -674,17 +497,11 @@ def get_single_topic_courses(request_ctx, course_id, topic_id, **request_kwargs)
         :return: Get a single topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_single_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_topic_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}',
+        'group_id, topic_id',
+        doc="""
     Returns data on an individual discussion topic. See the List action for the response formatting.
 
         :param request_ctx: The request context
@@ -696,17 +513,11 @@ def get_single_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
         :return: Get a single topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_single_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_topic_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}',
+        'collection_item_id, topic_id',
+        doc="""
     Returns data on an individual discussion topic. See the List action for the response formatting.
 
         :param request_ctx: The request context
@@ -718,17 +529,11 @@ def get_single_topic_collection_items(request_ctx, collection_item_id, topic_id,
         :return: Get a single topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_full_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_full_topic_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}/view',
+        'course_id, topic_id',
+        doc="""
     Return a cached structure of the discussion topic, containing all entries,
     their authors, and their message bodies.
     
@@ -768,17 +573,11 @@ def get_full_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
         :return: Get the full topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/view'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_full_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_full_topic_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}/view',
+        'group_id, topic_id',
+        doc="""
     Return a cached structure of the discussion topic, containing all entries,
     their authors, and their message bodies.
     
@@ -818,17 +617,11 @@ def get_full_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
         :return: Get the full topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/view'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_full_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_full_topic_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/view',
+        'collection_item_id, topic_id',
+        doc="""
     Return a cached structure of the discussion topic, containing all entries,
     their authors, and their message bodies.
     
@@ -868,17 +661,12 @@ def get_full_topic_collection_items(request_ctx, collection_item_id, topic_id, *
         :return: Get the full topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/view'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def post_entry_courses(request_ctx, course_id, topic_id, message, attachment=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'post_entry_courses', 'POST', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries',
+        'course_id, topic_id, message, attachment=None',
+        payload=('message', 'attachment'),
+        doc="""
     Create a new entry in a discussion topic. Returns a json representation of
     the created entry (see documentation for 'entries' method) on success.
 
@@ -895,21 +683,12 @@ def post_entry_courses(request_ctx, course_id, topic_id, message, attachment=Non
         :return: Post an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def post_entry_groups(request_ctx, group_id, topic_id, message, attachment=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'post_entry_groups', 'POST', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries',
+        'group_id, topic_id, message, attachment=None',
+        payload=('message', 'attachment'),
+        doc="""
     Create a new entry in a discussion topic. Returns a json representation of
     the created entry (see documentation for 'entries' method) on success.
 
@@ -926,21 +705,12 @@ def post_entry_groups(request_ctx, group_id, topic_id, message, attachment=None,
         :return: Post an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def post_entry_collection_items(request_ctx, collection_item_id, topic_id, message, attachment=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'post_entry_collection_items', 'POST', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries',
+        'collection_item_id, topic_id, message, attachment=None',
+        payload=('message', 'attachment'),
+        doc="""
     Create a new entry in a discussion topic. Returns a json representation of
     the created entry (see documentation for 'entries' method) on success.
 
@@ -957,21 +727,11 @@ def post_entry_collection_items(request_ctx, collection_item_id, topic_id, messa
         :return: Post an entry
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_topic_entries_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_topic_entries_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries',
+        'course_id, topic_id',
+        doc="""
     Retrieve the (paginated) top-level entries in a discussion topic.
     
     May require (depending on the topic) that the user has posted in the topic.
@@ -996,17 +756,11 @@ def list_topic_entries_courses(request_ctx, course_id, topic_id, **request_kwarg
         :return: List topic entries
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_topic_entries_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_topic_entries_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries',
+        'group_id, topic_id',
+        doc="""
     Retrieve the (paginated) top-level entries in a discussion topic.
     
     May require (depending on the topic) that the user has posted in the topic.
@@ -1031,17 +785,11 @@ def list_topic_entries_groups(request_ctx, group_id, topic_id, **request_kwargs)
         :return: List topic entries
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_topic_entries_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_topic_entries_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries',
+        'collection_item_id, topic_id',
+        doc="""
     Retrieve the (paginated) top-level entries in a discussion topic.
     
     May require (depending on the topic) that the user has posted in the topic.
@@ -1066,17 +814,12 @@ def list_topic_entries_collection_items(request_ctx, collection_item_id, topic_i
         :return: List topic entries
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def post_reply_courses(request_ctx, course_id, topic_id, entry_id, message, attachment=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'post_reply_courses', 'POST', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies',
+        'course_id, topic_id, entry_id, message, attachment=None',
+        payload=('message', 'attachment'),
+        doc="""
     Add a reply to an entry in a discussion topic. Returns a json
     representation of the created reply (see documentation for 'replies'
     method) on success.
@@ -1100,21 +843,12 @@ def post_reply_courses(request_ctx, course_id, topic_id, entry_id, message, atta
         :return: Post a reply
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def post_reply_groups(request_ctx, group_id, topic_id, entry_id, message, attachment=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'post_reply_groups', 'POST', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies',
+        'group_id, topic_id, entry_id, message, attachment=None',
+        payload=('message', 'attachment'),
+        doc="""
     Add a reply to an entry in a discussion topic. Returns a json
     representation of the created reply (see documentation for 'replies'
     method) on success.
@@ -1138,21 +872,12 @@ def post_reply_groups(request_ctx, group_id, topic_id, entry_id, message, attach
         :return: Post a reply
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def post_reply_collection_items(request_ctx, collection_item_id, topic_id, entry_id, message, attachment=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'post_reply_collection_items', 'POST', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies',
+        'collection_item_id, topic_id, entry_id, message, attachment=None',
+        payload=('message', 'attachment'),
+        doc="""
     Add a reply to an entry in a discussion topic. Returns a json
     representation of the created reply (see documentation for 'replies'
     method) on success.
@@ -1176,21 +901,11 @@ def post_reply_collection_items(request_ctx, collection_item_id, topic_id, entry
         :return: Post a reply
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_entry_replies_courses(request_ctx, course_id, topic_id, entry_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_entry_replies_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies',
+        'course_id, topic_id, entry_id',
+        doc="""
     Retrieve the (paginated) replies to a top-level entry in a discussion
     topic.
     
@@ -1211,17 +926,11 @@ def list_entry_replies_courses(request_ctx, course_id, topic_id, entry_id, **req
         :return: List entry replies
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_entry_replies_groups(request_ctx, group_id, topic_id, entry_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_entry_replies_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies',
+        'group_id, topic_id, entry_id',
+        doc="""
     Retrieve the (paginated) replies to a top-level entry in a discussion
     topic.
     
@@ -1242,17 +951,11 @@ def list_entry_replies_groups(request_ctx, group_id, topic_id, entry_id, **reque
         :return: List entry replies
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_entry_replies_collection_items(request_ctx, collection_item_id, topic_id, entry_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_entry_replies_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies',
+        'collection_item_id, topic_id, entry_id',
+        doc="""
     Retrieve the (paginated) replies to a top-level entry in a discussion
     topic.
     
@@ -1273,17 +976,12 @@ def list_entry_replies_collection_items(request_ctx, collection_item_id, topic_i
         :return: List entry replies
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_entries_courses(request_ctx, course_id, topic_id, ids, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_entries_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entry_list',
+        'course_id, topic_id, ids',
+        payload=('ids',),
+        doc="""
     Retrieve a paginated list of discussion entries, given a list of ids.
     
     May require (depending on the topic) that the user has posted in the topic.
@@ -1301,20 +999,12 @@ def list_entries_courses(request_ctx, course_id, topic_id, ids, **request_kwargs
         :return: List entries
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entry_list'
-    payload = {
-        'ids' : ids,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_entries_groups(request_ctx, group_id, topic_id, ids, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_entries_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entry_list',
+        'group_id, topic_id, ids',
+        payload=('ids',),
+        doc="""
     Retrieve a paginated list of discussion entries, given a list of ids.
     
     May require (depending on the topic) that the user has posted in the topic.
@@ -1332,20 +1022,12 @@ def list_entries_groups(request_ctx, group_id, topic_id, ids, **request_kwargs):
         :return: List entries
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entry_list'
-    payload = {
-        'ids' : ids,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_entries_collection_items(request_ctx, collection_item_id, topic_id, ids, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_entries_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entry_list',
+        'collection_item_id, topic_id, ids',
+        payload=('ids',),
+        doc="""
     Retrieve a paginated list of discussion entries, given a list of ids.
     
     May require (depending on the topic) that the user has posted in the topic.
@@ -1363,20 +1045,11 @@ def list_entries_collection_items(request_ctx, collection_item_id, topic_id, ids
         :return: List entries
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entry_list'
-    payload = {
-        'ids' : ids,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_topic_as_read_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_topic_as_read_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/read',
+        'course_id, topic_id',
+        doc="""
     Mark the initial text of the discussion topic as read.
     
     No request fields are necessary.
@@ -1392,17 +1065,11 @@ def mark_topic_as_read_courses(request_ctx, course_id, topic_id, **request_kwarg
         :return: Mark topic as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def mark_topic_as_read_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_topic_as_read_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/read',
+        'group_id, topic_id',
+        doc="""
     Mark the initial text of the discussion topic as read.
     
     No request fields are necessary.
@@ -1418,17 +1085,11 @@ def mark_topic_as_read_groups(request_ctx, group_id, topic_id, **request_kwargs)
         :return: Mark topic as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def mark_topic_as_read_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_topic_as_read_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read',
+        'collection_item_id, topic_id',
+        doc="""
     Mark the initial text of the discussion topic as read.
     
     No request fields are necessary.
@@ -1444,17 +1105,11 @@ def mark_topic_as_read_collection_items(request_ctx, collection_item_id, topic_i
         :return: Mark topic as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def mark_topic_as_unread_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_topic_as_unread_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/read',
+        'course_id, topic_id',
+        doc="""
     Mark the initial text of the discussion topic as unread.
     
     No request fields are necessary.
@@ -1470,17 +1125,11 @@ def mark_topic_as_unread_courses(request_ctx, course_id, topic_id, **request_kwa
         :return: Mark topic as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def mark_topic_as_unread_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_topic_as_unread_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/read',
+        'group_id, topic_id',
+        doc="""
     Mark the initial text of the discussion topic as unread.
     
     No request fields are necessary.
@@ -1496,17 +1145,11 @@ def mark_topic_as_unread_groups(request_ctx, group_id, topic_id, **request_kwarg
         :return: Mark topic as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def mark_topic_as_unread_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_topic_as_unread_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read',
+        'collection_item_id, topic_id',
+        doc="""
     Mark the initial text of the discussion topic as unread.
     
     No request fields are necessary.
@@ -1522,17 +1165,12 @@ def mark_topic_as_unread_collection_items(request_ctx, collection_item_id, topic
         :return: Mark topic as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def mark_all_entries_as_read_courses(request_ctx, course_id, topic_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_all_entries_as_read_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/read_all',
+        'course_id, topic_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark the discussion topic and all its entries as read.
     
     No request fields are necessary.
@@ -1550,20 +1188,12 @@ def mark_all_entries_as_read_courses(request_ctx, course_id, topic_id, forced_re
         :return: Mark all entries as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_all_entries_as_read_groups(request_ctx, group_id, topic_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_all_entries_as_read_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/read_all',
+        'group_id, topic_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark the discussion topic and all its entries as read.
     
     No request fields are necessary.
@@ -1581,20 +1211,12 @@ def mark_all_entries_as_read_groups(request_ctx, group_id, topic_id, forced_read
         :return: Mark all entries as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_all_entries_as_read_collection_items(request_ctx, collection_item_id, topic_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_all_entries_as_read_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read_all',
+        'collection_item_id, topic_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark the discussion topic and all its entries as read.
     
     No request fields are necessary.
@@ -1612,20 +1234,12 @@ def mark_all_entries_as_read_collection_items(request_ctx, collection_item_id, t
         :return: Mark all entries as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_all_entries_as_unread_courses(request_ctx, course_id, topic_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_all_entries_as_unread_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/read_all',
+        'course_id, topic_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark the discussion topic and all its entries as unread.
     
     No request fields are necessary.
@@ -1643,20 +1257,12 @@ def mark_all_entries_as_unread_courses(request_ctx, course_id, topic_id, forced_
         :return: Mark all entries as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_all_entries_as_unread_groups(request_ctx, group_id, topic_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_all_entries_as_unread_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/read_all',
+        'group_id, topic_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark the discussion topic and all its entries as unread.
     
     No request fields are necessary.
@@ -1674,20 +1280,12 @@ def mark_all_entries_as_unread_groups(request_ctx, group_id, topic_id, forced_re
         :return: Mark all entries as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_all_entries_as_unread_collection_items(request_ctx, collection_item_id, topic_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_all_entries_as_unread_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read_all',
+        'collection_item_id, topic_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark the discussion topic and all its entries as unread.
     
     No request fields are necessary.
@@ -1705,20 +1303,12 @@ def mark_all_entries_as_unread_collection_items(request_ctx, collection_item_id,
         :return: Mark all entries as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_entry_as_read_courses(request_ctx, course_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_entry_as_read_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/read',
+        'course_id, topic_id, entry_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark a discussion entry as read.
     
     No request fields are necessary.
@@ -1738,20 +1328,12 @@ def mark_entry_as_read_courses(request_ctx, course_id, topic_id, entry_id, force
         :return: Mark entry as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_entry_as_read_groups(request_ctx, group_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_entry_as_read_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/read',
+        'group_id, topic_id, entry_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark a discussion entry as read.
     
     No request fields are necessary.
@@ -1771,20 +1353,12 @@ def mark_entry_as_read_groups(request_ctx, group_id, topic_id, entry_id, forced_
         :return: Mark entry as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_entry_as_read_collection_items(request_ctx, collection_item_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_entry_as_read_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/read',
+        'collection_item_id, topic_id, entry_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark a discussion entry as read.
     
     No request fields are necessary.
@@ -1804,20 +1378,12 @@ def mark_entry_as_read_collection_items(request_ctx, collection_item_id, topic_i
         :return: Mark entry as read
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_entry_as_unread_courses(request_ctx, course_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_entry_as_unread_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/read',
+        'course_id, topic_id, entry_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark a discussion entry as unread.
     
     No request fields are necessary.
@@ -1837,20 +1403,12 @@ def mark_entry_as_unread_courses(request_ctx, course_id, topic_id, entry_id, for
         :return: Mark entry as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_entry_as_unread_groups(request_ctx, group_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_entry_as_unread_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/read',
+        'group_id, topic_id, entry_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark a discussion entry as unread.
     
     No request fields are necessary.
@@ -1870,20 +1428,12 @@ def mark_entry_as_unread_groups(request_ctx, group_id, topic_id, entry_id, force
         :return: Mark entry as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def mark_entry_as_unread_collection_items(request_ctx, collection_item_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'mark_entry_as_unread_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/read',
+        'collection_item_id, topic_id, entry_id, forced_read_state=None',
+        payload=('forced_read_state',),
+        doc="""
     Mark a discussion entry as unread.
     
     No request fields are necessary.
@@ -1903,20 +1453,11 @@ def mark_entry_as_unread_collection_items(request_ctx, collection_item_id, topic
         :return: Mark entry as unread
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def subscribe_to_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'subscribe_to_topic_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/subscribed',
+        'course_id, topic_id',
+        doc="""
     Subscribe to a topic to receive notifications about new entries
     
     On success, the response will be 204 No Content with an empty body
@@ -1930,17 +1471,11 @@ def subscribe_to_topic_courses(request_ctx, course_id, topic_id, **request_kwarg
         :return: Subscribe to a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def subscribe_to_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'subscribe_to_topic_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/subscribed',
+        'group_id, topic_id',
+        doc="""
     Subscribe to a topic to receive notifications about new entries
     
     On success, the response will be 204 No Content with an empty body
@@ -1954,17 +1489,11 @@ def subscribe_to_topic_groups(request_ctx, group_id, topic_id, **request_kwargs)
         :return: Subscribe to a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def subscribe_to_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'subscribe_to_topic_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/subscribed',
+        'collection_item_id, topic_id',
+        doc="""
     Subscribe to a topic to receive notifications about new entries
     
     On success, the response will be 204 No Content with an empty body
@@ -1978,17 +1507,11 @@ def subscribe_to_topic_collection_items(request_ctx, collection_item_id, topic_i
         :return: Subscribe to a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def unsubscribe_from_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'unsubscribe_from_topic_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/subscribed',
+        'course_id, topic_id',
+        doc="""
     Unsubscribe from a topic to stop receiving notifications about new entries
     
     On success, the response will be 204 No Content with an empty body
@@ -2002,17 +1525,11 @@ def unsubscribe_from_topic_courses(request_ctx, course_id, topic_id, **request_k
         :return: Unsubscribe from a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def unsubscribe_from_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'unsubscribe_from_topic_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/subscribed',
+        'group_id, topic_id',
+        doc="""
     Unsubscribe from a topic to stop receiving notifications about new entries
     
     On success, the response will be 204 No Content with an empty body
@@ -2026,17 +1543,11 @@ def unsubscribe_from_topic_groups(request_ctx, group_id, topic_id, **request_kwa
         :return: Unsubscribe from a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def unsubscribe_from_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'unsubscribe_from_topic_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/subscribed',
+        'collection_item_id, topic_id',
+        doc="""
     Unsubscribe from a topic to stop receiving notifications about new entries
     
     On success, the response will be 204 No Content with an empty body
@@ -2050,12 +1561,7 @@ def unsubscribe_from_topic_collection_items(request_ctx, collection_item_id, top
         :return: Unsubscribe from a topic
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def list_enrollment_terms(request_ctx, account_id, workflow_state=None, per_page=None, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'list_enrollment_terms', 'GET', '/v1/accounts/{account_id}/terms',
+        'account_id, workflow_state=None, per_page=None',
+        payload=('workflow_state', 'per_page'),
+        doc="""
     Return all of the terms in the account. Account must be a root account and
     requires permission to manage the account (when called on non-root
     accounts, will be directed to the appropriate root account).
@@ -17,18 +22,7 @@ def list_enrollment_terms(request_ctx, account_id, workflow_state=None, per_page
         :return: List enrollment terms
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/terms'
-    payload = {
-        'workflow_state' : workflow_state,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_enrollments_courses(request_ctx, course_id, type=None, role=None, role_id=None, state=None, user_id=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_enrollments_courses', 'GET', '/v1/courses/{course_id}/enrollments',
+        'course_id, type=None, role=None, role_id=None, state=None, user_id=None, per_page=None',
+        payload=('type[]', 'role[]', 'role_id[]', 'state[]', 'user_id', 'per_page'),
+        choices={'state': ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')},
+        doc="""
     Depending on the URL given, return either (1) all of the enrollments in
     a course, (2) all of the enrollments in a section or (3) all of a user's
     enrollments. This includes student, teacher, TA, and observer enrollments.
@@ -32,29 +38,13 @@ def list_enrollments_courses(request_ctx, course_id, type=None, role=None, role_
         :return: List enrollments
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/courses/{course_id}/enrollments'
-    payload = {
-        'type[]' : type,
-        'role[]' : role,
-        'role_id[]' : role_id,
-        'state[]' : state,
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_enrollments_sections(request_ctx, section_id, type=None, role=None, role_id=None, state=None, user_id=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_enrollments_sections', 'GET', '/v1/sections/{section_id}/enrollments',
+        'section_id, type=None, role=None, role_id=None, state=None, user_id=None, per_page=None',
+        payload=('type[]', 'role[]', 'role_id[]', 'state[]', 'user_id', 'per_page'),
+        choices={'state': ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')},
+        doc="""
     Depending on the URL given, return either (1) all of the enrollments in
     a course, (2) all of the enrollments in a section or (3) all of a user's
     enrollments. This includes student, teacher, TA, and observer enrollments.
@@ -85,29 +75,13 @@ def list_enrollments_sections(request_ctx, section_id, type=None, role=None, rol
         :return: List enrollments
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/sections/{section_id}/enrollments'
-    payload = {
-        'type[]' : type,
-        'role[]' : role,
-        'role_id[]' : role_id,
-        'state[]' : state,
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_enrollments_users(request_ctx, user_id, type=None, role=None, role_id=None, state=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_enrollments_users', 'GET', '/v1/users/{user_id}/enrollments',
+        'user_id, type=None, role=None, role_id=None, state=None, per_page=None',
+        payload=('type[]', 'role[]', 'role_id[]', 'state[]', 'per_page'),
+        choices={'state': ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')},
+        doc="""
     Depending on the URL given, return either (1) all of the enrollments in
     a course, (2) all of the enrollments in a section or (3) all of a user's
     enrollments. This includes student, teacher, TA, and observer enrollments.
@@ -136,28 +110,11 @@ def list_enrollments_users(request_ctx, user_id, type=None, role=None, role_id=N
         :return: List enrollments
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/users/{user_id}/enrollments'
-    payload = {
-        'type[]' : type,
-        'role[]' : role,
-        'role_id[]' : role_id,
-        'state[]' : state,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def enrollment_by_id(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'enrollment_by_id', 'GET', '/v1/accounts/{account_id}/enrollments/{id}',
+        'account_id, id',
+        doc="""
     Get an Enrollment object by Enrollment ID
 
         :param request_ctx: The request context
@@ -169,13 +126,30 @@ def enrollment_by_id(request_ctx, account_id, id, **request_kwargs):
         :return: Enrollment by ID
         :rtype: requests.Response (with Enrollment data)
 
-    """
+    """),
+    Endpoint(
+        'conclude_enrollment', 'DELETE', '/v1/courses/{course_id}/enrollments/{id}',
+        'course_id, id, task=None',
+        payload=('task',),
+        choices={'task': ('conclude', 'delete', 'inactivate', 'deactivate')},
+        doc="""
+    Delete or conclude an enrollment.
 
-    path = '/v1/accounts/{account_id}/enrollments/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param id: (required) ID
+        :type id: string
+        :param task: (optional) The action to take on the enrollment.
+        :type task: string or None
+        :return: Conclude an enrollment
+        :rtype: requests.Response (with Enrollment data)
 
-    return response
+    """),
+]
+
+build_methods(ENDPOINTS, globals())
 
 
 def enroll_user_courses(request_ctx, course_id, enrollment_user_id, enrollment_type=None, enrollment_role=None, enrollment_role_id=None, enrollment_enrollment_state=None, enrollment_course_section_id=None, enrollment_limit_privileges_to_course_section=None, enrollment_notify=None, enrollment_self_enrollment_code=None, enrollment_self_enrolled=None, **request_kwargs):
@@ -294,32 +268,3 @@ def enroll_user_sections(request_ctx, section_id, enrollment_user_id, enrollment
     response = client.post(request_ctx, url, payload=payload, **request_kwargs)
 
     return response
-
-
-def conclude_enrollment(request_ctx, course_id, id, task=None, **request_kwargs):
-    """
-    Delete or conclude an enrollment.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param id: (required) ID
-        :type id: string
-        :param task: (optional) The action to take on the enrollment.
-        :type task: string or None
-        :return: Conclude an enrollment
-        :rtype: requests.Response (with Enrollment data)
-
-    """
-
-    task_types = ('conclude', 'delete', 'inactivate', 'deactivate')
-    utils.validate_attr_is_acceptable(task, task_types)
-    path = '/v1/courses/{course_id}/enrollments/{id}'
-    payload = {
-        'task' : task,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
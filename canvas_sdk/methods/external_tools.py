@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_external_tools_courses(request_ctx, course_id, search_term=None, selectable=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_external_tools_courses', 'GET', '/v1/courses/{course_id}/external_tools',
+        'course_id, search_term=None, selectable=None, per_page=None',
+        payload=('search_term', 'selectable', 'per_page'),
+        doc="""
     Returns the paginated list of external tools for the current context.
     See the get request docs for a single tool for a list of properties on an external tool.
 
@@ -18,24 +23,12 @@ def list_external_tools_courses(request_ctx, course_id, search_term=None, select
         :return: List external tools
         :rtype: requests.Response (with void data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/external_tools'
-    payload = {
-        'search_term' : search_term,
-        'selectable' : selectable,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_external_tools_accounts(request_ctx, account_id, search_term=None, selectable=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_external_tools_accounts', 'GET', '/v1/accounts/{account_id}/external_tools',
+        'account_id, search_term=None, selectable=None, per_page=None',
+        payload=('search_term', 'selectable', 'per_page'),
+        doc="""
     Returns the paginated list of external tools for the current context.
     See the get request docs for a single tool for a list of properties on an external tool.
 
@@ -52,24 +45,12 @@ def list_external_tools_accounts(request_ctx, account_id, search_term=None, sele
         :return: List external tools
         :rtype: requests.Response (with void data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/external_tools'
-    payload = {
-        'search_term' : search_term,
-        'selectable' : selectable,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_sessionless_launch_url_for_external_tool_courses(request_ctx, course_id, id=None, url=None, assignment_id=None, launch_type=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_sessionless_launch_url_for_external_tool_courses', 'GET', '/v1/courses/{course_id}/external_tools/sessionless_launch',
+        'course_id, id=None, url=None, assignment_id=None, launch_type=None',
+        payload=('id', 'url', 'assignment_id', 'launch_type'),
+        doc="""
     Returns a sessionless launch url for an external tool.
     
     Either the id or url must be provided.
@@ -89,23 +70,12 @@ def get_sessionless_launch_url_for_external_tool_courses(request_ctx, course_id,
         :return: Get a sessionless launch url for an external tool.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/external_tools/sessionless_launch'
-    payload = {
-        'id' : id,
-        'url' : url,
-        'assignment_id' : assignment_id,
-        'launch_type' : launch_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_sessionless_launch_url_for_external_tool_accounts(request_ctx, account_id, id=None, url=None, assignment_id=None, launch_type=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_sessionless_launch_url_for_external_tool_accounts', 'GET', '/v1/accounts/{account_id}/external_tools/sessionless_launch',
+        'account_id, id=None, url=None, assignment_id=None, launch_type=None',
+        payload=('id', 'url', 'assignment_id', 'launch_type'),
+        doc="""
     Returns a sessionless launch url for an external tool.
     
     Either the id or url must be provided.
@@ -125,23 +95,11 @@ def get_sessionless_launch_url_for_external_tool_accounts(request_ctx, account_i
         :return: Get a sessionless launch url for an external tool.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/external_tools/sessionless_launch'
-    payload = {
-        'id' : id,
-        'url' : url,
-        'assignment_id' : assignment_id,
-        'launch_type' : launch_type,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_external_tool_courses(request_ctx, course_id, external_tool_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_external_tool_courses', 'GET', '/v1/courses/{course_id}/external_tools/{external_tool_id}',
+        'course_id, external_tool_id',
+        doc="""
     Returns the specified external tool.
 
         :param request_ctx: The request context
@@ -153,17 +111,11 @@ def get_single_external_tool_courses(request_ctx, course_id, external_tool_id, *
         :return: Get a single external tool
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/external_tools/{external_tool_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, external_tool_id=external_tool_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_single_external_tool_accounts(request_ctx, account_id, external_tool_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_external_tool_accounts', 'GET', '/v1/accounts/{account_id}/external_tools/{external_tool_id}',
+        'account_id, external_tool_id',
+        doc="""
     Returns the specified external tool.
 
         :param request_ctx: The request context
@@ -175,17 +127,26 @@ def get_single_external_tool_accounts(request_ctx, account_id, external_tool_id,
         :return: Get a single external tool
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/external_tools/{external_tool_id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, external_tool_id=external_tool_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_external_tool_courses(request_ctx, course_id, name, privacy_level, consumer_key, shared_secret, description=None, url=None, domain=None, icon_url=None, text=None, not_selectable=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_external_tool_courses', 'POST', '/v1/courses/{course_id}/external_tools',
+        'course_id, name, privacy_level, consumer_key, shared_secret, description=None, url=None, domain=None, icon_url=None, text=None, not_selectable=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None',
+        payload=(
+            'name', 'privacy_level', 'consumer_key', 'shared_secret', 'description', 'url', 'domain', 'icon_url',
+            'text', 'not_selectable', 'custom_fields', 'account_navigation[url]', 'account_navigation[enabled]',
+            'account_navigation[text]', 'user_navigation[url]', 'user_navigation[enabled]', 'user_navigation[text]',
+            'course_navigation[url]', 'course_navigation[enabled]', 'course_navigation[text]',
+            'course_navigation[visibility]', 'course_navigation[default]', 'editor_button[url]',
+            'editor_button[enabled]', 'editor_button[icon_url]', 'editor_button[selection_width]',
+            'editor_button[selection_height]', 'resource_selection[url]', 'resource_selection[enabled]',
+            'resource_selection[icon_url]', 'resource_selection[selection_width]',
+            'resource_selection[selection_height]', 'config_type', 'config_xml', 'config_url',
+        ),
+        choices={
+            'privacy_level': ('anonymous', 'name_only', 'public'),
+            'course_navigation_visibility': ('admins', 'members'),
+        },
+        doc="""
     Create an external tool in the specified course/account.
     The created tool will be returned, see the "show" endpoint for an example.
 
@@ -266,58 +227,26 @@ def create_external_tool_courses(request_ctx, course_id, name, privacy_level, co
         :return: Create an external tool
         :rtype: requests.Response (with void data)
 
-    """
-
-    privacy_level_types = ('anonymous', 'name_only', 'public')
-    course_navigation_visibility_types = ('admins', 'members')
-    utils.validate_attr_is_acceptable(privacy_level, privacy_level_types)
-    utils.validate_attr_is_acceptable(course_navigation_visibility, course_navigation_visibility_types)
-    path = '/v1/courses/{course_id}/external_tools'
-    payload = {
-        'name' : name,
-        'privacy_level' : privacy_level,
-        'consumer_key' : consumer_key,
-        'shared_secret' : shared_secret,
-        'description' : description,
-        'url' : url,
-        'domain' : domain,
-        'icon_url' : icon_url,
-        'text' : text,
-        'not_selectable' : not_selectable,
-        'custom_fields' : custom_fields,
-        'account_navigation[url]' : account_navigation_url,
-        'account_navigation[enabled]' : account_navigation_enabled,
-        'account_navigation[text]' : account_navigation_text,
-        'user_navigation[url]' : user_navigation_url,
-        'user_navigation[enabled]' : user_navigation_enabled,
-        'user_navigation[text]' : user_navigation_text,
-        'course_navigation[url]' : course_navigation_url,
-        'course_navigation[enabled]' : course_navigation_enabled,
-        'course_navigation[text]' : course_navigation_text,
-        'course_navigation[visibility]' : course_navigation_visibility,
-        'course_navigation[default]' : course_navigation_default,
-        'editor_button[url]' : editor_button_url,
-        'editor_button[enabled]' : editor_button_enabled,
-        'editor_button[icon_url]' : editor_button_icon_url,
-        'editor_button[selection_width]' : editor_button_selection_width,
-        'editor_button[selection_height]' : editor_button_selection_height,
-        'resource_selection[url]' : resource_selection_url,
-        'resource_selection[enabled]' : resource_selection_enabled,
-        'resource_selection[icon_url]' : resource_selection_icon_url,
-        'resource_selection[selection_width]' : resource_selection_selection_width,
-        'resource_selection[selection_height]' : resource_selection_selection_height,
-        'config_type' : config_type,
-        'config_xml' : config_xml,
-        'config_url' : config_url,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_external_tool_accounts(request_ctx, account_id, name, privacy_level, consumer_key, shared_secret, description=None, url=None, domain=None, icon_url=None, text=None, not_selectable=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_external_tool_accounts', 'POST', '/v1/accounts/{account_id}/external_tools',
+        'account_id, name, privacy_level, consumer_key, shared_secret, description=None, url=None, domain=None, icon_url=None, text=None, not_selectable=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None',
+        payload=(
+            'name', 'privacy_level', 'consumer_key', 'shared_secret', 'description', 'url', 'domain', 'icon_url',
+            'text', 'not_selectable', 'custom_fields', 'account_navigation[url]', 'account_navigation[enabled]',
+            'account_navigation[text]', 'user_navigation[url]', 'user_navigation[enabled]', 'user_navigation[text]',
+            'course_navigation[url]', 'course_navigation[enabled]', 'course_navigation[text]',
+            'course_navigation[visibility]', 'course_navigation[default]', 'editor_button[url]',
+            'editor_button[enabled]', 'editor_button[icon_url]', 'editor_button[selection_width]',
+            'editor_button[selection_height]', 'resource_selection[url]', 'resource_selection[enabled]',
+            'resource_selection[icon_url]', 'resource_selection[selection_width]',
+            'resource_selection[selection_height]', 'config_type', 'config_xml', 'config_url',
+        ),
+        choices={
+            'privacy_level': ('anonymous', 'name_only', 'public'),
+            'course_navigation_visibility': ('admins', 'members'),
+        },
+        doc="""
     Create an external tool in the specified course/account.
     The created tool will be returned, see the "show" endpoint for an example.
 
@@ -398,58 +327,26 @@ def create_external_tool_accounts(request_ctx, account_id, name, privacy_level,
         :return: Create an external tool
         :rtype: requests.Response (with void data)
 
-    """
-
-    privacy_level_types = ('anonymous', 'name_only', 'public')
-    course_navigation_visibility_types = ('admins', 'members')
-    utils.validate_attr_is_acceptable(privacy_level, privacy_level_types)
-    utils.validate_attr_is_acceptable(course_navigation_visibility, course_navigation_visibility_types)
-    path = '/v1/accounts/{account_id}/external_tools'
-    payload = {
-        'name' : name,
-        'privacy_level' : privacy_level,
-        'consumer_key' : consumer_key,
-        'shared_secret' : shared_secret,
-        'description' : description,
-        'url' : url,
-        'domain' : domain,
-        'icon_url' : icon_url,
-        'text' : text,
-        'not_selectable' : not_selectable,
-        'custom_fields' : custom_fields,
-        'account_navigation[url]' : account_navigation_url,
-        'account_navigation[enabled]' : account_navigation_enabled,
-        'account_navigation[text]' : account_navigation_text,
-        'user_navigation[url]' : user_navigation_url,
-        'user_navigation[enabled]' : user_navigation_enabled,
-        'user_navigation[text]' : user_navigation_text,
-        'course_navigation[url]' : course_navigation_url,
-        'course_navigation[enabled]' : course_navigation_enabled,
-        'course_navigation[text]' : course_navigation_text,
-        'course_navigation[visibility]' : course_navigation_visibility,
-        'course_navigation[default]' : course_navigation_default,
-        'editor_button[url]' : editor_button_url,
-        'editor_button[enabled]' : editor_button_enabled,
-        'editor_button[icon_url]' : editor_button_icon_url,
-        'editor_button[selection_width]' : editor_button_selection_width,
-        'editor_button[selection_height]' : editor_button_selection_height,
-        'resource_selection[url]' : resource_selection_url,
-        'resource_selection[enabled]' : resource_selection_enabled,
-        'resource_selection[icon_url]' : resource_selection_icon_url,
-        'resource_selection[selection_width]' : resource_selection_selection_width,
-        'resource_selection[selection_height]' : resource_selection_selection_height,
-        'config_type' : config_type,
-        'config_xml' : config_xml,
-        'config_url' : config_url,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def edit_external_tool_courses(request_ctx, course_id, external_tool_id, name=None, privacy_level=None, consumer_key=None, shared_secret=None, description=None, url=None, domain=None, icon_url=None, text=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_external_tool_courses', 'PUT', '/v1/courses/{course_id}/external_tools/{external_tool_id}',
+        'course_id, external_tool_id, name=None, privacy_level=None, consumer_key=None, shared_secret=None, description=None, url=None, domain=None, icon_url=None, text=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None',
+        payload=(
+            'name', 'privacy_level', 'consumer_key', 'shared_secret', 'description', 'url', 'domain', 'icon_url',
+            'text', 'custom_fields', 'account_navigation[url]', 'account_navigation[enabled]',
+            'account_navigation[text]', 'user_navigation[url]', 'user_navigation[enabled]', 'user_navigation[text]',
+            'course_navigation[url]', 'course_navigation[enabled]', 'course_navigation[text]',
+            'course_navigation[visibility]', 'course_navigation[default]', 'editor_button[url]',
+            'editor_button[enabled]', 'editor_button[icon_url]', 'editor_button[selection_width]',
+            'editor_button[selection_height]', 'resource_selection[url]', 'resource_selection[enabled]',
+            'resource_selection[icon_url]', 'resource_selection[selection_width]',
+            'resource_selection[selection_height]', 'config_type', 'config_xml', 'config_url',
+        ),
+        choices={
+            'privacy_level': ('anonymous', 'name_only', 'public'),
+            'course_navigation_visibility': ('admins', 'members'),
+        },
+        doc="""
     Update the specified external tool. Uses same parameters as create
 
         :param request_ctx: The request context
@@ -529,56 +426,26 @@ def edit_external_tool_courses(request_ctx, course_id, external_tool_id, name=No
         :return: Edit an external tool
         :rtype: requests.Response (with void data)
 
-    """
-    privacy_level_types = ('anonymous', 'name_only', 'public')
-    course_navigation_visibility_types = ('admins', 'members')
-    utils.validate_attr_is_acceptable(privacy_level, privacy_level_types)
-    utils.validate_attr_is_acceptable(course_navigation_visibility, course_navigation_visibility_types)
-    path = '/v1/courses/{course_id}/external_tools/{external_tool_id}'
-    payload = {
-        'name': name,
-        'privacy_level': privacy_level,
-        'consumer_key': consumer_key,
-        'shared_secret': shared_secret,
-        'description': description,
-        'url': url,
-        'domain': domain,
-        'icon_url': icon_url,
-        'text' : text,
-        'custom_fields' : custom_fields,
-        'account_navigation[url]' : account_navigation_url,
-        'account_navigation[enabled]' : account_navigation_enabled,
-        'account_navigation[text]' : account_navigation_text,
-        'user_navigation[url]' : user_navigation_url,
-        'user_navigation[enabled]' : user_navigation_enabled,
-        'user_navigation[text]' : user_navigation_text,
-        'course_navigation[url]' : course_navigation_url,
-        'course_navigation[enabled]' : course_navigation_enabled,
-        'course_navigation[text]' : course_navigation_text,
-        'course_navigation[visibility]' : course_navigation_visibility,
-        'course_navigation[default]' : course_navigation_default,
-        'editor_button[url]' : editor_button_url,
-        'editor_button[enabled]' : editor_button_enabled,
-        'editor_button[icon_url]' : editor_button_icon_url,
-        'editor_button[selection_width]' : editor_button_selection_width,
-        'editor_button[selection_height]' : editor_button_selection_height,
-        'resource_selection[url]' : resource_selection_url,
-        'resource_selection[enabled]' : resource_selection_enabled,
-        'resource_selection[icon_url]' : resource_selection_icon_url,
-        'resource_selection[selection_width]' : resource_selection_selection_width,
-        'resource_selection[selection_height]' : resource_selection_selection_height,
-        'config_type' : config_type,
-        'config_xml' : config_xml,
-        'config_url' : config_url,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, external_tool_id=external_tool_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def edit_external_tool_accounts(request_ctx, account_id, external_tool_id, name=None, privacy_level=None, consumer_key=None, shared_secret=None, description=None, url=None, domain=None, icon_url=None, text=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_external_tool_accounts', 'PUT', '/v1/accounts/{account_id}/external_tools/{external_tool_id}',
+        'account_id, external_tool_id, name=None, privacy_level=None, consumer_key=None, shared_secret=None, description=None, url=None, domain=None, icon_url=None, text=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None',
+        payload=(
+            'name', 'privacy_level', 'consumer_key', 'shared_secret', 'description', 'url', 'domain', 'icon_url',
+            'text', 'custom_fields', 'account_navigation[url]', 'account_navigation[enabled]',
+            'account_navigation[text]', 'user_navigation[url]', 'user_navigation[enabled]', 'user_navigation[text]',
+            'course_navigation[url]', 'course_navigation[enabled]', 'course_navigation[text]',
+            'course_navigation[visibility]', 'course_navigation[default]', 'editor_button[url]',
+            'editor_button[enabled]', 'editor_button[icon_url]', 'editor_button[selection_width]',
+            'editor_button[selection_height]', 'resource_selection[url]', 'resource_selection[enabled]',
+            'resource_selection[icon_url]', 'resource_selection[selection_width]',
+            'resource_selection[selection_height]', 'config_type', 'config_xml', 'config_url',
+        ),
+        choices={
+            'privacy_level': ('anonymous', 'name_only', 'public'),
+            'course_navigation_visibility': ('admins', 'members'),
+        },
+        doc="""
     Update the specified external tool. Uses same parameters as create
 
         :param request_ctx: The request context
@@ -658,57 +525,11 @@ def edit_external_tool_accounts(request_ctx, account_id, external_tool_id, name=
         :return: Edit an external tool
         :rtype: requests.Response (with void data)
 
-    """
-
-    privacy_level_types = ('anonymous', 'name_only', 'public')
-    course_navigation_visibility_types = ('admins', 'members')
-    utils.validate_attr_is_acceptable(privacy_level, privacy_level_types)
-    utils.validate_attr_is_acceptable(course_navigation_visibility, course_navigation_visibility_types)
-    path = '/v1/accounts/{account_id}/external_tools/{external_tool_id}'
-    payload = {
-        'name': name,
-        'privacy_level': privacy_level,
-        'consumer_key': consumer_key,
-        'shared_secret': shared_secret,
-        'description': description,
-        'url': url,
-        'domain': domain,
-        'icon_url': icon_url,
-        'text' : text,
-        'custom_fields' : custom_fields,
-        'account_navigation[url]' : account_navigation_url,
-        'account_navigation[enabled]' : account_navigation_enabled,
-        'account_navigation[text]' : account_navigation_text,
-        'user_navigation[url]' : user_navigation_url,
-        'user_navigation[enabled]' : user_navigation_enabled,
-        'user_navigation[text]' : user_navigation_text,
-        'course_navigation[url]' : course_navigation_url,
-        'course_navigation[enabled]' : course_navigation_enabled,
-        'course_navigation[text]' : course_navigation_text,
-        'course_navigation[visibility]' : course_navigation_visibility,
-        'course_navigation[default]' : course_navigation_default,
-        'editor_button[url]' : editor_button_url,
-        'editor_button[enabled]' : editor_button_enabled,
-        'editor_button[icon_url]' : editor_button_icon_url,
-        'editor_button[selection_width]' : editor_button_selection_width,
-        'editor_button[selection_height]' : editor_button_selection_height,
-        'resource_selection[url]' : resource_selection_url,
-        'resource_selection[enabled]' : resource_selection_enabled,
-        'resource_selection[icon_url]' : resource_selection_icon_url,
-        'resource_selection[selection_width]' : resource_selection_selection_width,
-        'resource_selection[selection_height]' : resource_selection_selection_height,
-        'config_type' : config_type,
-        'config_xml' : config_xml,
-        'config_url' : config_url,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, external_tool_id=external_tool_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_external_tool_courses(request_ctx, course_id, external_tool_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_external_tool_courses', 'DELETE', '/v1/courses/{course_id}/external_tools/{external_tool_id}',
+        'course_id, external_tool_id',
+        doc="""
     Remove the specified external tool
 
         :param request_ctx: The request context
@@ -720,17 +541,11 @@ def delete_external_tool_courses(request_ctx, course_id, external_tool_id, **req
         :return: Delete an external tool
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/external_tools/{external_tool_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, external_tool_id=external_tool_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_external_tool_accounts(request_ctx, account_id, external_tool_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_external_tool_accounts', 'DELETE', '/v1/accounts/{account_id}/external_tools/{external_tool_id}',
+        'account_id, external_tool_id',
+        doc="""
     Remove the specified external tool
 
         :param request_ctx: The request context
@@ -742,12 +557,7 @@ def delete_external_tool_accounts(request_ctx, account_id, external_tool_id, **r
         :return: Delete an external tool
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/external_tools/{external_tool_id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, external_tool_id=external_tool_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
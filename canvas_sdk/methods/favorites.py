@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_favorite_courses(request_ctx, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_favorite_courses', 'GET', '/v1/users/self/favorites/courses',
+        'per_page=None',
+        payload=('per_page',),
+        doc="""
     Retrieve the list of favorite courses for the current user. If the user has not chosen
     any favorites, then a selection of currently enrolled courses will be returned.
     
@@ -14,22 +19,11 @@ def list_favorite_courses(request_ctx, per_page=None, **request_kwargs):
         :return: List favorite courses
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/self/favorites/courses'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def add_course_to_favorites(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'add_course_to_favorites', 'POST', '/v1/users/self/favorites/courses/{id}',
+        'id',
+        doc="""
     Add a course to the current user's favorites.  If the course is already
     in the user's favorites, nothing happens.
 
@@ -40,17 +34,11 @@ def add_course_to_favorites(request_ctx, id, **request_kwargs):
         :return: Add course to favorites
         :rtype: requests.Response (with Favorite data)
 
-    """
-
-    path = '/v1/users/self/favorites/courses/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def remove_course_from_favorites(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'remove_course_from_favorites', 'DELETE', '/v1/users/self/favorites/courses/{id}',
+        'id',
+        doc="""
     Remove a course from the current user's favorites.
 
         :param request_ctx: The request context
@@ -60,17 +48,11 @@ def remove_course_from_favorites(request_ctx, id, **request_kwargs):
         :return: Remove course from favorites
         :rtype: requests.Response (with Favorite data)
 
-    """
-
-    path = '/v1/users/self/favorites/courses/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def reset_course_favorites(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reset_course_favorites', 'DELETE', '/v1/users/self/favorites/courses',
+        '',
+        doc="""
     Reset the current user's course favorites to the default
     automatically generated list of enrolled courses
 
@@ -79,12 +61,7 @@ def reset_course_favorites(request_ctx, **request_kwargs):
         :return: Reset course favorites
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/favorites/courses'
-    url = request_ctx.base_api_url + path.format()
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_features_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_features_courses', 'GET', '/v1/courses/{course_id}/features',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List all features that apply to a given Account, Course, or User.
 
         :param request_ctx: The request context
@@ -13,22 +18,12 @@ def list_features_courses(request_ctx, course_id, per_page=None, **request_kwarg
         :return: List features
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/features'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_features_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_features_accounts', 'GET', '/v1/accounts/{account_id}/features',
+        'account_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List all features that apply to a given Account, Course, or User.
 
         :param request_ctx: The request context
@@ -40,22 +35,12 @@ def list_features_accounts(request_ctx, account_id, per_page=None, **request_kwa
         :return: List features
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/features'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_features_users(request_ctx, user_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_features_users', 'GET', '/v1/users/{user_id}/features',
+        'user_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List all features that apply to a given Account, Course, or User.
 
         :param request_ctx: The request context
@@ -67,22 +52,11 @@ def list_features_users(request_ctx, user_id, per_page=None, **request_kwargs):
         :return: List features
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/features'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_enabled_features_courses(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_enabled_features_courses', 'GET', '/v1/courses/{course_id}/features/enabled',
+        'course_id',
+        doc="""
     List all features that are enabled on a given Account, Course, or User.
     Only the feature names are returned.
 
@@ -93,17 +67,11 @@ def list_enabled_features_courses(request_ctx, course_id, **request_kwargs):
         :return: List enabled features
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/features/enabled'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_enabled_features_accounts(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_enabled_features_accounts', 'GET', '/v1/accounts/{account_id}/features/enabled',
+        'account_id',
+        doc="""
     List all features that are enabled on a given Account, Course, or User.
     Only the feature names are returned.
 
@@ -114,17 +82,11 @@ def list_enabled_features_accounts(request_ctx, account_id, **request_kwargs):
         :return: List enabled features
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/features/enabled'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_enabled_features_users(request_ctx, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_enabled_features_users', 'GET', '/v1/users/{user_id}/features/enabled',
+        'user_id',
+        doc="""
     List all features that are enabled on a given Account, Course, or User.
     Only the feature names are returned.
 
@@ -135,17 +97,11 @@ def list_enabled_features_users(request_ctx, user_id, **request_kwargs):
         :return: List enabled features
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{user_id}/features/enabled'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_feature_flag_courses(request_ctx, course_id, feature, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_feature_flag_courses', 'GET', '/v1/courses/{course_id}/features/flags/{feature}',
+        'course_id, feature',
+        doc="""
     Get the feature flag that applies to a given Account, Course, or User.
     The flag may be defined on the object, or it may be inherited from a parent
     account. You can look at the context_id and context_type of the returned object
@@ -161,17 +117,11 @@ def get_feature_flag_courses(request_ctx, course_id, feature, **request_kwargs):
         :return: Get feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    path = '/v1/courses/{course_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, feature=feature)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_feature_flag_accounts(request_ctx, account_id, feature, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_feature_flag_accounts', 'GET', '/v1/accounts/{account_id}/features/flags/{feature}',
+        'account_id, feature',
+        doc="""
     Get the feature flag that applies to a given Account, Course, or User.
     The flag may be defined on the object, or it may be inherited from a parent
     account. You can look at the context_id and context_type of the returned object
@@ -187,17 +137,11 @@ def get_feature_flag_accounts(request_ctx, account_id, feature, **request_kwargs
         :return: Get feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, feature=feature)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_feature_flag_users(request_ctx, user_id, feature, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_feature_flag_users', 'GET', '/v1/users/{user_id}/features/flags/{feature}',
+        'user_id, feature',
+        doc="""
     Get the feature flag that applies to a given Account, Course, or User.
     The flag may be defined on the object, or it may be inherited from a parent
     account. You can look at the context_id and context_type of the returned object
@@ -213,17 +157,13 @@ def get_feature_flag_users(request_ctx, user_id, feature, **request_kwargs):
         :return: Get feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    path = '/v1/users/{user_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, feature=feature)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def set_feature_flag_courses(request_ctx, course_id, feature, state=None, locking_account_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'set_feature_flag_courses', 'PUT', '/v1/courses/{course_id}/features/flags/{feature}',
+        'course_id, feature, state=None, locking_account_id=None',
+        payload=('state', 'locking_account_id'),
+        choices={'state': ('off', 'allowed', 'on')},
+        doc="""
     Set a feature flag for a given Account, Course, or User. This call will fail if a parent account sets
     a feature flag for the same feature in any state other than "allowed".
 
@@ -240,23 +180,13 @@ def set_feature_flag_courses(request_ctx, course_id, feature, state=None, lockin
         :return: Set feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    state_types = ('off', 'allowed', 'on')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/courses/{course_id}/features/flags/{feature}'
-    payload = {
-        'state' : state,
-        'locking_account_id' : locking_account_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, feature=feature)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def set_feature_flag_accounts(request_ctx, account_id, feature, state=None, locking_account_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'set_feature_flag_accounts', 'PUT', '/v1/accounts/{account_id}/features/flags/{feature}',
+        'account_id, feature, state=None, locking_account_id=None',
+        payload=('state', 'locking_account_id'),
+        choices={'state': ('off', 'allowed', 'on')},
+        doc="""
     Set a feature flag for a given Account, Course, or User. This call will fail if a parent account sets
     a feature flag for the same feature in any state other than "allowed".
 
@@ -273,23 +203,13 @@ def set_feature_flag_accounts(request_ctx, account_id, feature, state=None, lock
         :return: Set feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    state_types = ('off', 'allowed', 'on')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/accounts/{account_id}/features/flags/{feature}'
-    payload = {
-        'state' : state,
-        'locking_account_id' : locking_account_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, feature=feature)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def set_feature_flag_users(request_ctx, user_id, feature, state=None, locking_account_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'set_feature_flag_users', 'PUT', '/v1/users/{user_id}/features/flags/{feature}',
+        'user_id, feature, state=None, locking_account_id=None',
+        payload=('state', 'locking_account_id'),
+        choices={'state': ('off', 'allowed', 'on')},
+        doc="""
     Set a feature flag for a given Account, Course, or User. This call will fail if a parent account sets
     a feature flag for the same feature in any state other than "allowed".
 
@@ -306,23 +226,11 @@ def set_feature_flag_users(request_ctx, user_id, feature, state=None, locking_ac
         :return: Set feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    state_types = ('off', 'allowed', 'on')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/users/{user_id}/features/flags/{feature}'
-    payload = {
-        'state' : state,
-        'locking_account_id' : locking_account_id,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, feature=feature)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def remove_feature_flag_courses(request_ctx, course_id, feature, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'remove_feature_flag_courses', 'DELETE', '/v1/courses/{course_id}/features/flags/{feature}',
+        'course_id, feature',
+        doc="""
     Remove feature flag for a given Account, Course, or User.  (Note that the flag must
     be defined on the Account, Course, or User directly.)  The object will then inherit
     the feature flags from a higher account, if any exist.  If this flag was 'on' or 'off',
@@ -337,17 +245,11 @@ def remove_feature_flag_courses(request_ctx, course_id, feature, **request_kwarg
         :return: Remove feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    path = '/v1/courses/{course_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, feature=feature)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def remove_feature_flag_accounts(request_ctx, account_id, feature, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'remove_feature_flag_accounts', 'DELETE', '/v1/accounts/{account_id}/features/flags/{feature}',
+        'account_id, feature',
+        doc="""
     Remove feature flag for a given Account, Course, or User.  (Note that the flag must
     be defined on the Account, Course, or User directly.)  The object will then inherit
     the feature flags from a higher account, if any exist.  If this flag was 'on' or 'off',
@@ -362,17 +264,11 @@ def remove_feature_flag_accounts(request_ctx, account_id, feature, **request_kwa
         :return: Remove feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, feature=feature)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def remove_feature_flag_users(request_ctx, user_id, feature, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'remove_feature_flag_users', 'DELETE', '/v1/users/{user_id}/features/flags/{feature}',
+        'user_id, feature',
+        doc="""
     Remove feature flag for a given Account, Course, or User.  (Note that the flag must
     be defined on the Account, Course, or User directly.)  The object will then inherit
     the feature flags from a higher account, if any exist.  If this flag was 'on' or 'off',
@@ -387,12 +283,7 @@ def remove_feature_flag_users(request_ctx, user_id, feature, **request_kwargs):
         :return: Remove feature flag
         :rtype: requests.Response (with FeatureFlag data)
 
-    """
-
-    path = '/v1/users/{user_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, feature=feature)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def get_quota_information_courses(request_ctx, course_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'get_quota_information_courses', 'GET', '/v1/courses/{course_id}/files/quota',
+        'course_id',
+        doc="""
     Returns the total and used storage quota for the course, group, or user.
 
         :param request_ctx: The request context
@@ -11,17 +15,11 @@ def get_quota_information_courses(request_ctx, course_id, **request_kwargs):
         :return: Get quota information
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/files/quota'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_quota_information_groups(request_ctx, group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_quota_information_groups', 'GET', '/v1/groups/{group_id}/files/quota',
+        'group_id',
+        doc="""
     Returns the total and used storage quota for the course, group, or user.
 
         :param request_ctx: The request context
@@ -31,17 +29,11 @@ def get_quota_information_groups(request_ctx, group_id, **request_kwargs):
         :return: Get quota information
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/files/quota'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_quota_information_users(request_ctx, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_quota_information_users', 'GET', '/v1/users/{user_id}/files/quota',
+        'user_id',
+        doc="""
     Returns the total and used storage quota for the course, group, or user.
 
         :param request_ctx: The request context
@@ -51,17 +43,17 @@ def get_quota_information_users(request_ctx, user_id, **request_kwargs):
         :return: Get quota information
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{user_id}/files/quota'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_files_courses(request_ctx, course_id, content_types=None, search_term=None, include=None, sort=None, order=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_files_courses', 'GET', '/v1/courses/{course_id}/files',
+        'course_id, content_types=None, search_term=None, include=None, sort=None, order=None, per_page=None',
+        payload=('content_types', 'search_term', 'include', 'sort', 'order', 'per_page'),
+        choices={
+            'include': ('user',),
+            'sort': ('name', 'size', 'created_at', 'updated_at', 'content_type', 'user'),
+            'order': ('asc', 'desc'),
+        },
+        doc="""
     Returns the paginated list of files for the folder or course.
 
         :param request_ctx: The request context
@@ -83,33 +75,17 @@ def list_files_courses(request_ctx, course_id, content_types=None, search_term=N
         :return: List files
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('user')
-    sort_types = ('name', 'size', 'created_at', 'updated_at', 'content_type', 'user')
-    order_types = ('asc', 'desc')
-    utils.validate_attr_is_acceptable(include, include_types)
-    utils.validate_attr_is_acceptable(sort, sort_types)
-    utils.validate_attr_is_acceptable(order, order_types)
-    path = '/v1/courses/{course_id}/files'
-    payload = {
-        'content_types' : content_types,
-        'search_term' : search_term,
-        'include' : include,
-        'sort' : sort,
-        'order' : order,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_files_folders(request_ctx, id, content_types=None, search_term=None, include=None, sort=None, order=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_files_folders', 'GET', '/v1/folders/{id}/files',
+        'id, content_types=None, search_term=None, include=None, sort=None, order=None, per_page=None',
+        payload=('content_types', 'search_term', 'include', 'sort', 'order', 'per_page'),
+        choices={
+            'include': ('user',),
+            'sort': ('name', 'size', 'created_at', 'updated_at', 'content_type', 'user'),
+            'order': ('asc', 'desc'),
+        },
+        doc="""
     Returns the paginated list of files for the folder or course.
 
         :param request_ctx: The request context
@@ -131,33 +107,11 @@ def list_files_folders(request_ctx, id, content_types=None, search_term=None, in
         :return: List files
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('user')
-    sort_types = ('name', 'size', 'created_at', 'updated_at', 'content_type', 'user')
-    order_types = ('asc', 'desc')
-    utils.validate_attr_is_acceptable(include, include_types)
-    utils.validate_attr_is_acceptable(sort, sort_types)
-    utils.validate_attr_is_acceptable(order, order_types)
-    path = '/v1/folders/{id}/files'
-    payload = {
-        'content_types' : content_types,
-        'search_term' : search_term,
-        'include' : include,
-        'sort' : sort,
-        'order' : order,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_quota_information(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_quota_information', 'GET', '/v1/files/{id}/public_url',
+        'id',
+        doc="""
     Determine the URL that should be used for inline preview of the file.
 
         :param request_ctx: The request context
@@ -167,17 +121,13 @@ def get_quota_information(request_ctx, id, **request_kwargs):
         :return: Get quota information
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/files/{id}/public_url'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_file(request_ctx, id, include=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_file', 'GET', '/v1/files/{id}',
+        'id, include=None',
+        payload=('include',),
+        choices={'include': ('user',)},
+        doc="""
     Returns the standard attachment json object
 
         :param request_ctx: The request context
@@ -189,22 +139,12 @@ def get_file(request_ctx, id, include=None, **request_kwargs):
         :return: Get file
         :rtype: requests.Response (with File data)
 
-    """
-
-    include_types = ('user')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/files/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_file(request_ctx, id, name, parent_folder_id, lock_at, unlock_at, locked, hidden, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_file', 'PUT', '/v1/files/{id}',
+        'id, name, parent_folder_id, lock_at, unlock_at, locked, hidden',
+        payload=('name', 'parent_folder_id', 'lock_at', 'unlock_at', 'locked', 'hidden'),
+        doc="""
     Update some settings on the specified file
 
         :param request_ctx: The request context
@@ -226,25 +166,11 @@ def update_file(request_ctx, id, name, parent_folder_id, lock_at, unlock_at, loc
         :return: Update file
         :rtype: requests.Response (with File data)
 
-    """
-
-    path = '/v1/files/{id}'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_file(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_file', 'DELETE', '/v1/files/{id}',
+        'id',
+        doc="""
     Remove the specified file
     
       curl -XDELETE 'https://<canvas>/api/v1/files/<file_id>' \
@@ -257,17 +183,12 @@ def delete_file(request_ctx, id, **request_kwargs):
         :return: Delete file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/files/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_folders(request_ctx, id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_folders', 'GET', '/v1/folders/{id}/folders',
+        'id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the paginated list of folders in the folder.
 
         :param request_ctx: The request context
@@ -279,22 +200,12 @@ def list_folders(request_ctx, id, per_page=None, **request_kwargs):
         :return: List folders
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/folders/{id}/folders'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def resolve_path_courses_full_path(request_ctx, course_id, full_path, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'resolve_path_courses_full_path', 'GET', '/v1/courses/{course_id}/folders/by_path/{full_path}',
+        'course_id, full_path, per_page=None',
+        payload=('per_page',),
+        doc="""
     Given the full path to a folder, returns a list of all Folders in the path hierarchy,
     starting at the root folder, and ending at the requested folder. The given path is
     relative to the context's root folder and does not include the root folder's name
@@ -313,22 +224,12 @@ def resolve_path_courses_full_path(request_ctx, course_id, full_path, per_page=N
         :return: Resolve path
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/folders/by_path/{full_path}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, full_path=full_path)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def resolve_path_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'resolve_path_courses', 'GET', '/v1/courses/{course_id}/folders/by_path',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Given the full path to a folder, returns a list of all Folders in the path hierarchy,
     starting at the root folder, and ending at the requested folder. The given path is
     relative to the context's root folder and does not include the root folder's name
@@ -345,22 +246,12 @@ def resolve_path_courses(request_ctx, course_id, per_page=None, **request_kwargs
         :return: Resolve path
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/folders/by_path'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def resolve_path_users_full_path(request_ctx, user_id, full_path, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'resolve_path_users_full_path', 'GET', '/v1/users/{user_id}/folders/by_path/{full_path}',
+        'user_id, full_path, per_page=None',
+        payload=('per_page',),
+        doc="""
     Given the full path to a folder, returns a list of all Folders in the path hierarchy,
     starting at the root folder, and ending at the requested folder. The given path is
     relative to the context's root folder and does not include the root folder's name
@@ -379,22 +270,12 @@ def resolve_path_users_full_path(request_ctx, user_id, full_path, per_page=None,
         :return: Resolve path
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/folders/by_path/{full_path}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, full_path=full_path)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def resolve_path_users(request_ctx, user_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'resolve_path_users', 'GET', '/v1/users/{user_id}/folders/by_path',
+        'user_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Given the full path to a folder, returns a list of all Folders in the path hierarchy,
     starting at the root folder, and ending at the requested folder. The given path is
     relative to the context's root folder and does not include the root folder's name
@@ -411,22 +292,12 @@ def resolve_path_users(request_ctx, user_id, per_page=None, **request_kwargs):
         :return: Resolve path
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/folders/by_path'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def resolve_path_groups_full_path(request_ctx, group_id, full_path, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'resolve_path_groups_full_path', 'GET', '/v1/groups/{group_id}/folders/by_path/{full_path}',
+        'group_id, full_path, per_page=None',
+        payload=('per_page',),
+        doc="""
     Given the full path to a folder, returns a list of all Folders in the path hierarchy,
     starting at the root folder, and ending at the requested folder. The given path is
     relative to the context's root folder and does not include the root folder's name
@@ -445,22 +316,12 @@ def resolve_path_groups_full_path(request_ctx, group_id, full_path, per_page=Non
         :return: Resolve path
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/folders/by_path/{full_path}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, full_path=full_path)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def resolve_path_groups(request_ctx, group_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'resolve_path_groups', 'GET', '/v1/groups/{group_id}/folders/by_path',
+        'group_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Given the full path to a folder, returns a list of all Folders in the path hierarchy,
     starting at the root folder, and ending at the requested folder. The given path is
     relative to the context's root folder and does not include the root folder's name
@@ -477,22 +338,11 @@ def resolve_path_groups(request_ctx, group_id, per_page=None, **request_kwargs):
         :return: Resolve path
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/folders/by_path'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_folder_courses(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_folder_courses', 'GET', '/v1/courses/{course_id}/folders/{id}',
+        'course_id, id',
+        doc="""
     Returns the details for a folder
     
     You can get the root folder from a context by using 'root' as the :id.
@@ -507,17 +357,11 @@ def get_folder_courses(request_ctx, course_id, id, **request_kwargs):
         :return: Get folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/courses/{course_id}/folders/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_folder_users(request_ctx, user_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_folder_users', 'GET', '/v1/users/{user_id}/folders/{id}',
+        'user_id, id',
+        doc="""
     Returns the details for a folder
     
     You can get the root folder from a context by using 'root' as the :id.
@@ -532,17 +376,11 @@ def get_folder_users(request_ctx, user_id, id, **request_kwargs):
         :return: Get folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/users/{user_id}/folders/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_folder_groups(request_ctx, group_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_folder_groups', 'GET', '/v1/groups/{group_id}/folders/{id}',
+        'group_id, id',
+        doc="""
     Returns the details for a folder
     
     You can get the root folder from a context by using 'root' as the :id.
@@ -557,17 +395,11 @@ def get_folder_groups(request_ctx, group_id, id, **request_kwargs):
         :return: Get folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/groups/{group_id}/folders/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_folder_folders(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_folder_folders', 'GET', '/v1/folders/{id}',
+        'id',
+        doc="""
     Returns the details for a folder
     
     You can get the root folder from a context by using 'root' as the :id.
@@ -580,17 +412,12 @@ def get_folder_folders(request_ctx, id, **request_kwargs):
         :return: Get folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/folders/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_folder(request_ctx, id, name, parent_folder_id, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_folder', 'PUT', '/v1/folders/{id}',
+        'id, name, parent_folder_id, lock_at, unlock_at, locked, hidden, position',
+        payload=('name', 'parent_folder_id', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position'),
+        doc="""
     Updates a folder
 
         :param request_ctx: The request context
@@ -614,26 +441,14 @@ def update_folder(request_ctx, id, name, parent_folder_id, lock_at, unlock_at, l
         :return: Update folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/folders/{id}'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_folder_courses(request_ctx, course_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_folder_courses', 'POST', '/v1/courses/{course_id}/folders',
+        'course_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position',
+        payload=(
+            'name', 'parent_folder_id', 'parent_folder_path', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position',
+        ),
+        doc="""
     Creates a folder in the specified context
 
         :param request_ctx: The request context
@@ -659,27 +474,14 @@ def create_folder_courses(request_ctx, course_id, name, parent_folder_id, parent
         :return: Create folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/courses/{course_id}/folders'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'parent_folder_path' : parent_folder_path,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_folder_users(request_ctx, user_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_folder_users', 'POST', '/v1/users/{user_id}/folders',
+        'user_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position',
+        payload=(
+            'name', 'parent_folder_id', 'parent_folder_path', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position',
+        ),
+        doc="""
     Creates a folder in the specified context
 
         :param request_ctx: The request context
@@ -705,27 +507,14 @@ def create_folder_users(request_ctx, user_id, name, parent_folder_id, parent_fol
         :return: Create folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/users/{user_id}/folders'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'parent_folder_path' : parent_folder_path,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_folder_groups(request_ctx, group_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_folder_groups', 'POST', '/v1/groups/{group_id}/folders',
+        'group_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position',
+        payload=(
+            'name', 'parent_folder_id', 'parent_folder_path', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position',
+        ),
+        doc="""
     Creates a folder in the specified context
 
         :param request_ctx: The request context
@@ -751,27 +540,14 @@ def create_folder_groups(request_ctx, group_id, name, parent_folder_id, parent_f
         :return: Create folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/groups/{group_id}/folders'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'parent_folder_path' : parent_folder_path,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_folder_folders(request_ctx, folder_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_folder_folders', 'POST', '/v1/folders/{folder_id}/folders',
+        'folder_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position',
+        payload=(
+            'name', 'parent_folder_id', 'parent_folder_path', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position',
+        ),
+        doc="""
     Creates a folder in the specified context
 
         :param request_ctx: The request context
@@ -797,27 +573,12 @@ def create_folder_folders(request_ctx, folder_id, name, parent_folder_id, parent
         :return: Create folder
         :rtype: requests.Response (with Folder data)
 
-    """
-
-    path = '/v1/folders/{folder_id}/folders'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'parent_folder_path' : parent_folder_path,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(folder_id=folder_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_folder(request_ctx, id, force, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_folder', 'DELETE', '/v1/folders/{id}',
+        'id, force',
+        payload=('force',),
+        doc="""
     Remove the specified folder. You can only delete empty folders unless you
     set the 'force' flag
 
@@ -830,20 +591,11 @@ def delete_folder(request_ctx, id, force, **request_kwargs):
         :return: Delete folder
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/folders/{id}'
-    payload = {
-        'force' : force,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def upload_file(request_ctx, folder_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'upload_file', 'POST', '/v1/folders/{folder_id}/files',
+        'folder_id',
+        doc="""
     Upload a file to a folder.
     
     This API endpoint is the first step in uploading a file.
@@ -860,12 +612,7 @@ def upload_file(request_ctx, folder_id, **request_kwargs):
         :return: Upload a file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/folders/{folder_id}/files'
-    url = request_ctx.base_api_url + path.format(folder_id=folder_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def query_by_assignment(request_ctx, assignment_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'query_by_assignment', 'GET', '/v1/audit/grade_change/assignments/{assignment_id}',
+        'assignment_id, start_time=None, end_time=None, per_page=None',
+        payload=('start_time', 'end_time', 'per_page'),
+        doc="""
     List grade change events for a given assignment.
 
         :param request_ctx: The request context
@@ -17,24 +22,12 @@ def query_by_assignment(request_ctx, assignment_id, start_time=None, end_time=No
         :return: Query by assignment.
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/grade_change/assignments/{assignment_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def query_by_course(request_ctx, course_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'query_by_course', 'GET', '/v1/audit/grade_change/courses/{course_id}',
+        'course_id, start_time=None, end_time=None, per_page=None',
+        payload=('start_time', 'end_time', 'per_page'),
+        doc="""
     List grade change events for a given course.
 
         :param request_ctx: The request context
@@ -50,24 +43,12 @@ def query_by_course(request_ctx, course_id, start_time=None, end_time=None, per_
         :return: Query by course.
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/grade_change/courses/{course_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def query_by_student(request_ctx, student_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'query_by_student', 'GET', '/v1/audit/grade_change/students/{student_id}',
+        'student_id, start_time=None, end_time=None, per_page=None',
+        payload=('start_time', 'end_time', 'per_page'),
+        doc="""
     List grade change events for a given student.
 
         :param request_ctx: The request context
@@ -83,24 +64,12 @@ def query_by_student(request_ctx, student_id, start_time=None, end_time=None, pe
         :return: Query by student.
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/grade_change/students/{student_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(student_id=student_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def query_by_grader(request_ctx, grader_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'query_by_grader', 'GET', '/v1/audit/grade_change/graders/{grader_id}',
+        'grader_id, start_time=None, end_time=None, per_page=None',
+        payload=('start_time', 'end_time', 'per_page'),
+        doc="""
     List grade change events for a given grader.
 
         :param request_ctx: The request context
@@ -116,19 +85,7 @@ def query_by_grader(request_ctx, grader_id, start_time=None, end_time=None, per_
         :return: Query by grader.
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/grade_change/graders/{grader_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(grader_id=grader_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
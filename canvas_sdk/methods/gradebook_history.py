@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def days_in_gradebook_history_for_this_course(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'days_in_gradebook_history_for_this_course', 'GET', '/v1/courses/{course_id}/gradebook_history/days',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns a map of dates to grader/assignment groups
 
         :param request_ctx: The request context
@@ -13,22 +18,12 @@ def days_in_gradebook_history_for_this_course(request_ctx, course_id, per_page=N
         :return: Days in gradebook history for this course
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/gradebook_history/days'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def details_for_given_date_in_gradebook_history_for_this_course(request_ctx, course_id, date, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'details_for_given_date_in_gradebook_history_for_this_course', 'GET', '/v1/courses/{course_id}/gradebook_history/{date}',
+        'course_id, date, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the graders who worked on this day, along with the assignments they worked on.
     More details can be obtained by selecting a grader and assignment and calling the
     'submissions' api endpoint for a given date.
@@ -44,22 +39,12 @@ def details_for_given_date_in_gradebook_history_for_this_course(request_ctx, cou
         :return: Details for a given date in gradebook history for this course
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/gradebook_history/{date}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, date=date)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def lists_submissions(request_ctx, course_id, date, grader_id, assignment_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'lists_submissions', 'GET', '/v1/courses/{course_id}/gradebook_history/{date}/graders/{grader_id}/assignments/{assignment_id}/submissions',
+        'course_id, date, grader_id, assignment_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Gives a nested list of submission versions
 
         :param request_ctx: The request context
@@ -77,22 +62,12 @@ def lists_submissions(request_ctx, course_id, date, grader_id, assignment_id, pe
         :return: Lists submissions
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/gradebook_history/{date}/graders/{grader_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, date=date, grader_id=grader_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_uncollated_submission_versions(request_ctx, course_id, assignment_id=None, user_id=None, ascending=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_uncollated_submission_versions', 'GET', '/v1/courses/{course_id}/gradebook_history/feed',
+        'course_id, assignment_id=None, user_id=None, ascending=None, per_page=None',
+        payload=('assignment_id', 'user_id', 'ascending', 'per_page'),
+        doc="""
     Gives a paginated, uncollated list of submission versions for all matching
     submissions in the context. This SubmissionVersion objects will not include
     the +new_grade+ or +previous_grade+ keys, only the +grade+; same for
@@ -113,20 +88,7 @@ def list_uncollated_submission_versions(request_ctx, course_id, assignment_id=No
         :return: List uncollated submission versions
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/gradebook_history/feed'
-    payload = {
-        'assignment_id' : assignment_id,
-        'user_id' : user_id,
-        'ascending' : ascending,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
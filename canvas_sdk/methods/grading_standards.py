@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def create_new_grading_standard_accounts(request_ctx, account_id, title, grading_scheme_entry_name, grading_scheme_entry_value, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'create_new_grading_standard_accounts', 'POST', '/v1/accounts/{account_id}/grading_standards',
+        'account_id, title, grading_scheme_entry_name, grading_scheme_entry_value',
+        payload=('title', 'grading_scheme_entry[name]', 'grading_scheme_entry[value]'),
+        doc="""
     Create a new grading standard
     
     If grading_scheme_entry arguments are omitted, then a default grading scheme
@@ -32,22 +37,12 @@ def create_new_grading_standard_accounts(request_ctx, account_id, title, grading
         :return: Create a new grading standard
         :rtype: requests.Response (with GradingStandard data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/grading_standards'
-    payload = {
-        'title' : title,
-        'grading_scheme_entry[name]' : grading_scheme_entry_name,
-        'grading_scheme_entry[value]' : grading_scheme_entry_value,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_new_grading_standard_courses(request_ctx, course_id, title, grading_scheme_entry_name, grading_scheme_entry_value, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_new_grading_standard_courses', 'POST', '/v1/courses/{course_id}/grading_standards',
+        'course_id, title, grading_scheme_entry_name, grading_scheme_entry_value',
+        payload=('title', 'grading_scheme_entry[name]', 'grading_scheme_entry[value]'),
+        doc="""
     Create a new grading standard
     
     If grading_scheme_entry arguments are omitted, then a default grading scheme
@@ -78,17 +73,7 @@ def create_new_grading_standard_courses(request_ctx, course_id, title, grading_s
         :return: Create a new grading standard
         :rtype: requests.Response (with GradingStandard data)
 
-    """
-
-    path = '/v1/courses/{course_id}/grading_standards'
-    payload = {
-        'title' : title,
-        'grading_scheme_entry[name]' : grading_scheme_entry_name,
-        'grading_scheme_entry[value]' : grading_scheme_entry_value,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_group_categories_for_context_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_group_categories_for_context_accounts', 'GET', '/v1/accounts/{account_id}/group_categories',
+        'account_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns a list of group categories in a context
 
         :param request_ctx: The request context
@@ -13,22 +18,12 @@ def list_group_categories_for_context_accounts(request_ctx, account_id, per_page
         :return: List group categories for a context
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/group_categories'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_group_categories_for_context_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_group_categories_for_context_courses', 'GET', '/v1/courses/{course_id}/group_categories',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns a list of group categories in a context
 
         :param request_ctx: The request context
@@ -40,22 +35,11 @@ def list_group_categories_for_context_courses(request_ctx, course_id, per_page=N
         :return: List group categories for a context
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/group_categories'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_group_category(request_ctx, group_category_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_group_category', 'GET', '/v1/group_categories/{group_category_id}',
+        'group_category_id',
+        doc="""
     Returns the data for a single group category, or a 401 if the caller doesn't have
     the rights to see it.
 
@@ -66,17 +50,13 @@ def get_single_group_category(request_ctx, group_category_id, **request_kwargs):
         :return: Get a single group category
         :rtype: requests.Response (with GroupCategory data)
 
-    """
-
-    path = '/v1/group_categories/{group_category_id}'
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_group_category_accounts(request_ctx, account_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_group_category_accounts', 'POST', '/v1/accounts/{account_id}/group_categories',
+        'account_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None',
+        payload=('name', 'self_signup', 'auto_leader', 'group_limit', 'create_group_count', 'split_group_count'),
+        choices={'self_signup': ('enabled', 'restricted'), 'auto_leader': ('first', 'random')},
+        doc="""
     Create a new group category
 
         :param request_ctx: The request context
@@ -98,29 +78,13 @@ def create_group_category_accounts(request_ctx, account_id, name, self_signup=No
         :return: Create a Group Category
         :rtype: requests.Response (with GroupCategory data)
 
-    """
-
-    self_signup_types = ('enabled', 'restricted')
-    auto_leader_types = ('first', 'random')
-    utils.validate_attr_is_acceptable(self_signup, self_signup_types)
-    utils.validate_attr_is_acceptable(auto_leader, auto_leader_types)
-    path = '/v1/accounts/{account_id}/group_categories'
-    payload = {
-        'name' : name,
-        'self_signup' : self_signup,
-        'auto_leader' : auto_leader,
-        'group_limit' : group_limit,
-        'create_group_count' : create_group_count,
-        'split_group_count' : split_group_count,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_group_category_courses(request_ctx, course_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_group_category_courses', 'POST', '/v1/courses/{course_id}/group_categories',
+        'course_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None',
+        payload=('name', 'self_signup', 'auto_leader', 'group_limit', 'create_group_count', 'split_group_count'),
+        choices={'self_signup': ('enabled', 'restricted'), 'auto_leader': ('first', 'random')},
+        doc="""
     Create a new group category
 
         :param request_ctx: The request context
@@ -142,29 +106,13 @@ def create_group_category_courses(request_ctx, course_id, name, self_signup=None
         :return: Create a Group Category
         :rtype: requests.Response (with GroupCategory data)
 
-    """
-
-    self_signup_types = ('enabled', 'restricted')
-    auto_leader_types = ('first', 'random')
-    utils.validate_attr_is_acceptable(self_signup, self_signup_types)
-    utils.validate_attr_is_acceptable(auto_leader, auto_leader_types)
-    path = '/v1/courses/{course_id}/group_categories'
-    payload = {
-        'name' : name,
-        'self_signup' : self_signup,
-        'auto_leader' : auto_leader,
-        'group_limit' : group_limit,
-        'create_group_count' : create_group_count,
-        'split_group_count' : split_group_count,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_group_category(request_ctx, group_category_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_group_category', 'PUT', '/v1/group_categories/{group_category_id}',
+        'group_category_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None',
+        payload=('name', 'self_signup', 'auto_leader', 'group_limit', 'create_group_count', 'split_group_count'),
+        choices={'self_signup': ('enabled', 'restricted'), 'auto_leader': ('first', 'random')},
+        doc="""
     Modifies an existing group category.
 
         :param request_ctx: The request context
@@ -186,29 +134,11 @@ def update_group_category(request_ctx, group_category_id, name, self_signup=None
         :return: Update a Group Category
         :rtype: requests.Response (with GroupCategory data)
 
-    """
-
-    self_signup_types = ('enabled', 'restricted')
-    auto_leader_types = ('first', 'random')
-    utils.validate_attr_is_acceptable(self_signup, self_signup_types)
-    utils.validate_attr_is_acceptable(auto_leader, auto_leader_types)
-    path = '/v1/group_categories/{group_category_id}'
-    payload = {
-        'name' : name,
-        'self_signup' : self_signup,
-        'auto_leader' : auto_leader,
-        'group_limit' : group_limit,
-        'create_group_count' : create_group_count,
-        'split_group_count' : split_group_count,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_group_category(request_ctx, group_category_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_group_category', 'DELETE', '/v1/group_categories/{group_category_id}',
+        'group_category_id',
+        doc="""
     Deletes a group category and all groups under it. Protected group
     categories can not be deleted, i.e. "communities", "student_organized", and "imported".
 
@@ -219,17 +149,12 @@ def delete_group_category(request_ctx, group_category_id, **request_kwargs):
         :return: Delete a Group Category
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/group_categories/{group_category_id}'
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_groups_in_group_category(request_ctx, group_category_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_groups_in_group_category', 'GET', '/v1/group_categories/{group_category_id}/groups',
+        'group_category_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns a list of groups in a group category
 
         :param request_ctx: The request context
@@ -241,22 +166,12 @@ def list_groups_in_group_category(request_ctx, group_category_id, per_page=None,
         :return: List groups in group category
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/group_categories/{group_category_id}/groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_users_in_group_category(request_ctx, group_category_id, search_term=None, unassigned=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_users_in_group_category', 'GET', '/v1/group_categories/{group_category_id}/users',
+        'group_category_id, search_term=None, unassigned=None, per_page=None',
+        payload=('search_term', 'unassigned', 'per_page'),
+        doc="""
     Returns a list of users in the group category.
 
         :param request_ctx: The request context
@@ -272,24 +187,12 @@ def list_users_in_group_category(request_ctx, group_category_id, search_term=Non
         :return: List users in group category
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/group_categories/{group_category_id}/users'
-    payload = {
-        'search_term' : search_term,
-        'unassigned' : unassigned,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def assign_unassigned_members(request_ctx, group_category_id, sync=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'assign_unassigned_members', 'POST', '/v1/group_categories/{group_category_id}/assign_unassigned_members',
+        'group_category_id, sync=None',
+        payload=('sync',),
+        doc="""
     Assign all unassigned members as evenly as possible among the existing
     student groups.
 
@@ -302,15 +205,7 @@ def assign_unassigned_members(request_ctx, group_category_id, sync=None, **reque
         :return: Assign unassigned members
         :rtype: requests.Response (with GroupMembership | Progress data)
 
-    """
-
-    path = '/v1/group_categories/{group_category_id}/assign_unassigned_members'
-    payload = {
-        'sync' : sync,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_your_groups(request_ctx, context_type=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_your_groups', 'GET', '/v1/users/self/groups',
+        'context_type=None, per_page=None',
+        payload=('context_type', 'per_page'),
+        choices={'context_type': ('Account', 'Course')},
+        doc="""
     Returns a list of active groups for the current user.
 
         :param request_ctx: The request context
@@ -13,25 +19,12 @@ def list_your_groups(request_ctx, context_type=None, per_page=None, **request_kw
         :return: List your groups
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    context_type_types = ('Account', 'Course')
-    utils.validate_attr_is_acceptable(context_type, context_type_types)
-    path = '/v1/users/self/groups'
-    payload = {
-        'context_type' : context_type,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_groups_available_in_context_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_groups_available_in_context_accounts', 'GET', '/v1/accounts/{account_id}/groups',
+        'account_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of active groups in the given context that are visible to user.
 
         :param request_ctx: The request context
@@ -43,22 +36,12 @@ def list_groups_available_in_context_accounts(request_ctx, account_id, per_page=
         :return: List the groups available in a context.
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_groups_available_in_context_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_groups_available_in_context_courses', 'GET', '/v1/courses/{course_id}/groups',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of active groups in the given context that are visible to user.
 
         :param request_ctx: The request context
@@ -70,22 +53,13 @@ def list_groups_available_in_context_courses(request_ctx, course_id, per_page=No
         :return: List the groups available in a context.
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_group(request_ctx, group_id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_group', 'GET', '/v1/groups/{group_id}',
+        'group_id, include',
+        payload=('include',),
+        choices={'include': ('permissions',)},
+        doc="""
     Returns the data for a single group, or a 401 if the caller doesn't have
     the rights to see it.
 
@@ -98,22 +72,13 @@ def get_single_group(request_ctx, group_id, include, **request_kwargs):
         :return: Get a single group
         :rtype: requests.Response (with Group data)
 
-    """
-
-    include_types = ('permissions')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/groups/{group_id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_group_groups(request_ctx, name, description, is_public, join_level, storage_quota_mb, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_group_groups', 'POST', '/v1/groups',
+        'name, description, is_public, join_level, storage_quota_mb',
+        payload=('name', 'description', 'is_public', 'join_level', 'storage_quota_mb'),
+        choices={'join_level': ('parent_context_auto_join', 'parent_context_request', 'invitation_only')},
+        doc="""
     Creates a new group. Groups created using the "/api/v1/groups/"
     endpoint will be community groups.
 
@@ -132,26 +97,13 @@ def create_group_groups(request_ctx, name, description, is_public, join_level, s
         :return: Create a group
         :rtype: requests.Response (with Group data)
 
-    """
-
-    join_level_types = ('parent_context_auto_join', 'parent_context_request', 'invitation_only')
-    utils.validate_attr_is_acceptable(join_level, join_level_types)
-    path = '/v1/groups'
-    payload = {
-        'name' : name,
-        'description' : description,
-        'is_public' : is_public,
-        'join_level' : join_level,
-        'storage_quota_mb' : storage_quota_mb,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_group_group_categories(request_ctx, group_category_id, name, description, is_public, join_level, storage_quota_mb, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_group_group_categories', 'POST', '/v1/group_categories/{group_category_id}/groups',
+        'group_category_id, name, description, is_public, join_level, storage_quota_mb',
+        payload=('name', 'description', 'is_public', 'join_level', 'storage_quota_mb'),
+        choices={'join_level': ('parent_context_auto_join', 'parent_context_request', 'invitation_only')},
+        doc="""
     Creates a new group. Groups created using the "/api/v1/groups/"
     endpoint will be community groups.
 
@@ -172,26 +124,13 @@ def create_group_group_categories(request_ctx, group_category_id, name, descript
         :return: Create a group
         :rtype: requests.Response (with Group data)
 
-    """
-
-    join_level_types = ('parent_context_auto_join', 'parent_context_request', 'invitation_only')
-    utils.validate_attr_is_acceptable(join_level, join_level_types)
-    path = '/v1/group_categories/{group_category_id}/groups'
-    payload = {
-        'name' : name,
-        'description' : description,
-        'is_public' : is_public,
-        'join_level' : join_level,
-        'storage_quota_mb' : storage_quota_mb,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def edit_group(request_ctx, group_id, name, description, is_public, join_level, avatar_id, storage_quota_mb, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_group', 'PUT', '/v1/groups/{group_id}',
+        'group_id, name, description, is_public, join_level, avatar_id, storage_quota_mb',
+        payload=('name', 'description', 'is_public', 'join_level', 'avatar_id', 'storage_quota_mb'),
+        choices={'join_level': ('parent_context_auto_join', 'parent_context_request', 'invitation_only')},
+        doc="""
     Modifies an existing group.  Note that to set an avatar image for the
     group, you must first upload the image file to the group, and the use the
     id in the response as the argument to this function.  See the
@@ -217,27 +156,11 @@ def edit_group(request_ctx, group_id, name, description, is_public, join_level,
         :return: Edit a group
         :rtype: requests.Response (with Group data)
 
-    """
-
-    join_level_types = ('parent_context_auto_join', 'parent_context_request', 'invitation_only')
-    utils.validate_attr_is_acceptable(join_level, join_level_types)
-    path = '/v1/groups/{group_id}'
-    payload = {
-        'name' : name,
-        'description' : description,
-        'is_public' : is_public,
-        'join_level' : join_level,
-        'avatar_id' : avatar_id,
-        'storage_quota_mb' : storage_quota_mb,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_group(request_ctx, group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_group', 'DELETE', '/v1/groups/{group_id}',
+        'group_id',
+        doc="""
     Deletes a group and removes all members.
 
         :param request_ctx: The request context
@@ -247,17 +170,12 @@ def delete_group(request_ctx, group_id, **request_kwargs):
         :return: Delete a group
         :rtype: requests.Response (with Group data)
 
-    """
-
-    path = '/v1/groups/{group_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def invite_others_to_group(request_ctx, group_id, invitees, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'invite_others_to_group', 'POST', '/v1/groups/{group_id}/invite',
+        'group_id, invitees',
+        payload=('invitees',),
+        doc="""
     Sends an invitation to all supplied email addresses which will allow the
     receivers to join the group.
 
@@ -270,20 +188,13 @@ def invite_others_to_group(request_ctx, group_id, invitees, **request_kwargs):
         :return: Invite others to a group
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/invite'
-    payload = {
-        'invitees' : invitees,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_group_s_users(request_ctx, group_id, include, search_term=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_group_s_users', 'GET', '/v1/groups/{group_id}/users',
+        'group_id, include, search_term=None, per_page=None',
+        payload=('search_term', 'include', 'per_page'),
+        choices={'include': ('avatar_url',)},
+        doc="""
     Returns a list of users in the group.
 
         :param request_ctx: The request context
@@ -299,26 +210,11 @@ def list_group_s_users(request_ctx, group_id, include, search_term=None, per_pag
         :return: List group's users
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('avatar_url')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/groups/{group_id}/users'
-    payload = {
-        'search_term' : search_term,
-        'include' : include,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def upload_file(request_ctx, group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'upload_file', 'POST', '/v1/groups/{group_id}/files',
+        'group_id',
+        doc="""
     Upload a file to the group.
     
     This API endpoint is the first step in uploading a file to a group.
@@ -336,17 +232,12 @@ def upload_file(request_ctx, group_id, **request_kwargs):
         :return: Upload a file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/files'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def preview_processed_html(request_ctx, group_id, html, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'preview_processed_html', 'POST', '/v1/groups/{group_id}/preview_html',
+        'group_id, html',
+        payload=('html',),
+        doc="""
     Preview html content processed for this group
 
         :param request_ctx: The request context
@@ -358,20 +249,11 @@ def preview_processed_html(request_ctx, group_id, html, **request_kwargs):
         :return: Preview processed html
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/preview_html'
-    payload = {
-        'html' : html,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def group_activity_stream(request_ctx, group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'group_activity_stream', 'GET', '/v1/groups/{group_id}/activity_stream',
+        'group_id',
+        doc="""
     Returns the current user's group-specific activity stream, paginated.
     
     For full documentation, see the API documentation for the user activity
@@ -384,17 +266,11 @@ def group_activity_stream(request_ctx, group_id, **request_kwargs):
         :return: Group activity stream
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/activity_stream'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def group_activity_stream_summary(request_ctx, group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'group_activity_stream_summary', 'GET', '/v1/groups/{group_id}/activity_stream/summary',
+        'group_id',
+        doc="""
     Returns a summary of the current user's group-specific activity stream.
     
     For full documentation, see the API documentation for the user activity
@@ -407,17 +283,13 @@ def group_activity_stream_summary(request_ctx, group_id, **request_kwargs):
         :return: Group activity stream summary
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/activity_stream/summary'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_group_memberships_memberships(request_ctx, group_id, filter_states=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_group_memberships_memberships', 'GET', '/v1/groups/{group_id}/memberships',
+        'group_id, filter_states=None, per_page=None',
+        payload=('filter_states', 'per_page'),
+        choices={'filter_states': ('accepted', 'invited', 'requested')},
+        doc="""
     List the members of a group.
 
         :param request_ctx: The request context
@@ -431,25 +303,13 @@ def list_group_memberships_memberships(request_ctx, group_id, filter_states=None
         :return: List group memberships
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    filter_states_types = ('accepted', 'invited', 'requested')
-    utils.validate_attr_is_acceptable(filter_states, filter_states_types)
-    path = '/v1/groups/{group_id}/memberships'
-    payload = {
-        'filter_states' : filter_states,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_group_memberships_users(request_ctx, group_id, filter_states=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_group_memberships_users', 'GET', '/v1/groups/{group_id}/users',
+        'group_id, filter_states=None, per_page=None',
+        payload=('filter_states', 'per_page'),
+        choices={'filter_states': ('accepted', 'invited', 'requested')},
+        doc="""
     List the members of a group.
 
         :param request_ctx: The request context
@@ -463,25 +323,12 @@ def list_group_memberships_users(request_ctx, group_id, filter_states=None, per_
         :return: List group memberships
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    filter_states_types = ('accepted', 'invited', 'requested')
-    utils.validate_attr_is_acceptable(filter_states, filter_states_types)
-    path = '/v1/groups/{group_id}/users'
-    payload = {
-        'filter_states' : filter_states,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_membership(request_ctx, group_id, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_membership', 'POST', '/v1/groups/{group_id}/memberships',
+        'group_id, user_id',
+        payload=('user_id',),
+        doc="""
     Join, or request to join, a group, depending on the join_level of the
     group.  If the membership or join request already exists, then it is simply
     returned
@@ -495,20 +342,13 @@ def create_membership(request_ctx, group_id, user_id, **request_kwargs):
         :return: Create a membership
         :rtype: requests.Response (with GroupMembership data)
 
-    """
-
-    path = '/v1/groups/{group_id}/memberships'
-    payload = {
-        'user_id' : user_id,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_membership_memberships(request_ctx, group_id, membership_id, moderator, workflow_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_membership_memberships', 'PUT', '/v1/groups/{group_id}/memberships/{membership_id}',
+        'group_id, membership_id, moderator, workflow_state=None',
+        payload=('workflow_state', 'moderator'),
+        choices={'workflow_state': ('accepted',)},
+        doc="""
     Accept a membership request, or add/remove moderator rights.
 
         :param request_ctx: The request context
@@ -524,23 +364,13 @@ def update_membership_memberships(request_ctx, group_id, membership_id, moderato
         :return: Update a membership
         :rtype: requests.Response (with GroupMembership data)
 
-    """
-
-    workflow_state_types = ('accepted')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/groups/{group_id}/memberships/{membership_id}'
-    payload = {
-        'workflow_state' : workflow_state,
-        'moderator' : moderator,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, membership_id=membership_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_membership_users(request_ctx, group_id, user_id, moderator, workflow_state=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_membership_users', 'PUT', '/v1/groups/{group_id}/users/{user_id}',
+        'group_id, user_id, moderator, workflow_state=None',
+        payload=('workflow_state', 'moderator'),
+        choices={'workflow_state': ('accepted',)},
+        doc="""
     Accept a membership request, or add/remove moderator rights.
 
         :param request_ctx: The request context
@@ -556,23 +386,11 @@ def update_membership_users(request_ctx, group_id, user_id, moderator, workflow_
         :return: Update a membership
         :rtype: requests.Response (with GroupMembership data)
 
-    """
-
-    workflow_state_types = ('accepted')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/groups/{group_id}/users/{user_id}'
-    payload = {
-        'workflow_state' : workflow_state,
-        'moderator' : moderator,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, user_id=user_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def leave_group_memberships(request_ctx, group_id, membership_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'leave_group_memberships', 'DELETE', '/v1/groups/{group_id}/memberships/{membership_id}',
+        'group_id, membership_id',
+        doc="""
     Leave a group if you are allowed to leave (some groups, such as sets of
     course groups created by teachers, cannot be left). You may also use 'self'
     in place of a membership_id.
@@ -586,17 +404,11 @@ def leave_group_memberships(request_ctx, group_id, membership_id, **request_kwar
         :return: Leave a group
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/memberships/{membership_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, membership_id=membership_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def leave_group_users(request_ctx, group_id, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'leave_group_users', 'DELETE', '/v1/groups/{group_id}/users/{user_id}',
+        'group_id, user_id',
+        doc="""
     Leave a group if you are allowed to leave (some groups, such as sets of
     course groups created by teachers, cannot be left). You may also use 'self'
     in place of a membership_id.
@@ -610,12 +422,7 @@ def leave_group_users(request_ctx, group_id, user_id, **request_kwargs):
         :return: Leave a group
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/groups/{group_id}/users/{user_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, user_id=user_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
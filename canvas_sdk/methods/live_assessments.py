@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def create_live_assessment_results(request_ctx, course_id, assessment_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'create_live_assessment_results', 'POST', '/v1/courses/{course_id}/live_assessments/{assessment_id}/results',
+        'course_id, assessment_id',
+        doc="""
     Creates live assessment results and adds them to a live assessment
 
         :param request_ctx: The request context
@@ -13,17 +17,12 @@ def create_live_assessment_results(request_ctx, course_id, assessment_id, **requ
         :return: Create live assessment results
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/live_assessments/{assessment_id}/results'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assessment_id=assessment_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_live_assessment_results(request_ctx, course_id, assessment_id, user_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_live_assessment_results', 'GET', '/v1/courses/{course_id}/live_assessments/{assessment_id}/results',
+        'course_id, assessment_id, user_id=None',
+        payload=('user_id',),
+        doc="""
     Returns a list of live assessment results
 
         :param request_ctx: The request context
@@ -37,20 +36,11 @@ def list_live_assessment_results(request_ctx, course_id, assessment_id, user_id=
         :return: List live assessment results
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/live_assessments/{assessment_id}/results'
-    payload = {
-        'user_id' : user_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assessment_id=assessment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_or_find_live_assessment(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_or_find_live_assessment', 'POST', '/v1/courses/{course_id}/live_assessments',
+        'course_id',
+        doc="""
     Creates or finds an existing live assessment with the given key and aligns it with
     the linked outcome
 
@@ -61,17 +51,11 @@ def create_or_find_live_assessment(request_ctx, course_id, **request_kwargs):
         :return: Create or find a live assessment
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/live_assessments'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_live_assessments(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_live_assessments', 'GET', '/v1/courses/{course_id}/live_assessments',
+        'course_id',
+        doc="""
     Returns a list of live assessments.
 
         :param request_ctx: The request context
@@ -81,12 +65,7 @@ def list_live_assessments(request_ctx, course_id, **request_kwargs):
         :return: List live assessments
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/live_assessments'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
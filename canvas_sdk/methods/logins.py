@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def list_user_logins_accounts(request_ctx, account_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'list_user_logins_accounts', 'GET', '/v1/accounts/{account_id}/logins',
+        'account_id',
+        doc="""
     Given a user ID, return that user's logins for the given account.
 
         :param request_ctx: The request context
@@ -11,17 +15,11 @@ def list_user_logins_accounts(request_ctx, account_id, **request_kwargs):
         :return: List user logins
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/logins'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_user_logins_users(request_ctx, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_user_logins_users', 'GET', '/v1/users/{user_id}/logins',
+        'user_id',
+        doc="""
     Given a user ID, return that user's logins for the given account.
 
         :param request_ctx: The request context
@@ -31,17 +29,12 @@ def list_user_logins_users(request_ctx, user_id, **request_kwargs):
         :return: List user logins
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{user_id}/logins'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_user_login(request_ctx, account_id, user_id, login_unique_id, login_password=None, login_sis_user_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_user_login', 'POST', '/v1/accounts/{account_id}/logins',
+        'account_id, user_id, login_unique_id, login_password=None, login_sis_user_id=None',
+        payload=('user[id]', 'login[unique_id]', 'login[password]', 'login[sis_user_id]'),
+        doc="""
     Create a new login for an existing user in the given account.
 
         :param request_ctx: The request context
@@ -59,23 +52,12 @@ def create_user_login(request_ctx, account_id, user_id, login_unique_id, login_p
         :return: Create a user login
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/logins'
-    payload = {
-        'user[id]' : user_id,
-        'login[unique_id]' : login_unique_id,
-        'login[password]' : login_password,
-        'login[sis_user_id]' : login_sis_user_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def edit_user_login(request_ctx, account_id, id, login_unique_id=None, login_password=None, login_sis_user_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_user_login', 'PUT', '/v1/accounts/{account_id}/logins/{id}',
+        'account_id, id, login_unique_id=None, login_password=None, login_sis_user_id=None',
+        payload=('login[unique_id]', 'login[password]', 'login[sis_user_id]'),
+        doc="""
     Update an existing login for a user in the given account.
 
         :param request_ctx: The request context
@@ -93,22 +75,11 @@ def edit_user_login(request_ctx, account_id, id, login_unique_id=None, login_pas
         :return: Edit a user login
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/logins/{id}'
-    payload = {
-        'login[unique_id]' : login_unique_id,
-        'login[password]' : login_password,
-        'login[sis_user_id]' : login_sis_user_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_user_login(request_ctx, user_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_user_login', 'DELETE', '/v1/users/{user_id}/logins/{id}',
+        'user_id, id',
+        doc="""
     Delete an existing login.
 
         :param request_ctx: The request context
@@ -120,12 +91,7 @@ def delete_user_login(request_ctx, user_id, id, **request_kwargs):
         :return: Delete a user login
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{user_id}/logins/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
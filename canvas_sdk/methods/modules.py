@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_modules(request_ctx, course_id, include, search_term=None, student_id=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_modules', 'GET', '/v1/courses/{course_id}/modules',
+        'course_id, include, search_term=None, student_id=None, per_page=None',
+        payload=('include', 'search_term', 'student_id', 'per_page'),
+        choices={'include': ('items', 'content_details')},
+        doc="""
     List the modules in a course
 
         :param request_ctx: The request context
@@ -19,27 +25,13 @@ def list_modules(request_ctx, course_id, include, search_term=None, student_id=N
         :return: List modules
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('items', 'content_details')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/modules'
-    payload = {
-        'include' : include,
-        'search_term' : search_term,
-        'student_id' : student_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_module(request_ctx, course_id, id, include, student_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_module', 'GET', '/v1/courses/{course_id}/modules/{id}',
+        'course_id, id, include, student_id=None',
+        payload=('include', 'student_id'),
+        choices={'include': ('items', 'content_details')},
+        doc="""
     Get information about a single module
 
         :param request_ctx: The request context
@@ -55,23 +47,15 @@ def show_module(request_ctx, course_id, id, include, student_id=None, **request_
         :return: Show module
         :rtype: requests.Response (with Module data)
 
-    """
-
-    include_types = ('items', 'content_details')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/modules/{id}'
-    payload = {
-        'include' : include,
-        'student_id' : student_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_module(request_ctx, course_id, module_name, module_unlock_at=None, module_position=None, module_require_sequential_progress=None, module_prerequisite_module_ids=None, module_publish_final_grade=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_module', 'POST', '/v1/courses/{course_id}/modules',
+        'course_id, module_name, module_unlock_at=None, module_position=None, module_require_sequential_progress=None, module_prerequisite_module_ids=None, module_publish_final_grade=None',
+        payload=(
+            'module[name]', 'module[unlock_at]', 'module[position]', 'module[require_sequential_progress]',
+            'module[prerequisite_module_ids]', 'module[publish_final_grade]',
+        ),
+        doc="""
     Create and return a new module
 
         :param request_ctx: The request context
@@ -93,25 +77,15 @@ def create_module(request_ctx, course_id, module_name, module_unlock_at=None, mo
         :return: Create a module
         :rtype: requests.Response (with Module data)
 
-    """
-
-    path = '/v1/courses/{course_id}/modules'
-    payload = {
-        'module[name]' : module_name,
-        'module[unlock_at]' : module_unlock_at,
-        'module[position]' : module_position,
-        'module[require_sequential_progress]' : module_require_sequential_progress,
-        'module[prerequisite_module_ids]' : module_prerequisite_module_ids,
-        'module[publish_final_grade]' : module_publish_final_grade,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_module(request_ctx, course_id, id, module_name=None, module_unlock_at=None, module_position=None, module_require_sequential_progress=None, module_prerequisite_module_ids=None, module_publish_final_grade=None, module_published=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_module', 'PUT', '/v1/courses/{course_id}/modules/{id}',
+        'course_id, id, module_name=None, module_unlock_at=None, module_position=None, module_require_sequential_progress=None, module_prerequisite_module_ids=None, module_publish_final_grade=None, module_published=None',
+        payload=(
+            'module[name]', 'module[unlock_at]', 'module[position]', 'module[require_sequential_progress]',
+            'module[prerequisite_module_ids]', 'module[publish_final_grade]', 'module[published]',
+        ),
+        doc="""
     Update and return an existing module
 
         :param request_ctx: The request context
@@ -137,26 +111,11 @@ def update_module(request_ctx, course_id, id, module_name=None, module_unlock_at
         :return: Update a module
         :rtype: requests.Response (with Module data)
 
-    """
-
-    path = '/v1/courses/{course_id}/modules/{id}'
-    payload = {
-        'module[name]' : module_name,
-        'module[unlock_at]' : module_unlock_at,
-        'module[position]' : module_position,
-        'module[require_sequential_progress]' : module_require_sequential_progress,
-        'module[prerequisite_module_ids]' : module_prerequisite_module_ids,
-        'module[publish_final_grade]' : module_publish_final_grade,
-        'module[published]' : module_published,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_module(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_module', 'DELETE', '/v1/courses/{course_id}/modules/{id}',
+        'course_id, id',
+        doc="""
     Delete a module
 
         :param request_ctx: The request context
@@ -168,17 +127,13 @@ def delete_module(request_ctx, course_id, id, **request_kwargs):
         :return: Delete module
         :rtype: requests.Response (with Module data)
 
-    """
-
-    path = '/v1/courses/{course_id}/modules/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_module_items(request_ctx, course_id, module_id, include, search_term=None, student_id=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_module_items', 'GET', '/v1/courses/{course_id}/modules/{module_id}/items',
+        'course_id, module_id, include, search_term=None, student_id=None, per_page=None',
+        payload=('include', 'search_term', 'student_id', 'per_page'),
+        choices={'include': ('content_details',)},
+        doc="""
     List the items in a module
 
         :param request_ctx: The request context
@@ -198,27 +153,13 @@ def list_module_items(request_ctx, course_id, module_id, include, search_term=No
         :return: List module items
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('content_details')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/modules/{module_id}/items'
-    payload = {
-        'include' : include,
-        'search_term' : search_term,
-        'student_id' : student_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, module_id=module_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_module_item(request_ctx, course_id, module_id, id, include, student_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_module_item', 'GET', '/v1/courses/{course_id}/modules/{module_id}/items/{id}',
+        'course_id, module_id, id, include, student_id=None',
+        payload=('include', 'student_id'),
+        choices={'include': ('content_details',)},
+        doc="""
     Get information about a single module item
 
         :param request_ctx: The request context
@@ -236,19 +177,49 @@ def show_module_item(request_ctx, course_id, module_id, id, include, student_id=
         :return: Show module item
         :rtype: requests.Response (with ModuleItem data)
 
-    """
+    """),
+    Endpoint(
+        'delete_module_item', 'DELETE', '/v1/courses/{course_id}/modules/{module_id}/items/{id}',
+        'course_id, module_id, id',
+        doc="""
+    Delete a module item
 
-    include_types = ('content_details')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/modules/{module_id}/items/{id}'
-    payload = {
-        'include' : include,
-        'student_id' : student_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, module_id=module_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param module_id: (required) ID
+        :type module_id: string
+        :param id: (required) ID
+        :type id: string
+        :return: Delete module item
+        :rtype: requests.Response (with ModuleItem data)
 
-    return response
+    """),
+    Endpoint(
+        'get_module_item_sequence', 'GET', '/v1/courses/{course_id}/module_item_sequence',
+        'course_id, asset_type, asset_id',
+        payload=('asset_type', 'asset_id'),
+        choices={'asset_type': ('ModuleItem', 'File', 'Page', 'Discussion', 'Assignment', 'Quiz', 'ExternalTool')},
+        doc="""
+    Given an asset in a course, find the ModuleItem it belongs to, and also the previous and next Module Items
+    in the course sequence.
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param course_id: (required) ID
+        :type course_id: string
+        :param asset_type: (required) The type of asset to find module sequence information for. Use the ModuleItem if it is known (e.g., the user navigated from a module item), since this will avoid ambiguity if the asset appears more than once in the module sequence.
+        :type asset_type: string
+        :param asset_id: (required) The id of the asset (or the url in the case of a Page)
+        :type asset_id: integer
+        :return: Get module item sequence
+        :rtype: requests.Response (with ModuleItemSequence data)
+
+    """),
+]
+
+build_methods(ENDPOINTS, globals())
 
 
 def create_module_item(request_ctx, course_id, module_id, module_item_type, module_item_content_id, module_item_page_url=None, module_item_external_url=None, module_item_completion_requirement_min_score=None, module_item_title=None, module_item_position=None, module_item_indent=None, module_item_new_tab=None, module_item_completion_requirement_type=None, **request_kwargs):
@@ -373,60 +344,3 @@ def update_module_item(request_ctx, course_id, module_id, id, module_item_comple
     response = client.put(request_ctx, url, payload=payload, **request_kwargs)
 
     return response
-
-
-def delete_module_item(request_ctx, course_id, module_id, id, **request_kwargs):
-    """
-    Delete a module item
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param module_id: (required) ID
-        :type module_id: string
-        :param id: (required) ID
-        :type id: string
-        :return: Delete module item
-        :rtype: requests.Response (with ModuleItem data)
-
-    """
-
-    path = '/v1/courses/{course_id}/modules/{module_id}/items/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, module_id=module_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_module_item_sequence(request_ctx, course_id, asset_type, asset_id, **request_kwargs):
-    """
-    Given an asset in a course, find the ModuleItem it belongs to, and also the previous and next Module Items
-    in the course sequence.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param course_id: (required) ID
-        :type course_id: string
-        :param asset_type: (required) The type of asset to find module sequence information for. Use the ModuleItem if it is known (e.g., the user navigated from a module item), since this will avoid ambiguity if the asset appears more than once in the module sequence.
-        :type asset_type: string
-        :param asset_id: (required) The id of the asset (or the url in the case of a Page)
-        :type asset_id: integer
-        :return: Get module item sequence
-        :rtype: requests.Response (with ModuleItemSequence data)
-
-    """
-
-    asset_type_types = ('ModuleItem', 'File', 'Page', 'Discussion', 'Assignment', 'Quiz', 'ExternalTool')
-    utils.validate_attr_is_acceptable(asset_type, asset_type_types)
-    path = '/v1/courses/{course_id}/module_item_sequence'
-    payload = {
-        'asset_type' : asset_type,
-        'asset_id' : asset_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_preferences_communication_channel_id(request_ctx, user_id, communication_channel_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_preferences_communication_channel_id', 'GET', '/v1/users/{user_id}/communication_channels/{communication_channel_id}/notification_preferences',
+        'user_id, communication_channel_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Fetch all preferences for the given communication channel
 
         :param request_ctx: The request context
@@ -15,22 +20,12 @@ def list_preferences_communication_channel_id(request_ctx, user_id, communicatio
         :return: List preferences
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/communication_channels/{communication_channel_id}/notification_preferences'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, communication_channel_id=communication_channel_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_preferences_type(request_ctx, user_id, type, address, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_preferences_type', 'GET', '/v1/users/{user_id}/communication_channels/{type}/{address}/notification_preferences',
+        'user_id, type, address, per_page=None',
+        payload=('per_page',),
+        doc="""
     Fetch all preferences for the given communication channel
 
         :param request_ctx: The request context
@@ -46,22 +41,11 @@ def list_preferences_type(request_ctx, user_id, type, address, per_page=None, **
         :return: List preferences
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/communication_channels/{type}/{address}/notification_preferences'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, type=type, address=address)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_preference_communication_channel_id(request_ctx, user_id, communication_channel_id, notification, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_preference_communication_channel_id', 'GET', '/v1/users/{user_id}/communication_channels/{communication_channel_id}/notification_preferences/{notification}',
+        'user_id, communication_channel_id, notification',
+        doc="""
     Fetch the preference for the given notification for the given communicaiton channel
 
         :param request_ctx: The request context
@@ -75,17 +59,11 @@ def get_preference_communication_channel_id(request_ctx, user_id, communication_
         :return: Get a preference
         :rtype: requests.Response (with NotificationPreference data)
 
-    """
-
-    path = '/v1/users/{user_id}/communication_channels/{communication_channel_id}/notification_preferences/{notification}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, communication_channel_id=communication_channel_id, notification=notification)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_preference_type(request_ctx, user_id, type, address, notification, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_preference_type', 'GET', '/v1/users/{user_id}/communication_channels/{type}/{address}/notification_preferences/{notification}',
+        'user_id, type, address, notification',
+        doc="""
     Fetch the preference for the given notification for the given communicaiton channel
 
         :param request_ctx: The request context
@@ -101,17 +79,12 @@ def get_preference_type(request_ctx, user_id, type, address, notification, **req
         :return: Get a preference
         :rtype: requests.Response (with NotificationPreference data)
 
-    """
-
-    path = '/v1/users/{user_id}/communication_channels/{type}/{address}/notification_preferences/{notification}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, type=type, address=address, notification=notification)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_preference_communication_channel_id(request_ctx, communication_channel_id, notification, notification_preferences_frequency, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_preference_communication_channel_id', 'PUT', '/v1/users/self/communication_channels/{communication_channel_id}/notification_preferences/{notification}',
+        'communication_channel_id, notification, notification_preferences_frequency',
+        payload=('notification_preferences[frequency]',),
+        doc="""
     Change the preference for a single notification for a single communication channel
 
         :param request_ctx: The request context
@@ -125,20 +98,12 @@ def update_preference_communication_channel_id(request_ctx, communication_channe
         :return: Update a preference
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/communication_channels/{communication_channel_id}/notification_preferences/{notification}'
-    payload = {
-        'notification_preferences[frequency]' : notification_preferences_frequency,
-    }
-    url = request_ctx.base_api_url + path.format(communication_channel_id=communication_channel_id, notification=notification)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_preference_type(request_ctx, type, address, notification, notification_preferences_frequency, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_preference_type', 'PUT', '/v1/users/self/communication_channels/{type}/{address}/notification_preferences/{notification}',
+        'type, address, notification, notification_preferences_frequency',
+        payload=('notification_preferences[frequency]',),
+        doc="""
     Change the preference for a single notification for a single communication channel
 
         :param request_ctx: The request context
@@ -154,20 +119,12 @@ def update_preference_type(request_ctx, type, address, notification, notificatio
         :return: Update a preference
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/communication_channels/{type}/{address}/notification_preferences/{notification}'
-    payload = {
-        'notification_preferences[frequency]' : notification_preferences_frequency,
-    }
-    url = request_ctx.base_api_url + path.format(type=type, address=address, notification=notification)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_multiple_preferences_communication_channel_id(request_ctx, communication_channel_id, notification_preferences_X_frequency, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_multiple_preferences_communication_channel_id', 'PUT', '/v1/users/self/communication_channels/{communication_channel_id}/notification_preferences',
+        'communication_channel_id, notification_preferences_X_frequency',
+        payload=('notification_preferences[X][frequency]',),
+        doc="""
     Change the preferences for multiple notifications for a single communication channel at once
 
         :param request_ctx: The request context
@@ -179,20 +136,12 @@ def update_multiple_preferences_communication_channel_id(request_ctx, communicat
         :return: Update multiple preferences
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/communication_channels/{communication_channel_id}/notification_preferences'
-    payload = {
-        'notification_preferences[X][frequency]' : notification_preferences_X_frequency,
-    }
-    url = request_ctx.base_api_url + path.format(communication_channel_id=communication_channel_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_multiple_preferences_type(request_ctx, type, address, notification_preferences_X_frequency, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_multiple_preferences_type', 'PUT', '/v1/users/self/communication_channels/{type}/{address}/notification_preferences',
+        'type, address, notification_preferences_X_frequency',
+        payload=('notification_preferences[X][frequency]',),
+        doc="""
     Change the preferences for multiple notifications for a single communication channel at once
 
         :param request_ctx: The request context
@@ -206,15 +155,7 @@ def update_multiple_preferences_type(request_ctx, type, address, notification_pr
         :return: Update multiple preferences
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/communication_channels/{type}/{address}/notification_preferences'
-    payload = {
-        'notification_preferences[X][frequency]' : notification_preferences_X_frequency,
-    }
-    url = request_ctx.base_api_url + path.format(type=type, address=address)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def redirect_to_root_outcome_group_for_context_global(request_ctx, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'redirect_to_root_outcome_group_for_context_global', 'GET', '/v1/global/root_outcome_group',
+        '',
+        doc="""
     Convenience redirect to find the root outcome group for a particular
     context. Will redirect to the appropriate outcome group's URL.
 
@@ -10,17 +14,11 @@ def redirect_to_root_outcome_group_for_context_global(request_ctx, **request_kwa
         :return: Redirect to root outcome group for context
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/global/root_outcome_group'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def redirect_to_root_outcome_group_for_context_accounts(request_ctx, account_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'redirect_to_root_outcome_group_for_context_accounts', 'GET', '/v1/accounts/{account_id}/root_outcome_group',
+        'account_id',
+        doc="""
     Convenience redirect to find the root outcome group for a particular
     context. Will redirect to the appropriate outcome group's URL.
 
@@ -31,17 +29,11 @@ def redirect_to_root_outcome_group_for_context_accounts(request_ctx, account_id,
         :return: Redirect to root outcome group for context
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/root_outcome_group'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def redirect_to_root_outcome_group_for_context_courses(request_ctx, course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'redirect_to_root_outcome_group_for_context_courses', 'GET', '/v1/courses/{course_id}/root_outcome_group',
+        'course_id',
+        doc="""
     Convenience redirect to find the root outcome group for a particular
     context. Will redirect to the appropriate outcome group's URL.
 
@@ -52,17 +44,12 @@ def redirect_to_root_outcome_group_for_context_courses(request_ctx, course_id, *
         :return: Redirect to root outcome group for context
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/root_outcome_group'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_all_outcome_groups_for_context_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_all_outcome_groups_for_context_accounts', 'GET', '/v1/accounts/{account_id}/outcome_groups',
+        'account_id, per_page=None',
+        payload=('per_page',),
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -73,22 +60,12 @@ def get_all_outcome_groups_for_context_accounts(request_ctx, account_id, per_pag
         :return: Get all outcome groups for context
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/outcome_groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_all_outcome_groups_for_context_courses(request_ctx, course_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_all_outcome_groups_for_context_courses', 'GET', '/v1/courses/{course_id}/outcome_groups',
+        'course_id, per_page=None',
+        payload=('per_page',),
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -99,22 +76,12 @@ def get_all_outcome_groups_for_context_courses(request_ctx, course_id, per_page=
         :return: Get all outcome groups for context
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/outcome_groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_all_outcome_links_for_context_accounts(request_ctx, account_id, outcome_style=None, outcome_group_style=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_all_outcome_links_for_context_accounts', 'GET', '/v1/accounts/{account_id}/outcome_group_links',
+        'account_id, outcome_style=None, outcome_group_style=None, per_page=None',
+        payload=('outcome_style', 'outcome_group_style', 'per_page'),
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -129,24 +96,12 @@ def get_all_outcome_links_for_context_accounts(request_ctx, account_id, outcome_
         :return: Get all outcome links for context
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/outcome_group_links'
-    payload = {
-        'outcome_style' : outcome_style,
-        'outcome_group_style' : outcome_group_style,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_all_outcome_links_for_context_courses(request_ctx, course_id, outcome_style=None, outcome_group_style=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_all_outcome_links_for_context_courses', 'GET', '/v1/courses/{course_id}/outcome_group_links',
+        'course_id, outcome_style=None, outcome_group_style=None, per_page=None',
+        payload=('outcome_style', 'outcome_group_style', 'per_page'),
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -161,24 +116,11 @@ def get_all_outcome_links_for_context_courses(request_ctx, course_id, outcome_st
         :return: Get all outcome links for context
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/outcome_group_links'
-    payload = {
-        'outcome_style' : outcome_style,
-        'outcome_group_style' : outcome_group_style,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_outcome_group_global(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_outcome_group_global', 'GET', '/v1/global/outcome_groups/{id}',
+        'id',
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -187,17 +129,11 @@ def show_outcome_group_global(request_ctx, id, **request_kwargs):
         :return: Show an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/global/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def show_outcome_group_accounts(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_outcome_group_accounts', 'GET', '/v1/accounts/{account_id}/outcome_groups/{id}',
+        'account_id, id',
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -208,17 +144,11 @@ def show_outcome_group_accounts(request_ctx, account_id, id, **request_kwargs):
         :return: Show an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def show_outcome_group_courses(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_outcome_group_courses', 'GET', '/v1/courses/{course_id}/outcome_groups/{id}',
+        'course_id, id',
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -229,17 +159,12 @@ def show_outcome_group_courses(request_ctx, course_id, id, **request_kwargs):
         :return: Show an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/courses/{course_id}/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_outcome_group_global(request_ctx, id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_outcome_group_global', 'PUT', '/v1/global/outcome_groups/{id}',
+        'id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None',
+        payload=('title', 'description', 'vendor_guid', 'parent_outcome_group_id'),
+        doc="""
     Modify an existing outcome group. Fields not provided are left as is;
     unrecognized fields are ignored.
     
@@ -262,23 +187,12 @@ def update_outcome_group_global(request_ctx, id, title=None, description=None, v
         :return: Update an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/global/outcome_groups/{id}'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'parent_outcome_group_id' : parent_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_outcome_group_accounts(request_ctx, account_id, id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_outcome_group_accounts', 'PUT', '/v1/accounts/{account_id}/outcome_groups/{id}',
+        'account_id, id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None',
+        payload=('title', 'description', 'vendor_guid', 'parent_outcome_group_id'),
+        doc="""
     Modify an existing outcome group. Fields not provided are left as is;
     unrecognized fields are ignored.
     
@@ -303,23 +217,12 @@ def update_outcome_group_accounts(request_ctx, account_id, id, title=None, descr
         :return: Update an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'parent_outcome_group_id' : parent_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_outcome_group_courses(request_ctx, course_id, id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_outcome_group_courses', 'PUT', '/v1/courses/{course_id}/outcome_groups/{id}',
+        'course_id, id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None',
+        payload=('title', 'description', 'vendor_guid', 'parent_outcome_group_id'),
+        doc="""
     Modify an existing outcome group. Fields not provided are left as is;
     unrecognized fields are ignored.
     
@@ -344,23 +247,11 @@ def update_outcome_group_courses(request_ctx, course_id, id, title=None, descrip
         :return: Update an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/courses/{course_id}/outcome_groups/{id}'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'parent_outcome_group_id' : parent_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_outcome_group_global(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_outcome_group_global', 'DELETE', '/v1/global/outcome_groups/{id}',
+        'id',
+        doc="""
     Deleting an outcome group deletes descendant outcome groups and outcome
     links. The linked outcomes themselves are only deleted if all links to the
     outcome were deleted.
@@ -376,17 +267,11 @@ def delete_outcome_group_global(request_ctx, id, **request_kwargs):
         :return: Delete an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/global/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_outcome_group_accounts(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_outcome_group_accounts', 'DELETE', '/v1/accounts/{account_id}/outcome_groups/{id}',
+        'account_id, id',
+        doc="""
     Deleting an outcome group deletes descendant outcome groups and outcome
     links. The linked outcomes themselves are only deleted if all links to the
     outcome were deleted.
@@ -404,17 +289,11 @@ def delete_outcome_group_accounts(request_ctx, account_id, id, **request_kwargs)
         :return: Delete an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_outcome_group_courses(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_outcome_group_courses', 'DELETE', '/v1/courses/{course_id}/outcome_groups/{id}',
+        'course_id, id',
+        doc="""
     Deleting an outcome group deletes descendant outcome groups and outcome
     links. The linked outcomes themselves are only deleted if all links to the
     outcome were deleted.
@@ -432,17 +311,12 @@ def delete_outcome_group_courses(request_ctx, course_id, id, **request_kwargs):
         :return: Delete an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/courses/{course_id}/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_linked_outcomes_global(request_ctx, id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_linked_outcomes_global', 'GET', '/v1/global/outcome_groups/{id}/outcomes',
+        'id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the immediate OutcomeLink children of the outcome group. Paginated.
 
         :param request_ctx: The request context
@@ -454,22 +328,12 @@ def list_linked_outcomes_global(request_ctx, id, per_page=None, **request_kwargs
         :return: List linked outcomes
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/global/outcome_groups/{id}/outcomes'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_linked_outcomes_accounts(request_ctx, account_id, id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_linked_outcomes_accounts', 'GET', '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes',
+        'account_id, id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the immediate OutcomeLink children of the outcome group. Paginated.
 
         :param request_ctx: The request context
@@ -483,22 +347,12 @@ def list_linked_outcomes_accounts(request_ctx, account_id, id, per_page=None, **
         :return: List linked outcomes
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_linked_outcomes_courses(request_ctx, course_id, id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_linked_outcomes_courses', 'GET', '/v1/courses/{course_id}/outcome_groups/{id}/outcomes',
+        'course_id, id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the immediate OutcomeLink children of the outcome group. Paginated.
 
         :param request_ctx: The request context
@@ -512,22 +366,15 @@ def list_linked_outcomes_courses(request_ctx, course_id, id, per_page=None, **re
         :return: List linked outcomes
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/outcomes'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_link_outcome_global(request_ctx, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_link_outcome_global', 'POST', '/v1/global/outcome_groups/{id}/outcomes',
+        'id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None',
+        payload=(
+            'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points',
+            'ratings[description]', 'ratings[points]',
+        ),
+        doc="""
     Link an outcome into the outcome group. The outcome to link can either be
     specified by a PUT to the link URL for a specific outcome (the outcome_id
     in the PUT URLs) or by supplying the information for a new outcome (title,
@@ -574,27 +421,15 @@ def create_link_outcome_global(request_ctx, id, outcome_id=None, title=None, dis
         :return: Create/link an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/global/outcome_groups/{id}/outcomes'
-    payload = {
-        'outcome_id' : outcome_id,
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_link_outcome_global_outcome_id(request_ctx, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_link_outcome_global_outcome_id', 'PUT', '/v1/global/outcome_groups/{id}/outcomes/{outcome_id}',
+        'id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None',
+        payload=(
+            'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', 'ratings[description]',
+            'ratings[points]',
+        ),
+        doc="""
     Link an outcome into the outcome group. The outcome to link can either be
     specified by a PUT to the link URL for a specific outcome (the outcome_id
     in the PUT URLs) or by supplying the information for a new outcome (title,
@@ -641,26 +476,15 @@ def create_link_outcome_global_outcome_id(request_ctx, id, outcome_id=None, titl
         :return: Create/link an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/global/outcome_groups/{id}/outcomes/{outcome_id}'
-    payload = {
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(id=id, outcome_id=outcome_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_link_outcome_accounts(request_ctx, account_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_link_outcome_accounts', 'POST', '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes',
+        'account_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None',
+        payload=(
+            'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points',
+            'ratings[description]', 'ratings[points]',
+        ),
+        doc="""
     Link an outcome into the outcome group. The outcome to link can either be
     specified by a PUT to the link URL for a specific outcome (the outcome_id
     in the PUT URLs) or by supplying the information for a new outcome (title,
@@ -709,27 +533,15 @@ def create_link_outcome_accounts(request_ctx, account_id, id, outcome_id=None, t
         :return: Create/link an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes'
-    payload = {
-        'outcome_id' : outcome_id,
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_link_outcome_accounts_outcome_id(request_ctx, account_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_link_outcome_accounts_outcome_id', 'PUT', '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes/{outcome_id}',
+        'account_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None',
+        payload=(
+            'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', 'ratings[description]',
+            'ratings[points]',
+        ),
+        doc="""
     Link an outcome into the outcome group. The outcome to link can either be
     specified by a PUT to the link URL for a specific outcome (the outcome_id
     in the PUT URLs) or by supplying the information for a new outcome (title,
@@ -778,26 +590,15 @@ def create_link_outcome_accounts_outcome_id(request_ctx, account_id, id, outcome
         :return: Create/link an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes/{outcome_id}'
-    payload = {
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id, outcome_id=outcome_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_link_outcome_courses(request_ctx, course_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_link_outcome_courses', 'POST', '/v1/courses/{course_id}/outcome_groups/{id}/outcomes',
+        'course_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None',
+        payload=(
+            'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points',
+            'ratings[description]', 'ratings[points]',
+        ),
+        doc="""
     Link an outcome into the outcome group. The outcome to link can either be
     specified by a PUT to the link URL for a specific outcome (the outcome_id
     in the PUT URLs) or by supplying the information for a new outcome (title,
@@ -846,27 +647,15 @@ def create_link_outcome_courses(request_ctx, course_id, id, outcome_id=None, tit
         :return: Create/link an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/outcomes'
-    payload = {
-        'outcome_id' : outcome_id,
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_link_outcome_courses_outcome_id(request_ctx, course_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_link_outcome_courses_outcome_id', 'PUT', '/v1/courses/{course_id}/outcome_groups/{id}/outcomes/{outcome_id}',
+        'course_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None',
+        payload=(
+            'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', 'ratings[description]',
+            'ratings[points]',
+        ),
+        doc="""
     Link an outcome into the outcome group. The outcome to link can either be
     specified by a PUT to the link URL for a specific outcome (the outcome_id
     in the PUT URLs) or by supplying the information for a new outcome (title,
@@ -915,26 +704,11 @@ def create_link_outcome_courses_outcome_id(request_ctx, course_id, id, outcome_i
         :return: Create/link an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/outcomes/{outcome_id}'
-    payload = {
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id, outcome_id=outcome_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def unlink_outcome_global(request_ctx, id, outcome_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'unlink_outcome_global', 'DELETE', '/v1/global/outcome_groups/{id}/outcomes/{outcome_id}',
+        'id, outcome_id',
+        doc="""
     Unlinking an outcome only deletes the outcome itself if this was the last
     link to the outcome in any group in any context. Aligned outcomes cannot be
     deleted; as such, if this is the last link to an aligned outcome, the
@@ -949,17 +723,11 @@ def unlink_outcome_global(request_ctx, id, outcome_id, **request_kwargs):
         :return: Unlink an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/global/outcome_groups/{id}/outcomes/{outcome_id}'
-    url = request_ctx.base_api_url + path.format(id=id, outcome_id=outcome_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def unlink_outcome_accounts(request_ctx, account_id, id, outcome_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'unlink_outcome_accounts', 'DELETE', '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes/{outcome_id}',
+        'account_id, id, outcome_id',
+        doc="""
     Unlinking an outcome only deletes the outcome itself if this was the last
     link to the outcome in any group in any context. Aligned outcomes cannot be
     deleted; as such, if this is the last link to an aligned outcome, the
@@ -976,17 +744,11 @@ def unlink_outcome_accounts(request_ctx, account_id, id, outcome_id, **request_k
         :return: Unlink an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes/{outcome_id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id, outcome_id=outcome_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def unlink_outcome_courses(request_ctx, course_id, id, outcome_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'unlink_outcome_courses', 'DELETE', '/v1/courses/{course_id}/outcome_groups/{id}/outcomes/{outcome_id}',
+        'course_id, id, outcome_id',
+        doc="""
     Unlinking an outcome only deletes the outcome itself if this was the last
     link to the outcome in any group in any context. Aligned outcomes cannot be
     deleted; as such, if this is the last link to an aligned outcome, the
@@ -1003,17 +765,12 @@ def unlink_outcome_courses(request_ctx, course_id, id, outcome_id, **request_kwa
         :return: Unlink an outcome
         :rtype: requests.Response (with OutcomeLink data)
 
-    """
-
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/outcomes/{outcome_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id, outcome_id=outcome_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_subgroups_global(request_ctx, id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_subgroups_global', 'GET', '/v1/global/outcome_groups/{id}/subgroups',
+        'id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the immediate OutcomeGroup children of the outcome group. Paginated.
 
         :param request_ctx: The request context
@@ -1025,22 +782,12 @@ def list_subgroups_global(request_ctx, id, per_page=None, **request_kwargs):
         :return: List subgroups
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/global/outcome_groups/{id}/subgroups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_subgroups_accounts(request_ctx, account_id, id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_subgroups_accounts', 'GET', '/v1/accounts/{account_id}/outcome_groups/{id}/subgroups',
+        'account_id, id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the immediate OutcomeGroup children of the outcome group. Paginated.
 
         :param request_ctx: The request context
@@ -1054,22 +801,12 @@ def list_subgroups_accounts(request_ctx, account_id, id, per_page=None, **reques
         :return: List subgroups
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/subgroups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_subgroups_courses(request_ctx, course_id, id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_subgroups_courses', 'GET', '/v1/courses/{course_id}/outcome_groups/{id}/subgroups',
+        'course_id, id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the immediate OutcomeGroup children of the outcome group. Paginated.
 
         :param request_ctx: The request context
@@ -1083,22 +820,12 @@ def list_subgroups_courses(request_ctx, course_id, id, per_page=None, **request_
         :return: List subgroups
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/subgroups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_subgroup_global(request_ctx, id, title, description=None, vendor_guid=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_subgroup_global', 'POST', '/v1/global/outcome_groups/{id}/subgroups',
+        'id, title, description=None, vendor_guid=None',
+        payload=('title', 'description', 'vendor_guid'),
+        doc="""
     Creates a new empty subgroup under the outcome group with the given title
     and description.
 
@@ -1115,22 +842,12 @@ def create_subgroup_global(request_ctx, id, title, description=None, vendor_guid
         :return: Create a subgroup
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/global/outcome_groups/{id}/subgroups'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_subgroup_accounts(request_ctx, account_id, id, title, description=None, vendor_guid=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_subgroup_accounts', 'POST', '/v1/accounts/{account_id}/outcome_groups/{id}/subgroups',
+        'account_id, id, title, description=None, vendor_guid=None',
+        payload=('title', 'description', 'vendor_guid'),
+        doc="""
     Creates a new empty subgroup under the outcome group with the given title
     and description.
 
@@ -1149,22 +866,12 @@ def create_subgroup_accounts(request_ctx, account_id, id, title, description=Non
         :return: Create a subgroup
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/subgroups'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_subgroup_courses(request_ctx, course_id, id, title, description=None, vendor_guid=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_subgroup_courses', 'POST', '/v1/courses/{course_id}/outcome_groups/{id}/subgroups',
+        'course_id, id, title, description=None, vendor_guid=None',
+        payload=('title', 'description', 'vendor_guid'),
+        doc="""
     Creates a new empty subgroup under the outcome group with the given title
     and description.
 
@@ -1183,22 +890,12 @@ def create_subgroup_courses(request_ctx, course_id, id, title, description=None,
         :return: Create a subgroup
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/subgroups'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def import_outcome_group_global(request_ctx, id, source_outcome_group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'import_outcome_group_global', 'POST', '/v1/global/outcome_groups/{id}/import',
+        'id, source_outcome_group_id',
+        payload=('source_outcome_group_id',),
+        doc="""
     Creates a new subgroup of the outcome group with the same title and
     description as the source group, then creates links in that new subgroup to
     the same outcomes that are linked in the source group. Recurses on the
@@ -1221,20 +918,12 @@ def import_outcome_group_global(request_ctx, id, source_outcome_group_id, **requ
         :return: Import an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/global/outcome_groups/{id}/import'
-    payload = {
-        'source_outcome_group_id' : source_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def import_outcome_group_accounts(request_ctx, account_id, id, source_outcome_group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'import_outcome_group_accounts', 'POST', '/v1/accounts/{account_id}/outcome_groups/{id}/import',
+        'account_id, id, source_outcome_group_id',
+        payload=('source_outcome_group_id',),
+        doc="""
     Creates a new subgroup of the outcome group with the same title and
     description as the source group, then creates links in that new subgroup to
     the same outcomes that are linked in the source group. Recurses on the
@@ -1259,20 +948,12 @@ def import_outcome_group_accounts(request_ctx, account_id, id, source_outcome_gr
         :return: Import an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/import'
-    payload = {
-        'source_outcome_group_id' : source_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def import_outcome_group_courses(request_ctx, course_id, id, source_outcome_group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'import_outcome_group_courses', 'POST', '/v1/courses/{course_id}/outcome_groups/{id}/import',
+        'course_id, id, source_outcome_group_id',
+        payload=('source_outcome_group_id',),
+        doc="""
     Creates a new subgroup of the outcome group with the same title and
     description as the source group, then creates links in that new subgroup to
     the same outcomes that are linked in the source group. Recurses on the
@@ -1297,15 +978,7 @@ def import_outcome_group_courses(request_ctx, course_id, id, source_outcome_grou
         :return: Import an outcome group
         :rtype: requests.Response (with OutcomeGroup data)
 
-    """
-
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/import'
-    payload = {
-        'source_outcome_group_id' : source_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
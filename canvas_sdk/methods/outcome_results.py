@@ -1,7 +1,15 @@
 from canvas_sdk import client, utils
-
-def get_outcome_results(request_ctx, course_id, user_ids=None, outcome_ids=None, include=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'get_outcome_results', 'GET', '/v1/courses/{course_id}/outcome_results',
+        'course_id, user_ids=None, outcome_ids=None, include=None',
+        payload=('user_ids', 'outcome_ids', 'include'),
+        choices={
+            'include': ('alignments', 'outcomes', 'outcomes.alignments', 'outcome_groups', 'outcome_links', 'outcome_paths', 'users'),
+        },
+        doc="""
     Gets the outcome results for users and outcomes in the specified context.
 
         :param request_ctx: The request context
@@ -17,24 +25,16 @@ def get_outcome_results(request_ctx, course_id, user_ids=None, outcome_ids=None,
         :return: Get outcome results
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('alignments', 'outcomes', 'outcomes.alignments', 'outcome_groups', 'outcome_links', 'outcome_paths', 'users')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/outcome_results'
-    payload = {
-        'user_ids' : user_ids,
-        'outcome_ids' : outcome_ids,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_outcome_result_rollups(request_ctx, course_id, aggregate=None, user_ids=None, outcome_ids=None, include=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_outcome_result_rollups', 'GET', '/v1/courses/{course_id}/outcome_rollups',
+        'course_id, aggregate=None, user_ids=None, outcome_ids=None, include=None',
+        payload=('aggregate', 'user_ids', 'outcome_ids', 'include'),
+        choices={
+            'aggregate': ('course',),
+            'include': ('courses', 'outcomes', 'outcomes.alignments', 'outcome_groups', 'outcome_links', 'outcome_paths', 'users'),
+        },
+        doc="""
     Gets the outcome rollups for the users and outcomes in the specified
     context.
 
@@ -53,22 +53,7 @@ def get_outcome_result_rollups(request_ctx, course_id, aggregate=None, user_ids=
         :return: Get outcome result rollups
         :rtype: requests.Response (with void data)
 
-    """
-
-    aggregate_types = ('course')
-    include_types = ('courses', 'outcomes', 'outcomes.alignments', 'outcome_groups', 'outcome_links', 'outcome_paths', 'users')
-    utils.validate_attr_is_acceptable(aggregate, aggregate_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/outcome_rollups'
-    payload = {
-        'aggregate' : aggregate,
-        'user_ids' : user_ids,
-        'outcome_ids' : outcome_ids,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def show_outcome(request_ctx, id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'show_outcome', 'GET', '/v1/outcomes/{id}',
+        'id',
+        doc="""
     Returns the details of the outcome with the given id.
 
         :param request_ctx: The request context
@@ -11,17 +15,15 @@ def show_outcome(request_ctx, id, **request_kwargs):
         :return: Show an outcome
         :rtype: requests.Response (with Outcome data)
 
-    """
-
-    path = '/v1/outcomes/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_outcome(request_ctx, id, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_outcome', 'PUT', '/v1/outcomes/{id}',
+        'id, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None',
+        payload=(
+            'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', 'ratings[description]',
+            'ratings[points]',
+        ),
+        doc="""
     Modify an existing outcome. Fields not provided are left as is;
     unrecognized fields are ignored.
     
@@ -56,21 +58,7 @@ def update_outcome(request_ctx, id, title=None, display_name=None, description=N
         :return: Update an outcome
         :rtype: requests.Response (with Outcome data)
 
-    """
-
-    path = '/v1/outcomes/{id}'
-    payload = {
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def show_front_page_courses(request_ctx, course_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'show_front_page_courses', 'GET', '/v1/courses/{course_id}/front_page',
+        'course_id',
+        doc="""
     Retrieve the content of the front page
 
         :param request_ctx: The request context
@@ -11,17 +15,11 @@ def show_front_page_courses(request_ctx, course_id, **request_kwargs):
         :return: Show front page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    path = '/v1/courses/{course_id}/front_page'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def show_front_page_groups(request_ctx, group_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_front_page_groups', 'GET', '/v1/groups/{group_id}/front_page',
+        'group_id',
+        doc="""
     Retrieve the content of the front page
 
         :param request_ctx: The request context
@@ -31,17 +29,16 @@ def show_front_page_groups(request_ctx, group_id, **request_kwargs):
         :return: Show front page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    path = '/v1/groups/{group_id}/front_page'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_create_front_page_courses(request_ctx, course_id, wiki_page_body, wiki_page_title=None, wiki_page_hide_from_students=None, wiki_page_editing_roles=None, wiki_page_notify_of_update=None, wiki_page_published=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_create_front_page_courses', 'PUT', '/v1/courses/{course_id}/front_page',
+        'course_id, wiki_page_body, wiki_page_title=None, wiki_page_hide_from_students=None, wiki_page_editing_roles=None, wiki_page_notify_of_update=None, wiki_page_published=None',
+        payload=(
+            'wiki_page[title]', 'wiki_page[body]', 'wiki_page[hide_from_students]', 'wiki_page[editing_roles]',
+            'wiki_page[notify_of_update]', 'wiki_page[published]',
+        ),
+        choices={'wiki_page_editing_roles': ('teachers', 'students', 'members', 'public')},
+        doc="""
     Update the title or contents of the front page
 
         :param request_ctx: The request context
@@ -63,27 +60,16 @@ def update_create_front_page_courses(request_ctx, course_id, wiki_page_body, wik
         :return: Update/create front page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/courses/{course_id}/front_page'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_create_front_page_groups(request_ctx, group_id, wiki_page_body, wiki_page_title=None, wiki_page_hide_from_students=None, wiki_page_editing_roles=None, wiki_page_notify_of_update=None, wiki_page_published=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_create_front_page_groups', 'PUT', '/v1/groups/{group_id}/front_page',
+        'group_id, wiki_page_body, wiki_page_title=None, wiki_page_hide_from_students=None, wiki_page_editing_roles=None, wiki_page_notify_of_update=None, wiki_page_published=None',
+        payload=(
+            'wiki_page[title]', 'wiki_page[body]', 'wiki_page[hide_from_students]', 'wiki_page[editing_roles]',
+            'wiki_page[notify_of_update]', 'wiki_page[published]',
+        ),
+        choices={'wiki_page_editing_roles': ('teachers', 'students', 'members', 'public')},
+        doc="""
     Update the title or contents of the front page
 
         :param request_ctx: The request context
@@ -105,27 +91,13 @@ def update_create_front_page_groups(request_ctx, group_id, wiki_page_body, wiki_
         :return: Update/create front page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/groups/{group_id}/front_page'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_pages_courses(request_ctx, course_id, sort=None, order=None, search_term=None, published=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_pages_courses', 'GET', '/v1/courses/{course_id}/pages',
+        'course_id, sort=None, order=None, search_term=None, published=None, per_page=None',
+        payload=('sort', 'order', 'search_term', 'published', 'per_page'),
+        choices={'sort': ('title', 'created_at', 'updated_at'), 'order': ('asc', 'desc')},
+        doc="""
     List the wiki pages associated with a course or group
 
         :param request_ctx: The request context
@@ -145,30 +117,13 @@ def list_pages_courses(request_ctx, course_id, sort=None, order=None, search_ter
         :return: List pages
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    sort_types = ('title', 'created_at', 'updated_at')
-    order_types = ('asc', 'desc')
-    utils.validate_attr_is_acceptable(sort, sort_types)
-    utils.validate_attr_is_acceptable(order, order_types)
-    path = '/v1/courses/{course_id}/pages'
-    payload = {
-        'sort' : sort,
-        'order' : order,
-        'search_term' : search_term,
-        'published' : published,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_pages_groups(request_ctx, group_id, sort=None, order=None, search_term=None, published=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_pages_groups', 'GET', '/v1/groups/{group_id}/pages',
+        'group_id, sort=None, order=None, search_term=None, published=None, per_page=None',
+        payload=('sort', 'order', 'search_term', 'published', 'per_page'),
+        choices={'sort': ('title', 'created_at', 'updated_at'), 'order': ('asc', 'desc')},
+        doc="""
     List the wiki pages associated with a course or group
 
         :param request_ctx: The request context
@@ -188,30 +143,16 @@ def list_pages_groups(request_ctx, group_id, sort=None, order=None, search_term=
         :return: List pages
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    sort_types = ('title', 'created_at', 'updated_at')
-    order_types = ('asc', 'desc')
-    utils.validate_attr_is_acceptable(sort, sort_types)
-    utils.validate_attr_is_acceptable(order, order_types)
-    path = '/v1/groups/{group_id}/pages'
-    payload = {
-        'sort' : sort,
-        'order' : order,
-        'search_term' : search_term,
-        'published' : published,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_page_courses(request_ctx, course_id, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_page_courses', 'POST', '/v1/courses/{course_id}/pages',
+        'course_id, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None',
+        payload=(
+            'wiki_page[title]', 'wiki_page[body]', 'wiki_page[hide_from_students]', 'wiki_page[editing_roles]',
+            'wiki_page[notify_of_update]', 'wiki_page[published]', 'wiki_page[front_page]',
+        ),
+        choices={'wiki_page_editing_roles': ('teachers', 'students', 'members', 'public')},
+        doc="""
     Create a new wiki page
 
         :param request_ctx: The request context
@@ -235,28 +176,16 @@ def create_page_courses(request_ctx, course_id, wiki_page_title, wiki_page_body,
         :return: Create page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/courses/{course_id}/pages'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-        'wiki_page[front_page]' : wiki_page_front_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_page_groups(request_ctx, group_id, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_page_groups', 'POST', '/v1/groups/{group_id}/pages',
+        'group_id, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None',
+        payload=(
+            'wiki_page[title]', 'wiki_page[body]', 'wiki_page[hide_from_students]', 'wiki_page[editing_roles]',
+            'wiki_page[notify_of_update]', 'wiki_page[published]', 'wiki_page[front_page]',
+        ),
+        choices={'wiki_page_editing_roles': ('teachers', 'students', 'members', 'public')},
+        doc="""
     Create a new wiki page
 
         :param request_ctx: The request context
@@ -280,28 +209,11 @@ def create_page_groups(request_ctx, group_id, wiki_page_title, wiki_page_body, w
         :return: Create page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/groups/{group_id}/pages'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-        'wiki_page[front_page]' : wiki_page_front_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_page_courses(request_ctx, course_id, url, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_page_courses', 'GET', '/v1/courses/{course_id}/pages/{url}',
+        'course_id, url',
+        doc="""
     Retrieve the content of a wiki page
 
         :param request_ctx: The request context
@@ -313,17 +225,11 @@ def show_page_courses(request_ctx, course_id, url, **request_kwargs):
         :return: Show page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    path = '/v1/courses/{course_id}/pages/{url}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def show_page_groups(request_ctx, group_id, url, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_page_groups', 'GET', '/v1/groups/{group_id}/pages/{url}',
+        'group_id, url',
+        doc="""
     Retrieve the content of a wiki page
 
         :param request_ctx: The request context
@@ -335,17 +241,16 @@ def show_page_groups(request_ctx, group_id, url, **request_kwargs):
         :return: Show page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    path = '/v1/groups/{group_id}/pages/{url}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def update_create_page_courses(request_ctx, course_id, url, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_create_page_courses', 'PUT', '/v1/courses/{course_id}/pages/{url}',
+        'course_id, url, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None',
+        payload=(
+            'wiki_page[title]', 'wiki_page[body]', 'wiki_page[hide_from_students]', 'wiki_page[editing_roles]',
+            'wiki_page[notify_of_update]', 'wiki_page[published]', 'wiki_page[front_page]',
+        ),
+        choices={'wiki_page_editing_roles': ('teachers', 'students', 'members', 'public')},
+        doc="""
     Update the title or contents of a wiki page
 
         :param request_ctx: The request context
@@ -371,28 +276,16 @@ def update_create_page_courses(request_ctx, course_id, url, wiki_page_title, wik
         :return: Update/create page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/courses/{course_id}/pages/{url}'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-        'wiki_page[front_page]' : wiki_page_front_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_create_page_groups(request_ctx, group_id, url, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_create_page_groups', 'PUT', '/v1/groups/{group_id}/pages/{url}',
+        'group_id, url, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None',
+        payload=(
+            'wiki_page[title]', 'wiki_page[body]', 'wiki_page[hide_from_students]', 'wiki_page[editing_roles]',
+            'wiki_page[notify_of_update]', 'wiki_page[published]', 'wiki_page[front_page]',
+        ),
+        choices={'wiki_page_editing_roles': ('teachers', 'students', 'members', 'public')},
+        doc="""
     Update the title or contents of a wiki page
 
         :param request_ctx: The request context
@@ -418,28 +311,11 @@ def update_create_page_groups(request_ctx, group_id, url, wiki_page_title, wiki_
         :return: Update/create page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/groups/{group_id}/pages/{url}'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-        'wiki_page[front_page]' : wiki_page_front_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_page_courses(request_ctx, course_id, url, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_page_courses', 'DELETE', '/v1/courses/{course_id}/pages/{url}',
+        'course_id, url',
+        doc="""
     Delete a wiki page
 
         :param request_ctx: The request context
@@ -451,17 +327,11 @@ def delete_page_courses(request_ctx, course_id, url, **request_kwargs):
         :return: Delete page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    path = '/v1/courses/{course_id}/pages/{url}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_page_groups(request_ctx, group_id, url, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_page_groups', 'DELETE', '/v1/groups/{group_id}/pages/{url}',
+        'group_id, url',
+        doc="""
     Delete a wiki page
 
         :param request_ctx: The request context
@@ -473,17 +343,12 @@ def delete_page_groups(request_ctx, group_id, url, **request_kwargs):
         :return: Delete page
         :rtype: requests.Response (with Page data)
 
-    """
-
-    path = '/v1/groups/{group_id}/pages/{url}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_revisions_courses(request_ctx, course_id, url, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_revisions_courses', 'GET', '/v1/courses/{course_id}/pages/{url}/revisions',
+        'course_id, url, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the revisions of a page. Callers must have update rights on the page in order to see page history.
 
         :param request_ctx: The request context
@@ -497,22 +362,12 @@ def list_revisions_courses(request_ctx, course_id, url, per_page=None, **request
         :return: List revisions
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/pages/{url}/revisions'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_revisions_groups(request_ctx, group_id, url, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_revisions_groups', 'GET', '/v1/groups/{group_id}/pages/{url}/revisions',
+        'group_id, url, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the revisions of a page. Callers must have update rights on the page in order to see page history.
 
         :param request_ctx: The request context
@@ -526,22 +381,12 @@ def list_revisions_groups(request_ctx, group_id, url, per_page=None, **request_k
         :return: List revisions
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/pages/{url}/revisions'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_revision_courses_latest(request_ctx, course_id, url, summary=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_revision_courses_latest', 'GET', '/v1/courses/{course_id}/pages/{url}/revisions/latest',
+        'course_id, url, summary=None',
+        payload=('summary',),
+        doc="""
     Retrieve the metadata and optionally content of a revision of the page.
     Note that retrieving historic versions of pages requires edit rights.
 
@@ -556,20 +401,12 @@ def show_revision_courses_latest(request_ctx, course_id, url, summary=None, **re
         :return: Show revision
         :rtype: requests.Response (with PageRevision data)
 
-    """
-
-    path = '/v1/courses/{course_id}/pages/{url}/revisions/latest'
-    payload = {
-        'summary' : summary,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_revision_groups_latest(request_ctx, group_id, url, summary=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_revision_groups_latest', 'GET', '/v1/groups/{group_id}/pages/{url}/revisions/latest',
+        'group_id, url, summary=None',
+        payload=('summary',),
+        doc="""
     Retrieve the metadata and optionally content of a revision of the page.
     Note that retrieving historic versions of pages requires edit rights.
 
@@ -584,20 +421,12 @@ def show_revision_groups_latest(request_ctx, group_id, url, summary=None, **requ
         :return: Show revision
         :rtype: requests.Response (with PageRevision data)
 
-    """
-
-    path = '/v1/groups/{group_id}/pages/{url}/revisions/latest'
-    payload = {
-        'summary' : summary,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_revision_courses_revision_id(request_ctx, course_id, url, revision_id, summary=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_revision_courses_revision_id', 'GET', '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}',
+        'course_id, url, revision_id, summary=None',
+        payload=('summary',),
+        doc="""
     Retrieve the metadata and optionally content of a revision of the page.
     Note that retrieving historic versions of pages requires edit rights.
 
@@ -614,20 +443,12 @@ def show_revision_courses_revision_id(request_ctx, course_id, url, revision_id,
         :return: Show revision
         :rtype: requests.Response (with PageRevision data)
 
-    """
-
-    path = '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}'
-    payload = {
-        'summary' : summary,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url, revision_id=revision_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_revision_groups_revision_id(request_ctx, group_id, url, revision_id, summary=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_revision_groups_revision_id', 'GET', '/v1/groups/{group_id}/pages/{url}/revisions/{revision_id}',
+        'group_id, url, revision_id, summary=None',
+        payload=('summary',),
+        doc="""
     Retrieve the metadata and optionally content of a revision of the page.
     Note that retrieving historic versions of pages requires edit rights.
 
@@ -644,20 +465,11 @@ def show_revision_groups_revision_id(request_ctx, group_id, url, revision_id, su
         :return: Show revision
         :rtype: requests.Response (with PageRevision data)
 
-    """
-
-    path = '/v1/groups/{group_id}/pages/{url}/revisions/{revision_id}'
-    payload = {
-        'summary' : summary,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url, revision_id=revision_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def revert_to_revision_courses(request_ctx, course_id, url, revision_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'revert_to_revision_courses', 'POST', '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}',
+        'course_id, url, revision_id',
+        doc="""
     Revert a page to a prior revision.
 
         :param request_ctx: The request context
@@ -671,17 +483,11 @@ def revert_to_revision_courses(request_ctx, course_id, url, revision_id, **reque
         :return: Revert to revision
         :rtype: requests.Response (with PageRevision data)
 
-    """
-
-    path = '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url, revision_id=revision_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def revert_to_revision_groups(request_ctx, group_id, url, revision_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'revert_to_revision_groups', 'POST', '/v1/groups/{group_id}/pages/{url}/revisions/{revision_id}',
+        'group_id, url, revision_id',
+        doc="""
     Revert a page to a prior revision.
 
         :param request_ctx: The request context
@@ -695,12 +501,7 @@ def revert_to_revision_groups(request_ctx, group_id, url, revision_id, **request
         :return: Revert to revision
         :rtype: requests.Response (with PageRevision data)
 
-    """
-
-    path = '/v1/groups/{group_id}/pages/{url}/revisions/{revision_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url, revision_id=revision_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
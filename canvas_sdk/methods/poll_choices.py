@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def list_poll_choices_in_poll(request_ctx, poll_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'list_poll_choices_in_poll', 'GET', '/v1/polls/{poll_id}/poll_choices',
+        'poll_id',
+        doc="""
     Returns the list of PollChoices in this poll.
 
         :param request_ctx: The request context
@@ -11,17 +15,11 @@ def list_poll_choices_in_poll(request_ctx, poll_id, **request_kwargs):
         :return: List poll choices in a poll
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_choices'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_single_poll_choice(request_ctx, poll_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_poll_choice', 'GET', '/v1/polls/{poll_id}/poll_choices/{id}',
+        'poll_id, id',
+        doc="""
     Returns the poll choice with the given id
 
         :param request_ctx: The request context
@@ -33,17 +31,12 @@ def get_single_poll_choice(request_ctx, poll_id, id, **request_kwargs):
         :return: Get a single poll choice
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_choices/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_single_poll_choice(request_ctx, poll_id, poll_choices_text, poll_choices_is_correct=None, poll_choices_position=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_single_poll_choice', 'POST', '/v1/polls/{poll_id}/poll_choices',
+        'poll_id, poll_choices_text, poll_choices_is_correct=None, poll_choices_position=None',
+        payload=('poll_choices[text]', 'poll_choices[is_correct]', 'poll_choices[position]'),
+        doc="""
     Create a new poll choice for this poll
 
         :param request_ctx: The request context
@@ -59,22 +52,12 @@ def create_single_poll_choice(request_ctx, poll_id, poll_choices_text, poll_choi
         :return: Create a single poll choice
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_choices'
-    payload = {
-        'poll_choices[text]' : poll_choices_text,
-        'poll_choices[is_correct]' : poll_choices_is_correct,
-        'poll_choices[position]' : poll_choices_position,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_single_poll_choice(request_ctx, poll_id, id, poll_choices_text, poll_choices_is_correct=None, poll_choices_position=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_single_poll_choice', 'PUT', '/v1/polls/{poll_id}/poll_choices/{id}',
+        'poll_id, id, poll_choices_text, poll_choices_is_correct=None, poll_choices_position=None',
+        payload=('poll_choices[text]', 'poll_choices[is_correct]', 'poll_choices[position]'),
+        doc="""
     Update an existing poll choice for this poll
 
         :param request_ctx: The request context
@@ -92,22 +75,11 @@ def update_single_poll_choice(request_ctx, poll_id, id, poll_choices_text, poll_
         :return: Update a single poll choice
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_choices/{id}'
-    payload = {
-        'poll_choices[text]' : poll_choices_text,
-        'poll_choices[is_correct]' : poll_choices_is_correct,
-        'poll_choices[position]' : poll_choices_position,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_poll_choice(request_ctx, poll_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_poll_choice', 'DELETE', '/v1/polls/{poll_id}/poll_choices/{id}',
+        'poll_id, id',
+        doc="""
     <b>204 No Content</b> response code is returned if the deletion was successful.
 
         :param request_ctx: The request context
@@ -119,12 +91,7 @@ def delete_poll_choice(request_ctx, poll_id, id, **request_kwargs):
         :return: Delete a poll choice
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_choices/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
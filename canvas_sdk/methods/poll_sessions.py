@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def list_poll_sessions_for_poll(request_ctx, poll_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'list_poll_sessions_for_poll', 'GET', '/v1/polls/{poll_id}/poll_sessions',
+        'poll_id',
+        doc="""
     Returns the list of PollSessions in this poll.
 
         :param request_ctx: The request context
@@ -11,17 +15,11 @@ def list_poll_sessions_for_poll(request_ctx, poll_id, **request_kwargs):
         :return: List poll sessions for a poll
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_results_for_single_poll_session(request_ctx, poll_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_results_for_single_poll_session', 'GET', '/v1/polls/{poll_id}/poll_sessions/{id}',
+        'poll_id, id',
+        doc="""
     Returns the poll session with the given id
 
         :param request_ctx: The request context
@@ -33,17 +31,12 @@ def get_results_for_single_poll_session(request_ctx, poll_id, id, **request_kwar
         :return: Get the results for a single poll session
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_single_poll_session(request_ctx, poll_id, poll_sessions_course_id, poll_sessions_course_section_id=None, poll_sessions_has_public_results=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_single_poll_session', 'POST', '/v1/polls/{poll_id}/poll_sessions',
+        'poll_id, poll_sessions_course_id, poll_sessions_course_section_id=None, poll_sessions_has_public_results=None',
+        payload=('poll_sessions[course_id]', 'poll_sessions[course_section_id]', 'poll_sessions[has_public_results]'),
+        doc="""
     Create a new poll session for this poll
 
         :param request_ctx: The request context
@@ -59,22 +52,12 @@ def create_single_poll_session(request_ctx, poll_id, poll_sessions_course_id, po
         :return: Create a single poll session
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions'
-    payload = {
-        'poll_sessions[course_id]' : poll_sessions_course_id,
-        'poll_sessions[course_section_id]' : poll_sessions_course_section_id,
-        'poll_sessions[has_public_results]' : poll_sessions_has_public_results,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_single_poll_session(request_ctx, poll_id, id, poll_sessions_course_id, poll_sessions_course_section_id, poll_sessions_has_public_results=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_single_poll_session', 'PUT', '/v1/polls/{poll_id}/poll_sessions/{id}',
+        'poll_id, id, poll_sessions_course_id, poll_sessions_course_section_id, poll_sessions_has_public_results=None',
+        payload=('poll_sessions[course_id]', 'poll_sessions[course_section_id]', 'poll_sessions[has_public_results]'),
+        doc="""
     Update an existing poll session for this poll
 
         :param request_ctx: The request context
@@ -92,22 +75,11 @@ def update_single_poll_session(request_ctx, poll_id, id, poll_sessions_course_id
         :return: Update a single poll session
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}'
-    payload = {
-        'poll_sessions[course_id]' : poll_sessions_course_id,
-        'poll_sessions[course_section_id]' : poll_sessions_course_section_id,
-        'poll_sessions[has_public_results]' : poll_sessions_has_public_results,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_poll_session(request_ctx, poll_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_poll_session', 'DELETE', '/v1/polls/{poll_id}/poll_sessions/{id}',
+        'poll_id, id',
+        doc="""
     <b>204 No Content</b> response code is returned if the deletion was successful.
 
         :param request_ctx: The request context
@@ -119,17 +91,11 @@ def delete_poll_session(request_ctx, poll_id, id, **request_kwargs):
         :return: Delete a poll session
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def open_poll_session(request_ctx, poll_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'open_poll_session', 'GET', '/v1/polls/{poll_id}/poll_sessions/{id}/open',
+        'poll_id, id',
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -140,17 +106,11 @@ def open_poll_session(request_ctx, poll_id, id, **request_kwargs):
         :return: Open a poll session
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}/open'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def close_opened_poll_session(request_ctx, poll_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'close_opened_poll_session', 'GET', '/v1/polls/{poll_id}/poll_sessions/{id}/close',
+        'poll_id, id',
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -161,17 +121,11 @@ def close_opened_poll_session(request_ctx, poll_id, id, **request_kwargs):
         :return: Close an opened poll session
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}/close'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_opened_poll_sessions(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_opened_poll_sessions', 'GET', '/v1/poll_sessions/opened',
+        '',
+        doc="""
     Lists all opened poll sessions available to the current user.
 
         :param request_ctx: The request context
@@ -179,17 +133,11 @@ def list_opened_poll_sessions(request_ctx, **request_kwargs):
         :return: List opened poll sessions
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/poll_sessions/opened'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_closed_poll_sessions(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_closed_poll_sessions', 'GET', '/v1/poll_sessions/closed',
+        '',
+        doc="""
     Lists all closed poll sessions available to the current user.
 
         :param request_ctx: The request context
@@ -197,12 +145,7 @@ def list_closed_poll_sessions(request_ctx, **request_kwargs):
         :return: List closed poll sessions
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/poll_sessions/closed'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def get_single_poll_submission(request_ctx, poll_id, poll_session_id, id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'get_single_poll_submission', 'GET', '/v1/polls/{poll_id}/poll_sessions/{poll_session_id}/poll_submissions/{id}',
+        'poll_id, poll_session_id, id',
+        doc="""
     Returns the poll submission with the given id
 
         :param request_ctx: The request context
@@ -15,17 +19,12 @@ def get_single_poll_submission(request_ctx, poll_id, poll_session_id, id, **requ
         :return: Get a single poll submission
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions/{poll_session_id}/poll_submissions/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, poll_session_id=poll_session_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_single_poll_submission(request_ctx, poll_id, poll_session_id, poll_submissions_poll_choice_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_single_poll_submission', 'POST', '/v1/polls/{poll_id}/poll_sessions/{poll_session_id}/poll_submissions',
+        'poll_id, poll_session_id, poll_submissions_poll_choice_id',
+        payload=('poll_submissions[poll_choice_id]',),
+        doc="""
     Create a new poll submission for this poll session
 
         :param request_ctx: The request context
@@ -39,15 +38,7 @@ def create_single_poll_submission(request_ctx, poll_id, poll_session_id, poll_su
         :return: Create a single poll submission
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{poll_id}/poll_sessions/{poll_session_id}/poll_submissions'
-    payload = {
-        'poll_submissions[poll_choice_id]' : poll_submissions_poll_choice_id,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, poll_session_id=poll_session_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def list_polls(request_ctx, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'list_polls', 'GET', '/v1/polls',
+        '',
+        doc="""
     Returns the list of polls for the current user.
 
         :param request_ctx: The request context
@@ -9,17 +13,11 @@ def list_polls(request_ctx, **request_kwargs):
         :return: List polls
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_single_poll(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_poll', 'GET', '/v1/polls/{id}',
+        'id',
+        doc="""
     Returns the poll with the given id
 
         :param request_ctx: The request context
@@ -29,17 +27,12 @@ def get_single_poll(request_ctx, id, **request_kwargs):
         :return: Get a single poll
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_single_poll(request_ctx, polls_question, polls_description=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_single_poll', 'POST', '/v1/polls',
+        'polls_question, polls_description=None',
+        payload=('polls[question]', 'polls[description]'),
+        doc="""
     Create a new poll for the current user
 
         :param request_ctx: The request context
@@ -51,21 +44,12 @@ def create_single_poll(request_ctx, polls_question, polls_description=None, **re
         :return: Create a single poll
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls'
-    payload = {
-        'polls[question]' : polls_question,
-        'polls[description]' : polls_description,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_single_poll(request_ctx, id, polls_question, polls_description=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_single_poll', 'PUT', '/v1/polls/{id}',
+        'id, polls_question, polls_description=None',
+        payload=('polls[question]', 'polls[description]'),
+        doc="""
     Update an existing poll belonging to the current user
 
         :param request_ctx: The request context
@@ -79,21 +63,11 @@ def update_single_poll(request_ctx, id, polls_question, polls_description=None,
         :return: Update a single poll
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{id}'
-    payload = {
-        'polls[question]' : polls_question,
-        'polls[description]' : polls_description,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_poll(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_poll', 'DELETE', '/v1/polls/{id}',
+        'id',
+        doc="""
     <b>204 No Content</b> response code is returned if the deletion was successful.
 
         :param request_ctx: The request context
@@ -103,12 +77,7 @@ def delete_poll(request_ctx, id, **request_kwargs):
         :return: Delete a poll
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/polls/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
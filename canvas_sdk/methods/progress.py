@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def query_progress(request_ctx, id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'query_progress', 'GET', '/v1/progress/{id}',
+        'id',
+        doc="""
     Return completion and status information about an asynchronous job
 
         :param request_ctx: The request context
@@ -11,12 +15,7 @@ def query_progress(request_ctx, id, **request_kwargs):
         :return: Query progress
         :rtype: requests.Response (with Progress data)
 
-    """
-
-    path = '/v1/progress/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def retrieve_assignment_overridden_dates_for_quizzes(request_ctx, course_id, quiz_assignment_overrides_0_quiz_ids=None, per_page=None, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'retrieve_assignment_overridden_dates_for_quizzes', 'GET', '/v1/courses/{course_id}/quizzes/assignment_overrides',
+        'course_id, quiz_assignment_overrides_0_quiz_ids=None, per_page=None',
+        payload=('quiz_assignment_overrides[0][quiz_ids]', 'per_page'),
+        doc="""
     Retrieve the actual due-at, unlock-at, and available-at dates for quizzes
     based on the assignment overrides active for the current API user.
 
@@ -16,18 +21,7 @@ def retrieve_assignment_overridden_dates_for_quizzes(request_ctx, course_id, qui
         :return: Retrieve assignment-overridden dates for quizzes
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/quizzes/assignment_overrides'
-    payload = {
-        'quiz_assignment_overrides[0][quiz_ids]' : quiz_assignment_overrides_0_quiz_ids,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
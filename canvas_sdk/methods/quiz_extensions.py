@@ -1,7 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def set_extensions_for_student_quiz_submissions(request_ctx, course_id, quiz_id, user_id, extra_attempts=None, extra_time=None, manually_unlocked=None, extend_from_now=None, extend_from_end_at=None, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'set_extensions_for_student_quiz_submissions', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/extensions',
+        'course_id, quiz_id, user_id, extra_attempts=None, extra_time=None, manually_unlocked=None, extend_from_now=None, extend_from_end_at=None',
+        payload=(
+            'user_id', 'extra_attempts', 'extra_time', 'manually_unlocked', 'extend_from_now', 'extend_from_end_at',
+        ),
+        doc="""
     <b>Responses</b>
     
     * <b>200 OK</b> if the request was successful
@@ -28,20 +35,7 @@ def set_extensions_for_student_quiz_submissions(request_ctx, course_id, quiz_id,
         :return: Set extensions for student quiz submissions
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/extensions'
-    payload = {
-        'user_id' : user_id,
-        'extra_attempts' : extra_attempts,
-        'extra_time' : extra_time,
-        'manually_unlocked' : manually_unlocked,
-        'extend_from_now' : extend_from_now,
-        'extend_from_end_at' : extend_from_end_at,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
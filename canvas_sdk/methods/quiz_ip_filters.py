@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def get_available_quiz_ip_filters(request_ctx, course_id, quiz_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'get_available_quiz_ip_filters', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/ip_filters',
+        'course_id, quiz_id',
+        doc="""
     Get a list of available IP filters for this Quiz.
     
     <b>200 OK</b> response code is returned if the request was successful.
@@ -15,12 +19,7 @@ def get_available_quiz_ip_filters(request_ctx, course_id, quiz_id, **request_kwa
         :return: Get available quiz IP filters.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/ip_filters'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,15 @@
 from canvas_sdk import client, utils
-
-def create_question_group(request_ctx, course_id, quiz_id, quiz_groups_name=None, quiz_groups_pick_count=None, quiz_groups_question_points=None, quiz_groups_assessment_question_bank_id=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'create_question_group', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/groups',
+        'course_id, quiz_id, quiz_groups_name=None, quiz_groups_pick_count=None, quiz_groups_question_points=None, quiz_groups_assessment_question_bank_id=None',
+        payload=(
+            'quiz_groups[name]', 'quiz_groups[pick_count]', 'quiz_groups[question_points]',
+            'quiz_groups[assessment_question_bank_id]',
+        ),
+        doc="""
     Create a new question group for this quiz
     
     <b>201 Created</b> response code is returned if the creation was successful.
@@ -23,23 +31,12 @@ def create_question_group(request_ctx, course_id, quiz_id, quiz_groups_name=None
         :return: Create a question group
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/groups'
-    payload = {
-        'quiz_groups[name]' : quiz_groups_name,
-        'quiz_groups[pick_count]' : quiz_groups_pick_count,
-        'quiz_groups[question_points]' : quiz_groups_question_points,
-        'quiz_groups[assessment_question_bank_id]' : quiz_groups_assessment_question_bank_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_question_group(request_ctx, course_id, quiz_id, id, quiz_groups_name=None, quiz_groups_pick_count=None, quiz_groups_question_points=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_question_group', 'PUT', '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}',
+        'course_id, quiz_id, id, quiz_groups_name=None, quiz_groups_pick_count=None, quiz_groups_question_points=None',
+        payload=('quiz_groups[name]', 'quiz_groups[pick_count]', 'quiz_groups[question_points]'),
+        doc="""
     Update a question group
 
         :param request_ctx: The request context
@@ -59,22 +56,11 @@ def update_question_group(request_ctx, course_id, quiz_id, id, quiz_groups_name=
         :return: Update a question group
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}'
-    payload = {
-        'quiz_groups[name]' : quiz_groups_name,
-        'quiz_groups[pick_count]' : quiz_groups_pick_count,
-        'quiz_groups[question_points]' : quiz_groups_question_points,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_question_group(request_ctx, course_id, quiz_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_question_group', 'DELETE', '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}',
+        'course_id, quiz_id, id',
+        doc="""
     Delete a question group
     
     <b>204 No Content<b> response code is returned if the deletion was successful.
@@ -90,17 +76,13 @@ def delete_question_group(request_ctx, course_id, quiz_id, id, **request_kwargs)
         :return: Delete a question group
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def reorder_question_groups(request_ctx, course_id, quiz_id, id, order_id, order_type, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reorder_question_groups', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}/reorder',
+        'course_id, quiz_id, id, order_id, order_type',
+        payload=('order[id]', 'order[type]'),
+        choices={'order_type': ('question',)},
+        doc="""
     Change the order of the quiz questions within the group
     
     <b>204 No Content<b> response code is returned if the reorder was successful.
@@ -120,18 +102,7 @@ def reorder_question_groups(request_ctx, course_id, quiz_id, id, order_id, order
         :return: Reorder question groups
         :rtype: requests.Response (with void data)
 
-    """
-
-    order_type_types = ('question')
-    utils.validate_attr_is_acceptable(order_type, order_type_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}/reorder'
-    payload = {
-        'order[id]' : order_id,
-        'order[type]' : order_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
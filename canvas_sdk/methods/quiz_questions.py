@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_questions_in_quiz(request_ctx, course_id, quiz_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_questions_in_quiz', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions',
+        'course_id, quiz_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of QuizQuestions in this quiz.
 
         :param request_ctx: The request context
@@ -15,22 +20,11 @@ def list_questions_in_quiz(request_ctx, course_id, quiz_id, per_page=None, **req
         :return: List questions in a quiz
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_quiz_question(request_ctx, course_id, quiz_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_quiz_question', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}',
+        'course_id, quiz_id, id',
+        doc="""
     Returns the quiz question with the given id
 
         :param request_ctx: The request context
@@ -44,17 +38,20 @@ def get_single_quiz_question(request_ctx, course_id, quiz_id, id, **request_kwar
         :return: Get a single quiz question
         :rtype: requests.Response (with QuizQuestion data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_single_quiz_question(request_ctx, course_id, quiz_id, question_question_name, question_question_text, question_question_type, question_quiz_group_id=None, question_position=None, question_points_possible=None, question_correct_comments=None, question_incorrect_comments=None, question_neutral_comments=None, question_text_after_answers=None, question_answers=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_single_quiz_question', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions',
+        'course_id, quiz_id, question_question_name, question_question_text, question_question_type, question_quiz_group_id=None, question_position=None, question_points_possible=None, question_correct_comments=None, question_incorrect_comments=None, question_neutral_comments=None, question_text_after_answers=None, question_answers=None',
+        payload=(
+            'question[question_name]', 'question[question_text]', 'question[quiz_group_id]', 'question[question_type]',
+            'question[position]', 'question[points_possible]', 'question[correct_comments]',
+            'question[incorrect_comments]', 'question[neutral_comments]', 'question[text_after_answers]',
+            'question[answers]',
+        ),
+        choices={
+            'question_question_type': ('calculated_question', 'essay_question', 'file_upload_question', 'fill_in_multiple_blanks_question', 'matching_question', 'multiple_answers_question', 'multiple_choice_question', 'multiple_dropdowns_question', 'numerical_question', 'short_answer_question', 'text_only_question'),
+        },
+        doc="""
     Create a new quiz question for this quiz
 
         :param request_ctx: The request context
@@ -88,32 +85,20 @@ def create_single_quiz_question(request_ctx, course_id, quiz_id, question_questi
         :return: Create a single quiz question
         :rtype: requests.Response (with QuizQuestion data)
 
-    """
-
-    question_question_type_types = ('calculated_question', 'essay_question', 'file_upload_question', 'fill_in_multiple_blanks_question', 'matching_question', 'multiple_answers_question', 'multiple_choice_question', 'multiple_dropdowns_question', 'numerical_question', 'short_answer_question', 'text_only_question')
-    utils.validate_attr_is_acceptable(question_question_type, question_question_type_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions'
-    payload = {
-        'question[question_name]' : question_question_name,
-        'question[question_text]' : question_question_text,
-        'question[quiz_group_id]' : question_quiz_group_id,
-        'question[question_type]' : question_question_type,
-        'question[position]' : question_position,
-        'question[points_possible]' : question_points_possible,
-        'question[correct_comments]' : question_correct_comments,
-        'question[incorrect_comments]' : question_incorrect_comments,
-        'question[neutral_comments]' : question_neutral_comments,
-        'question[text_after_answers]' : question_text_after_answers,
-        'question[answers]' : question_answers,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_existing_quiz_question(request_ctx, course_id, quiz_id, id, question_question_name, question_question_text, question_question_type, question_quiz_group_id=None, question_position=None, question_points_possible=None, question_correct_comments=None, question_incorrect_comments=None, question_neutral_comments=None, question_text_after_answers=None, question_answers=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_existing_quiz_question', 'PUT', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}',
+        'course_id, quiz_id, id, question_question_name, question_question_text, question_question_type, question_quiz_group_id=None, question_position=None, question_points_possible=None, question_correct_comments=None, question_incorrect_comments=None, question_neutral_comments=None, question_text_after_answers=None, question_answers=None',
+        payload=(
+            'question[question_name]', 'question[question_text]', 'question[quiz_group_id]', 'question[question_type]',
+            'question[position]', 'question[points_possible]', 'question[correct_comments]',
+            'question[incorrect_comments]', 'question[neutral_comments]', 'question[text_after_answers]',
+            'question[answers]',
+        ),
+        choices={
+            'question_question_type': ('calculated_question', 'essay_question', 'file_upload_question', 'fill_in_multiple_blanks_question', 'matching_question', 'multiple_answers_question', 'multiple_choice_question', 'multiple_dropdowns_question', 'numerical_question', 'short_answer_question', 'text_only_question'),
+        },
+        doc="""
     Updates an existing quiz question for this quiz
 
         :param request_ctx: The request context
@@ -149,32 +134,11 @@ def update_existing_quiz_question(request_ctx, course_id, quiz_id, id, question_
         :return: Update an existing quiz question
         :rtype: requests.Response (with QuizQuestion data)
 
-    """
-
-    question_question_type_types = ('calculated_question', 'essay_question', 'file_upload_question', 'fill_in_multiple_blanks_question', 'matching_question', 'multiple_answers_question', 'multiple_choice_question', 'multiple_dropdowns_question', 'numerical_question', 'short_answer_question', 'text_only_question')
-    utils.validate_attr_is_acceptable(question_question_type, question_question_type_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}'
-    payload = {
-        'question[question_name]' : question_question_name,
-        'question[question_text]' : question_question_text,
-        'question[quiz_group_id]' : question_quiz_group_id,
-        'question[question_type]' : question_question_type,
-        'question[position]' : question_position,
-        'question[points_possible]' : question_points_possible,
-        'question[correct_comments]' : question_correct_comments,
-        'question[incorrect_comments]' : question_incorrect_comments,
-        'question[neutral_comments]' : question_neutral_comments,
-        'question[text_after_answers]' : question_text_after_answers,
-        'question[answers]' : question_answers,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_quiz_question(request_ctx, course_id, quiz_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_quiz_question', 'DELETE', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}',
+        'course_id, quiz_id, id',
+        doc="""
     <b>204 No Content<b> response code is returned if the deletion was successful.
 
         :param request_ctx: The request context
@@ -188,12 +152,7 @@ def delete_quiz_question(request_ctx, course_id, quiz_id, id, **request_kwargs):
         :return: Delete a quiz question
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
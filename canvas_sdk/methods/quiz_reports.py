@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def retrieve_all_quiz_reports(request_ctx, course_id, quiz_id, includes_all_versions=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'retrieve_all_quiz_reports', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/reports',
+        'course_id, quiz_id, includes_all_versions=None, per_page=None',
+        payload=('includes_all_versions', 'per_page'),
+        doc="""
     Returns a list of all available reports.
 
         :param request_ctx: The request context
@@ -17,23 +22,13 @@ def retrieve_all_quiz_reports(request_ctx, course_id, quiz_id, includes_all_vers
         :return: Retrieve all quiz reports
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/reports'
-    payload = {
-        'includes_all_versions' : includes_all_versions,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_quiz_report(request_ctx, course_id, quiz_id, quiz_report_report_type, quiz_report_includes_all_versions=None, include=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_quiz_report', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/reports',
+        'course_id, quiz_id, quiz_report_report_type, quiz_report_includes_all_versions=None, include=None',
+        payload=('quiz_report[report_type]', 'quiz_report[includes_all_versions]', 'include'),
+        choices={'quiz_report_report_type': ('student_analysis', 'item_analysis'), 'include': ('file', 'progress')},
+        doc="""
     Create and return a new report for this quiz. If a previously
     generated report matches the arguments and is still current (i.e.
     there have been no new submissions), it will be returned.
@@ -53,26 +48,13 @@ def create_quiz_report(request_ctx, course_id, quiz_id, quiz_report_report_type,
         :return: Create a quiz report
         :rtype: requests.Response (with QuizReport data)
 
-    """
-
-    quiz_report_report_type_types = ('student_analysis', 'item_analysis')
-    include_types = ('file', 'progress')
-    utils.validate_attr_is_acceptable(quiz_report_report_type, quiz_report_report_type_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/reports'
-    payload = {
-        'quiz_report[report_type]' : quiz_report_report_type,
-        'quiz_report[includes_all_versions]' : quiz_report_includes_all_versions,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_quiz_report(request_ctx, course_id, quiz_id, id, include=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_quiz_report', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/reports/{id}',
+        'course_id, quiz_id, id, include=None',
+        payload=('include',),
+        choices={'include': ('file', 'progress')},
+        doc="""
     Returns the data for a single quiz report.
 
         :param request_ctx: The request context
@@ -88,17 +70,7 @@ def get_quiz_report(request_ctx, course_id, quiz_id, id, include=None, **request
         :return: Get a quiz report
         :rtype: requests.Response (with QuizReport data)
 
-    """
-
-    include_types = ('file', 'progress')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/reports/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
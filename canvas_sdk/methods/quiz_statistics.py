@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def fetching_latest_quiz_statistics(request_ctx, course_id, quiz_id, all_versions, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'fetching_latest_quiz_statistics', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/statistics',
+        'course_id, quiz_id, all_versions',
+        payload=('all_versions',),
+        doc="""
     This endpoint provides statistics for all quiz versions, or for a specific
     quiz version, in which case the output is guaranteed to represent the
     _latest_ and most current version of the quiz.
@@ -19,15 +24,7 @@ def fetching_latest_quiz_statistics(request_ctx, course_id, quiz_id, all_version
         :return: Fetching the latest quiz statistics
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/statistics'
-    payload = {
-        'all_versions' : all_versions,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
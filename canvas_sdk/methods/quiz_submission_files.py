@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def upload_file(request_ctx, course_id, quiz_id, name, on_duplicate, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'upload_file', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/self/files',
+        'course_id, quiz_id, name, on_duplicate',
+        payload=('name', 'on_duplicate'),
+        doc="""
     Associate a new quiz submission file
     
     This API endpoint is the first step in uploading a quiz submission file.
@@ -22,16 +27,7 @@ def upload_file(request_ctx, course_id, quiz_id, name, on_duplicate, **request_k
         :return: Upload a file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/self/files'
-    payload = {
-        'name' : name,
-        'on_duplicate' : on_duplicate,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
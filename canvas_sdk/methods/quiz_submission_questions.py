@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def get_all_quiz_submission_questions(request_ctx, quiz_submission_id, include, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'get_all_quiz_submission_questions', 'GET', '/v1/quiz_submissions/{quiz_submission_id}/questions',
+        'quiz_submission_id, include',
+        payload=('include',),
+        choices={'include': ('quiz_question',)},
+        doc="""
     Get a list of all the question records for this quiz submission.
     
     <b>200 OK</b> response code is returned if the request was successful.
@@ -15,22 +21,13 @@ def get_all_quiz_submission_questions(request_ctx, quiz_submission_id, include,
         :return: Get all quiz submission questions.
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('quiz_question')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_quiz_submission_question(request_ctx, quiz_submission_id, id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_quiz_submission_question', 'GET', '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}',
+        'quiz_submission_id, id, include',
+        payload=('include',),
+        choices={'include': ('quiz_question',)},
+        doc="""
     Get a single question record.
     
     <b>200 OK</b> response code is returned if the request was successful.
@@ -46,22 +43,12 @@ def get_single_quiz_submission_question(request_ctx, quiz_submission_id, id, inc
         :return: Get a single quiz submission question.
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('quiz_question')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def answering_question(request_ctx, quiz_submission_id, id, attempt, validation_token, access_code=None, answer=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'answering_question', 'PUT', '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}',
+        'quiz_submission_id, id, attempt, validation_token, access_code=None, answer=None',
+        payload=('attempt', 'validation_token', 'access_code', 'answer'),
+        doc="""
     Provide or modify an answer to a QuizQuestion.
 
         :param request_ctx: The request context
@@ -81,23 +68,12 @@ def answering_question(request_ctx, quiz_submission_id, id, attempt, validation_
         :return: Answering a question.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}'
-    payload = {
-        'attempt' : attempt,
-        'validation_token' : validation_token,
-        'access_code' : access_code,
-        'answer' : answer,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def flagging_question(request_ctx, quiz_submission_id, id, attempt, validation_token, access_code=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'flagging_question', 'PUT', '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}/flag',
+        'quiz_submission_id, id, attempt, validation_token, access_code=None',
+        payload=('attempt', 'validation_token', 'access_code'),
+        doc="""
     Set a flag on a quiz question to indicate that you want to return to it
     later.
 
@@ -116,22 +92,12 @@ def flagging_question(request_ctx, quiz_submission_id, id, attempt, validation_t
         :return: Flagging a question.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}/flag'
-    payload = {
-        'attempt' : attempt,
-        'validation_token' : validation_token,
-        'access_code' : access_code,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def unflagging_question(request_ctx, quiz_submission_id, id, attempt, validation_token, access_code=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'unflagging_question', 'PUT', '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}/unflag',
+        'quiz_submission_id, id, attempt, validation_token, access_code=None',
+        payload=('attempt', 'validation_token', 'access_code'),
+        doc="""
     Remove the flag that you previously set on a quiz question after you've
     returned to it.
 
@@ -150,17 +116,7 @@ def unflagging_question(request_ctx, quiz_submission_id, id, attempt, validation
         :return: Unflagging a question.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}/unflag'
-    payload = {
-        'attempt' : attempt,
-        'validation_token' : validation_token,
-        'access_code' : access_code,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
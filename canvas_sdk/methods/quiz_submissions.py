@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def get_all_quiz_submissions(request_ctx, course_id, quiz_id, include, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'get_all_quiz_submissions', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions',
+        'course_id, quiz_id, include',
+        payload=('include',),
+        choices={'include': ('submission', 'quiz', 'user')},
+        doc="""
     Get a list of all submissions for this quiz.
     
     <b>200 OK</b> response code is returned if the request was successful.
@@ -17,22 +23,13 @@ def get_all_quiz_submissions(request_ctx, course_id, quiz_id, include, **request
         :return: Get all quiz submissions.
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('submission', 'quiz', 'user')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_quiz_submission(request_ctx, course_id, quiz_id, id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_quiz_submission', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}',
+        'course_id, quiz_id, id, include',
+        payload=('include',),
+        choices={'include': ('submission', 'quiz', 'user')},
+        doc="""
     Get a single quiz submission.
     
     <b>200 OK</b> response code is returned if the request was successful.
@@ -50,22 +47,12 @@ def get_single_quiz_submission(request_ctx, course_id, quiz_id, id, include, **r
         :return: Get a single quiz submission.
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('submission', 'quiz', 'user')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_quiz_submission_start_quiz_taking_session(request_ctx, course_id, quiz_id, access_code=None, preview=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_quiz_submission_start_quiz_taking_session', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions',
+        'course_id, quiz_id, access_code=None, preview=None',
+        payload=('access_code', 'preview'),
+        doc="""
     Start taking a Quiz by creating a QuizSubmission which you can use to answer
     questions and submit your answers.
     
@@ -90,21 +77,12 @@ def create_quiz_submission_start_quiz_taking_session(request_ctx, course_id, qui
         :return: Create the quiz submission (start a quiz-taking session)
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions'
-    payload = {
-        'access_code' : access_code,
-        'preview' : preview,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_student_question_scores_and_comments(request_ctx, course_id, quiz_id, id, attempt, fudge_points=None, questions=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_student_question_scores_and_comments', 'PUT', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}',
+        'course_id, quiz_id, id, attempt, fudge_points=None, questions=None',
+        payload=('attempt', 'fudge_points', 'questions'),
+        doc="""
     Update the amount of points a student has scored for questions they've
     answered, provide comments for the student about their answer(s), or simply
     fudge the total score by a specific amount of points.
@@ -133,22 +111,12 @@ def update_student_question_scores_and_comments(request_ctx, course_id, quiz_id,
         :return: Update student question scores and comments.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}'
-    payload = {
-        'attempt' : attempt,
-        'fudge_points' : fudge_points,
-        'questions' : questions,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def complete_quiz_submission_turn_it_in(request_ctx, course_id, quiz_id, id, attempt, validation_token, access_code=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'complete_quiz_submission_turn_it_in', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}/complete',
+        'course_id, quiz_id, id, attempt, validation_token, access_code=None',
+        payload=('attempt', 'validation_token', 'access_code'),
+        doc="""
     Complete the quiz submission by marking it as complete and grading it. When
     the quiz submission has been marked as complete, no further modifications
     will be allowed.
@@ -180,17 +148,7 @@ def complete_quiz_submission_turn_it_in(request_ctx, course_id, quiz_id, id, att
         :return: Complete the quiz submission (turn it in).
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}/complete'
-    payload = {
-        'attempt' : attempt,
-        'validation_token' : validation_token,
-        'access_code' : access_code,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_quizzes_in_course(request_ctx, course_id, search_term=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_quizzes_in_course', 'GET', '/v1/courses/{course_id}/quizzes',
+        'course_id, search_term=None, per_page=None',
+        payload=('search_term', 'per_page'),
+        doc="""
     Returns the list of Quizzes in this course.
 
         :param request_ctx: The request context
@@ -15,23 +20,11 @@ def list_quizzes_in_course(request_ctx, course_id, search_term=None, per_page=No
         :return: List quizzes in a course
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/quizzes'
-    payload = {
-        'search_term' : search_term,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_quiz(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_quiz', 'GET', '/v1/courses/{course_id}/quizzes/{id}',
+        'course_id, id',
+        doc="""
     Returns the quiz with the given id.
 
         :param request_ctx: The request context
@@ -43,17 +36,23 @@ def get_single_quiz(request_ctx, course_id, id, **request_kwargs):
         :return: Get a single quiz
         :rtype: requests.Response (with Quiz data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_quiz(request_ctx, course_id, quiz_title, quiz_quiz_type, quiz_description=None, quiz_assignment_group_id=None, quiz_time_limit=None, quiz_shuffle_answers=None, quiz_hide_results=None, quiz_show_correct_answers=None, quiz_show_correct_answers_at=None, quiz_hide_correct_answers_at=None, quiz_allowed_attempts=None, quiz_scoring_policy=None, quiz_one_question_at_a_time=None, quiz_cant_go_back=None, quiz_access_code=None, quiz_ip_filter=None, quiz_due_at=None, quiz_lock_at=None, quiz_unlock_at=None, quiz_published=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_quiz', 'POST', '/v1/courses/{course_id}/quizzes',
+        'course_id, quiz_title, quiz_quiz_type, quiz_description=None, quiz_assignment_group_id=None, quiz_time_limit=None, quiz_shuffle_answers=None, quiz_hide_results=None, quiz_show_correct_answers=None, quiz_show_correct_answers_at=None, quiz_hide_correct_answers_at=None, quiz_allowed_attempts=None, quiz_scoring_policy=None, quiz_one_question_at_a_time=None, quiz_cant_go_back=None, quiz_access_code=None, quiz_ip_filter=None, quiz_due_at=None, quiz_lock_at=None, quiz_unlock_at=None, quiz_published=None',
+        payload=(
+            'quiz[title]', 'quiz[description]', 'quiz[quiz_type]', 'quiz[assignment_group_id]', 'quiz[time_limit]',
+            'quiz[shuffle_answers]', 'quiz[hide_results]', 'quiz[show_correct_answers]',
+            'quiz[show_correct_answers_at]', 'quiz[hide_correct_answers_at]', 'quiz[allowed_attempts]',
+            'quiz[scoring_policy]', 'quiz[one_question_at_a_time]', 'quiz[cant_go_back]', 'quiz[access_code]',
+            'quiz[ip_filter]', 'quiz[due_at]', 'quiz[lock_at]', 'quiz[unlock_at]', 'quiz[published]',
+        ),
+        choices={
+            'quiz_quiz_type': ('practice_quiz', 'assignment', 'graded_survey', 'survey'),
+            'quiz_hide_results': ('always', 'until_after_last_attempt'),
+            'quiz_scoring_policy': ('keep_highest', 'keep_latest'),
+        },
+        doc="""
     Create a new quiz for this course.
 
         :param request_ctx: The request context
@@ -103,45 +102,12 @@ def create_quiz(request_ctx, course_id, quiz_title, quiz_quiz_type, quiz_descrip
         :return: Create a quiz
         :rtype: requests.Response (with Quiz data)
 
-    """
-
-    quiz_quiz_type_types = ('practice_quiz', 'assignment', 'graded_survey', 'survey')
-    quiz_hide_results_types = ('always', 'until_after_last_attempt')
-    quiz_scoring_policy_types = ('keep_highest', 'keep_latest')
-    utils.validate_attr_is_acceptable(quiz_quiz_type, quiz_quiz_type_types)
-    utils.validate_attr_is_acceptable(quiz_hide_results, quiz_hide_results_types)
-    utils.validate_attr_is_acceptable(quiz_scoring_policy, quiz_scoring_policy_types)
-    path = '/v1/courses/{course_id}/quizzes'
-    payload = {
-        'quiz[title]' : quiz_title,
-        'quiz[description]' : quiz_description,
-        'quiz[quiz_type]' : quiz_quiz_type,
-        'quiz[assignment_group_id]' : quiz_assignment_group_id,
-        'quiz[time_limit]' : quiz_time_limit,
-        'quiz[shuffle_answers]' : quiz_shuffle_answers,
-        'quiz[hide_results]' : quiz_hide_results,
-        'quiz[show_correct_answers]' : quiz_show_correct_answers,
-        'quiz[show_correct_answers_at]' : quiz_show_correct_answers_at,
-        'quiz[hide_correct_answers_at]' : quiz_hide_correct_answers_at,
-        'quiz[allowed_attempts]' : quiz_allowed_attempts,
-        'quiz[scoring_policy]' : quiz_scoring_policy,
-        'quiz[one_question_at_a_time]' : quiz_one_question_at_a_time,
-        'quiz[cant_go_back]' : quiz_cant_go_back,
-        'quiz[access_code]' : quiz_access_code,
-        'quiz[ip_filter]' : quiz_ip_filter,
-        'quiz[due_at]' : quiz_due_at,
-        'quiz[lock_at]' : quiz_lock_at,
-        'quiz[unlock_at]' : quiz_unlock_at,
-        'quiz[published]' : quiz_published,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def edit_quiz(request_ctx, course_id, id, quiz_notify_of_update, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_quiz', 'PUT', '/v1/courses/{course_id}/quizzes/{id}',
+        'course_id, id, quiz_notify_of_update',
+        payload=('quiz[notify_of_update]',),
+        doc="""
     Modify an existing quiz. See the documentation for quiz creation.
     
     Additional arguments:
@@ -157,20 +123,11 @@ def edit_quiz(request_ctx, course_id, id, quiz_notify_of_update, **request_kwarg
         :return: Edit a quiz
         :rtype: requests.Response (with Quiz data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{id}'
-    payload = {
-        'quiz[notify_of_update]' : quiz_notify_of_update,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_quiz(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_quiz', 'DELETE', '/v1/courses/{course_id}/quizzes/{id}',
+        'course_id, id',
+        doc="""
 
         :param request_ctx: The request context
         :type request_ctx: :class:RequestContext
@@ -181,17 +138,13 @@ def delete_quiz(request_ctx, course_id, id, **request_kwargs):
         :return: Delete a quiz
         :rtype: requests.Response (with Quiz data)
 
-    """
-
-    path = '/v1/courses/{course_id}/quizzes/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def reorder_quiz_items(request_ctx, course_id, id, order_id, order_type, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'reorder_quiz_items', 'POST', '/v1/courses/{course_id}/quizzes/{id}/reorder',
+        'course_id, id, order_id, order_type',
+        payload=('order[id]', 'order[type]'),
+        choices={'order_type': ('question', 'group')},
+        doc="""
     Change order of the quiz questions or groups within the quiz
     
     <b>204 No Content<b> response code is returned if the reorder was successful.
@@ -209,18 +162,7 @@ def reorder_quiz_items(request_ctx, course_id, id, order_id, order_type, **reque
         :return: Reorder quiz items
         :rtype: requests.Response (with void data)
 
-    """
-
-    order_type_types = ('question', 'group')
-    utils.validate_attr_is_acceptable(order_type, order_type_types)
-    path = '/v1/courses/{course_id}/quizzes/{id}/reorder'
-    payload = {
-        'order[id]' : order_id,
-        'order[type]' : order_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
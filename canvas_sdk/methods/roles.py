@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_roles(request_ctx, account_id, state, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_roles', 'GET', '/v1/accounts/{account_id}/roles',
+        'account_id, state, per_page=None',
+        payload=('state[]', 'per_page'),
+        choices={'state': ('active', 'inactive')},
+        doc="""
     List the roles available to an account.
 
         :param request_ctx: The request context
@@ -15,25 +21,11 @@ def list_roles(request_ctx, account_id, state, per_page=None, **request_kwargs):
         :return: List roles
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('active', 'inactive')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/accounts/{account_id}/roles'
-    payload = {
-        'state[]' : state,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_role(request_ctx, account_id, role, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_role', 'GET', '/v1/accounts/{account_id}/roles/{role}',
+        'account_id, role',
+        doc="""
     Retrieve information about a single role
 
         :param request_ctx: The request context
@@ -45,13 +37,45 @@ def get_single_role(request_ctx, account_id, role, **request_kwargs):
         :return: Get a single role
         :rtype: requests.Response (with Role data)
 
-    """
+    """),
+    Endpoint(
+        'deactivate_role', 'DELETE', '/v1/accounts/{account_id}/roles/{role}',
+        'account_id, role',
+        doc="""
+    Deactivates a custom role.  This hides it in the user interface and prevents it
+    from being assigned to new users.  Existing users assigned to the role will
+    continue to function with the same permissions they had previously.
+    Built-in roles cannot be deactivated.
 
-    path = '/v1/accounts/{account_id}/roles/{role}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, role=role)
-    response = client.get(request_ctx, url, **request_kwargs)
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param account_id: (required) ID
+        :type account_id: string
+        :param role: (required) Label and unique identifier for the role.
+        :type role: string
+        :return: Deactivate a role
+        :rtype: requests.Response (with Role data)
 
-    return response
+    """),
+    Endpoint(
+        'activate_role', 'POST', '/v1/accounts/{account_id}/roles/{role}/activate',
+        'account_id, role',
+        doc="""
+    Re-activates an inactive role (allowing it to be assigned to new users)
+
+        :param request_ctx: The request context
+        :type request_ctx: :class:RequestContext
+        :param account_id: (required) ID
+        :type account_id: string
+        :param role: (required) Label and unique identifier for the role.
+        :type role: string
+        :return: Activate a role
+        :rtype: requests.Response (with Role data)
+
+    """),
+]
+
+build_methods(ENDPOINTS, globals())
 
 
 def create_new_role(request_ctx, account_id, role, base_role_type=None, permissions={}, **request_kwargs):
@@ -91,53 +115,6 @@ def create_new_role(request_ctx, account_id, role, base_role_type=None, permissi
     return response
 
 
-def deactivate_role(request_ctx, account_id, role, **request_kwargs):
-    """
-    Deactivates a custom role.  This hides it in the user interface and prevents it
-    from being assigned to new users.  Existing users assigned to the role will
-    continue to function with the same permissions they had previously.
-    Built-in roles cannot be deactivated.
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param account_id: (required) ID
-        :type account_id: string
-        :param role: (required) Label and unique identifier for the role.
-        :type role: string
-        :return: Deactivate a role
-        :rtype: requests.Response (with Role data)
-
-    """
-
-    path = '/v1/accounts/{account_id}/roles/{role}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, role=role)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def activate_role(request_ctx, account_id, role, **request_kwargs):
-    """
-    Re-activates an inactive role (allowing it to be assigned to new users)
-
-        :param request_ctx: The request context
-        :type request_ctx: :class:RequestContext
-        :param account_id: (required) ID
-        :type account_id: string
-        :param role: (required) Label and unique identifier for the role.
-        :type role: string
-        :return: Activate a role
-        :rtype: requests.Response (with Role data)
-
-    """
-
-    path = '/v1/accounts/{account_id}/roles/{role}/activate'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, role=role)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
 def update_role(request_ctx, account_id, role, label=None, permissions={}, **request_kwargs):
     """
     Update permissions for an existing role.
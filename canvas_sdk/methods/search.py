@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def find_recipients_conversations(request_ctx, search, context, exclude, type, user_id, from_conversation_id, permissions, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'find_recipients_conversations', 'GET', '/v1/conversations/find_recipients',
+        'search, context, exclude, type, user_id, from_conversation_id, permissions',
+        payload=('search', 'context', 'exclude', 'type', 'user_id', 'from_conversation_id', 'permissions'),
+        choices={'type': ('user', 'context')},
+        doc="""
     Find valid recipients (users, courses and groups) that the current user
     can send messages to. The /api/v1/search/recipients path is the preferred
     endpoint, /api/v1/conversations/find_recipients is deprecated.
@@ -27,28 +33,13 @@ def find_recipients_conversations(request_ctx, search, context, exclude, type, u
         :return: Find recipients
         :rtype: requests.Response (with void data)
 
-    """
-
-    type_types = ('user', 'context')
-    utils.validate_attr_is_acceptable(type, type_types)
-    path = '/v1/conversations/find_recipients'
-    payload = {
-        'search' : search,
-        'context' : context,
-        'exclude' : exclude,
-        'type' : type,
-        'user_id' : user_id,
-        'from_conversation_id' : from_conversation_id,
-        'permissions' : permissions,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def find_recipients_search(request_ctx, search, context, exclude, type, user_id, from_conversation_id, permissions, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'find_recipients_search', 'GET', '/v1/search/recipients',
+        'search, context, exclude, type, user_id, from_conversation_id, permissions',
+        payload=('search', 'context', 'exclude', 'type', 'user_id', 'from_conversation_id', 'permissions'),
+        choices={'type': ('user', 'context')},
+        doc="""
     Find valid recipients (users, courses and groups) that the current user
     can send messages to. The /api/v1/search/recipients path is the preferred
     endpoint, /api/v1/conversations/find_recipients is deprecated.
@@ -74,23 +65,7 @@ def find_recipients_search(request_ctx, search, context, exclude, type, user_id,
         :return: Find recipients
         :rtype: requests.Response (with void data)
 
-    """
-
-    type_types = ('user', 'context')
-    utils.validate_attr_is_acceptable(type, type_types)
-    path = '/v1/search/recipients'
-    payload = {
-        'search' : search,
-        'context' : context,
-        'exclude' : exclude,
-        'type' : type,
-        'user_id' : user_id,
-        'from_conversation_id' : from_conversation_id,
-        'permissions' : permissions,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
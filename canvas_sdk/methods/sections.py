@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_course_sections(request_ctx, course_id, include=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_course_sections', 'GET', '/v1/courses/{course_id}/sections',
+        'course_id, include=None, per_page=None',
+        payload=('include[]', 'per_page'),
+        choices={'include': ('students', 'avatar_url')},
+        doc="""
     Returns the list of sections for this course.
 
         :param request_ctx: The request context
@@ -15,25 +21,15 @@ def list_course_sections(request_ctx, course_id, include=None, per_page=None, **
         :return: List course sections
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('students', 'avatar_url')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/sections'
-    payload = {
-        'include[]' : include,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def create_course_section(request_ctx, course_id, course_section_name, course_section_sis_section_id=None, course_section_start_at=None, course_section_end_at=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_course_section', 'POST', '/v1/courses/{course_id}/sections',
+        'course_id, course_section_name, course_section_sis_section_id=None, course_section_start_at=None, course_section_end_at=None',
+        payload=(
+            'course_section[name]', 'course_section[sis_section_id]', 'course_section[start_at]',
+            'course_section[end_at]',
+        ),
+        doc="""
     Creates a new section for this course.
 
         :param request_ctx: The request context
@@ -51,23 +47,11 @@ def create_course_section(request_ctx, course_id, course_section_name, course_se
         :return: Create course section
         :rtype: requests.Response (with Section data)
 
-    """
-
-    path = '/v1/courses/{course_id}/sections'
-    payload = {
-        'course_section[name]' : course_section_name,
-        'course_section[sis_section_id]' : course_section_sis_section_id,
-        'course_section[start_at]' : course_section_start_at,
-        'course_section[end_at]' : course_section_end_at,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def cross_list_section(request_ctx, id, new_course_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'cross_list_section', 'POST', '/v1/sections/{id}/crosslist/{new_course_id}',
+        'id, new_course_id',
+        doc="""
     Move the Section to another course.  The new course may be in a different account (department),
     but must belong to the same root account (institution).
 
@@ -80,17 +64,11 @@ def cross_list_section(request_ctx, id, new_course_id, **request_kwargs):
         :return: Cross-list a Section
         :rtype: requests.Response (with Section data)
 
-    """
-
-    path = '/v1/sections/{id}/crosslist/{new_course_id}'
-    url = request_ctx.base_api_url + path.format(id=id, new_course_id=new_course_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def de_cross_list_section(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'de_cross_list_section', 'DELETE', '/v1/sections/{id}/crosslist',
+        'id',
+        doc="""
     Undo cross-listing of a Section, returning it to its original course.
 
         :param request_ctx: The request context
@@ -100,17 +78,15 @@ def de_cross_list_section(request_ctx, id, **request_kwargs):
         :return: De-cross-list a Section
         :rtype: requests.Response (with Section data)
 
-    """
-
-    path = '/v1/sections/{id}/crosslist'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def edit_section(request_ctx, id, course_section_name=None, course_section_sis_section_id=None, course_section_start_at=None, course_section_end_at=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_section', 'PUT', '/v1/sections/{id}',
+        'id, course_section_name=None, course_section_sis_section_id=None, course_section_start_at=None, course_section_end_at=None',
+        payload=(
+            'course_section[name]', 'course_section[sis_section_id]', 'course_section[start_at]',
+            'course_section[end_at]',
+        ),
+        doc="""
     Modify an existing section. See the documentation for `SectionsController#create <https://github.com/instructure/canvas-lms/blob/master/app/controllers/sections_controller.rb>`_.
     :param request_ctx: The request context
     :type request_ctx: :class:RequestContext
@@ -126,21 +102,11 @@ def edit_section(request_ctx, id, course_section_name=None, course_section_sis_s
     :type course_section_end_at: datetime or None
     :return: Edit a section
     :rtype: requests.Response (with Section data)
-    """
-    path = '/v1/sections/{id}'
-    payload = {
-        'course_section[name]' : course_section_name,
-        'course_section[sis_section_id]' : course_section_sis_section_id,
-        'course_section[start_at]' : course_section_start_at,
-        'course_section[end_at]' : course_section_end_at,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-    return response
-
-
-def get_section_information_courses(request_ctx, course_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_section_information_courses', 'GET', '/v1/courses/{course_id}/sections/{id}',
+        'course_id, id',
+        doc="""
     Gets details about a specific section
 
         :param request_ctx: The request context
@@ -152,17 +118,11 @@ def get_section_information_courses(request_ctx, course_id, id, **request_kwargs
         :return: Get section information
         :rtype: requests.Response (with Section data)
 
-    """
-
-    path = '/v1/courses/{course_id}/sections/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_section_information_sections(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_section_information_sections', 'GET', '/v1/sections/{id}',
+        'id',
+        doc="""
     Gets details about a specific section
 
         :param request_ctx: The request context
@@ -172,17 +132,11 @@ def get_section_information_sections(request_ctx, id, **request_kwargs):
         :return: Get section information
         :rtype: requests.Response (with Section data)
 
-    """
-
-    path = '/v1/sections/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def delete_section(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_section', 'DELETE', '/v1/sections/{id}',
+        'id',
+        doc="""
     Delete an existing section.  Returns the former Section.
 
         :param request_ctx: The request context
@@ -192,12 +146,7 @@ def delete_section(request_ctx, id, **request_kwargs):
         :return: Delete a section
         :rtype: requests.Response (with Section data)
 
-    """
-
-    path = '/v1/sections/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def get_kaltura_config(request_ctx, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'get_kaltura_config', 'GET', '/v1/services/kaltura',
+        '',
+        doc="""
     Return the config information for the Kaltura plugin in json format.
 
         :param request_ctx: The request context
@@ -9,17 +13,11 @@ def get_kaltura_config(request_ctx, **request_kwargs):
         :return: Get Kaltura config
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/services/kaltura'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def start_kaltura_session(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'start_kaltura_session', 'POST', '/v1/services/kaltura_session',
+        '',
+        doc="""
     Start a new Kaltura session, so that new media can be recorded and uploaded
     to this Canvas instance's Kaltura instance.
 
@@ -28,12 +26,7 @@ def start_kaltura_session(request_ctx, **request_kwargs):
         :return: Start Kaltura session
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/services/kaltura_session'
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
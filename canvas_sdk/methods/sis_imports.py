@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def get_sis_import_list(request_ctx, account_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'get_sis_import_list', 'GET', '/v1/accounts/{account_id}/sis_imports',
+        'account_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Returns the list of SIS imports for an account
     
       Examples:
@@ -17,22 +22,15 @@ def get_sis_import_list(request_ctx, account_id, per_page=None, **request_kwargs
         :return: Get SIS import list
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/sis_imports'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def import_sis_data(request_ctx, account_id, attachment, import_type=None, extension=None, batch_mode=None, batch_mode_term_id=None, override_sis_stickiness=None, add_sis_stickiness=None, clear_sis_stickiness=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'import_sis_data', 'POST', '/v1/accounts/{account_id}/sis_imports',
+        'account_id, attachment, import_type=None, extension=None, batch_mode=None, batch_mode_term_id=None, override_sis_stickiness=None, add_sis_stickiness=None, clear_sis_stickiness=None',
+        payload=(
+            'import_type', 'attachment', 'extension', 'batch_mode', 'batch_mode_term_id', 'override_sis_stickiness',
+            'add_sis_stickiness', 'clear_sis_stickiness',
+        ),
+        doc="""
     Import SIS data into Canvas. Must be on a root account with SIS imports
     enabled.
     
@@ -62,27 +60,11 @@ def import_sis_data(request_ctx, account_id, attachment, import_type=None, exten
         :return: Import SIS data
         :rtype: requests.Response (with SisImport data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/sis_imports'
-    payload = {
-        'import_type' : import_type,
-        'attachment' : attachment,
-        'extension' : extension,
-        'batch_mode' : batch_mode,
-        'batch_mode_term_id' : batch_mode_term_id,
-        'override_sis_stickiness' : override_sis_stickiness,
-        'add_sis_stickiness' : add_sis_stickiness,
-        'clear_sis_stickiness' : clear_sis_stickiness,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_sis_import_status(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_sis_import_status', 'GET', '/v1/accounts/{account_id}/sis_imports/{id}',
+        'account_id, id',
+        doc="""
     Get the status of an already created SIS import.
     
       Examples:
@@ -98,12 +80,7 @@ def get_sis_import_status(request_ctx, account_id, id, **request_kwargs):
         :return: Get SIS import status
         :rtype: requests.Response (with SisImport data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/sis_imports/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
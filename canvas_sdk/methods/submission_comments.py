@@ -1,7 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.engine import Endpoint, build_methods
 
-def upload_file(request_ctx, course_id, assignment_id, user_id, **request_kwargs):
-    """
+ENDPOINTS = [
+    Endpoint(
+        'upload_file', 'POST', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}/comments/files',
+        'course_id, assignment_id, user_id',
+        doc="""
     Upload a file to attach to a submission comment
     
     See the {file:file_uploads.html File Upload Documentation} for details on the file upload workflow.
@@ -21,12 +25,7 @@ def upload_file(request_ctx, course_id, assignment_id, user_id, **request_kwargs
         :return: Upload a file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}/comments/files'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
@@ -1,7 +1,19 @@
 from canvas_sdk import client, utils
-
-def submit_assignment_courses(request_ctx, course_id, assignment_id, submission_submission_type, comment_text_comment=None, submission_body=None, submission_url=None, submission_file_ids=None, submission_media_comment_id=None, submission_media_comment_type=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'submit_assignment_courses', 'POST', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions',
+        'course_id, assignment_id, submission_submission_type, comment_text_comment=None, submission_body=None, submission_url=None, submission_file_ids=None, submission_media_comment_id=None, submission_media_comment_type=None',
+        payload=(
+            'comment[text_comment]', 'submission[submission_type]', 'submission[body]', 'submission[url]',
+            'submission[file_ids]', 'submission[media_comment_id]', 'submission[media_comment_type]',
+        ),
+        choices={
+            'submission_submission_type': ('online_text_entry', 'online_url', 'online_upload', 'media_recording'),
+            'submission_media_comment_type': ('audio', 'video'),
+        },
+        doc="""
     Make a submission for an assignment. You must be enrolled as a student in
     the course/section to do this.
     
@@ -35,30 +47,19 @@ def submit_assignment_courses(request_ctx, course_id, assignment_id, submission_
         :return: Submit an assignment
         :rtype: requests.Response (with void data)
 
-    """
-
-    submission_submission_type_types = ('online_text_entry', 'online_url', 'online_upload', 'media_recording')
-    submission_media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(submission_submission_type, submission_submission_type_types)
-    utils.validate_attr_is_acceptable(submission_media_comment_type, submission_media_comment_type_types)
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'comment[text_comment]' : comment_text_comment,
-        'submission[submission_type]' : submission_submission_type,
-        'submission[body]' : submission_body,
-        'submission[url]' : submission_url,
-        'submission[file_ids]' : submission_file_ids,
-        'submission[media_comment_id]' : submission_media_comment_id,
-        'submission[media_comment_type]' : submission_media_comment_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def submit_assignment_sections(request_ctx, section_id, assignment_id, submission_submission_type, comment_text_comment=None, submission_body=None, submission_url=None, submission_file_ids=None, submission_media_comment_id=None, submission_media_comment_type=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'submit_assignment_sections', 'POST', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions',
+        'section_id, assignment_id, submission_submission_type, comment_text_comment=None, submission_body=None, submission_url=None, submission_file_ids=None, submission_media_comment_id=None, submission_media_comment_type=None',
+        payload=(
+            'comment[text_comment]', 'submission[submission_type]', 'submission[body]', 'submission[url]',
+            'submission[file_ids]', 'submission[media_comment_id]', 'submission[media_comment_type]',
+        ),
+        choices={
+            'submission_submission_type': ('online_text_entry', 'online_url', 'online_upload', 'media_recording'),
+            'submission_media_comment_type': ('audio', 'video'),
+        },
+        doc="""
     Make a submission for an assignment. You must be enrolled as a student in
     the course/section to do this.
     
@@ -92,30 +93,13 @@ def submit_assignment_sections(request_ctx, section_id, assignment_id, submissio
         :return: Submit an assignment
         :rtype: requests.Response (with void data)
 
-    """
-
-    submission_submission_type_types = ('online_text_entry', 'online_url', 'online_upload', 'media_recording')
-    submission_media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(submission_submission_type, submission_submission_type_types)
-    utils.validate_attr_is_acceptable(submission_media_comment_type, submission_media_comment_type_types)
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'comment[text_comment]' : comment_text_comment,
-        'submission[submission_type]' : submission_submission_type,
-        'submission[body]' : submission_body,
-        'submission[url]' : submission_url,
-        'submission[file_ids]' : submission_file_ids,
-        'submission[media_comment_id]' : submission_media_comment_id,
-        'submission[media_comment_type]' : submission_media_comment_type,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_assignment_submissions_courses(request_ctx, course_id, assignment_id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_assignment_submissions_courses', 'GET', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions',
+        'course_id, assignment_id, include',
+        payload=('include',),
+        choices={'include': ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment')},
+        doc="""
     Get all existing submissions for an assignment.
 
         :param request_ctx: The request context
@@ -129,22 +113,13 @@ def list_assignment_submissions_courses(request_ctx, course_id, assignment_id, i
         :return: List assignment submissions
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_assignment_submissions_sections(request_ctx, section_id, assignment_id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_assignment_submissions_sections', 'GET', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions',
+        'section_id, assignment_id, include',
+        payload=('include',),
+        choices={'include': ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment')},
+        doc="""
     Get all existing submissions for an assignment.
 
         :param request_ctx: The request context
@@ -158,22 +133,15 @@ def list_assignment_submissions_sections(request_ctx, section_id, assignment_id,
         :return: List assignment submissions
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_submissions_for_multiple_assignments_courses(request_ctx, course_id, student_ids, assignment_ids, grouped, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_submissions_for_multiple_assignments_courses', 'GET', '/v1/courses/{course_id}/students/submissions',
+        'course_id, student_ids, assignment_ids, grouped, include',
+        payload=('student_ids', 'assignment_ids', 'grouped', 'include'),
+        choices={
+            'include': ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment', 'total_scores'),
+        },
+        doc="""
     Get all existing submissions for a given set of students and assignments.
 
         :param request_ctx: The request context
@@ -191,25 +159,15 @@ def list_submissions_for_multiple_assignments_courses(request_ctx, course_id, st
         :return: List submissions for multiple assignments
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment', 'total_scores')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/students/submissions'
-    payload = {
-        'student_ids' : student_ids,
-        'assignment_ids' : assignment_ids,
-        'grouped' : grouped,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_submissions_for_multiple_assignments_sections(request_ctx, section_id, student_ids, assignment_ids, grouped, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_submissions_for_multiple_assignments_sections', 'GET', '/v1/sections/{section_id}/students/submissions',
+        'section_id, student_ids, assignment_ids, grouped, include',
+        payload=('student_ids', 'assignment_ids', 'grouped', 'include'),
+        choices={
+            'include': ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment', 'total_scores'),
+        },
+        doc="""
     Get all existing submissions for a given set of students and assignments.
 
         :param request_ctx: The request context
@@ -227,25 +185,13 @@ def list_submissions_for_multiple_assignments_sections(request_ctx, section_id,
         :return: List submissions for multiple assignments
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment', 'total_scores')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/sections/{section_id}/students/submissions'
-    payload = {
-        'student_ids' : student_ids,
-        'assignment_ids' : assignment_ids,
-        'grouped' : grouped,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_submission_courses(request_ctx, course_id, assignment_id, user_id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_submission_courses', 'GET', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}',
+        'course_id, assignment_id, user_id, include',
+        payload=('include',),
+        choices={'include': ('submission_history', 'submission_comments', 'rubric_assessment')},
+        doc="""
     Get a single submission, based on user id.
 
         :param request_ctx: The request context
@@ -261,22 +207,13 @@ def get_single_submission_courses(request_ctx, course_id, assignment_id, user_id
         :return: Get a single submission
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def get_single_submission_sections(request_ctx, section_id, assignment_id, user_id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_single_submission_sections', 'GET', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}',
+        'section_id, assignment_id, user_id, include',
+        payload=('include',),
+        choices={'include': ('submission_history', 'submission_comments', 'rubric_assessment')},
+        doc="""
     Get a single submission, based on user id.
 
         :param request_ctx: The request context
@@ -292,22 +229,11 @@ def get_single_submission_sections(request_ctx, section_id, assignment_id, user_
         :return: Get a single submission
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def upload_file_courses(request_ctx, course_id, assignment_id, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'upload_file_courses', 'POST', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}/files',
+        'course_id, assignment_id, user_id',
+        doc="""
     Upload a file to a submission.
     
     This API endpoint is the first step in uploading a file to a submission as a student.
@@ -328,17 +254,11 @@ def upload_file_courses(request_ctx, course_id, assignment_id, user_id, **reques
         :return: Upload a file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}/files'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def upload_file_sections(request_ctx, section_id, assignment_id, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'upload_file_sections', 'POST', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}/files',
+        'section_id, assignment_id, user_id',
+        doc="""
     Upload a file to a submission.
     
     This API endpoint is the first step in uploading a file to a submission as a student.
@@ -359,17 +279,16 @@ def upload_file_sections(request_ctx, section_id, assignment_id, user_id, **requ
         :return: Upload a file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}/files'
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def grade_or_comment_on_submission_courses(request_ctx, course_id, assignment_id, user_id, comment_text_comment=None, comment_group_comment=None, comment_media_comment_id=None, comment_media_comment_type=None, comment_file_ids=None, submission_posted_grade=None, rubric_assessment=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'grade_or_comment_on_submission_courses', 'PUT', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}',
+        'course_id, assignment_id, user_id, comment_text_comment=None, comment_group_comment=None, comment_media_comment_id=None, comment_media_comment_type=None, comment_file_ids=None, submission_posted_grade=None, rubric_assessment=None',
+        payload=(
+            'comment[text_comment]', 'comment[group_comment]', 'comment[media_comment_id]',
+            'comment[media_comment_type]', 'comment[file_ids]', 'submission[posted_grade]', 'rubric_assessment',
+        ),
+        choices={'comment_media_comment_type': ('audio', 'video')},
+        doc="""
     Comment on and/or update the grading for a student's assignment submission.
     If any submission or rubric_assessment arguments are provided, the user
     must have permission to manage grades in the appropriate context (course or
@@ -400,28 +319,16 @@ def grade_or_comment_on_submission_courses(request_ctx, course_id, assignment_id
         :return: Grade or comment on a submission
         :rtype: requests.Response (with void data)
 
-    """
-
-    comment_media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(comment_media_comment_type, comment_media_comment_type_types)
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}'
-    payload = {
-        'comment[text_comment]' : comment_text_comment,
-        'comment[group_comment]' : comment_group_comment,
-        'comment[media_comment_id]' : comment_media_comment_id,
-        'comment[media_comment_type]' : comment_media_comment_type,
-        'comment[file_ids]' : comment_file_ids,
-        'submission[posted_grade]' : submission_posted_grade,
-        'rubric_assessment' : rubric_assessment,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def grade_or_comment_on_submission_sections(request_ctx, section_id, assignment_id, user_id, comment_text_comment=None, comment_group_comment=None, comment_media_comment_id=None, comment_media_comment_type=None, comment_file_ids=None, submission_posted_grade=None, rubric_assessment=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'grade_or_comment_on_submission_sections', 'PUT', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}',
+        'section_id, assignment_id, user_id, comment_text_comment=None, comment_group_comment=None, comment_media_comment_id=None, comment_media_comment_type=None, comment_file_ids=None, submission_posted_grade=None, rubric_assessment=None',
+        payload=(
+            'comment[text_comment]', 'comment[group_comment]', 'comment[media_comment_id]',
+            'comment[media_comment_type]', 'comment[file_ids]', 'submission[posted_grade]', 'rubric_assessment',
+        ),
+        choices={'comment_media_comment_type': ('audio', 'video')},
+        doc="""
     Comment on and/or update the grading for a student's assignment submission.
     If any submission or rubric_assessment arguments are provided, the user
     must have permission to manage grades in the appropriate context (course or
@@ -452,23 +359,7 @@ def grade_or_comment_on_submission_sections(request_ctx, section_id, assignment_
         :return: Grade or comment on a submission
         :rtype: requests.Response (with void data)
 
-    """
-
-    comment_media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(comment_media_comment_type, comment_media_comment_type_types)
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}'
-    payload = {
-        'comment[text_comment]' : comment_text_comment,
-        'comment[group_comment]' : comment_group_comment,
-        'comment[media_comment_id]' : comment_media_comment_id,
-        'comment[media_comment_type]' : comment_media_comment_type,
-        'comment[file_ids]' : comment_file_ids,
-        'submission[posted_grade]' : submission_posted_grade,
-        'rubric_assessment' : rubric_assessment,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
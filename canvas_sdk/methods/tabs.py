@@ -1,7 +1,13 @@
 from canvas_sdk import client, utils
-
-def list_available_tabs_for_course_or_group_courses(request_ctx, course_id, include, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_available_tabs_for_course_or_group_courses', 'GET', '/v1/courses/{course_id}/tabs',
+        'course_id, include',
+        payload=('include',),
+        choices={'include': ('external',)},
+        doc="""
     Returns a list of navigation tabs available in the current context.
 
         :param request_ctx: The request context
@@ -13,22 +19,13 @@ def list_available_tabs_for_course_or_group_courses(request_ctx, course_id, incl
         :return: List available tabs for a course or group
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('external')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/tabs'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_available_tabs_for_course_or_group_groups(request_ctx, group_id, include, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_available_tabs_for_course_or_group_groups', 'GET', '/v1/groups/{group_id}/tabs',
+        'group_id, include',
+        payload=('include',),
+        choices={'include': ('external',)},
+        doc="""
     Returns a list of navigation tabs available in the current context.
 
         :param request_ctx: The request context
@@ -40,22 +37,12 @@ def list_available_tabs_for_course_or_group_groups(request_ctx, group_id, includ
         :return: List available tabs for a course or group
         :rtype: requests.Response (with void data)
 
-    """
-
-    include_types = ('external')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/groups/{group_id}/tabs'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_tab_for_course(request_ctx, course_id, tab_id, position, hidden, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_tab_for_course', 'PUT', '/v1/courses/{course_id}/tabs/{tab_id}',
+        'course_id, tab_id, position, hidden',
+        payload=('position', 'hidden'),
+        doc="""
     Home and Settings tabs are not manageable, and can't be hidden or moved
     
     Returns a tab object
@@ -73,16 +60,7 @@ def update_tab_for_course(request_ctx, course_id, tab_id, position, hidden, **re
         :return: Update a tab for a course
         :rtype: requests.Response (with Tab data)
 
-    """
-
-    path = '/v1/courses/{course_id}/tabs/{tab_id}'
-    payload = {
-        'position' : position,
-        'hidden' : hidden,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, tab_id=tab_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
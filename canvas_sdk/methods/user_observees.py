@@ -1,7 +1,12 @@
 from canvas_sdk import client, utils
-
-def list_observees(request_ctx, user_id, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_observees', 'GET', '/v1/users/{user_id}/observees',
+        'user_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     List the users that the given user is observing.
     
     *Note:* all users are allowed to list their own observees. Administrators can list
@@ -16,22 +21,12 @@ def list_observees(request_ctx, user_id, per_page=None, **request_kwargs):
         :return: List observees
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/observees'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def add_observee_with_credentials(request_ctx, user_id, observee_unique_id=None, observee_password=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'add_observee_with_credentials', 'POST', '/v1/users/{user_id}/observees',
+        'user_id, observee_unique_id=None, observee_password=None',
+        payload=('observee[unique_id]', 'observee[password]'),
+        doc="""
     Register the given user to observe another user, given the observee's credentials.
     
     *Note:* all users are allowed to add their own observees, given the observee's
@@ -49,21 +44,11 @@ def add_observee_with_credentials(request_ctx, user_id, observee_unique_id=None,
         :return: Add an observee with credentials
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/users/{user_id}/observees'
-    payload = {
-        'observee[unique_id]' : observee_unique_id,
-        'observee[password]' : observee_password,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def show_observee(request_ctx, user_id, observee_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'show_observee', 'GET', '/v1/users/{user_id}/observees/{observee_id}',
+        'user_id, observee_id',
+        doc="""
     Gets information about an observed user.
     
     *Note:* all users are allowed to view their own observees.
@@ -77,17 +62,11 @@ def show_observee(request_ctx, user_id, observee_id, **request_kwargs):
         :return: Show an observee
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/users/{user_id}/observees/{observee_id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, observee_id=observee_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def add_observee(request_ctx, user_id, observee_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'add_observee', 'PUT', '/v1/users/{user_id}/observees/{observee_id}',
+        'user_id, observee_id',
+        doc="""
     Registers a user as being observed by the given user.
 
         :param request_ctx: The request context
@@ -99,17 +78,11 @@ def add_observee(request_ctx, user_id, observee_id, **request_kwargs):
         :return: Add an observee
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/users/{user_id}/observees/{observee_id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, observee_id=observee_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def remove_observee(request_ctx, user_id, observee_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'remove_observee', 'DELETE', '/v1/users/{user_id}/observees/{observee_id}',
+        'user_id, observee_id',
+        doc="""
     Unregisters a user as being observed by the given user.
 
         :param request_ctx: The request context
@@ -121,12 +94,7 @@ def remove_observee(request_ctx, user_id, observee_id, **request_kwargs):
         :return: Remove an observee
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/users/{user_id}/observees/{observee_id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, observee_id=observee_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
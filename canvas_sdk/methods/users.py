@@ -1,9 +1,13 @@
 from canvas_sdk import client, utils
-
-
-def list_users_in_account(request_ctx, account_id, search_term=None,
-                          include=None, per_page=None, **request_kwargs):
-    """
+from canvas_sdk.engine import Endpoint, build_methods
+
+ENDPOINTS = [
+    Endpoint(
+        'list_users_in_account', 'GET', '/v1/accounts/{account_id}/users',
+        'account_id, search_term=None, include=None, per_page=None',
+        payload=('include[]', 'search_term', 'per_page'),
+        choices={'include': ('avatar_url', 'email', 'last_login', 'time_zone')},
+        doc="""
     Retrieve the list of users associated with this account.
 
      @example_request
@@ -31,26 +35,11 @@ administrative queries will only be compared against name.
         :return: List users in account
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('avatar_url', 'email', 'last_login', 'time_zone')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/accounts/{account_id}/users'
-    payload = {
-        'include[]': include,
-        'search_term': search_term,
-        'per_page': per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_activity_stream_self(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_activity_stream_self', 'GET', '/v1/users/self/activity_stream',
+        '',
+        doc="""
     Returns the current user's global activity stream, paginated.
     
     There are many types of objects that can be returned in the activity
@@ -148,17 +137,11 @@ def list_activity_stream_self(request_ctx, **request_kwargs):
         :return: List the activity stream
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/activity_stream'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_activity_stream_activity_stream(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_activity_stream_activity_stream', 'GET', '/v1/users/activity_stream',
+        '',
+        doc="""
     Returns the current user's global activity stream, paginated.
     
     There are many types of objects that can be returned in the activity
@@ -256,17 +239,11 @@ def list_activity_stream_activity_stream(request_ctx, **request_kwargs):
         :return: List the activity stream
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/activity_stream'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def activity_stream_summary(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'activity_stream_summary', 'GET', '/v1/users/self/activity_stream/summary',
+        '',
+        doc="""
     Returns a summary of the current user's global activity stream.
 
         :param request_ctx: The request context
@@ -274,17 +251,11 @@ def activity_stream_summary(request_ctx, **request_kwargs):
         :return: Activity stream summary
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/activity_stream/summary'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_todo_items(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_todo_items', 'GET', '/v1/users/self/todo',
+        '',
+        doc="""
     Returns the current user's list of todo items, as seen on the user dashboard.
     
     There is a limit to the number of items returned.
@@ -301,17 +272,11 @@ def list_todo_items(request_ctx, **request_kwargs):
         :return: List the TODO items
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/todo'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_upcoming_assignments_calendar_events(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_upcoming_assignments_calendar_events', 'GET', '/v1/users/self/upcoming_events',
+        '',
+        doc="""
     Returns the current user's upcoming events, i.e. the same things shown
     in the dashboard 'Coming Up' sidebar.
 
@@ -320,17 +285,11 @@ def list_upcoming_assignments_calendar_events(request_ctx, **request_kwargs):
         :return: List upcoming assignments, calendar events
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/upcoming_events'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def hide_stream_item(request_ctx, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'hide_stream_item', 'DELETE', '/v1/users/self/activity_stream/{id}',
+        'id',
+        doc="""
     Hide the given stream item.
 
         :param request_ctx: The request context
@@ -340,17 +299,11 @@ def hide_stream_item(request_ctx, id, **request_kwargs):
         :return: Hide a stream item
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/activity_stream/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def hide_all_stream_items(request_ctx, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'hide_all_stream_items', 'DELETE', '/v1/users/self/activity_stream',
+        '',
+        doc="""
     Hide all stream items for the user
 
         :param request_ctx: The request context
@@ -358,17 +311,11 @@ def hide_all_stream_items(request_ctx, **request_kwargs):
         :return: Hide all stream items
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/self/activity_stream'
-    url = request_ctx.base_api_url + path.format()
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def upload_file(request_ctx, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'upload_file', 'POST', '/v1/users/{user_id}/files',
+        'user_id',
+        doc="""
     Upload a file to the user's personal files section.
     
     This API endpoint is the first step in uploading a file to a user's files.
@@ -386,17 +333,17 @@ def upload_file(request_ctx, user_id, **request_kwargs):
         :return: Upload a file
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{user_id}/files'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def create_user(request_ctx, account_id, pseudonym_unique_id, user_name=None, user_short_name=None, user_sortable_name=None, user_time_zone=None, user_locale=None, user_birthdate=None, user_terms_of_use=None, pseudonym_password=None, pseudonym_sis_user_id=None, pseudonym_send_confirmation=None, communication_channel_type=None, communication_channel_address=None, communication_channel_skip_confirmation=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'create_user', 'POST', '/v1/accounts/{account_id}/users',
+        'account_id, pseudonym_unique_id, user_name=None, user_short_name=None, user_sortable_name=None, user_time_zone=None, user_locale=None, user_birthdate=None, user_terms_of_use=None, pseudonym_password=None, pseudonym_sis_user_id=None, pseudonym_send_confirmation=None, communication_channel_type=None, communication_channel_address=None, communication_channel_skip_confirmation=None',
+        payload=(
+            'user[name]', 'user[short_name]', 'user[sortable_name]', 'user[time_zone]', 'user[locale]',
+            'user[birthdate]', 'user[terms_of_use]', 'pseudonym[unique_id]', 'pseudonym[password]',
+            'pseudonym[sis_user_id]', 'pseudonym[send_confirmation]', 'communication_channel[type]',
+            'communication_channel[address]', 'communication_channel[skip_confirmation]',
+        ),
+        doc="""
     Create and return a new user and pseudonym for an account.
     
     If you don't have the "Modify login details for users" permission, but
@@ -439,33 +386,12 @@ def create_user(request_ctx, account_id, pseudonym_unique_id, user_name=None, us
         :return: Create a user
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/users'
-    payload = {
-        'user[name]' : user_name,
-        'user[short_name]' : user_short_name,
-        'user[sortable_name]' : user_sortable_name,
-        'user[time_zone]' : user_time_zone,
-        'user[locale]' : user_locale,
-        'user[birthdate]' : user_birthdate,
-        'user[terms_of_use]' : user_terms_of_use,
-        'pseudonym[unique_id]' : pseudonym_unique_id,
-        'pseudonym[password]' : pseudonym_password,
-        'pseudonym[sis_user_id]' : pseudonym_sis_user_id,
-        'pseudonym[send_confirmation]' : pseudonym_send_confirmation,
-        'communication_channel[type]' : communication_channel_type,
-        'communication_channel[address]' : communication_channel_address,
-        'communication_channel[skip_confirmation]' : communication_channel_skip_confirmation,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def update_user_settings(request_ctx, id, manual_mark_as_read, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'update_user_settings', 'GET', '/v1/users/{id}/settings',
+        'id, manual_mark_as_read',
+        payload=('manual_mark_as_read',),
+        doc="""
     Update an existing user's settings.
 
         :param request_ctx: The request context
@@ -477,20 +403,15 @@ def update_user_settings(request_ctx, id, manual_mark_as_read, **request_kwargs)
         :return: Update user settings.
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{id}/settings'
-    payload = {
-        'manual_mark_as_read' : manual_mark_as_read,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def edit_user(request_ctx, id, user_name=None, user_short_name=None, user_sortable_name=None, user_time_zone=None, user_locale=None, user_avatar_token=None, user_avatar_url=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'edit_user', 'PUT', '/v1/users/{id}',
+        'id, user_name=None, user_short_name=None, user_sortable_name=None, user_time_zone=None, user_locale=None, user_avatar_token=None, user_avatar_url=None',
+        payload=(
+            'user[name]', 'user[short_name]', 'user[sortable_name]', 'user[time_zone]', 'user[locale]',
+            'user[avatar][token]', 'user[avatar][url]',
+        ),
+        doc="""
     Modify an existing user. To modify a user's login, see the documentation for logins.
 
         :param request_ctx: The request context
@@ -514,26 +435,11 @@ def edit_user(request_ctx, id, user_name=None, user_short_name=None, user_sortab
         :return: Edit a user
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/users/{id}'
-    payload = {
-        'user[name]' : user_name,
-        'user[short_name]' : user_short_name,
-        'user[sortable_name]' : user_sortable_name,
-        'user[time_zone]' : user_time_zone,
-        'user[locale]' : user_locale,
-        'user[avatar][token]' : user_avatar_token,
-        'user[avatar][url]' : user_avatar_url,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_user(request_ctx, account_id, id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_user', 'DELETE', '/v1/accounts/{account_id}/users/{id}',
+        'account_id, id',
+        doc="""
     Delete a user record from Canvas.
     
     WARNING: This API will allow a user to delete themselves. If you do this,
@@ -548,17 +454,11 @@ def delete_user(request_ctx, account_id, id, **request_kwargs):
         :return: Delete a user
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/accounts/{account_id}/users/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def merge_user_into_another_user_destination_user_id(request_ctx, id, destination_user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'merge_user_into_another_user_destination_user_id', 'PUT', '/v1/users/{id}/merge_into/{destination_user_id}',
+        'id, destination_user_id',
+        doc="""
     Merge a user into another user.
     To merge users, the caller must have permissions to manage both users.
     
@@ -576,17 +476,11 @@ def merge_user_into_another_user_destination_user_id(request_ctx, id, destinatio
         :return: Merge user into another user
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/users/{id}/merge_into/{destination_user_id}'
-    url = request_ctx.base_api_url + path.format(id=id, destination_user_id=destination_user_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def merge_user_into_another_user_accounts(request_ctx, id, destination_account_id, destination_user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'merge_user_into_another_user_accounts', 'PUT', '/v1/users/{id}/merge_into/accounts/{destination_account_id}/users/{destination_user_id}',
+        'id, destination_account_id, destination_user_id',
+        doc="""
     Merge a user into another user.
     To merge users, the caller must have permissions to manage both users.
     
@@ -606,17 +500,11 @@ def merge_user_into_another_user_accounts(request_ctx, id, destination_account_i
         :return: Merge user into another user
         :rtype: requests.Response (with User data)
 
-    """
-
-    path = '/v1/users/{id}/merge_into/accounts/{destination_account_id}/users/{destination_user_id}'
-    url = request_ctx.base_api_url + path.format(id=id, destination_account_id=destination_account_id, destination_user_id=destination_user_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def get_user_profile(request_ctx, user_id, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'get_user_profile', 'GET', '/v1/users/{user_id}/profile',
+        'user_id',
+        doc="""
     Returns user profile data, including user id, name, and profile pic.
     
     When requesting the profile for the user accessing the API, the user's
@@ -629,17 +517,12 @@ def get_user_profile(request_ctx, user_id, **request_kwargs):
         :return: Get user profile
         :rtype: requests.Response (with Profile data)
 
-    """
-
-    path = '/v1/users/{user_id}/profile'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
-
-
-def list_avatar_options(request_ctx, user_id, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_avatar_options', 'GET', '/v1/users/{user_id}/avatars',
+        'user_id, per_page=None',
+        payload=('per_page',),
+        doc="""
     Retrieve the possible user avatar options that can be set with the user update endpoint. The response will be an array of avatar records. If the 'type' field is 'attachment', the record will include all the normal attachment json fields; otherwise it will include only the 'url' and 'display_name' fields. Additionally, all records will include a 'type' field and a 'token' field. The following explains each field in more detail
     type:: ["gravatar"|"attachment"|"no_pic"] The type of avatar record, for categorization purposes.
     url:: The url of the avatar
@@ -659,22 +542,12 @@ def list_avatar_options(request_ctx, user_id, per_page=None, **request_kwargs):
         :return: List avatar options
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/avatars'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def list_user_page_views(request_ctx, user_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'list_user_page_views', 'GET', '/v1/users/{user_id}/page_views',
+        'user_id, start_time=None, end_time=None, per_page=None',
+        payload=('start_time', 'end_time', 'per_page'),
+        doc="""
     Return the user's page view history in json format, similar to the
     available CSV download. Pagination is used as described in API basics
     section. Page views are returned in descending order, newest to oldest.
@@ -692,24 +565,12 @@ def list_user_page_views(request_ctx, user_id, start_time=None, end_time=None, p
         :return: List user page views
         :rtype: requests.Response (with array data)
 
-    """
-
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/page_views'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def store_custom_data(request_ctx, user_id, scope, ns, data, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'store_custom_data', 'PUT', '/v1/users/{user_id}/custom_data/{scope}',
+        'user_id, scope, ns, data',
+        payload=('ns', 'data'),
+        doc="""
     Store arbitrary user data as JSON.
     
     Arbitrary JSON data can be stored for a User.
@@ -865,21 +726,12 @@ def store_custom_data(request_ctx, user_id, scope, ns, data, **request_kwargs):
         :return: Store custom data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{user_id}/custom_data/{scope}'
-    payload = {
-        'ns' : ns,
-        'data' : data,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, scope=scope)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def load_custom_data(request_ctx, user_id, scope, ns, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'load_custom_data', 'GET', '/v1/users/{user_id}/custom_data/{scope}',
+        'user_id, scope, ns',
+        payload=('ns',),
+        doc="""
     Load custom user data.
     
     Arbitrary JSON data can be stored for a User.  This API call
@@ -903,20 +755,12 @@ def load_custom_data(request_ctx, user_id, scope, ns, **request_kwargs):
         :return: Load custom data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{user_id}/custom_data/{scope}'
-    payload = {
-        'ns' : ns,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, scope=scope)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
-
-def delete_custom_data(request_ctx, user_id, scope, ns, **request_kwargs):
-    """
+    """),
+    Endpoint(
+        'delete_custom_data', 'DELETE', '/v1/users/{user_id}/custom_data/{scope}',
+        'user_id, scope, ns',
+        payload=('ns',),
+        doc="""
     Delete custom user data.
     
     Arbitrary JSON data can be stored for a User.  This API call
@@ -1032,15 +876,7 @@ def delete_custom_data(request_ctx, user_id, scope, ns, **request_kwargs):
         :return: Delete custom data
         :rtype: requests.Response (with void data)
 
-    """
-
-    path = '/v1/users/{user_id}/custom_data/{scope}'
-    payload = {
-        'ns' : ns,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, scope=scope)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
-
+    """),
+]
 
+build_methods(ENDPOINTS, globals())
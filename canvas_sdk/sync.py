@@ -0,0 +1,139 @@
+import threading
+from datetime import timedelta
+from itertools import chain
+
+from canvas_sdk import utils
+from canvas_sdk.checkpoint import Checkpoint
+
+"""
+An incremental sync fetches only the events of a log endpoint (e.g. grade_change_log.query_by_course, or the
+course and authentication audit logs) created since the previous sync, instead of the whole history every time.
+
+Each query synced (an API function and its arguments, e.g. the grade change log of a course, an assignment or a
+student) has a cursor, kept in the state of a :class:`Checkpoint <canvas_sdk.checkpoint.Checkpoint>` so that it
+survives between runs.  The state of the checkpoint is ``{'cursors': {key: cursor}}``, where the key identifies
+the query (see :py:func:`canvas_sdk.utils.get_checkpoint_key`) and the cursor holds:
+
+* ``created_at``: the high-water mark, the newest created_at of the events synced so far
+* ``recent``: the ``[id, created_at]`` pairs of the events synced within the overlap before the high-water mark
+"""
+
+"""
+How far before the high-water mark a sync asks for events by default, to pick up the events Canvas records with a
+created_at a little in the past
+"""
+DEFAULT_OVERLAP = timedelta(minutes=5)
+
+
+class EventSync(object):
+
+    """
+    Syncs the events of log queries incrementally: a query is first synced from start_time (or from the beginning
+    of its history), and from then on from its high-water mark less the overlap.  Events fetched again because of
+    the overlap are recognized by their id and skipped, so each event is handed to the sink once::
+
+        sync = EventSync(request_context, store_events, FileCheckpoint('grade_changes.json'))
+        for course_id in course_ids:
+            sync.sync(grade_change_log.query_by_course, course_id)
+
+    The cursor of a query is only advanced once all of its new events have been handed to the sink, so a sync
+    that fails part way (including when the sink raises) hands the same events again on the next sync: delivery
+    is at least once.  Different queries may be synced from different threads at once, but a query must not be
+    synced twice at the same time.
+
+    :param RequestContext request_context: The context required to make an API call
+    :param sink: A callable called with each list of new events, as they are fetched (one list per page, newest
+        first for the endpoints that list the newest events first)
+    :param checkpoint: (optional) Where the cursors are kept, e.g. a :class:`FileCheckpoint
+        <canvas_sdk.checkpoint.FileCheckpoint>`.  Defaults to a Checkpoint in memory.
+    :param timedelta overlap: (optional) How far before the high-water mark events are asked for again.  Defaults
+        to 5 minutes.
+    :param start_time: (optional) Where a query without a cursor starts, a datetime or an ISO 8601 timestamp.
+        Defaults to None, the beginning of its history.
+    :param str timestamp_key: (optional) The member of an event that holds its timestamp.  Defaults to 'created_at'.
+    :param str items_key: (optional) The member of a page that holds its events.  Defaults to 'events', as in the
+        responses of the audit log endpoints.
+    """
+
+    def __init__(self, request_context, sink, checkpoint=None, overlap=DEFAULT_OVERLAP, start_time=None,
+                 timestamp_key='created_at', items_key='events'):
+        self.request_context = request_context
+        self.sink = sink
+        self.checkpoint = checkpoint if checkpoint is not None else Checkpoint()
+        self.overlap = overlap
+        self.start_time = start_time
+        self.timestamp_key = timestamp_key
+        self.items_key = items_key
+        self._lock = threading.Lock()
+
+    def get_cursor(self, function, *args, **kwargs):
+        """
+        Return the cursor of a query, or None if it hasn't been synced
+        """
+        state = self.checkpoint.load() or {}
+        return state.get('cursors', {}).get(utils.get_checkpoint_key(function, args, kwargs))
+
+    def reset(self, function, *args, **kwargs):
+        """
+        Forget the cursor of a query, so that its next sync starts over from start_time
+        """
+        self.save_cursor(utils.get_checkpoint_key(function, args, kwargs), None)
+
+    def save_cursor(self, key, cursor):
+        with self._lock:
+            state = self.checkpoint.load() or {}
+            cursors = state.setdefault('cursors', {})
+            if cursor is None:
+                cursors.pop(key, None)
+            else:
+                cursors[key] = cursor
+            self.checkpoint.save(state)
+
+    def sync(self, function, *args, **kwargs):
+        """
+        Fetch the events of a query created since its previous sync, hand them to the sink and advance the cursor
+        of the query.  The function is called with args, kwargs and a start_time.
+
+            :param function function: The API function of the log, e.g. grade_change_log.query_by_course
+            :return: The number of new events
+            :rtype: int
+        """
+        key = utils.get_checkpoint_key(function, args, kwargs)
+        cursor = self.get_cursor(function, *args, **kwargs)
+        if cursor is not None:
+            high_water_mark = utils.to_utc(cursor['created_at'])
+            start_time = high_water_mark - self.overlap
+            recent = dict((event_id, created_at) for event_id, created_at in cursor['recent'])
+        else:
+            high_water_mark = None
+            start_time = utils.to_utc(self.start_time) if self.start_time is not None else None
+            recent = {}
+        if start_time is not None:
+            kwargs['start_time'] = utils.format_timestamp(start_time)
+        count = 0
+        response = function(self.request_context, *args, **kwargs)
+        for response in chain((response,), utils.get_next_responses(self.request_context, response)):
+            events = []
+            for event in utils.get_page_items(self.request_context, response, self.items_key):
+                event_id = event['id']
+                if event_id in recent:
+                    continue
+                created_at = utils.to_utc(event[self.timestamp_key])
+                recent[event_id] = utils.format_timestamp(created_at)
+                if high_water_mark is None or created_at > high_water_mark:
+                    high_water_mark = created_at
+                events.append(event)
+            response = None
+            if events:
+                self.sink(events)
+                count += len(events)
+        if high_water_mark is not None:
+            # The next sync asks for events from the high-water mark less the overlap, so only the events since then
+            # need to be recognized
+            threshold = high_water_mark - self.overlap
+            self.save_cursor(key, {
+                'created_at': utils.format_timestamp(high_water_mark),
+                'recent': sorted([event_id, created_at] for event_id, created_at in recent.items()
+                                 if utils.to_utc(created_at) >= threshold),
+            })
+        return count
@@ -0,0 +1,478 @@
+import base64
+import bisect
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from canvas_sdk.client.base import RATE_LIMIT_EXCEEDED_MESSAGE
+from canvas_sdk.client.throttle import RATE_LIMIT_REMAINING_HEADER, REQUEST_COST_HEADER
+from canvas_sdk.utils import format_timestamp, parse_timestamp, to_utc
+
+"""
+The page size Canvas uses when a request doesn't give one, and the largest it honors
+"""
+DEFAULT_PER_PAGE = 10
+MAX_PER_PAGE = 100
+
+"""
+The time range the grade change events of a course are spread over: they get denser towards its end, the way
+activity picks up over a term
+"""
+EVENTS_START = datetime(2020, 9, 1, tzinfo=timezone.utc)
+EVENTS_SPAN = timedelta(days=90)
+
+"""
+Status codes injected at random when a FakeCanvasServer has an error_rate
+"""
+DEFAULT_ERROR_CODES = (409, 500, 502, 503, 504)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+
+    # http.server.ThreadingHTTPServer is only available from python 3.7
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+
+    # HTTP/1.1 keeps connections alive, as Canvas does, so connection pooling is exercised
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which Nagle's algorithm would hold up for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.fake.handle(self)
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark and test output clean
+
+
+class FakeCanvasServer(object):
+
+    """
+    A local stand-in for the Canvas API, for tests and benchmarks that need real HTTP round trips without
+    touching a Canvas instance.  It serves synthetic accounts, courses, enrollments, assignments and submissions
+    from a threaded http.server, paginated the way Canvas paginates: ``page`` and ``per_page`` params and a Link
+    header with current, next, prev, first and last urls (or opaque bookmark cursors without a last link).
+    Objects are generated from their ids when a page is served, so large data sets cost no memory.
+
+    Canvas behaviors that clients have to cope with can be switched on: a rate limiting bucket reported in the
+    ``X-Rate-Limit-Remaining`` and ``X-Request-Cost`` headers, latency added to every response and errors injected
+    either at random or on demand (see fail_next).  Requests are counted by status code in ``stats``.
+
+    Usage::
+
+        with FakeCanvasServer(courses_per_account=5, latency=0.01) as server:
+            request_context = RequestContext('token', server.base_api_url)
+            enrollments = utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1)
+
+    Served endpoints (relative to base_api_url)::
+
+        GET /v1/accounts
+        GET /v1/accounts/{id}
+        GET /v1/accounts/{account_id}/courses
+        GET /v1/courses/{id}
+        GET /v1/courses/{course_id}/enrollments
+        GET /v1/courses/{course_id}/users
+        GET /v1/courses/{course_id}/assignments
+        GET /v1/courses/{course_id}/assignments/{assignment_id}/submissions
+        GET /v1/courses/{course_id}/students/submissions  (filtered by student_ids and assignment_ids)
+        GET /v1/audit/grade_change/courses/{course_id}  (newest first, filtered by start_time and end_time)
+
+    :param int accounts: (optional) The number of accounts.  Defaults to 1.
+    :param int courses_per_account: (optional) Defaults to 10.
+    :param int enrollments_per_course: (optional) The number of students enrolled in each course.  Defaults to 50.
+    :param int assignments_per_course: (optional) Defaults to 10.  Every student has a submission for every
+        assignment of the course.
+    :param int events_per_course: (optional) The number of grade change events of each course.  Defaults to 0.
+    :param bool bookmarks: (optional) Whether pages are addressed with opaque bookmark cursors, which can only be
+        followed one "next" link at a time, instead of page numbers.  Defaults to False.
+    :param float latency: (optional) Seconds added to every response.  Defaults to 0.
+    :param float error_rate: (optional) The probability that a request fails with one of error_codes.  Defaults to 0.
+    :param error_codes: (optional) The status codes of the injected errors.  Defaults to 409 and the 5xx codes the
+        client retries.
+    :param float rate_limit: (optional) The capacity of the rate limiting bucket.  Requests that find less than
+        their cost left in the bucket are refused with the 403 Canvas sends.  Defaults to None, no rate limiting.
+    :param float refill_rate: (optional) The quota units per second the bucket refills at.  Defaults to 10.
+    :param float request_cost: (optional) The quota units a request costs.  Defaults to 1.
+    :param str auth_token: (optional) When given, requests without this bearer token get a 401.
+    :param int seed: (optional) Seed of the random injected errors, for repeatable runs.
+    :param str host: (optional) The interface to listen on.  Defaults to 127.0.0.1.
+    :param int port: (optional) The port to listen on.  Defaults to 0, a free port.
+    :param int max_per_page: (optional) The largest page served; larger per_page params are capped to it, and the
+        Link urls carry the capped per_page, as Canvas does.  Defaults to 100.
+    """
+
+    def __init__(self, accounts=1, courses_per_account=10, enrollments_per_course=50, assignments_per_course=10,
+                 bookmarks=False, latency=0.0, error_rate=0.0, error_codes=DEFAULT_ERROR_CODES, rate_limit=None,
+                 refill_rate=10.0, request_cost=1.0, auth_token=None, seed=None, host='127.0.0.1', port=0,
+                 max_per_page=MAX_PER_PAGE, events_per_course=0):
+        self.accounts = accounts
+        self.courses_per_account = courses_per_account
+        self.enrollments_per_course = enrollments_per_course
+        self.assignments_per_course = assignments_per_course
+        self.bookmarks = bookmarks
+        self.max_per_page = max_per_page
+        self.events_per_course = events_per_course
+        # Seconds after EVENTS_START of each event, in order, and the numbers its id is made from, the same for every
+        # course
+        span = int(EVENTS_SPAN.total_seconds())
+        self._event_offsets = [span - (events_per_course - index) ** 2 * span // events_per_course ** 2
+                               for index in range(events_per_course)]
+        self._event_numbers = list(range(events_per_course))
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self.rate_limit = rate_limit
+        self.refill_rate = refill_rate
+        self.request_cost = request_cost
+        self.auth_token = auth_token
+        self.host = host
+        self.port = port
+        self.stats = Counter()
+        self._random = random.Random(seed)
+        self._failures = deque()
+        self._remaining = rate_limit
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._routes = [
+            (re.compile(r'/v1/accounts$'), self.list_accounts),
+            (re.compile(r'/v1/accounts/(\d+)$'), self.get_account),
+            (re.compile(r'/v1/accounts/(\d+)/courses$'), self.list_courses),
+            (re.compile(r'/v1/courses/(\d+)$'), self.get_course),
+            (re.compile(r'/v1/courses/(\d+)/(?:enrollments|users)$'), self.list_enrollments),
+            (re.compile(r'/v1/courses/(\d+)/assignments$'), self.list_assignments),
+            (re.compile(r'/v1/courses/(\d+)/assignments/(\d+)/submissions$'), self.list_assignment_submissions),
+            (re.compile(r'/v1/courses/(\d+)/students/submissions$'), self.list_course_submissions),
+            (re.compile(r'/v1/audit/grade_change/courses/(\d+)$'), self.list_grade_change_events),
+        ]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def base_api_url(self):
+        """
+        The url to give a RequestContext, in the form http://host:port/api
+        """
+        if self._server is None:
+            raise RuntimeError("The fake Canvas server has not been started.")
+        host, port = self._server.server_address[:2]
+        return 'http://%s:%d/api' % (host, port)
+
+    def start(self):
+        """
+        Start serving requests from a background thread
+        """
+        self._server = _ThreadingHTTPServer((self.host, self.port), _RequestHandler)
+        self._server.fake = self
+        # A short poll interval lets stop() return quickly
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05},
+                                        name='fake-canvas-server')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop serving requests and close the listening socket
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def fail_next(self, status_code, times=1, retry_after=None):
+        """
+        Fail the next requests with the given status code, ahead of any random errors.
+
+        :param int status_code: The status of the failed responses
+        :param int times: (optional) How many requests fail.  Defaults to 1.
+        :param int retry_after: (optional) Seconds sent in a Retry-After header with the failures
+        """
+        with self._lock:
+            self._failures.extend([(status_code, retry_after)] * times)
+
+    def reset_stats(self):
+        self.stats.clear()
+
+    def add_grade_change_events(self, *timestamps):
+        """
+        Add a grade change event to every course for each of the given timestamps, e.g. to test an incremental sync.
+        Events may be created in the past, as events that Canvas records late are, and are listed among the older
+        events.
+
+        :param timestamps: The created_at of the new events, as datetimes or ISO 8601 timestamps
+        """
+        with self._lock:
+            for timestamp in timestamps:
+                offset = int((to_utc(timestamp) - EVENTS_START).total_seconds())
+                index = bisect.bisect_right(self._event_offsets, offset)
+                self._event_offsets.insert(index, offset)
+                self._event_numbers.insert(index, self.events_per_course)
+                self.events_per_course += 1
+
+    # Synthetic objects, generated from their ids
+
+    def get_account_ids(self):
+        return range(1, self.accounts + 1)
+
+    def get_course_ids(self, account_id):
+        first = (account_id - 1) * self.courses_per_account + 1
+        return range(first, first + self.courses_per_account)
+
+    def get_student_ids(self, course_id):
+        first = 1000 + (course_id - 1) * self.enrollments_per_course
+        return range(first, first + self.enrollments_per_course)
+
+    def get_assignment_ids(self, course_id):
+        first = (course_id - 1) * self.assignments_per_course + 1
+        return range(first, first + self.assignments_per_course)
+
+    def has_course(self, course_id):
+        return 1 <= course_id <= self.accounts * self.courses_per_account
+
+    def make_account(self, account_id):
+        return {'id': account_id, 'name': 'Account %d' % account_id, 'parent_account_id': None,
+                'root_account_id': None, 'workflow_state': 'active', 'sis_account_id': 'account-%d' % account_id}
+
+    def make_course(self, course_id):
+        return {'id': course_id, 'name': 'Course %d' % course_id, 'course_code': 'C%d' % course_id,
+                'account_id': (course_id - 1) // self.courses_per_account + 1, 'workflow_state': 'available',
+                'sis_course_id': 'course-%d' % course_id, 'start_at': '2020-09-01T00:00:00Z', 'end_at': None,
+                'enrollment_term_id': 1, 'total_students': self.enrollments_per_course}
+
+    def make_enrollment(self, course_id, user_id):
+        return {'id': user_id * 10 + 1, 'course_id': course_id, 'user_id': user_id, 'type': 'StudentEnrollment',
+                'role': 'StudentEnrollment', 'enrollment_state': 'active', 'course_section_id': course_id,
+                'created_at': '2020-08-15T12:00:00Z', 'updated_at': '2020-08-15T12:00:00Z',
+                'user': {'id': user_id, 'name': 'Student %d' % user_id, 'sortable_name': '%d, Student' % user_id,
+                         'sis_user_id': 'user-%d' % user_id, 'login_id': 'student%d@example.edu' % user_id}}
+
+    def make_assignment(self, course_id, assignment_id):
+        return {'id': assignment_id, 'course_id': course_id, 'name': 'Assignment %d' % assignment_id,
+                'points_possible': 100.0, 'grading_type': 'points', 'submission_types': ['online_upload'],
+                'due_at': '2020-10-01T23:59:00Z', 'published': True, 'position': assignment_id}
+
+    def make_submission(self, assignment_id, user_id):
+        score = (assignment_id * 7 + user_id * 13) % 101
+        return {'id': assignment_id * 100000 + user_id, 'assignment_id': assignment_id, 'user_id': user_id,
+                'score': float(score), 'grade': str(score), 'attempt': 1, 'workflow_state': 'graded',
+                'submitted_at': '2020-09-30T18:00:00Z', 'graded_at': '2020-10-03T09:00:00Z', 'late': False}
+
+    def make_grade_change_event(self, course_id, index):
+        created_at = EVENTS_START + timedelta(seconds=self._event_offsets[index])
+        number = self._event_numbers[index]
+        return {'id': course_id * 10000000 + number, 'created_at': format_timestamp(created_at),
+                'event_type': 'grade_change', 'grade_before': None, 'grade_after': str(number % 101),
+                'links': {'assignment': number % self.assignments_per_course + 1, 'course': course_id,
+                          'student': 1000 + number % max(1, self.enrollments_per_course), 'grader': 1}}
+
+    # Endpoints: each returns the json of the response, or a Page of a list
+
+    def list_accounts(self, query):
+        return Page(self.get_account_ids(), self.make_account)
+
+    def get_account(self, query, account_id):
+        if account_id not in self.get_account_ids():
+            return None
+        return self.make_account(account_id)
+
+    def list_courses(self, query, account_id):
+        if account_id not in self.get_account_ids():
+            return None
+        return Page(self.get_course_ids(account_id), self.make_course)
+
+    def get_course(self, query, course_id):
+        return self.make_course(course_id) if self.has_course(course_id) else None
+
+    def list_enrollments(self, query, course_id):
+        if not self.has_course(course_id):
+            return None
+        return Page(self.get_student_ids(course_id), lambda user_id: self.make_enrollment(course_id, user_id))
+
+    def list_assignments(self, query, course_id):
+        if not self.has_course(course_id):
+            return None
+        return Page(self.get_assignment_ids(course_id),
+                    lambda assignment_id: self.make_assignment(course_id, assignment_id))
+
+    def list_assignment_submissions(self, query, course_id, assignment_id):
+        if not self.has_course(course_id) or assignment_id not in self.get_assignment_ids(course_id):
+            return None
+        return Page(self.get_student_ids(course_id), lambda user_id: self.make_submission(assignment_id, user_id))
+
+    def list_course_submissions(self, query, course_id):
+        if not self.has_course(course_id):
+            return None
+        # The generated method sends the ids without the [] suffix Canvas documents, so both are accepted
+        student_ids = self.get_student_ids(course_id)
+        selected = query.get('student_ids[]', query.get('student_ids'))
+        if selected and 'all' not in selected:
+            student_ids = [int(i) for i in selected if i.isdigit() and int(i) in student_ids]
+        assignment_ids = self.get_assignment_ids(course_id)
+        selected = query.get('assignment_ids[]', query.get('assignment_ids'))
+        if selected:
+            assignment_ids = [int(i) for i in selected if i.isdigit() and int(i) in assignment_ids]
+        pairs = [(assignment_id, user_id) for user_id in student_ids for assignment_id in assignment_ids]
+        return Page(pairs, lambda pair: self.make_submission(*pair))
+
+    def list_grade_change_events(self, query, course_id):
+        if not self.has_course(course_id):
+            return None
+        # The events from start_time to end_time, both included, newest first
+        offsets = self._event_offsets
+        first, last = 0, len(offsets)
+        try:
+            if 'start_time' in query:
+                start = parse_timestamp(query['start_time'][0]) - EVENTS_START
+                first = bisect.bisect_left(offsets, start.total_seconds())
+            if 'end_time' in query:
+                end = parse_timestamp(query['end_time'][0]) - EVENTS_START
+                last = bisect.bisect_right(offsets, end.total_seconds())
+        except ValueError:
+            return None
+        return Page(range(last - 1, first - 1, -1), lambda index: self.make_grade_change_event(course_id, index),
+                    key='events')
+
+    # Request handling
+
+    def handle(self, handler):
+        """
+        Answer the request of an http.server request handler
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        status, body, headers = self.get_response(handler)
+        with self._lock:
+            self.stats[status] += 1
+        content = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json; charset=utf-8')
+        handler.send_header('Content-Length', str(len(content)))
+        for name, value in headers:
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def get_response(self, handler):
+        """
+        Return the (status, body, headers) of the response to a request, where headers is a list of pairs
+        """
+        if self.auth_token is not None and handler.headers.get('Authorization') != 'Bearer %s' % self.auth_token:
+            return 401, {'errors': [{'message': 'Invalid access token.'}]}, [
+                ('WWW-Authenticate', 'Bearer realm="canvas-lms"')]
+        headers = []
+        if self.rate_limit is not None:
+            with self._lock:
+                now = time.monotonic()
+                self._remaining = min(self.rate_limit,
+                                      self._remaining + (now - self._refilled_at) * self.refill_rate)
+                self._refilled_at = now
+                limited = self._remaining < self.request_cost
+                if not limited:
+                    self._remaining -= self.request_cost
+                headers.append((RATE_LIMIT_REMAINING_HEADER, '%.3f' % self._remaining))
+            headers.append((REQUEST_COST_HEADER, '%.3f' % self.request_cost))
+            if limited:
+                return 403, ('403 Forbidden (%s)\n' % RATE_LIMIT_EXCEEDED_MESSAGE).encode('utf-8'), headers
+        with self._lock:
+            failure = self._failures.popleft() if self._failures else None
+            if failure is None and self.error_rate and self._random.random() < self.error_rate:
+                failure = (self._random.choice(self.error_codes), None)
+        if failure is not None:
+            status, retry_after = failure
+            if retry_after is not None:
+                headers.append(('Retry-After', str(retry_after)))
+            return status, {'errors': [{'message': 'Injected error'}]}, headers
+        url = urlsplit(handler.path)
+        query = parse_qs(url.query, keep_blank_values=True)
+        path = url.path[len('/api'):] if url.path.startswith('/api/') else None
+        for pattern, endpoint in self._routes if path else ():
+            match = pattern.match(path)
+            if match:
+                body = endpoint(query, *(int(group) for group in match.groups()))
+                break
+        else:
+            body = None
+        if body is None:
+            return 404, {'errors': [{'message': 'The specified resource does not exist.'}]}, headers
+        if isinstance(body, Page):
+            page = body
+            body, link = self.paginate(handler, url, query, page)
+            if page.key is not None:
+                body = {page.key: body, 'linked': {}, 'links': {}}
+            headers.append(('Link', link))
+        return 200, body, headers
+
+    def paginate(self, handler, url, query, page):
+        """
+        Return the items of the requested page of a list and the Link header of the response
+        """
+        try:
+            per_page = min(self.max_per_page, max(1, int(query.get('per_page', [DEFAULT_PER_PAGE])[0])))
+        except ValueError:
+            per_page = DEFAULT_PER_PAGE
+        page_param = query.get('page', ['1'])[0]
+        if page_param.startswith('bookmark:'):
+            try:
+                offset = json.loads(base64.urlsafe_b64decode(page_param[len('bookmark:'):].encode('ascii')))[0]
+            except (TypeError, ValueError, IndexError):
+                offset = 0
+        else:
+            offset = (int(page_param) - 1) * per_page if page_param.isdigit() and int(page_param) > 0 else 0
+        count = len(page.ids)
+        items = [page.make(item_id) for item_id in page.ids[offset:offset + per_page]]
+        base_url = 'http://%s%s' % (handler.headers.get('Host', '%s:%d' % handler.server.server_address[:2]),
+                                    url.path)
+        params = [(key, value) for key, values in query.items() if key not in ('page', 'per_page') for value in values]
+        params.append(('per_page', str(per_page)))
+
+        def page_url(page_offset):
+            if self.bookmarks:
+                cursor = json.dumps([page_offset]).encode('ascii')
+                page_value = 'bookmark:' + base64.urlsafe_b64encode(cursor).decode('ascii')
+            else:
+                page_value = str(page_offset // per_page + 1)
+            return '%s?%s' % (base_url, urlencode(params + [('page', page_value)]))
+
+        links = [('current', offset)]
+        if offset + per_page < count:
+            links.append(('next', offset + per_page))
+        if offset > 0:
+            links.append(('prev', max(0, offset - per_page)))
+        links.append(('first', 0))
+        if not self.bookmarks:
+            links.append(('last', max(0, (count - 1) // per_page * per_page)))
+        return items, ','.join('<%s>; rel="%s"' % (page_url(link_offset), rel) for rel, link_offset in links)
+
+
+class Page(object):
+
+    """
+    A list endpoint's result: the ids of its items in order, and the function that makes an item from its id.  If
+    key is given, the items of a page are served as that member of a json object, as the audit endpoints do.
+    """
+
+    __slots__ = ('ids', 'make', 'key')
+
+    def __init__(self, ids, make, key=None):
+        self.ids = ids
+        self.make = make
+        self.key = key
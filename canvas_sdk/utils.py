@@ -1,10 +1,34 @@
+import inspect
+import math
+import re
+import threading
 from canvas_sdk import client
-from collections import defaultdict
+from canvas_sdk.client import tracing
+from canvas_sdk.client.paging import MAX_PER_PAGE
+from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import chain
+from queue import Queue
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 """
 The util module contains helper methods for the SDK
 """
 
+"""
+An ISO 8601 timestamp as Canvas writes them, e.g. 2020-09-01T12:00:00Z or 2020-09-01T06:00:00.123-06:00
+"""
+TIMESTAMP_PATTERN = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?(Z|[+-]\d{2}:?\d{2})?$')
+
+"""
+The outcome of one call made by map_concurrent: the keyword arguments of the call and either the
+response returned or the exception raised by the function
+"""
+MapResult = namedtuple('MapResult', 'kwargs response error')
+
 
 def validate_attr_is_acceptable(value, acceptable_values=[], allow_none=True):
     """
@@ -43,9 +67,177 @@ def get_next(request_context, response):
         :return: next response object retrieved by client
         :rtype: iterator
     """
-    while 'next' in response.links:
-        response = client.get(request_context, response.links["next"]["url"])
-        yield response
+    tracer = request_context.tracer
+    if tracer is None:
+        while 'next' in response.links:
+            response = client.get(request_context, response.links["next"]["url"])
+            yield response
+        return
+    # The requests of the pages are children of a span covering the whole chain, which isn't current between
+    # pages so that it doesn't leak into the caller's code
+    span = tracing.start_list_span(tracer, 'get_next')
+    page_count = byte_count = 0
+    try:
+        while 'next' in response.links:
+            with tracing.use_span(span):
+                response = client.get(request_context, response.links["next"]["url"])
+            page_count += 1
+            byte_count += len(response.content)
+            yield response
+    finally:
+        tracing.end_list_span(span, page_count, byte_count)
+
+
+def prefetch_next(request_context, response, depth=1):
+    """
+    Return an iterator over the same "next" responses as get_next, fetched ahead of the caller: a background
+    thread requests each page as soon as the Link header of the one before it has arrived, starting right away,
+    and keeps up to depth pages ready beyond the one the caller is working on.  Processing a page thus overlaps
+    with downloading the next one, which speeds up bookmark-style cursors that can't be fetched by page number
+    (see get_pages).  Errors raised while fetching a page are raised when that page would have been returned.
+
+    Once the iterator is exhausted, garbage collected or closed, no further pages are requested, though a
+    request already in flight is completed and discarded.
+
+        :param :class:RequestContext request_context: The context required to make a "get" request
+        :param response: The response whose "next" links are followed
+        :param int depth: (optional) The number of pages fetched ahead of the caller.  Defaults to 1.
+        :return: next response object retrieved by client
+        :rtype: iterator
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1.")
+    pages = Queue()
+    # One slot per page the thread may fetch beyond the one the caller holds; taking a page frees a slot
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+    if 'next' not in response.links:
+        stopped.set()
+        return PrefetchedPages(pages, slots, stopped)
+    span = tracing.get_current_span() if request_context.tracer is not None else None
+
+    def fetch_pages(url):
+        try:
+            while url is not None:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                if span is not None:
+                    # The thread doesn't inherit the current span, so the page requests are parented explicitly
+                    with tracing.use_span(span):
+                        page = client.get(request_context, url)
+                else:
+                    page = client.get(request_context, url)
+                url = page.links['next']['url'] if 'next' in page.links else None
+                pages.put((page, None))
+        except Exception as error:
+            pages.put((None, error))
+            return
+        pages.put((None, None))
+
+    thread = threading.Thread(target=fetch_pages, args=(response.links['next']['url'],),
+                              name='canvas-sdk-prefetch')
+    thread.daemon = True
+    thread.start()
+    return PrefetchedPages(pages, slots, stopped)
+
+
+class PrefetchedPages(object):
+
+    """
+    The iterator returned by prefetch_next, over the pages its thread puts on a queue
+    """
+
+    def __init__(self, pages, slots, stopped):
+        self.pages = pages
+        self.slots = slots
+        self.stopped = stopped
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.stopped.is_set():
+            raise StopIteration
+        page, error = self.pages.get()
+        if page is None:
+            self.close()
+            if error is not None:
+                raise error
+            raise StopIteration
+        self.slots.release()
+        return page
+
+    def close(self):
+        """
+        Stop fetching pages
+        """
+        if not self.stopped.is_set():
+            self.stopped.set()
+            self.slots.release()  # Wake the thread if it is waiting for a slot, so it sees it was stopped
+
+    def __del__(self):
+        self.close()
+
+
+def get_next_responses(request_context, response):
+    """
+    Return the "next" responses of a response the way the request context asks for: fetched ahead by
+    prefetch_next if its prefetch_pages is set, else walked by get_next.
+    """
+    if request_context.prefetch_pages:
+        return prefetch_next(request_context, response, request_context.prefetch_pages)
+    return get_next(request_context, response)
+
+
+def get_remaining_page_urls(response):
+    """
+    Compute the urls of every page after the given response using its "next" and "last" header links.
+    This is only possible when Canvas paginates with numeric page numbers; bookmark-style cursors (e.g.
+    page=bookmark:...) or a missing "last" link can only be walked through "next" links, in which case
+    None is returned.
+
+        :param response: A paged response retrieved by client
+        :return: The urls of the remaining pages in page order, or None if they can't be computed
+        :rtype: list of str or None
+    """
+    if 'next' not in response.links or 'last' not in response.links:
+        return None
+    next_url = urlparse(response.links['next']['url'])
+    next_query = parse_qsl(next_url.query, keep_blank_values=True)
+    next_page = dict(next_query).get('page', '')
+    last_page = dict(parse_qsl(urlparse(response.links['last']['url']).query)).get('page', '')
+    if not (next_page.isdigit() and last_page.isdigit()):
+        return None
+    page_urls = []
+    for page in range(int(next_page), int(last_page) + 1):
+        query = [(key, str(page) if key == 'page' else value) for key, value in next_query]
+        page_urls.append(urlunparse(next_url._replace(query=urlencode(query))))
+    return page_urls
+
+
+def get_pages(request_context, page_urls, max_workers):
+    """
+    Generator function that fetches the given page urls with a pool of at most max_workers threads and
+    yields the responses in page order.
+
+        :param :class:RequestContext request_context: The context required to make a "get" request
+        :param list page_urls: The urls of the pages to fetch, e.g. from get_remaining_page_urls
+        :param int max_workers: The maximum number of requests in flight at once
+        :return: response objects retrieved by client, in the order of page_urls
+        :rtype: iterator
+    """
+    span = tracing.get_current_span() if request_context.tracer is not None else None
+
+    def get_page(url):
+        # Worker threads don't inherit the current span, so the page requests are parented explicitly
+        with tracing.use_span(span):
+            return client.get(request_context, url)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for response in executor.map(get_page if span is not None else partial(client.get, request_context),
+                                     page_urls):
+            yield response
 
 
 def get_all_list_data(request_context, function, *args, **kwargs):
@@ -54,8 +246,16 @@ def get_all_list_data(request_context, function, *args, **kwargs):
     Return initial response json data or all json data as a single list.  Responses that have a series of
     next responses (as retrieved by get_next generator) are expected to have data returned as a list.
     If an exception is raised during the initial function call or in the process of paging over results,
-    that exception will be bubbled back to the caller and any intermediary results will be lost.  Worst case
-    complexity O(n).
+    that exception will be bubbled back to the caller and any intermediary results will be lost (see
+    iter_list_data_with_checkpoint for crawls that can be resumed).  Worst case complexity O(n).
+
+    If the request context has page_workers set to more than 1 and Canvas reports a numeric "last" page, the
+    remaining pages are fetched concurrently (see get_pages) and reassembled in page order.  Otherwise the
+    "next" links are walked serially, with the next pages fetched in the background while a page is decoded if
+    the request context has prefetch_pages set (see prefetch_next).
+
+    If the request context has a tracer, the requests are traced as children of a span that counts the pages and
+    bytes retrieved (see :py:mod:`canvas_sdk.client.tracing`).
 
 
         :param RequestContext request_context: The context required to make an API call
@@ -64,11 +264,149 @@ def get_all_list_data(request_context, function, *args, **kwargs):
             function response if there are no paged results
         :rtype: list of json data or json
     """
+    tracer = request_context.tracer
+    if tracer is None:
+        return _get_all_list_data(request_context, None, function, args, kwargs)
+    span = tracing.start_list_span(tracer, 'get_all_list_data', function)
+    with tracing.use_span(span):
+        return _get_all_list_data(request_context, span, function, args, kwargs)
+
+
+def _get_all_list_data(request_context, span, function, args, kwargs):
+    """
+    The body of get_all_list_data.  Unless span is None, the pages and bytes retrieved are counted on it and it is
+    ended once the data has been retrieved, or has failed to.
+    """
+    page_count = byte_count = 0
+    try:
+        response = function(request_context, *args, **kwargs)
+        if span is not None:
+            page_count, byte_count = 1, len(response.content)
+        data = client.decode_json(response, request_context.json_decoder)
+        page_urls = None
+        if request_context.page_workers and request_context.page_workers > 1:
+            page_urls = get_remaining_page_urls(response)
+        if page_urls:
+            next_responses = get_pages(request_context, page_urls, request_context.page_workers)
+        else:
+            next_responses = get_next_responses(request_context, response)
+        for next_response in next_responses:
+            data.extend(client.decode_json(next_response, request_context.json_decoder))
+            if span is not None:
+                page_count += 1
+                byte_count += len(next_response.content)
+        return data
+    finally:
+        if span is not None:
+            tracing.end_list_span(span, page_count, byte_count)
+
+
+def iter_list_data(request_context, function, *args, **kwargs):
+    """
+    Make a function request with args and kwargs and yield the json objects of the response and of every
+    "next" response, one page at a time.  This is the streaming counterpart of get_all_list_data: each
+    page's response is released before its items are yielded and the next page is only requested once
+    the previous page has been consumed, so peak memory stays at roughly one page regardless of the size
+    of the result set.  A response whose json is not a list is yielded as a single item.
+
+    If the request context has prefetch_pages set, up to that many pages are fetched in the background while the
+    caller consumes the items of a page (see prefetch_next), which costs that many pages of memory in exchange
+    for not waiting on each page.
+
+        :param RequestContext request_context: The context required to make an API call
+        :param function function: The API function to call
+        :return: The json objects retrieved while iterating over response links
+        :rtype: iterator
+    """
     response = function(request_context, *args, **kwargs)
-    data = response.json()
-    for next_response in get_next(request_context, response):
-        data.extend(next_response.json())
-    return data
+    if request_context.prefetch_pages:
+        next_responses = prefetch_next(request_context, response, request_context.prefetch_pages)
+        try:
+            for response in chain((response,), next_responses):
+                data = client.decode_json(response, request_context.json_decoder)
+                response = None
+                if isinstance(data, list):
+                    for item in data:
+                        yield item
+                else:
+                    yield data
+                data = None
+        finally:
+            next_responses.close()
+        return
+    while True:
+        data = client.decode_json(response, request_context.json_decoder)
+        next_url = response.links['next']['url'] if 'next' in response.links else None
+        response = None  # Release the page before handing out its items
+        if isinstance(data, list):
+            for item in data:
+                yield item
+        else:
+            yield data
+        data = None
+        if next_url is None:
+            return
+        response = client.get(request_context, next_url)
+
+
+def get_checkpoint_key(function, args, kwargs):
+    """
+    Return the key that identifies a paged list in a checkpoint: the name of the API function and its arguments
+    """
+    arguments = [repr(arg) for arg in args] + ['%s=%r' % item for item in sorted(kwargs.items())]
+    return '%s(%s)' % (getattr(function, '__name__', repr(function)), ', '.join(arguments))
+
+
+def iter_list_data_with_checkpoint(request_context, checkpoint, function, *args, **kwargs):
+    """
+    Like iter_list_data, yield the json objects of a function request and of every "next" response, and save to
+    checkpoint (see :py:mod:`canvas_sdk.checkpoint`) the url of the next page and the number of items yielded
+    each time the caller has finished with the items of a page.  If the checkpoint holds a saved state, the
+    function isn't called: the crawl resumes from the saved url, so a crawl that failed or was stopped part way
+    picks up where it left off instead of fetching every page again.  The checkpoint is cleared once the last
+    page is finished.
+
+    Items are yielded at least once: the items of a page the caller was working on when the crawl stopped are
+    yielded again on resume.  Pages are prefetched if the request context has prefetch_pages set.
+
+        :param RequestContext request_context: The context required to make an API call
+        :param checkpoint: Where the progress is saved, e.g. a :class:`FileCheckpoint
+            <canvas_sdk.checkpoint.FileCheckpoint>`
+        :param function function: The API function to call
+        :raises ValueError: If the checkpoint was saved by the crawl of a different function or arguments
+        :return: The json objects retrieved while iterating over response links
+        :rtype: iterator
+    """
+    key = get_checkpoint_key(function, args, kwargs)
+    state = checkpoint.load()
+    if state is None:
+        response = function(request_context, *args, **kwargs)
+        item_count = page_count = 0
+    elif state.get('key') != key:
+        raise ValueError("The checkpoint was saved by %s, not %s." % (state.get('key'), key))
+    else:
+        response = client.get(request_context, state['next_url'])
+        item_count, page_count = state['item_count'], state['page_count']
+    next_responses = get_next_responses(request_context, response)
+    try:
+        for response in chain((response,), next_responses):
+            data = client.decode_json(response, request_context.json_decoder)
+            next_url = response.links['next']['url'] if 'next' in response.links else None
+            response = None
+            items = data if isinstance(data, list) else [data]
+            data = None
+            for item in items:
+                yield item
+            item_count += len(items)
+            page_count += 1
+            items = None
+            if next_url is None:
+                checkpoint.clear()
+            else:
+                checkpoint.save({'key': key, 'next_url': next_url, 'item_count': item_count,
+                                 'page_count': page_count})
+    finally:
+        next_responses.close()
 
 
 def masquerade(request_context, function, as_user_id, *args, **kwargs):
@@ -88,14 +426,303 @@ def masquerade(request_context, function, as_user_id, *args, **kwargs):
     return function(request_context, *args, **function_kwargs)
 
 
+def accepts_per_page(function):
+    """
+    Return True if a function takes a per_page argument, as the SDK methods of paginated endpoints do
+    """
+    try:
+        return 'per_page' in inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 def get_count(request_context, function, *args, **kwargs):
     """
-    Make a function request with args and kwargs and return the total result count.  Worst case complexity
-    is O(n).
+    Make a function request with args and kwargs and return the total result count.
+
+    When the function accepts a per_page argument, as the SDK methods of paginated endpoints do, the first page is requested with a single item per page.  When Canvas answers with a numeric "last"
+    link, the count is derived from the last page number and only the final page is fetched, so counting
+    takes at most two requests regardless of the result size.  For bookmark-style cursors the results are
+    streamed with iter_list_data at the maximum page size and counted without being retained, which is
+    O(n) in requests but constant in memory.  The results of other functions are all fetched and counted.
 
         :param RequestContext request_context: The context required to make an API call
         :param function function: The API function to call
         :return: Total result count
         :rtype: int
     """
-    return len(get_all_list_data(request_context, function, *args, **kwargs))
+    if not accepts_per_page(function):
+        return len(get_all_list_data(request_context, function, *args, **kwargs))
+    response = function(request_context, *args, **dict(kwargs, per_page=1))
+    if 'next' not in response.links:
+        return len(client.decode_json(response, request_context.json_decoder))
+    page_urls = get_remaining_page_urls(response)
+    if page_urls:
+        last_response = client.get(request_context, page_urls[-1])
+        return len(page_urls) + len(client.decode_json(last_response, request_context.json_decoder))
+    stream_kwargs = dict(kwargs)
+    if stream_kwargs.get('per_page') is None:
+        stream_kwargs['per_page'] = MAX_PER_PAGE
+    return sum(1 for _ in iter_list_data(request_context, function, *args, **stream_kwargs))
+
+
+def map_concurrent(request_context, function, iterable_of_kwargs, max_workers=8, ordered=False):
+    """
+    Call an API function once for every set of keyword arguments, with at most max_workers calls in flight
+    at once, and yield a MapResult for each call.  Results are yielded as calls complete, or in the order of
+    the arguments if ordered is True.  An exception raised by a call is returned in the error field of its
+    result instead of interrupting the other calls; the function's own retry behavior (see the max_retries
+    and backoff settings of the request context) applies to every call.  Arguments are consumed lazily, so
+    iterable_of_kwargs may be a generator over a very large roster, and closing the returned generator early
+    cancels the calls that have not started yet.
+
+        :param RequestContext request_context: The context required to make an API call
+        :param function function: The API function to call
+        :param iterable_of_kwargs: The keyword arguments of each call, e.g. [{'course_id': 1, 'user_id': 2}, ...]
+        :param int max_workers: (optional) The maximum number of calls in flight at once.  Defaults to 8.
+        :param bool ordered: (optional) Whether results are yielded in the order of the arguments.  Defaults to
+            False.
+        :return: A MapResult(kwargs, response, error) per call
+        :rtype: iterator
+    """
+    kwargs_iterator = iter(iterable_of_kwargs)
+    # Keep a few calls queued beyond the ones in flight so workers don't idle while results are consumed
+    window = max_workers * 2
+    pending = OrderedDict()  # future -> kwargs, in submission order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit_next():
+            for kwargs in kwargs_iterator:
+                pending[executor.submit(function, request_context, **kwargs)] = kwargs
+                return
+
+        try:
+            for _ in range(window):
+                submit_next()
+            while pending:
+                if ordered:
+                    done = [next(iter(pending))]
+                else:
+                    done = [future for future in pending if future.done()]
+                    if not done:
+                        done = wait(pending, return_when=FIRST_COMPLETED).done
+                for future in done:
+                    kwargs = pending.pop(future)
+                    submit_next()
+                    try:
+                        result = MapResult(kwargs, future.result(), None)
+                    except Exception as error:
+                        result = MapResult(kwargs, None, error)
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def parse_timestamp(value):
+    """
+    Parse an ISO 8601 timestamp of the Canvas API into an aware datetime.  A timestamp without an offset is UTC.
+
+        :param str value: The timestamp, e.g. 2020-09-01T12:00:00Z
+        :raises ValueError: If value isn't an ISO 8601 timestamp
+        :rtype: datetime
+    """
+    match = TIMESTAMP_PATTERN.match(value)
+    if match is None:
+        raise ValueError("%r is not an ISO 8601 timestamp." % (value,))
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = timezone.utc
+    if offset and offset != 'Z':
+        offset = offset.replace(':', '')
+        minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+        tzinfo = timezone(timedelta(minutes=-minutes if offset[0] == '-' else minutes))
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                    int((fraction or '0').ljust(6, '0')), tzinfo)
+
+
+def format_timestamp(value):
+    """
+    Format a datetime as the UTC ISO 8601 timestamp Canvas expects, to the second.  A naive datetime is taken
+    to be UTC.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def to_utc(value):
+    """
+    Return a datetime or ISO 8601 timestamp as an aware UTC datetime, truncated to the second.  A naive datetime
+    is taken to be UTC.
+    """
+    if isinstance(value, str):
+        value = parse_timestamp(value)
+    value = value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def get_time_windows(start_time, end_time, count):
+    """
+    Split the time range from start_time to end_time into at most count windows of equal length, in whole
+    seconds.  Consecutive windows share their boundary, as the time range filters of Canvas include both ends.
+
+        :param start_time: The start of the range, a datetime or an ISO 8601 timestamp
+        :param end_time: The end of the range
+        :param int count: The number of windows
+        :return: The (start, end) pairs of the windows in chronological order, as aware UTC datetimes
+        :rtype: list of tuple
+    """
+    start_time, end_time = to_utc(start_time), to_utc(end_time)
+    if end_time < start_time:
+        raise ValueError("end_time must not be before start_time.")
+    seconds = int((end_time - start_time).total_seconds())
+    step = max(1, int(math.ceil(seconds / float(max(1, count)))))
+    boundaries = [start_time + timedelta(seconds=offset) for offset in range(0, seconds, step)] + [end_time]
+    if len(boundaries) == 1:
+        return [(start_time, end_time)]
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def get_page_items(request_context, response, items_key=None):
+    """
+    Return the items of a page of a list: its json if it is a list, the member items_key of its json if it is an
+    object that has one (as the {"events": [...]} pages of the audit log endpoints), or else its json as the one item
+    """
+    data = client.decode_json(response, request_context.json_decoder)
+    if isinstance(data, dict) and items_key in data:
+        return data[items_key]
+    return data if isinstance(data, list) else [data]
+
+
+def iter_time_sharded_list_data(request_context, function, start_time, end_time, *args, windows=8, max_workers=8,
+                                ordered=True, newest_first=True, timestamp_key='created_at', items_key='events',
+                                pages_per_window=4, **kwargs):
+    """
+    Yield the items of a list endpoint filtered by a start_time and end_time (e.g. the grade change and course
+    audit logs, the authentication log, comm messages or page views), fetching the time range as several windows
+    concurrently.  These endpoints paginate with bookmark cursors, so a single query can only be walked one page at
+    a time; windows are separate queries whose pages are walked in parallel.
+
+    The range starts out split into the given number of windows.  Windows then adapt to the density of the items:
+    when the first page of a window shows that walking the rest of it would take more than pages_per_window pages,
+    the rest of its time range is split into further windows that are fetched concurrently as well.
+
+    Items are yielded in timestamp order when ordered is True: windows are yielded one after another, newest first
+    if newest_first is (matching endpoints that list the newest items first, as the audit logs and page views do),
+    so items are never sorted, but the items of windows fetched ahead of the one being yielded are held in memory.
+    With ordered False the items of every page are yielded as soon as it arrives.  Windows share their boundary
+    second, so items with an id whose timestamp falls on a boundary are yielded once.
+
+        :param RequestContext request_context: The context required to make an API call
+        :param function function: The API function to call.  It is called with args, kwargs and the start_time and
+            end_time of a window as UTC ISO 8601 timestamps.
+        :param start_time: The start of the time range, a datetime or an ISO 8601 timestamp.  Naive datetimes are
+            taken to be UTC.
+        :param end_time: The end of the time range
+        :param int windows: (optional) The number of windows the range is split into at first, and the most a
+            window is split into.  Defaults to 8.
+        :param int max_workers: (optional) The maximum number of pages fetched at once.  Defaults to 8.
+        :param bool ordered: (optional) Whether items are yielded in timestamp order.  Defaults to True.
+        :param bool newest_first: (optional) Whether the endpoint lists the newest items first.  Defaults to True.
+        :param str timestamp_key: (optional) The member of an item that holds its timestamp.  Defaults to
+            'created_at'.
+        :param str items_key: (optional) The member of a page that holds its items when the page is a json object
+            rather than a list.  Defaults to 'events', as in the responses of the audit log endpoints.
+        :param int pages_per_window: (optional) The number of pages a window is walked for before it is split.
+            Defaults to 4.
+        :return: The items of the time range
+        :rtype: iterator
+    """
+    futures = []
+    stopped = threading.Event()
+    # The seconds windows meet at, and the ids of the items yielded that fall on them
+    boundaries = set()
+    boundary_ids = set()
+    lock = threading.Lock()
+
+    def split(window_start, window_end, count):
+        """
+        Split a time range into windows, submit them and return their futures in the order they are yielded
+        """
+        time_windows = get_time_windows(window_start, window_end, count)
+        if newest_first:
+            time_windows.reverse()
+        with lock:
+            if stopped.is_set():
+                return []
+            boundaries.update(boundary for time_window in time_windows for boundary in time_window)
+            window_futures = [executor.submit(fetch_window, *time_window) for time_window in time_windows]
+            futures.extend(window_futures)
+        return window_futures
+
+    def fetch_window(window_start, window_end):
+        """
+        Fetch the items of a window, and return them as a list of parts in the order they are yielded: lists of
+        items, and the futures of the windows the rest of the window was split into
+        """
+        response = function(request_context, *args, start_time=format_timestamp(window_start),
+                            end_time=format_timestamp(window_end), **kwargs)
+        items = get_page_items(request_context, response, items_key)
+        parts = [items]
+        if 'next' not in response.links:
+            return parts
+        if items and window_end > window_start and isinstance(items[-1], dict) and items[-1].get(timestamp_key):
+            # How much of the window the first page covered tells how many pages the rest of it will take
+            edge = to_utc(items[-1][timestamp_key])
+            if newest_first:
+                covered, rest = window_end - edge, (window_start, edge)
+            else:
+                covered, rest = edge - window_start, (edge, window_end)
+            remaining = (rest[1] - rest[0]).total_seconds()
+            pages = remaining / covered.total_seconds() if covered.total_seconds() > 0 else float('inf')
+            if pages > pages_per_window and remaining >= 2:
+                count = min(windows, int(math.ceil(pages / pages_per_window)))
+                return parts + split(rest[0], rest[1], count)
+        for next_response in get_next_responses(request_context, response):
+            parts.append(get_page_items(request_context, next_response, items_key))
+            if stopped.is_set():
+                break
+        return parts
+
+    def get_unique(items):
+        for item in items:
+            timestamp = item.get(timestamp_key) if isinstance(item, dict) and 'id' in item else None
+            if timestamp and to_utc(timestamp) in boundaries:
+                with lock:
+                    if item['id'] in boundary_ids:
+                        continue
+                    boundary_ids.add(item['id'])
+            yield item
+
+    def walk(parts):
+        for part in parts:
+            if isinstance(part, Future):
+                for item in walk(part.result()):
+                    yield item
+            else:
+                for item in get_unique(part):
+                    yield item
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            pending = split(start_time, end_time, windows)
+            if ordered:
+                for item in walk(pending):
+                    yield item
+                return
+            pending = set(pending)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for part in future.result():
+                        if isinstance(part, Future):
+                            pending.add(part)
+                        else:
+                            for item in get_unique(part):
+                                yield item
+        finally:
+            # Windows that haven't started are dropped, and windows still running stop after their current page
+            with lock:
+                stopped.set()
+                for future in futures:
+                    future.cancel()
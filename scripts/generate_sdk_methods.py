@@ -16,6 +16,11 @@ FOUR = 4
 EIGHT = 8
 TWELVE = 12
 
+"""
+Longest line written for the payload and choices of an endpoint
+"""
+MAX_LINE_LENGTH = 120
+
 """
 Append to the begining if we encounter a python keyword
 """
@@ -32,6 +37,13 @@ The script will create a new directory relative to the CWD called
 """
 METHODS_DIR = BASE_DIR+'/canvas_sdk/methods'
 
+"""
+The generated modules are built by the engine of the canvas_sdk package the
+script writes to, which also decides how payload keys map to arguments
+"""
+sys.path.insert(0, BASE_DIR)
+from canvas_sdk.engine import get_argument_name
+
 """
 parameters to replace the pre_attachment[*] parameter in the Canvas meta api
 """
@@ -129,8 +141,10 @@ def is_array_param(param):
 
 def build_payload(parameters):
     """
-    build_payload creates a list of parameters to be used in the payload of
-    the api call
+    build_payload creates the list of payload keys of the api call, in the
+    format of the payload of a canvas_sdk.engine.Endpoint: the key alone when
+    the engine can work out the name of its argument, otherwise a
+    (key, argument) pair
     """
     payload = []
     for param in parameters:
@@ -139,10 +153,13 @@ def build_payload(parameters):
         """
         if param['paramType'] != 'path':
             field_name = clean_param(param['name'])
-            field = flatten_param(field_name)
+            field = check_param(flatten_param(field_name))
             if is_array_param(param):
                 field_name += '[]'
-            payload.append("'{0}': {1},".format(field_name, check_param(field)))
+            if get_argument_name(field_name) == field:
+                payload.append(field_name)
+            else:
+                payload.append((field_name, field))
     return payload
 
 
@@ -216,28 +233,19 @@ def get_path_parameters(parameters):
 def check_for_enums(parameters):
     """
     Check for the existance of enums in the parameter list.
-    If an enum exists, we need to build a tuple of the emum names
-    as well as the code that will validate the the enum. We create
-    two lists one that contains the enums as tuples and another that contains
-    the valdiate code. The method returns a list that consistes of these
-    two lists joined with the enums followed by the validate code.
+    If an enum exists, the engine needs to validate the parameter against
+    its values. We create a dictionary that maps the parameter names to a
+    tuple of the enum names, which becomes the choices of the endpoint.
 
     Enum params are just flat strings so there is not need to flatten them.
     """
 
-    enum_line = ''
-    enum_lines = []
-    validate_enums = []
+    choices = {}
     for param in parameters:
         if 'enum' in param:
             param_name = check_param(flatten_param(param['name']))
-            param_enum = param['enum']
-            enum_line = param_name + '_types = ('
-            enums = ", ".join("'{0}'".format(p) for p in param_enum)
-            enum_line += enums + ')'
-            enum_lines.append(enum_line)
-            validate_enums.append('utils.validate_attr_is_acceptable('+param_name+', ' +param_name+'_types)')
-    return enum_lines + validate_enums
+            choices[param_name] = tuple(param['enum'])
+    return choices
 
 
 def convert(name):
@@ -278,39 +286,77 @@ def check_for_pre_attachment_param(parameters):
             break
     return parameters
 
-def build_method(method_name, description, parameters, api_path, http_method, summary, return_type):
+def pack_items(items, spacing):
+    """
+    Lay the reprs of items out on as few lines as fit in MAX_LINE_LENGTH
+    """
+    content = ''
+    line = ''
+    for item in items:
+        text = repr(item) + ','
+        if line and spacing + len(line) + 1 + len(text) > MAX_LINE_LENGTH:
+            content += line_format(line, spacing)
+            line = text
+        else:
+            line = line + ' ' + text if line else text
+    if line:
+        content += line_format(line, spacing)
+    return content
+
+
+def build_endpoint(method_name, description, parameters, api_path, http_method, summary, return_type):
     """
-    build method is used build the methods of the class we are processing.
+    build endpoint is used to build the spec of each method of the module we
+    are processing. canvas_sdk.engine turns the spec into the method.
     """
-    allow_per_page = False
     parameters = check_for_pre_attachment_param(parameters)
     arg_list = get_parameters(parameters)
     param_descriptions = get_parameter_descriptions(parameters)
     payload = build_payload(parameters)
-    enums = check_for_enums(parameters)
+    choices = check_for_enums(parameters)
 
     """
-    If the method returns an array, allow the per_page parameter for paging
+    If the method returns an array, allow the per_page parameter for paging.  The per_page argument marks the
+    endpoint as paginated, so canvas_sdk.engine also gives it an iter_<name> companion that streams every page.
     """
     if return_type == 'array' or (method_name.startswith("list_") and http_method == "GET"):
         arg_list.append('per_page=None')
         param_descriptions.append(':param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE')
         param_descriptions.append(':type per_page: integer or None')
-        payload.append('\'per_page\': per_page,')
-        allow_per_page = True
-
-    arg_list.append('**request_kwargs')
+        payload.append('per_page')
 
     """
-    Create the method signature
+    Create the name, http method, path and arguments of the endpoint
     """
+    content = line_format('Endpoint(', FOUR)
+    content += line_format('{0!r}, {1!r}, {2!r},'.format(method_name, http_method, api_path), EIGHT)
+    content += line_format(repr(', '.join(arg_list)) + ',', EIGHT)
 
-    content = line_format('def ' + method_name + '(request_ctx, ' + ', '.join(arg_list) + '):', NONE)
-    content += line_format('"""', FOUR)
+    """
+    Add a payload and choices if they exist
+    """
+    if payload:
+        payload_line = 'payload={0!r},'.format(tuple(payload))
+        if EIGHT + len(payload_line) <= MAX_LINE_LENGTH:
+            content += line_format(payload_line, EIGHT)
+        else:
+            content += line_format('payload=(', EIGHT)
+            content += pack_items(payload, TWELVE)
+            content += line_format('),', EIGHT)
+    if choices:
+        choices_line = 'choices={0!r},'.format(choices)
+        if EIGHT + len(choices_line) <= MAX_LINE_LENGTH:
+            content += line_format(choices_line, EIGHT)
+        else:
+            content += line_format('choices={', EIGHT)
+            for param_name, enum in choices.items():
+                content += line_format('{0!r}: {1!r},'.format(param_name, enum), TWELVE)
+            content += line_format('},', EIGHT)
 
     """
     Create the method description text from the description in the meta api
     """
+    content += line_format('doc="""', EIGHT)
     regex = re.compile(r'\{api\:(\w+)\#(\w+).*?\}')
     for line in description.splitlines(True):
         rst_line = regex.sub(format_api_string, line)
@@ -327,47 +373,7 @@ def build_method(method_name, description, parameters, api_path, http_method, su
     content += line_format(':return: '+summary, EIGHT)
     content += line_format(':rtype: requests.Response (with ' + return_type + ' data)', EIGHT)
     content += line_format('', NONE)
-    content += line_format('"""', FOUR)
-    content += line_format('', NONE)
-
-    """
-    Add the per_page check
-    """
-    if allow_per_page:
-        content += line_format('if per_page is None:', FOUR)
-        content += line_format('per_page = request_ctx.per_page', EIGHT)
-
-    """
-    Add any enums if they exist.
-    """
-    for enum in enums:
-        content += line_format(enum, FOUR)
-
-    """
-    Add the api path
-    """
-    path_formatted = 'path = \'' + api_path + '\''
-    content += line_format(path_formatted, FOUR)
-
-    """
-    Add a payload if one exists
-    """
-    payload_string = ''
-    if payload:
-        content += line_format('payload = {', FOUR)
-        for item in payload:
-            content += line_format(item, EIGHT)
-        content += line_format('}', FOUR)
-        payload_string = ', payload=payload'
-
-    content += line_format('url = request_ctx.base_api_url + path.format(' + ', '.join(get_path_parameters(parameters)) + ')', FOUR)
-    content += line_format(
-        'response = client.'+http_method.lower()+'(request_ctx, url' + payload_string + ', **request_kwargs)', FOUR)
-
-    content += line_format('', NONE)
-    content += line_format('return response', FOUR)
-    content += line_format('', NONE)
-    content += line_format('', NONE)
+    content += line_format('"""),', FOUR)
     return content
 
 
@@ -381,7 +387,9 @@ def build_module(json_api_url):
     apis = json_resp['apis']
 
     content = line_format('from canvas_sdk import client, utils', NONE)
-    content += '\n\n'
+    content += line_format('from canvas_sdk.engine import Endpoint, build_methods', NONE)
+    content += line_format('', NONE)
+    content += line_format('ENDPOINTS = [', NONE)
 
     """
     Extract the data needed to build the method from the json source
@@ -395,9 +403,12 @@ def build_module(json_api_url):
         parameters = operations['parameters']
         summary = operations['summary']
         return_type = operations['type']
-        content += build_method(
+        content += build_endpoint(
             method_name, description, parameters, api_path, http_method,
             summary, return_type)
+    content += line_format(']', NONE)
+    content += line_format('', NONE)
+    content += line_format('build_methods(ENDPOINTS, globals())', NONE)
     return content
 
 def create_sdk_directories():
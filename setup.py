@@ -33,6 +33,9 @@ setup(
     ],
     extras_require={
         'docs': ['sphinx>=1.2.0'],
+        'aio': ['aiohttp>=3.0'],
+        'fastjson': ['orjson'],
+        'tracing': ['opentelemetry-api'],
     },
     # TODO: `from collections import ABC` imports will break in python 3.8.
     #       They are present both in this library and in the `futurize`
@@ -0,0 +1,159 @@
+import asyncio
+import unittest
+from unittest import mock
+
+try:
+    from multidict import CIMultiDict  # installed along with aiohttp
+except ImportError:
+    CIMultiDict = dict
+
+from canvas_sdk.client import aio
+from canvas_sdk.client.hooks import RequestObserver
+from canvas_sdk.exceptions import (
+    SDKException, CanvasAPIError, InvalidOAuthTokenError)
+
+
+class FakeAioResponse(object):
+    """
+    Stand-in for an aiohttp.ClientResponse used as an async context manager
+    """
+
+    def __init__(self, status=200, body=b'[]', headers=None, url='http://fake/url'):
+        self.status = status
+        self.body = body
+        self.headers = CIMultiDict(headers or {})
+        self.url = url
+        self.reason = 'Reason'
+
+    async def read(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+@unittest.skipIf(aio.aiohttp is None, "aiohttp is not installed")
+class TestAio(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.base_api_url = "https://path/to/canvas/api"
+        self.url = self.base_api_url + "/fake/path/to/method"
+        self.req_ctx = aio.AsyncRequestContext('my-token', self.base_api_url, backoff=None)
+        self.aio_session = mock.MagicMock(name='aio-session', closed=False)
+        self.aio_session.request.return_value = FakeAioResponse()
+        self.req_ctx.async_session = self.aio_session
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def run_call(self, *args, **kwargs):
+        return self.loop.run_until_complete(aio.call(*args, **kwargs))
+
+    def set_responses(self, *responses):
+        self.aio_session.request.side_effect = list(responses)
+
+    def test_call_returns_requests_response_with_content(self):
+        """
+        Test that 'call' returns a requests.Response holding the body, headers and url
+        of the aiohttp response.
+        """
+        self.set_responses(FakeAioResponse(
+            body=b'[{"id": 1}]', headers={'Link': '<http://next/url>; rel="next"'},
+            url=self.url))
+        response = self.run_call("GET", self.url, self.req_ctx)
+        self.assertEqual(response.json(), [{'id': 1}])
+        self.assertEqual(response.links['next']['url'], 'http://next/url')
+        self.assertEqual(response.url, self.url)
+
+    def test_call_encodes_params_like_requests(self):
+        """
+        Test that params are serialized with the requests library, so list values are
+        repeated and None values are dropped.
+        """
+        self.run_call("GET", self.url, self.req_ctx,
+                      params={'include[]': ['a', 'b'], 'per_page': None})
+        sent_url = self.aio_session.request.call_args[0][1]
+        self.assertEqual(sent_url, self.url + '?include%5B%5D=a&include%5B%5D=b')
+
+    def test_call_sends_bearer_authorization_header(self):
+        """
+        Test that the request carries the context's OAuth2 token, or the token passed to call.
+        """
+        self.run_call("GET", self.url, self.req_ctx)
+        headers = self.aio_session.request.call_args[1]['headers']
+        self.assertEqual(headers['Authorization'], 'Bearer my-token')
+
+        self.aio_session.request.side_effect = [FakeAioResponse()]
+        self.run_call("GET", self.url, self.req_ctx, auth_token='other-token')
+        headers = self.aio_session.request.call_args[1]['headers']
+        self.assertEqual(headers['Authorization'], 'Bearer other-token')
+
+    @mock.patch('canvas_sdk.client.base.RETRY_ERROR_CODES', (503,))
+    def test_call_retries_retriable_status_codes(self):
+        """
+        Test that a retriable error is retried and the eventual success returned
+        """
+        self.set_responses(FakeAioResponse(status=503), FakeAioResponse(body=b'{"ok": true}'))
+        response = self.run_call("GET", self.url, self.req_ctx, max_retries=2)
+        self.assertEqual(response.json(), {'ok': True})
+        self.assertEqual(self.aio_session.request.call_count, 2)
+
+    @mock.patch('canvas_sdk.client.base.RETRY_ERROR_CODES', (503,))
+    def test_call_raises_canvas_api_error_after_retries_exhausted(self):
+        """
+        Test that a CanvasAPIError with the error json is raised once retries are exhausted
+        """
+        self.set_responses(*[FakeAioResponse(status=503, body=b'{"errors": []}')] * 3)
+        with self.assertRaises(CanvasAPIError) as canvas_error:
+            self.run_call("GET", self.url, self.req_ctx, max_retries=2)
+        self.assertEqual(self.aio_session.request.call_count, 3)
+        self.assertEqual(canvas_error.exception.status_code, 503)
+        self.assertEqual(canvas_error.exception.error_json, {'errors': []})
+
+    @mock.patch('canvas_sdk.client.base.RETRY_ERROR_CODES', (503,))
+    def test_call_raises_immediately_when_status_code_not_in_retry_list(self):
+        """
+        Test that a non-retriable error is raised without retrying
+        """
+        self.set_responses(FakeAioResponse(status=404, body=b'Not Found'))
+        with self.assertRaises(SDKException) as canvas_error:
+            self.run_call("GET", self.url, self.req_ctx, max_retries=3)
+        self.assertEqual(self.aio_session.request.call_count, 1)
+        self.assertEqual(canvas_error.exception.error_msg, 'Not Found')
+
+    @mock.patch('canvas_sdk.client.base.RETRY_ERROR_CODES', (503,))
+    def test_call_notifies_observers_of_attempts_and_retries(self):
+        """
+        Test that observers are notified of each attempt, its response and the retry, as by the blocking client
+        """
+        observer = mock.Mock(spec=RequestObserver)
+        self.req_ctx.observers = [observer]
+        self.set_responses(FakeAioResponse(status=503), FakeAioResponse(body=b'{"ok": true}'))
+        self.run_call("GET", self.url, self.req_ctx, max_retries=1)
+        self.assertEqual([name for name, _, _ in observer.mock_calls], [
+            'before_request', 'after_response', 'on_retry', 'before_request', 'after_response'])
+        self.assertEqual(observer.after_response.call_args[0][2].json(), {'ok': True})
+
+    def test_call_raises_invalid_oauth_token_error_when_401_and_auth_header(self):
+        """
+        Test that an InvalidOAuthTokenError is raised on 401s with a WWW-Authenticate header
+        """
+        self.set_responses(FakeAioResponse(status=401, headers={'WWW-Authenticate': ''}))
+        with self.assertRaises(InvalidOAuthTokenError):
+            self.run_call("GET", self.url, self.req_ctx)
+
+    @mock.patch('canvas_sdk.client.aio.call')
+    def test_get_merges_payload_into_params(self, call_mock):
+        """
+        Test that the get coroutine passes its payload to call as url params
+        """
+        async def fake_call(*args, **kwargs):
+            return 'response'
+        call_mock.side_effect = fake_call
+        result = self.loop.run_until_complete(
+            aio.get(self.req_ctx, self.url, {'foo': 'bar'}))
+        self.assertEqual(result, 'response')
+        call_mock.assert_called_once_with("GET", self.url, self.req_ctx, params={'foo': 'bar'})
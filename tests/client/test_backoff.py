@@ -0,0 +1,89 @@
+import unittest
+from unittest import mock
+from email.utils import formatdate
+
+from canvas_sdk.client.backoff import Backoff
+
+
+class TestBackoff(unittest.TestCase):
+    longMessage = True
+
+    def build_response_mock(self, headers=None):
+        response = mock.MagicMock(name='response')
+        response.headers = headers or {}
+        return response
+
+    def test_get_delay_grows_exponentially_without_jitter(self):
+        """
+        Test that the delay is base_delay * multiplier ** retry when jitter is disabled
+        """
+        backoff = Backoff(base_delay=0.5, multiplier=3, max_delay=100, jitter=False)
+        self.assertEqual([backoff.get_delay(retry) for retry in range(4)], [0.5, 1.5, 4.5, 13.5])
+
+    def test_get_delay_is_capped_at_max_delay(self):
+        """
+        Test that the delay never exceeds max_delay, even for very long retry chains
+        """
+        backoff = Backoff(base_delay=1, multiplier=2, max_delay=10, jitter=False)
+        self.assertEqual(backoff.get_delay(5), 10)
+        self.assertEqual(backoff.get_delay(5000), 10)
+
+    @mock.patch('canvas_sdk.client.backoff.random.uniform')
+    def test_get_delay_applies_full_jitter(self, uniform_mock):
+        """
+        Test that full jitter draws the delay between 0 and the exponential delay
+        """
+        backoff = Backoff(base_delay=1, multiplier=2, max_delay=10)
+        result = backoff.get_delay(2)
+        uniform_mock.assert_called_once_with(0, 4)
+        self.assertEqual(result, uniform_mock.return_value)
+
+    def test_get_delay_honors_retry_after_seconds(self):
+        """
+        Test that a Retry-After header given in seconds takes precedence over the exponential delay
+        """
+        backoff = Backoff(base_delay=1, max_delay=60)
+        response = self.build_response_mock({'Retry-After': '7'})
+        self.assertEqual(backoff.get_delay(0, response), 7)
+
+    def test_get_delay_caps_retry_after_at_max_delay(self):
+        """
+        Test that a Retry-After header can't ask for a longer delay than max_delay
+        """
+        backoff = Backoff(max_delay=5)
+        response = self.build_response_mock({'Retry-After': '120'})
+        self.assertEqual(backoff.get_delay(0, response), 5)
+
+    @mock.patch('canvas_sdk.client.backoff.time.time')
+    def test_get_retry_after_parses_http_date(self, time_mock):
+        """
+        Test that a Retry-After header given as an HTTP date is converted to seconds from now
+        """
+        time_mock.return_value = 1000000000
+        response = self.build_response_mock({'Retry-After': formatdate(1000000030, usegmt=True)})
+        self.assertEqual(Backoff.get_retry_after(response), 30)
+
+    def test_get_retry_after_ignores_missing_or_invalid_header(self):
+        """
+        Test that get_retry_after returns None when there is no usable Retry-After header
+        """
+        self.assertIsNone(Backoff.get_retry_after(None))
+        self.assertIsNone(Backoff.get_retry_after(self.build_response_mock()))
+        self.assertIsNone(Backoff.get_retry_after(self.build_response_mock({'Retry-After': 'soon'})))
+
+    def test_get_delay_ignores_retry_after_when_disabled(self):
+        """
+        Test that Retry-After is ignored when respect_retry_after is False
+        """
+        backoff = Backoff(base_delay=2, jitter=False, respect_retry_after=False)
+        response = self.build_response_mock({'Retry-After': '30'})
+        self.assertEqual(backoff.get_delay(0, response), 2)
+
+    def test_initialize_rejects_invalid_values(self):
+        """
+        Test that negative delays and multipliers below 1 raise a ValueError
+        """
+        with self.assertRaises(ValueError):
+            Backoff(base_delay=-1)
+        with self.assertRaises(ValueError):
+            Backoff(multiplier=0.5)
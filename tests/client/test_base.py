@@ -6,6 +6,8 @@ from requests.exceptions import HTTPError
 
 from canvas_sdk import client
 from canvas_sdk.client import base
+from canvas_sdk.client.base import build_response
+from canvas_sdk.client.cache import ETagCache, ResponseCache
 from canvas_sdk.exceptions import (
     SDKException, CanvasAPIError, InvalidOAuthTokenError)
 
@@ -34,6 +36,15 @@ class TestBase(unittest.TestCase):
         self.req_ctx.base_api_url = self.base_api_url
         self.req_ctx.session = self.session
         self.req_ctx.max_retries = 0
+        self.req_ctx.backoff = None
+        self.req_ctx.throttle = None
+        self.req_ctx.etag_cache = None
+        self.req_ctx.response_cache = None
+        self.req_ctx.single_flight = None
+        self.req_ctx.json_decoder = None
+        self.req_ctx.observers = None
+        self.req_ctx.tracer = None
+        self.req_ctx.page_size_policy = None
         self.payload = {'foo': 'bar'}
         self.request_kwargs = {'headers': {'my': 'header'}, 'timeout': 30}
 
@@ -526,6 +537,16 @@ class TestBase(unittest.TestCase):
         self.assertEqual(canvas_error.error_json, error_json)
         self.assertEqual(canvas_error.error_msg, str(error_json))
 
+    def test_call_parses_canvas_api_error_body_with_context_json_decoder(self):
+        """
+        Test that the json body of an error response is decoded with the decoder of the request context
+        """
+        self.req_ctx.json_decoder = mock.Mock(name='json-decoder', return_value={'errors': ['not found']})
+        canvas_error = self.make_retry_call_with_error_code(404)
+
+        self.req_ctx.json_decoder.assert_called_once_with(self.session.request.return_value.content)
+        self.assertEqual(canvas_error.error_json, {'errors': ['not found']})
+
     def test_call_raises_invalid_oauth_token_error_when_401_and_auth_header(self):
         """
         Test that an InvalidOAuthTokenError gets raised on 401 responses that
@@ -561,3 +582,157 @@ class TestBase(unittest.TestCase):
             error_code, max_retries=1, response_headers=resp_headers)
 
         self.assertIs(type(canvas_error), CanvasAPIError)
+
+    @patch('canvas_sdk.client.base.time.sleep')
+    @patch('canvas_sdk.client.base.RETRY_ERROR_CODES', (503,))
+    def test_call_sleeps_for_backoff_delay_between_retries(self, sleep_mock):
+        """
+        Test that the 'call' method waits for the delay given by the context's
+        backoff policy before each retry, but not after the final attempt.
+        """
+        self.req_ctx.backoff = mock.MagicMock(name='backoff')
+        self.req_ctx.backoff.get_delay.side_effect = [1.5, 3.0]
+        self.make_retry_call_with_error_code(503, max_retries=2)
+        self.req_ctx.backoff.get_delay.assert_has_calls([
+            mock.call(0, self.session.request.return_value),
+            mock.call(1, self.session.request.return_value)])
+        sleep_mock.assert_has_calls([mock.call(1.5), mock.call(3.0)])
+        self.assertEqual(2, sleep_mock.call_count)
+
+    @patch('canvas_sdk.client.base.time.sleep')
+    @patch('canvas_sdk.client.base.RETRY_ERROR_CODES', (503,))
+    def test_call_does_not_sleep_without_backoff(self, sleep_mock):
+        """
+        Test that the 'call' method retries immediately when the context has
+        no backoff policy.
+        """
+        self.make_retry_call_with_error_code(503, max_retries=2)
+        self.assertFalse(sleep_mock.called)
+
+    def test_call_retries_rate_limited_forbidden_response(self):
+        """
+        Test that a 403 caused by the Canvas rate limit is retried like the
+        status codes in RETRY_ERROR_CODES.
+        """
+        self.session.request.return_value.text = '403 Forbidden (Rate Limit Exceeded)'
+        self.make_retry_call_with_error_code(403, max_retries=2)
+        self.assertEqual(3, self.session.request.call_count,
+                         "Rate limited requests should be retried")
+
+    def test_call_does_not_retry_other_forbidden_responses(self):
+        """
+        Test that a 403 that isn't caused by the rate limit is raised without
+        retrying.
+        """
+        self.session.request.return_value.text = 'user not authorized to perform that action'
+        canvas_error = self.make_retry_call_with_error_code(403, max_retries=2)
+        self.assertEqual(1, self.session.request.call_count)
+        self.assertIs(type(canvas_error), CanvasAPIError)
+
+    @patch('canvas_sdk.client.base.time.sleep')
+    def test_call_waits_for_throttle_and_updates_it_with_response(self, sleep_mock):
+        """
+        Test that the 'call' method reserves quota from the context's throttle,
+        waits for the delay it returns, and reports the response back to it.
+        """
+        self.req_ctx.throttle = mock.MagicMock(name='throttle')
+        self.req_ctx.throttle.reserve.return_value = 2.5
+        base.call("GET", self.url, self.req_ctx)
+        sleep_mock.assert_called_once_with(2.5)
+        self.req_ctx.throttle.update.assert_called_once_with(
+            self.session.request.return_value)
+
+    def test_call_sends_if_none_match_for_cached_get_and_returns_cached_body_on_304(self):
+        """
+        Test that a GET for a url cached in the context's ETag cache is sent
+        with an If-None-Match header, and that the cached body is returned when
+        Canvas answers 304 Not Modified.
+        """
+        self.req_ctx.etag_cache = ETagCache()
+        self.req_ctx.auth_token = 'my-auth-token'
+        cached = build_response(200, {'ETag': '"v1"'}, b'{"id": 1}', self.url)
+        self.req_ctx.etag_cache.set(
+            ETagCache.get_key(self.url, {'foo': 'bar'}, self.req_ctx.auth_token), cached)
+        self.session.request.return_value = build_response(304, {}, b'', self.url)
+
+        result = base.call("GET", self.url, self.req_ctx, params={'foo': 'bar'})
+        self.assertEqual(self.session.request.call_args[1]['headers'], {'If-None-Match': '"v1"'})
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.json(), {'id': 1})
+
+    def test_call_stores_get_responses_with_etag_in_cache(self):
+        """
+        Test that a successful GET response with an ETag is stored in the
+        context's ETag cache, and that no conditional header is sent for
+        uncached urls.
+        """
+        self.req_ctx.etag_cache = ETagCache()
+        self.req_ctx.auth_token = 'my-auth-token'
+        self.session.request.return_value = build_response(200, {'ETag': '"v1"'}, b'[]', self.url)
+
+        base.call("GET", self.url, self.req_ctx)
+        self.assertIsNone(self.session.request.call_args[1]['headers'])
+        self.assertEqual(len(self.req_ctx.etag_cache), 1)
+
+    def test_call_does_not_use_etag_cache_for_other_methods(self):
+        """
+        Test that only GET requests are cached
+        """
+        self.req_ctx.etag_cache = ETagCache()
+        self.req_ctx.auth_token = 'my-auth-token'
+        self.session.request.return_value = build_response(200, {'ETag': '"v1"'}, b'[]', self.url)
+
+        base.call("POST", self.url, self.req_ctx)
+        self.assertEqual(len(self.req_ctx.etag_cache), 0)
+
+    def test_call_returns_fresh_response_cache_entry_without_request(self):
+        """
+        Test that a GET for an endpoint cached in the context's response cache
+        is answered from the cache without making a request.
+        """
+        self.req_ctx.auth_token = 'my-auth-token'
+        self.req_ctx.response_cache = ResponseCache(policies={'/fake/path/to/method': 60})
+        self.session.request.return_value = build_response(200, {}, b'{"id": 1}', self.url)
+
+        first = base.call("GET", self.url, self.req_ctx)
+        second = base.call("GET", self.url, self.req_ctx)
+        self.assertEqual(1, self.session.request.call_count,
+                         "The second call should have been answered from the cache")
+        self.assertEqual(first.json(), second.json())
+
+    def test_call_bypasses_response_cache_for_endpoints_without_ttl(self):
+        """
+        Test that endpoints that match no policy of the response cache are
+        neither served from nor stored in the cache.
+        """
+        self.req_ctx.auth_token = 'my-auth-token'
+        self.req_ctx.response_cache = ResponseCache(policies={'/v1/roles': 60})
+        self.session.request.return_value = build_response(200, {}, b'{"id": 1}', self.url)
+
+        base.call("GET", self.url, self.req_ctx)
+        base.call("GET", self.url, self.req_ctx)
+        self.assertEqual(2, self.session.request.call_count)
+        self.assertEqual(0, len(self.req_ctx.response_cache.backend))
+
+    def test_call_coalesces_get_requests_through_single_flight(self):
+        """
+        Test that GET requests are made through the context's single flight
+        group, keyed by url, params and token.
+        """
+        self.req_ctx.auth_token = 'my-auth-token'
+        self.req_ctx.single_flight = mock.MagicMock(name='single-flight')
+        result = base.call("GET", self.url, self.req_ctx, params={'foo': 'bar'})
+        self.req_ctx.single_flight.do.assert_called_once_with(
+            base.get_cache_key(self.url, {'foo': 'bar'}, 'my-auth-token'), mock.ANY)
+        self.assertEqual(result, self.req_ctx.single_flight.do.return_value)
+        self.assertFalse(self.session.request.called,
+                         "The request should be left to the single flight group")
+
+    def test_call_does_not_coalesce_other_methods(self):
+        """
+        Test that only GET requests are coalesced
+        """
+        self.req_ctx.single_flight = mock.MagicMock(name='single-flight')
+        base.call("POST", self.url, self.req_ctx)
+        self.assertFalse(self.req_ctx.single_flight.do.called)
+        self.assertTrue(self.session.request.called)
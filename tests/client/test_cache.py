@@ -0,0 +1,169 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from canvas_sdk.client.base import build_response
+from canvas_sdk.client.cache import (
+    CachedResponse, ETagCache, MemoryBackend, ResponseCache, SQLiteBackend, get_cache_key)
+
+
+class TestETagCache(unittest.TestCase):
+    longMessage = True
+
+    def build_response(self, content=b'[]', etag='"v1"', status_code=200):
+        headers = {'ETag': etag} if etag else {}
+        return build_response(status_code, headers, content, 'http://canvas/api/v1/roles')
+
+    def test_get_cache_key_includes_serialized_params_and_token(self):
+        """
+        Test that keys differ by query params and access token, and that equivalent params produce the same key
+        """
+        url = 'http://canvas/api/v1/roles'
+        key = get_cache_key(url, {'per_page': 10, 'state[]': ['active']}, 'token')
+        self.assertEqual(key, get_cache_key(url, {'per_page': 10, 'state[]': ['active'], 'page': None}, 'token'))
+        self.assertNotEqual(key, get_cache_key(url, {'per_page': 20, 'state[]': ['active']}, 'token'))
+        self.assertNotEqual(key, get_cache_key(url, {'per_page': 10, 'state[]': ['active']}, 'other-token'))
+        self.assertNotIn('token', key.split(' ')[0], "The access token should not be stored in plain text")
+
+    def test_set_and_get_round_trip_response(self):
+        """
+        Test that a stored response can be retrieved and rebuilt as a requests.Response
+        """
+        cache = ETagCache()
+        cache.set('key', self.build_response(b'[{"id": 1}]'))
+        entry = cache.get('key')
+        self.assertEqual(entry.etag, '"v1"')
+        self.assertEqual(entry.to_response().json(), [{'id': 1}])
+
+    def test_set_ignores_responses_without_etag_or_unsuccessful(self):
+        """
+        Test that only 200 responses with an ETag are stored
+        """
+        cache = ETagCache()
+        cache.set('no-etag', self.build_response(etag=None))
+        cache.set('error', self.build_response(status_code=500))
+        self.assertEqual(len(cache), 0)
+
+    def test_set_evicts_least_recently_used_entries_beyond_max_bytes(self):
+        """
+        Test that the cache stays within max_bytes by evicting the least recently used entries
+        """
+        entry_size = CachedResponse.from_response(self.build_response(b'x' * 100)).size
+        cache = ETagCache(max_bytes=entry_size * 2)
+        cache.set('a', self.build_response(b'x' * 100))
+        cache.set('b', self.build_response(b'x' * 100))
+        cache.get('a')  # 'a' is now the most recently used entry
+        cache.set('c', self.build_response(b'x' * 100))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.size, entry_size * 2)
+
+    def test_set_skips_responses_larger_than_max_bytes(self):
+        """
+        Test that a response that can never fit doesn't flush the cache
+        """
+        cache = ETagCache(max_bytes=200)
+        cache.set('small', self.build_response(b'x'))
+        cache.set('large', self.build_response(b'x' * 1000))
+        self.assertIsNotNone(cache.get('small'))
+        self.assertIsNone(cache.get('large'))
+
+    def test_to_response_prefers_revalidation_headers_except_entity_headers(self):
+        """
+        Test that headers of a 304 response replace cached ones, except for those describing the body
+        """
+        entry = CachedResponse.from_response(build_response(
+            200, {'ETag': '"v1"', 'Content-Type': 'application/json', 'X-Rate-Limit-Remaining': '600'},
+            b'[]', 'http://canvas/api/v1/roles'))
+        response = entry.to_response({'Content-Type': 'text/plain', 'X-Rate-Limit-Remaining': '550'})
+        self.assertEqual(response.headers['Content-Type'], 'application/json')
+        self.assertEqual(response.headers['X-Rate-Limit-Remaining'], '550')
+
+
+class TestResponseCache(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.entry = CachedResponse.from_response(build_response(
+            200, {'Content-Type': 'application/json', 'ETag': '"v1"'}, b'[{"id": 1}]',
+            'http://canvas/api/v1/accounts/1/roles'))
+
+    def test_get_ttl_matches_endpoint_templates(self):
+        """
+        Test that a url gets the TTL of the first matching endpoint template, or the default TTL
+        """
+        cache = ResponseCache(policies={
+            '/v1/accounts/{account_id}/roles': 600,
+            '/v1/accounts/{id}': 3600,
+        }, default_ttl=5)
+        self.assertEqual(cache.get_ttl('http://canvas/api/v1/accounts/1/roles?per_page=10'), 600)
+        self.assertEqual(cache.get_ttl('http://canvas/api/v1/accounts/sis_account_id:abc'), 3600)
+        self.assertEqual(cache.get_ttl('http://canvas/api/v1/accounts/1/roles/2'), 5)
+
+    def test_get_ttl_returns_none_for_unmatched_urls_without_default(self):
+        """
+        Test that only endpoints listed in the policies are cached by default
+        """
+        cache = ResponseCache(policies={'/v1/accounts/{account_id}/terms': 600})
+        self.assertIsNone(cache.get_ttl('http://canvas/api/v1/courses/1'))
+
+    def test_set_only_stores_successful_responses(self):
+        """
+        Test that error responses are not cached
+        """
+        cache = ResponseCache()
+        cache.set('error', build_response(500, {}, b'', 'http://canvas/api'), 60)
+        cache.set('ok', build_response(200, {}, b'[]', 'http://canvas/api'), 60)
+        self.assertIsNone(cache.get('error'))
+        self.assertIsNotNone(cache.get('ok'))
+
+    @mock.patch('canvas_sdk.client.cache.time.time')
+    def test_memory_backend_expires_entries_after_ttl(self, time_mock):
+        """
+        Test that entries of the memory backend are no longer returned once their TTL has passed
+        """
+        time_mock.return_value = 1000
+        backend = MemoryBackend()
+        backend.set('key', self.entry, 60)
+        time_mock.return_value = 1059
+        self.assertEqual(backend.get('key'), self.entry)
+        time_mock.return_value = 1060
+        self.assertIsNone(backend.get('key'))
+        self.assertEqual(len(backend), 0)
+
+    def test_sqlite_backend_round_trips_entries_between_instances(self):
+        """
+        Test that an entry written by one SQLite backend can be read by another using the same file,
+        as separate worker processes would.
+        """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'cache.db')
+        writer, reader = SQLiteBackend(path), SQLiteBackend(path)
+        self.addCleanup(writer.close)
+        self.addCleanup(reader.close)
+        writer.set('key', self.entry, 60)
+
+        entry = reader.get('key')
+        self.assertEqual(entry, self.entry)
+        self.assertEqual(entry.to_response().json(), [{'id': 1}])
+
+    @mock.patch('canvas_sdk.client.cache.time.time')
+    def test_sqlite_backend_expires_and_purges_entries(self, time_mock):
+        """
+        Test that expired entries of the SQLite backend are not returned and can be purged
+        """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        backend = SQLiteBackend(os.path.join(directory, 'cache.db'))
+        self.addCleanup(backend.close)
+        time_mock.return_value = 1000
+        backend.set('key', self.entry, 60)
+        time_mock.return_value = 1060
+        self.assertIsNone(backend.get('key'))
+        self.assertEqual(len(backend), 1)
+        backend.purge_expired()
+        self.assertEqual(len(backend), 0)
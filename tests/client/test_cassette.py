@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from canvas_sdk import utils
+from canvas_sdk.client import Cassette, RequestContext
+from canvas_sdk.client.cassette import CassetteMissError
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import courses, enrollments
+from canvas_sdk.testing import FakeCanvasServer
+
+
+class TestCassette(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'cassette.jsonl.gz')
+
+    def record(self, function, **server_kwargs):
+        """
+        Record what function does with a request context against a fake Canvas server, and return its result
+        """
+        server_kwargs = dict(dict(courses_per_account=2, enrollments_per_course=25, rate_limit=700), **server_kwargs)
+        with FakeCanvasServer(**server_kwargs) as server:
+            with Cassette(self.path, mode='record') as cassette:
+                request_context = RequestContext('secret-token', server.base_api_url, per_page=10, backoff=None,
+                                                 cassette=cassette)
+                return function(request_context)
+
+    def get_replay_context(self, **kwargs):
+        return RequestContext('token', 'https://canvas.example.edu/api', per_page=10, backoff=None,
+                              cassette=Cassette(self.path, **kwargs))
+
+    def test_replays_paginated_list(self):
+        """
+        Test that a paginated list is replayed with its Link headers, without a server, from any base_api_url
+        """
+        def get_enrollments(request_context):
+            return utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1)
+
+        recorded = self.record(get_enrollments)
+        self.assertEqual(get_enrollments(self.get_replay_context()), recorded)
+        self.assertEqual(len(recorded), 25)
+
+    def test_replays_with_page_workers(self):
+        """
+        Test that pages recorded by walking next links can be replayed concurrently
+        """
+        recorded = self.record(
+            lambda request_context: utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1))
+        request_context = self.get_replay_context()
+        request_context.page_workers = 4
+        self.assertEqual(utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1), recorded)
+
+    def test_replays_headers_and_errors(self):
+        """
+        Test that rate limit headers and error responses are replayed, in the order they were recorded
+        """
+        with FakeCanvasServer(rate_limit=700) as server:
+            server.fail_next(503)
+            with Cassette(self.path, mode='record') as cassette:
+                request_context = RequestContext('token', server.base_api_url, max_retries=1, backoff=None,
+                                                 cassette=cassette)
+                courses.get_single_course_courses(request_context, 1)
+        self.assertEqual([interaction['status'] for interaction in Cassette(self.path).interactions], [503, 200])
+        request_context = self.get_replay_context()
+        request_context.max_retries = 1
+        response = courses.get_single_course_courses(request_context, 1)
+        self.assertEqual(response.json()['id'], 1)
+        self.assertEqual(float(response.headers['X-Request-Cost']), 1.0)
+        self.assertIn('X-Rate-Limit-Remaining', response.headers)
+        with self.assertRaises(CanvasAPIError) as context:
+            courses.get_single_course_courses(self.get_replay_context(), 1)
+        self.assertEqual(context.exception.status_code, 503)
+
+    def test_last_response_is_repeated(self):
+        """
+        Test that the last recorded response of a request is replayed for every repeat of it
+        """
+        self.record(lambda request_context: courses.get_single_course_courses(request_context, 1))
+        request_context = self.get_replay_context()
+        for _ in range(3):
+            self.assertEqual(courses.get_single_course_courses(request_context, 1).json()['id'], 1)
+
+    def test_key_matches_method_path_query_and_body(self):
+        """
+        Test that the key of a request depends on its method, path, query and body, but not its host
+        """
+        key = Cassette.get_key('POST', 'https://canvas.example.edu/api/v1/courses?a=1', b'name=A')
+        self.assertEqual(key, Cassette.get_key('POST', 'http://localhost:8000/api/v1/courses?a=1', 'name=A'))
+        self.assertNotEqual(key, Cassette.get_key('POST', 'https://canvas.example.edu/api/v1/courses?a=1', 'name=B'))
+        self.assertNotEqual(key, Cassette.get_key('POST', 'https://canvas.example.edu/api/v1/courses?a=2', 'name=A'))
+        self.assertNotEqual(key, Cassette.get_key('PUT', 'https://canvas.example.edu/api/v1/courses?a=1', 'name=A'))
+
+    def test_missing_request_raises(self):
+        """
+        Test that replaying a request that wasn't recorded raises CassetteMissError
+        """
+        self.record(lambda request_context: courses.get_single_course_courses(request_context, 1))
+        with self.assertRaises(CassetteMissError):
+            courses.get_single_course_courses(self.get_replay_context(), 2)
+
+    def test_recorded_latency(self):
+        """
+        Test that replay sleeps for the recorded latency, or for a fixed latency
+        """
+        self.record(lambda request_context: courses.get_single_course_courses(request_context, 1), latency=0.05)
+        with mock.patch('canvas_sdk.client.cassette.time.sleep') as sleep_mock:
+            courses.get_single_course_courses(self.get_replay_context(latency='recorded'), 1)
+        self.assertGreaterEqual(sleep_mock.call_args[0][0], 0.05)
+        with mock.patch('canvas_sdk.client.cassette.time.sleep') as sleep_mock:
+            courses.get_single_course_courses(self.get_replay_context(latency=0.2), 1)
+        sleep_mock.assert_called_once_with(0.2)
+
+    def test_uncompressed_cassette(self):
+        """
+        Test that a cassette whose path doesn't end in .gz is recorded and replayed as plain text
+        """
+        self.path = os.path.join(self.directory, 'cassette.jsonl')
+        self.record(lambda request_context: courses.get_single_course_courses(request_context, 1))
+        with open(self.path) as cassette_file:
+            self.assertEqual(len(cassette_file.readlines()), 1)
+        self.assertEqual(courses.get_single_course_courses(self.get_replay_context(), 1).json()['id'], 1)
+
+    def test_request_headers_are_not_recorded(self):
+        """
+        Test that the headers of a request, and so its token, are left out of the cassette
+        """
+        self.path = os.path.join(self.directory, 'cassette.jsonl')
+        self.record(lambda request_context: courses.get_single_course_courses(request_context, 1))
+        with open(self.path) as cassette_file:
+            self.assertNotIn('secret-token', cassette_file.read())
+
+    def test_invalid_mode(self):
+        """
+        Test that a mode other than record or replay raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            Cassette(self.path, mode='rewind')
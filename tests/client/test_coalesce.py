@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import unittest
+
+from canvas_sdk.client.coalesce import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    longMessage = True
+
+    def run_concurrently(self, single_flight, key, function, count=5):
+        """
+        Start count threads calling single_flight.do while function blocks until all of them have
+        started, and return the results (or exceptions) of every thread.
+        """
+        outcomes = []
+
+        def worker():
+            try:
+                outcomes.append(single_flight.do(key, function))
+            except Exception as error:
+                outcomes.append(error)
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return outcomes
+
+    def test_do_shares_result_of_concurrent_calls(self):
+        """
+        Test that concurrent calls with the same key make a single call and all receive its result
+        """
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            release.wait(5)
+            return 'response'
+
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        outcomes = self.run_concurrently(single_flight, 'key', function)
+        self.assertEqual(len(calls), 1, "Only one call should have been made")
+        self.assertEqual(outcomes, ['response'] * 5)
+
+    def test_do_shares_exception_of_concurrent_calls(self):
+        """
+        Test that every waiter receives the exception raised by the shared call
+        """
+        single_flight = SingleFlight()
+        release = threading.Event()
+        error = ValueError('boom')
+
+        def function():
+            release.wait(5)
+            raise error
+
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        outcomes = self.run_concurrently(single_flight, 'key', function)
+        self.assertEqual(outcomes, [error] * 5)
+
+    def test_do_makes_new_call_once_previous_call_completed(self):
+        """
+        Test that results are only shared while a call is in flight
+        """
+        single_flight = SingleFlight()
+        results = iter(['first', 'second'])
+        self.assertEqual(single_flight.do('key', lambda: next(results)), 'first')
+        self.assertEqual(single_flight.do('key', lambda: next(results)), 'second')
+
+    def test_do_async_shares_result_of_concurrent_calls(self):
+        """
+        Test that concurrent coroutines with the same key await a single call and all receive its result
+        """
+        single_flight = SingleFlight()
+        calls = []
+
+        async def request():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'response'
+
+        async def run():
+            return await asyncio.gather(*[single_flight.do_async('key', request) for _ in range(5)])
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        self.assertEqual(loop.run_until_complete(run()), ['response'] * 5)
+        self.assertEqual(len(calls), 1, "Only one call should have been made")
+
+    def test_do_async_shares_exception_of_concurrent_calls(self):
+        """
+        Test that every waiting coroutine receives the exception raised by the shared call
+        """
+        single_flight = SingleFlight()
+
+        async def request():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        async def run():
+            return await asyncio.gather(
+                *[single_flight.do_async('key', request) for _ in range(3)], return_exceptions=True)
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        outcomes = loop.run_until_complete(run())
+        self.assertTrue(all(isinstance(outcome, ValueError) for outcome in outcomes))
+
+    def test_do_async_cancelled_first_caller_does_not_cancel_others(self):
+        """
+        Test that cancelling the caller that started the shared call leaves it running for the other callers
+        """
+        single_flight = SingleFlight()
+        calls = []
+
+        async def request():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return 'response'
+
+        async def run():
+            first = asyncio.ensure_future(single_flight.do_async('key', request))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(single_flight.do_async('key', request))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        first, second = loop.run_until_complete(run())
+        self.assertIsInstance(first, asyncio.CancelledError)
+        self.assertEqual(second, 'response')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(single_flight._futures, {})
@@ -0,0 +1,69 @@
+import json
+import unittest
+from unittest import mock
+
+import requests
+from mock import patch
+
+from canvas_sdk.client import decoder
+from canvas_sdk.client.base import build_response
+
+
+class TestDecoder(unittest.TestCase):
+    longMessage = True
+
+    def test_get_default_decoder_prefers_orjson(self):
+        """
+        Test that orjson is used when it is installed, even if ujson is installed too
+        """
+        mock_orjson, mock_ujson = mock.Mock(name='orjson'), mock.Mock(name='ujson')
+        with patch.object(decoder, 'orjson', mock_orjson), patch.object(decoder, 'ujson', mock_ujson):
+            self.assertIs(decoder.get_default_decoder(), mock_orjson.loads)
+
+    def test_get_default_decoder_falls_back_to_ujson(self):
+        """
+        Test that ujson is used when it is installed and orjson is not
+        """
+        mock_ujson = mock.Mock(name='ujson')
+        with patch.object(decoder, 'orjson', None), patch.object(decoder, 'ujson', mock_ujson):
+            self.assertIs(decoder.get_default_decoder(), mock_ujson.loads)
+
+    def test_get_default_decoder_falls_back_to_standard_library(self):
+        """
+        Test that the standard library decoder is used when neither orjson nor ujson is installed
+        """
+        with patch.object(decoder, 'orjson', None), patch.object(decoder, 'ujson', None):
+            self.assertIs(decoder.get_default_decoder(), json.loads)
+
+    def test_decode_json_passes_response_body_to_decoder(self):
+        """
+        Test that the decoder receives the raw bytes of the response body
+        """
+        response = build_response(200, {'Content-Type': 'application/json'}, b'[{"id": 1}]', 'http://canvas/api')
+        mock_decoder = mock.Mock(name='decoder')
+        result = decoder.decode_json(response, mock_decoder)
+        mock_decoder.assert_called_once_with(b'[{"id": 1}]')
+        self.assertIs(result, mock_decoder.return_value)
+
+    def test_decode_json_uses_response_json_without_decoder(self):
+        """
+        Test that response.json() is used when no decoder is given
+        """
+        response = mock.MagicMock(spec=requests.Response)
+        self.assertIs(decoder.decode_json(response), response.json.return_value)
+
+    def test_default_decoder_decodes_unicode_body(self):
+        """
+        Test that the default decoder handles utf-8 encoded bodies like response.json() does
+        """
+        body = json.dumps([{'name': 'Zoë Ångström'}]).encode('utf-8')
+        response = build_response(200, {'Content-Type': 'application/json'}, body, 'http://canvas/api')
+        self.assertEqual(decoder.decode_json(response, decoder.DEFAULT_JSON_DECODER), response.json())
+
+    def test_default_decoder_raises_value_error_on_invalid_body(self):
+        """
+        Test that an invalid body raises a ValueError, as callers parsing error bodies expect
+        """
+        response = build_response(404, {}, b'Not Found', 'http://canvas/api')
+        with self.assertRaises(ValueError):
+            decoder.decode_json(response, decoder.DEFAULT_JSON_DECODER)
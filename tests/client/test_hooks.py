@@ -0,0 +1,194 @@
+import importlib
+import unittest
+from unittest import mock
+
+from requests.exceptions import ConnectionError
+
+from canvas_sdk.client import base, hooks
+from canvas_sdk.client.base import build_response
+from canvas_sdk.exceptions import CanvasAPIError
+
+
+class TestEndpointTemplate(unittest.TestCase):
+    longMessage = True
+
+    def test_ids_are_replaced_with_placeholders(self):
+        """
+        Test that the ids of a url are replaced with placeholders named after their collection
+        """
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/123/assignments/45/submissions'),
+            '/v1/courses/{course_id}/assignments/{assignment_id}/submissions')
+
+    def test_trailing_id_becomes_id(self):
+        """
+        Test that the id that ends a url is replaced with {id}
+        """
+        self.assertEqual(hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/123'),
+                         '/v1/courses/{id}')
+
+    def test_query_params_are_dropped(self):
+        """
+        Test that the query of a url is left out of its template
+        """
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/1/enrollments?page=2&per_page=10'),
+            '/v1/courses/{course_id}/enrollments')
+
+    def test_prefixed_ids_and_self_are_replaced(self):
+        """
+        Test that SIS ids and self are replaced like numeric ids
+        """
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/sis_course_id:BIO-101/users'),
+            '/v1/courses/{course_id}/users')
+        self.assertEqual(hooks.get_endpoint_template('https://canvas.example.edu/api/v1/users/self/profile'),
+                         '/v1/users/{user_id}/profile')
+
+    def test_placeholders_are_singular(self):
+        """
+        Test that placeholders are named after the singular of their collection
+        """
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/1/quizzes/2/questions'),
+            '/v1/courses/{course_id}/quizzes/{quiz_id}/questions')
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/group_categories/3/groups'),
+            '/v1/group_categories/{group_category_id}/groups')
+
+    def test_percent_encoded_prefixed_ids_are_replaced(self):
+        """
+        Test that SIS ids with a percent-encoded colon are replaced like numeric ids
+        """
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/sis_course_id%3AABC/users'),
+            '/v1/courses/{course_id}/users')
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/users/sis_login_id%3ajdoe/logins'),
+            '/v1/users/{user_id}/logins')
+
+    def test_page_urls_are_replaced(self):
+        """
+        Test that the url of a wiki page is replaced with {url}
+        """
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/1/pages/intro-to-course'),
+            '/v1/courses/{course_id}/pages/{url}')
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/groups/2/pages/week-1/revisions'),
+            '/v1/groups/{group_id}/pages/{url}/revisions')
+
+    def test_folder_paths_are_replaced(self):
+        """
+        Test that the path of a folder looked up by path is replaced with {full_path}
+        """
+        self.assertEqual(
+            hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/1/folders/by_path/a/b/c'),
+            '/v1/courses/{course_id}/folders/by_path/{full_path}')
+
+    def test_registered_templates_take_precedence(self):
+        """
+        Test that a path of an endpoint the engine registered gets the template of its spec, the one with the most
+        literal segments when several match
+        """
+        importlib.import_module('canvas_sdk.methods.pages')
+        importlib.import_module('canvas_sdk.methods.files')
+        url = 'https://canvas.example.edu/api/v1/courses/1/pages/intro/revisions/latest'
+        self.assertEqual(hooks.get_endpoint_template(url), '/v1/courses/{course_id}/pages/{url}/revisions/latest')
+        template = hooks.get_endpoint_template('https://canvas.example.edu/api/v1/courses/1/pages/intro/revisions/2')
+        self.assertEqual(template, '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}')
+        template = hooks.get_endpoint_template('https://canvas.example.edu/api/v1/users/self/folders/by_path/a/b')
+        self.assertEqual(template, '/v1/users/{user_id}/folders/by_path/{full_path}')
+
+    def test_path_before_api_is_dropped(self):
+        """
+        Test that the part of the path before /api is left out of the template
+        """
+        self.assertEqual(hooks.get_endpoint_template('https://example.edu/canvas/api/v1/accounts/1/courses'),
+                         '/v1/accounts/{account_id}/courses')
+
+
+class TestObservers(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.url = "https://path/to/canvas/api/v1/courses/1"
+        self.session = mock.MagicMock(name='canvas-session')
+        self.req_ctx = mock.MagicMock(name='request-context')
+        self.req_ctx.session = self.session
+        self.req_ctx.max_retries = 0
+        self.req_ctx.backoff = None
+        self.req_ctx.throttle = None
+        self.req_ctx.etag_cache = None
+        self.req_ctx.response_cache = None
+        self.req_ctx.single_flight = None
+        self.req_ctx.json_decoder = None
+        self.req_ctx.observers = None
+        self.req_ctx.tracer = None
+        self.req_ctx.page_size_policy = None
+        self.observer = mock.Mock(spec=hooks.RequestObserver)
+        self.req_ctx.observers = [self.observer]
+
+    def test_successful_request(self):
+        """
+        Test that observers are notified before the request and of its response
+        """
+        response = build_response(200, {}, b'{}', self.url)
+        self.session.request.return_value = response
+        base.call("GET", self.url, self.req_ctx)
+        self.assertEqual([name for name, _, _ in self.observer.mock_calls], ['before_request', 'after_response'])
+        self.observer.before_request.assert_called_once_with('GET', self.url, 0)
+        action, url, observed, elapsed, attempt = self.observer.after_response.call_args[0]
+        self.assertEqual((action, url, observed, attempt), ('GET', self.url, response, 0))
+        self.assertGreaterEqual(elapsed, 0)
+
+    @mock.patch('canvas_sdk.client.base.time.sleep')
+    def test_retried_request(self, sleep_mock):
+        """
+        Test that observers are notified of each attempt, of the retry with its delay and of the final error
+        """
+        self.req_ctx.backoff = mock.Mock(name='backoff')
+        self.req_ctx.backoff.get_delay.return_value = 0.5
+        failure = build_response(503, {}, b'{"errors": []}', self.url)
+        self.session.request.return_value = failure
+        with self.assertRaises(CanvasAPIError) as context:
+            base.call("GET", self.url, self.req_ctx, max_retries=1)
+        self.assertEqual([name for name, _, _ in self.observer.mock_calls], [
+            'before_request', 'after_response', 'on_retry', 'before_request', 'after_response', 'on_error'])
+        self.observer.on_retry.assert_called_once_with('GET', self.url, failure, 0, 0.5)
+        self.observer.on_error.assert_called_once_with('GET', self.url, context.exception, 1)
+        sleep_mock.assert_called_once_with(0.5)
+
+    def test_request_without_response(self):
+        """
+        Test that observers are notified of an exception raised by the transport
+        """
+        error = ConnectionError('refused')
+        self.session.request.side_effect = error
+        with self.assertRaises(ConnectionError):
+            base.call("GET", self.url, self.req_ctx)
+        self.observer.on_error.assert_called_once_with('GET', self.url, error, 0)
+        self.assertFalse(self.observer.after_response.called)
+
+    def test_failing_observer_does_not_fail_the_request(self):
+        """
+        Test that an exception raised by an observer is logged and the other observers are still notified
+        """
+        failing = mock.Mock(spec=hooks.RequestObserver)
+        failing.before_request.side_effect = ValueError('bug')
+        self.req_ctx.observers = [failing, self.observer]
+        self.session.request.return_value = build_response(200, {}, b'{}', self.url)
+        with self.assertLogs('canvas_sdk.client.hooks', 'ERROR'):
+            response = base.call("GET", self.url, self.req_ctx)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.observer.before_request.called)
+
+    def test_base_observer_ignores_every_event(self):
+        """
+        Test that the base RequestObserver accepts every event and does nothing
+        """
+        observer = hooks.RequestObserver()
+        observer.before_request('GET', self.url, 0)
+        observer.after_response('GET', self.url, None, 0.1, 0)
+        observer.on_retry('GET', self.url, None, 0, 1.0)
+        observer.on_error('GET', self.url, None, 0)
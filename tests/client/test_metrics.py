@@ -0,0 +1,97 @@
+import unittest
+
+from canvas_sdk.client import MetricsCollector, RequestContext
+from canvas_sdk.client.base import build_response
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import courses, enrollments
+from canvas_sdk.testing import FakeCanvasServer
+
+BASE_API_URL = 'https://canvas.example.edu/api'
+
+
+class TestMetricsCollector(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.metrics = MetricsCollector(buckets=(0.1, 1.0))
+
+    def observe(self, path, status=200, elapsed=0.05, content=b'[]'):
+        url = BASE_API_URL + path
+        self.metrics.after_response('GET', url, build_response(status, {}, content, url), elapsed, 0)
+
+    def test_responses_are_grouped_by_endpoint_template(self):
+        """
+        Test that responses are counted per method and endpoint template, by status, size and latency
+        """
+        self.observe('/v1/courses/1/enrollments', content=b'[1, 2]')
+        self.observe('/v1/courses/2/enrollments?page=2', status=500, elapsed=0.5)
+        self.observe('/v1/courses/3', elapsed=5.0)
+        metrics = self.metrics.get_metrics()
+        self.assertEqual(sorted(metrics), [('GET', '/v1/courses/{course_id}/enrollments'), ('GET', '/v1/courses/{id}')])
+        enrollment_metrics = metrics[('GET', '/v1/courses/{course_id}/enrollments')]
+        self.assertEqual(enrollment_metrics['responses'], 2)
+        self.assertEqual(enrollment_metrics['statuses'], {200: 1, 500: 1})
+        self.assertEqual(enrollment_metrics['bytes'], 8)
+        self.assertAlmostEqual(enrollment_metrics['latency_sum'], 0.55)
+        self.assertEqual(enrollment_metrics['latency_buckets'], [(0.1, 1), (1.0, 2), (float('inf'), 2)])
+        self.assertEqual(metrics[('GET', '/v1/courses/{id}')]['latency_buckets'],
+                         [(0.1, 0), (1.0, 0), (float('inf'), 1)])
+
+    def test_latency_on_a_bound_falls_in_its_bucket(self):
+        """
+        Test that a latency equal to the bound of a bucket is counted in that bucket
+        """
+        self.observe('/v1/courses/1', elapsed=0.1)
+        self.assertEqual(self.metrics.get_metrics()[('GET', '/v1/courses/{id}')]['latency_buckets'][0], (0.1, 1))
+
+    def test_retries_and_errors_are_counted(self):
+        """
+        Test that retries and errors are counted per endpoint template
+        """
+        url = BASE_API_URL + '/v1/courses/1'
+        self.metrics.on_retry('GET', url, None, 0, 1.0)
+        self.metrics.on_retry('GET', url, None, 1, 2.0)
+        self.metrics.on_error('GET', url, CanvasAPIError(), 2)
+        metrics = self.metrics.get_metrics()[('GET', '/v1/courses/{id}')]
+        self.assertEqual((metrics['retries'], metrics['errors'], metrics['responses']), (2, 1, 0))
+
+    def test_reset(self):
+        """
+        Test that reset forgets every metric
+        """
+        self.observe('/v1/courses/1')
+        self.metrics.reset()
+        self.assertEqual(self.metrics.get_metrics(), {})
+
+    def test_render_prometheus(self):
+        """
+        Test that the metrics are rendered in the Prometheus text format
+        """
+        self.observe('/v1/courses/1/enrollments', content=b'[1, 2]')
+        self.metrics.on_retry('GET', BASE_API_URL + '/v1/courses/1/enrollments', None, 0, 1.0)
+        lines = self.metrics.render_prometheus().splitlines()
+        labels = 'method="GET",endpoint="/v1/courses/{course_id}/enrollments"'
+        self.assertIn('# TYPE canvas_sdk_request_duration_seconds histogram', lines)
+        self.assertIn('canvas_sdk_request_duration_seconds_bucket{%s,le="0.1"} 1' % labels, lines)
+        self.assertIn('canvas_sdk_request_duration_seconds_bucket{%s,le="+Inf"} 1' % labels, lines)
+        self.assertIn('canvas_sdk_request_duration_seconds_count{%s} 1' % labels, lines)
+        self.assertIn('canvas_sdk_responses_total{%s,status="200"} 1' % labels, lines)
+        self.assertIn('canvas_sdk_response_bytes_total{%s} 6' % labels, lines)
+        self.assertIn('canvas_sdk_retries_total{%s} 1' % labels, lines)
+        self.assertIn('canvas_sdk_errors_total{%s} 0' % labels, lines)
+
+    def test_collects_requests_made_with_a_context(self):
+        """
+        Test that a collector given to a request context sees every attempt of the requests made with it
+        """
+        with FakeCanvasServer(courses_per_account=2, enrollments_per_course=25) as server:
+            request_context = RequestContext('token', server.base_api_url, per_page=10, max_retries=1, backoff=None,
+                                             observers=[self.metrics])
+            for course_id in (1, 2):
+                enrollments.list_enrollments_courses(request_context, course_id)
+            server.fail_next(503)
+            courses.get_single_course_courses(request_context, 1)
+        metrics = self.metrics.get_metrics()
+        self.assertEqual(metrics[('GET', '/v1/courses/{course_id}/enrollments')]['statuses'], {200: 2})
+        self.assertEqual(metrics[('GET', '/v1/courses/{id}')]['statuses'], {200: 1, 503: 1})
+        self.assertEqual(metrics[('GET', '/v1/courses/{id}')]['retries'], 1)
@@ -0,0 +1,239 @@
+import unittest
+from unittest import mock
+
+import requests
+
+from canvas_sdk import utils
+from canvas_sdk.client import Backoff, ETagCache, PageSizePolicy, ResponseCache
+from canvas_sdk.client import paging
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import accounts, enrollments
+from tests.helpers import FakeCanvasServerTestCase
+
+
+class TestPagingHelpers(unittest.TestCase):
+
+    def test_get_page_size(self):
+        """
+        Test that the page size is read from the params, or else from the query of the url
+        """
+        self.assertEqual(paging.get_page_size('http://canvas/api/v1/users', {'per_page': 50}), 50)
+        self.assertEqual(paging.get_page_size('http://canvas/api/v1/users?page=2&per_page=20'), 20)
+        self.assertIsNone(paging.get_page_size('http://canvas/api/v1/users', {'include[]': 'email'}))
+
+    def test_can_resize_page(self):
+        """
+        Test that first pages and bookmark pages can be resized, but numbered pages can't
+        """
+        self.assertTrue(paging.can_resize_page('http://canvas/api/v1/users', {'per_page': 50}))
+        self.assertTrue(paging.can_resize_page('http://canvas/api/v1/users?page=bookmark:WzEwXQ&per_page=50'))
+        self.assertFalse(paging.can_resize_page('http://canvas/api/v1/users?page=3&per_page=50'))
+
+    def test_set_page_size(self):
+        """
+        Test that the page size is replaced in the params, or else in the query of the url
+        """
+        self.assertEqual(paging.set_page_size('http://canvas/api/v1/users', {'per_page': 50, 'a': 1}, 25),
+                         ('http://canvas/api/v1/users', {'per_page': 25, 'a': 1}))
+        self.assertEqual(paging.set_page_size('http://canvas/api/v1/users?page=bookmark:x&per_page=50', None, 25),
+                         ('http://canvas/api/v1/users?page=bookmark%3Ax&per_page=25', None))
+
+
+class TestPageSizePolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = PageSizePolicy(grow_after=2)
+        self.url = 'http://canvas/api/v1/courses/12/enrollments'
+
+    def build_response(self, per_page):
+        response = mock.MagicMock(spec=requests.Response)
+        response.links = {'next': {'url': self.url + '?page=2&per_page=%d' % per_page}}
+        return response
+
+    def test_max_per_page_by_default(self):
+        """
+        Test that endpoints without a known cap are asked for max_per_page items
+        """
+        self.assertEqual(self.policy.get_per_page(self.url), 100)
+
+    def test_cap_is_remembered_per_endpoint_template(self):
+        """
+        Test that a short first page is remembered as the cap of its endpoint template
+        """
+        self.policy.record_page(self.url, 100, self.build_response(50))
+        self.assertEqual(self.policy.get_per_page('http://canvas/api/v1/courses/34/enrollments?page=3'), 50)
+        self.assertEqual(self.policy.get_per_page('http://canvas/api/v1/courses/34/users'), 100)
+        self.assertEqual(self.policy.get_caps(), {'/v1/courses/{course_id}/enrollments': 50})
+
+    def test_shrinks_down_to_min_per_page(self):
+        """
+        Test that the page size is halved on each shrink, down to min_per_page
+        """
+        self.assertEqual(self.policy.shrink(self.url, 100), 50)
+        self.assertEqual(self.policy.get_per_page(self.url), 50)
+        self.assertEqual(self.policy.shrink(self.url, 50), 25)
+        self.assertEqual(self.policy.shrink(self.url, 25), 12)
+        self.assertEqual(self.policy.shrink(self.url, 12), 10)
+        self.assertIsNone(self.policy.shrink(self.url, 10))
+        self.assertEqual(self.policy.get_sizes(), {'/v1/courses/{course_id}/enrollments': 10})
+
+    def test_grows_back_after_successful_pages(self):
+        """
+        Test that a shrunk page size doubles again after enough successful pages
+        """
+        self.policy.shrink(self.url, 100)
+        self.policy.record_page(self.url, 50, self.build_response(50))
+        self.assertEqual(self.policy.get_per_page(self.url), 50)
+        self.policy.record_page(self.url, 50, self.build_response(50))
+        self.assertEqual(self.policy.get_per_page(self.url), 100)
+        self.assertEqual(self.policy.get_sizes(), {})
+
+    def test_does_not_grow_past_cap(self):
+        """
+        Test that a shrunk page size doesn't grow past the cap of its endpoint
+        """
+        self.policy.record_page(self.url, 100, self.build_response(40))
+        self.policy.shrink(self.url, 40)
+        for _ in range(4):
+            self.policy.record_page(self.url, 20, self.build_response(20))
+        self.assertEqual(self.policy.get_per_page(self.url), 40)
+
+    def test_invalid_shrink_factor(self):
+        """
+        Test that a shrink_factor that doesn't shrink pages raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            PageSizePolicy(shrink_factor=1)
+
+
+class TestPageSizePolicyEndToEnd(FakeCanvasServerTestCase):
+    server_defaults = {'enrollments_per_course': 250}
+    context_defaults = {'per_page': 10, 'backoff': None}
+
+    def get_request_context(self, server, **kwargs):
+        kwargs.setdefault('page_size_policy', PageSizePolicy())
+        return super(TestPageSizePolicyEndToEnd, self).get_request_context(server, **kwargs)
+
+    def test_lists_are_fetched_in_largest_pages(self):
+        """
+        Test that list data is fetched in pages of max_per_page rather than the per_page of the context
+        """
+        server = self.start_server()
+        data = utils.get_all_list_data(self.get_request_context(server), enrollments.list_enrollments_courses, 1)
+        self.assertEqual(len(data), 250)
+        self.assertEqual(server.stats['requests'], 3)
+
+    def test_written_out_methods_use_policy(self):
+        """
+        Test that the hand written paginated methods ask for the page size of the policy
+        """
+        server = self.start_server(accounts=150)
+        response = accounts.list_accounts(self.get_request_context(server))
+        self.assertEqual(len(response.json()), 100)
+        self.assertEqual(paging.get_page_size(response.links['next']['url']), 100)
+
+    def test_explicit_per_page_takes_precedence(self):
+        """
+        Test that a per_page passed to a method is used instead of the page size of the policy
+        """
+        server = self.start_server()
+        request_context = self.get_request_context(server)
+        response = enrollments.list_enrollments_courses(request_context, 1, per_page=5)
+        self.assertEqual(len(response.json()), 5)
+
+    def test_capped_page_size_is_learned(self):
+        """
+        Test that a server capping per_page below max_per_page teaches the policy its cap
+        """
+        server = self.start_server(max_per_page=50)
+        request_context = self.get_request_context(server)
+        self.assertEqual(len(enrollments.list_enrollments_courses(request_context, 1).json()), 50)
+        policy = request_context.page_size_policy
+        self.assertEqual(policy.get_per_page(server.base_api_url + '/v1/courses/2/enrollments'), 50)
+
+    def test_failed_first_page_is_fetched_in_smaller_pages(self):
+        """
+        Test that a first page that fails with a 5xx is retried with a smaller size, and that the rest of the list
+        follows on in the smaller size
+        """
+        server = self.start_server()
+        server.fail_next(504)
+        request_context = self.get_request_context(server, max_retries=1)
+        data = utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1)
+        self.assertEqual([item['user_id'] for item in data], list(range(1000, 1250)))
+        self.assertEqual(server.stats[504], 1)
+        self.assertEqual(server.stats[200], 5)
+
+    def test_failed_numbered_page_is_not_resized(self):
+        """
+        Test that a numbered page isn't asked for in another size, which would shift the pages after it, but that
+        the smaller size is used by the next list
+        """
+        server = self.start_server()
+        request_context = self.get_request_context(server)
+        response = enrollments.list_enrollments_courses(request_context, 1)
+        server.fail_next(503)
+        with self.assertRaises(CanvasAPIError):
+            list(utils.get_next(request_context, response))
+        self.assertEqual(len(enrollments.list_enrollments_courses(request_context, 1).json()), 50)
+
+    def test_read_timeout_is_fetched_in_smaller_pages(self):
+        """
+        Test that a page whose read timed out is asked for again with a smaller page size
+        """
+        server = self.start_server()
+        request_context = self.get_request_context(server, max_retries=1)
+        session = request_context.session
+        send = session.request
+        calls = []
+
+        def request(*args, **kwargs):
+            calls.append(kwargs['params']['per_page'])
+            if len(calls) == 1:
+                raise requests.exceptions.ReadTimeout('read timed out')
+            return send(*args, **kwargs)
+
+        with mock.patch.object(session, 'request', side_effect=request):
+            self.assertEqual(len(enrollments.list_enrollments_courses(request_context, 1).json()), 50)
+        self.assertEqual(calls, [100, 50])
+
+    def test_resize_counts_as_retry_and_waits_for_backoff(self):
+        """
+        Test that a page retried with a smaller size waits for the backoff delay and uses up a retry, so that a
+        failing server gets no more requests than max_retries allows
+        """
+        server = self.start_server()
+        server.fail_next(503, times=5)
+        request_context = self.get_request_context(server, max_retries=2)
+        request_context.backoff = Backoff(base_delay=0.25, jitter=False)
+        with mock.patch('canvas_sdk.client.base.time.sleep') as sleep:
+            with self.assertRaises(CanvasAPIError):
+                enrollments.list_enrollments_courses(request_context, 1)
+        self.assertEqual(server.stats[503], 3)
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], [0.25, 0.5])
+
+    def test_failed_page_without_retries_is_not_resent(self):
+        """
+        Test that without retries a failed page is raised rather than resent, and that the next list asks for the
+        smaller size
+        """
+        server = self.start_server()
+        server.fail_next(504)
+        request_context = self.get_request_context(server)
+        with self.assertRaises(CanvasAPIError):
+            enrollments.list_enrollments_courses(request_context, 1)
+        self.assertEqual(server.stats['requests'], 1)
+        self.assertEqual(len(enrollments.list_enrollments_courses(request_context, 1).json()), 50)
+
+    def test_smaller_page_is_not_cached_for_the_request(self):
+        """
+        Test that the response to a page retried with a smaller size isn't cached under the key of the request for
+        the larger page
+        """
+        server = self.start_server()
+        server.fail_next(500)
+        request_context = self.get_request_context(server, max_retries=1, etag_cache=ETagCache(),
+                                                   response_cache=ResponseCache(default_ttl=60))
+        self.assertEqual(len(enrollments.list_enrollments_courses(request_context, 1, per_page=100).json()), 50)
+        self.assertEqual(len(request_context.etag_cache), 0)
+        self.assertEqual(len(enrollments.list_enrollments_courses(request_context, 1, per_page=100).json()), 100)
@@ -1,7 +1,13 @@
+import copy
+import pickle
+import threading
+import time
 import unittest
 from unittest import mock
 from mock import patch
 from canvas_sdk.client import RequestContext
+from canvas_sdk.client.backoff import DEFAULT_BACKOFF
+from canvas_sdk.client.decoder import DEFAULT_JSON_DECODER
 
 
 class TestRequestContext(unittest.TestCase):
@@ -124,6 +130,45 @@ class TestRequestContext(unittest.TestCase):
         context = RequestContext(self.auth_token, self.base_api_url)
         self.assertEqual(None, context.per_page, "per_page should default to None on creation")
 
+    def test_initialize_page_workers_defaults_to_none(self):
+        """
+        Test that if page_workers is not passed in, the instance attribute defaults to None
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        self.assertEqual(None, context.page_workers, "page_workers should default to None on creation")
+
+    def test_initialize_page_workers(self):
+        """
+        Test that page_workers passed in, as an argument or in a dictionary of settings, is stored on the instance
+        """
+        context = RequestContext(self.auth_token, self.base_api_url, page_workers=4)
+        self.assertEqual(4, context.page_workers, "page_workers should be stored on creation")
+        context = RequestContext(**{'auth_token': self.auth_token, 'base_api_url': self.base_api_url,
+                                    'page_workers': 4})
+        self.assertEqual(4, context.page_workers, "page_workers should be stored on creation")
+
+    def test_initialize_backoff_defaults_to_default_backoff(self):
+        """
+        Test that if backoff is not passed in, the instance attribute defaults to the default backoff policy
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        self.assertIs(DEFAULT_BACKOFF, context.backoff, "backoff should default to DEFAULT_BACKOFF on creation")
+
+    def test_initialize_json_decoder_defaults_to_default_json_decoder(self):
+        """
+        Test that if json_decoder is not passed in, the instance attribute defaults to the fastest installed decoder
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        self.assertIs(DEFAULT_JSON_DECODER, context.json_decoder,
+                      "json_decoder should default to DEFAULT_JSON_DECODER on creation")
+
+    def test_initialize_observers_defaults_to_empty_list(self):
+        """
+        Test that if observers are not passed in, the instance attribute defaults to an empty list
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        self.assertEqual([], context.observers, "observers should default to an empty list on creation")
+
     def test_initialize_from_dictionary(self):
         """
         Test that RequestContext can be initialized from a dictionary of settings
@@ -316,3 +361,85 @@ class TestRequestContext(unittest.TestCase):
         context.expire_session()
         self.assertNotEqual(previous_session, context.session,
                             "Prior stored session should have been cleared out after call to expire_session")
+
+    def test_session_creation_mounts_adapter_with_pool_settings(self):
+        """
+        Test that the session uses an adapter configured with the context's connection pool settings
+        """
+        context = RequestContext(self.auth_token, self.base_api_url, pool_connections=4, pool_maxsize=32,
+                                 pool_block=True)
+        for prefix in ('https://', 'http://'):
+            adapter = context.session.get_adapter(prefix + 'canvas')
+            self.assertEqual(adapter._pool_connections, 4)
+            self.assertEqual(adapter._pool_maxsize, 32)
+            self.assertEqual(adapter._pool_block, True)
+
+    def test_session_creation_sets_connection_close_header_without_keep_alive(self):
+        """
+        Test that a 'Connection: close' header is sent when keep_alive is disabled, and not by default
+        """
+        self.mock_default_headers.return_value = {}
+        context = RequestContext(self.auth_token, self.base_api_url, keep_alive=False)
+        self.assertEqual(context.session.headers.get('Connection'), 'close')
+        context = RequestContext(self.auth_token, self.base_api_url)
+        self.assertNotEqual(context.session.headers.get('Connection'), 'close')
+
+    def test_session_creation_is_thread_safe(self):
+        """
+        Test that concurrent first accesses of the session property create a single session
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        created = []
+
+        def slow_create_session():
+            time.sleep(0.01)  # Widen the window for a race
+            created.append(mock.Mock(name='session'))
+            return created[-1]
+
+        sessions = []
+        with patch.object(context, 'create_session', side_effect=slow_create_session):
+            threads = [threading.Thread(target=lambda: sessions.append(context.session)) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(created), 1, "Only one session should have been created")
+        self.assertEqual(set(map(id, sessions)), {id(created[0])})
+
+    def test_session_per_thread_creates_a_session_for_each_thread(self):
+        """
+        Test that with session_per_thread set, each thread gets its own session that is reused within the thread
+        """
+        context = RequestContext(self.auth_token, self.base_api_url, session_per_thread=True)
+        main_session = context.session
+        self.assertIs(main_session, context.session)
+        other_sessions = []
+        thread = threading.Thread(target=lambda: other_sessions.append(context.session))
+        thread.start()
+        thread.join()
+        self.assertIsNot(main_session, other_sessions[0])
+
+    def test_expire_session_clears_per_thread_sessions(self):
+        """
+        Test that expire_session causes per-thread sessions to be recreated on next access
+        """
+        context = RequestContext(self.auth_token, self.base_api_url, session_per_thread=True)
+        previous_session = context.session
+        context.expire_session()
+        self.assertIsNot(previous_session, context.session)
+
+    def test_pickle_and_deepcopy_round_trip(self):
+        """
+        Test that a context that has created its sessions can be pickled and deep-copied, and that the copy keeps the
+        configuration and creates sessions of its own
+        """
+        self.mock_default_headers.return_value = {}
+        for session_per_thread in (False, True):
+            context = RequestContext(self.auth_token, self.base_api_url, per_page=50, max_retries=3,
+                                     session_per_thread=session_per_thread)
+            session = context.session
+            for copied in (pickle.loads(pickle.dumps(context)), copy.deepcopy(context)):
+                self.assertEqual((copied.auth_token, copied.base_api_url, copied.per_page, copied.max_retries),
+                                 (self.auth_token, self.base_api_url, 50, 3))
+                self.assertIsNot(session, copied.session)
+                copied.expire_session()
@@ -0,0 +1,101 @@
+import unittest
+from unittest import mock
+
+from canvas_sdk.client.throttle import Throttle
+
+
+class TestThrottle(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        patcher = mock.patch('canvas_sdk.client.throttle.time.monotonic')
+        self.addCleanup(patcher.stop)
+        self.mock_monotonic = patcher.start()
+        self.mock_monotonic.return_value = 100.0
+
+    def build_response_mock(self, remaining=None, cost=None):
+        response = mock.MagicMock(name='response')
+        response.headers = {}
+        if remaining is not None:
+            response.headers['X-Rate-Limit-Remaining'] = str(remaining)
+        if cost is not None:
+            response.headers['X-Request-Cost'] = str(cost)
+        return response
+
+    def test_initialize_rejects_invalid_refill_rate(self):
+        """
+        Test that a refill_rate that isn't positive raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            Throttle(refill_rate=0)
+
+    def test_reserve_does_not_delay_before_quota_is_known(self):
+        """
+        Test that requests are not delayed until Canvas has reported the remaining quota
+        """
+        throttle = Throttle()
+        self.assertEqual(throttle.reserve(), 0)
+        self.assertIsNone(throttle.remaining)
+
+    def test_reserve_does_not_delay_with_plenty_of_quota(self):
+        """
+        Test that requests are let through without delay while the quota is above min_remaining
+        """
+        throttle = Throttle(min_remaining=100)
+        throttle.update(self.build_response_mock(remaining=600, cost=1))
+        self.assertEqual(throttle.reserve(), 0)
+
+    def test_reserve_delays_until_bucket_refills_above_min_remaining(self):
+        """
+        Test that a request that would take the quota below min_remaining is delayed for as long as the
+        bucket needs to refill.
+        """
+        throttle = Throttle(min_remaining=100, refill_rate=10)
+        throttle.update(self.build_response_mock(remaining=51))
+        # request_cost estimate starts at 1, so 50 units are missing at 10 units per second
+        self.assertAlmostEqual(throttle.reserve(), 5.0)
+
+    def test_reserve_queues_concurrent_callers(self):
+        """
+        Test that each reservation books quota, so later callers are delayed further
+        """
+        throttle = Throttle(min_remaining=100, refill_rate=10)
+        throttle.update(self.build_response_mock(remaining=100))
+        first, second = throttle.reserve(), throttle.reserve()
+        self.assertAlmostEqual(first, 0.1)
+        self.assertAlmostEqual(second, 0.2)
+
+    def test_reserve_delay_is_capped_at_max_wait(self):
+        """
+        Test that no single request is delayed longer than max_wait
+        """
+        throttle = Throttle(min_remaining=500, refill_rate=1, max_wait=10)
+        throttle.update(self.build_response_mock(remaining=0))
+        self.assertEqual(throttle.reserve(), 10)
+
+    def test_get_available_refills_over_time_up_to_capacity(self):
+        """
+        Test that the projected quota grows with the refill rate and is capped at the capacity
+        """
+        throttle = Throttle(refill_rate=10, capacity=700)
+        throttle.update(self.build_response_mock(remaining=600))
+        self.mock_monotonic.return_value = 105.0
+        self.assertEqual(throttle.get_available(), 650)
+        self.mock_monotonic.return_value = 200.0
+        self.assertEqual(throttle.get_available(), 700)
+
+    def test_update_tracks_average_request_cost(self):
+        """
+        Test that the request cost estimate moves towards the X-Request-Cost values reported by Canvas
+        """
+        throttle = Throttle()
+        throttle.update(self.build_response_mock(remaining=600, cost=11))
+        self.assertAlmostEqual(throttle.request_cost, 3.0)
+
+    def test_update_ignores_responses_without_headers(self):
+        """
+        Test that responses without rate limit headers leave the throttle unchanged
+        """
+        throttle = Throttle()
+        throttle.update(self.build_response_mock())
+        self.assertIsNone(throttle.remaining)
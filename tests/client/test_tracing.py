@@ -0,0 +1,146 @@
+import threading
+import unittest
+
+from mock import patch
+
+from canvas_sdk import utils
+from canvas_sdk.client import RequestContext, tracing
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import courses, enrollments
+from canvas_sdk.testing import FakeCanvasServer
+
+
+class FakeSpan(object):
+    """
+    Records what is done with a span, with the subset of the OpenTelemetry span API the SDK uses
+    """
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_status(self, status):
+        pass
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+    def end(self):
+        self.ended = True
+
+
+class FakeTracer(object):
+
+    def __init__(self):
+        self.spans = []
+        self.lock = threading.Lock()
+
+    def start_span(self, name, attributes=None, **kwargs):
+        span = FakeSpan(name, attributes)
+        with self.lock:
+            self.spans.append(span)
+        return span
+
+
+@patch.object(tracing, 'trace', None)
+class TestTracing(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.tracer = FakeTracer()
+        self.server = FakeCanvasServer(courses_per_account=2, enrollments_per_course=25, rate_limit=700)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def get_request_context(self, **kwargs):
+        return RequestContext('token', self.server.base_api_url, per_page=10, backoff=None, tracer=self.tracer,
+                              **kwargs)
+
+    def get_spans(self, prefix):
+        return [span for span in self.tracer.spans if span.name.startswith(prefix)]
+
+    def test_span_per_attempt(self):
+        """
+        Test that every attempt of a request gets a span with the endpoint template, status and attempt number
+        """
+        self.server.fail_next(503)
+        courses.get_single_course_courses(self.get_request_context(max_retries=1), 1)
+        spans = self.tracer.spans
+        self.assertEqual([span.name for span in spans], ['GET /v1/courses/{id}'] * 2)
+        self.assertTrue(all(span.ended for span in spans))
+        self.assertEqual([span.attributes['http.response.status_code'] for span in spans], [503, 200])
+        self.assertEqual([span.attributes['http.request.resend_count'] for span in spans], [0, 1])
+        self.assertEqual(spans[0].attributes['error.type'], '503')
+        self.assertNotIn('error.type', spans[1].attributes)
+        self.assertEqual(spans[1].attributes['url.template'], '/v1/courses/{id}')
+        self.assertEqual(spans[1].attributes['http.request.method'], 'GET')
+        self.assertEqual(spans[1].attributes['canvas.request_cost'], 1.0)
+
+    def test_span_of_failed_request(self):
+        """
+        Test that the span of a request that fails records the status as its error type and is ended
+        """
+        with self.assertRaises(CanvasAPIError):
+            courses.get_single_course_courses(self.get_request_context(), 3)
+        span, = self.tracer.spans
+        self.assertEqual(span.attributes['error.type'], '404')
+        self.assertTrue(span.ended)
+
+    def test_get_all_list_data_span(self):
+        """
+        Test that get_all_list_data gets a span counting its pages and bytes, walking the next links or not
+        """
+        for page_workers in (None, 4):
+            self.tracer.spans = []
+            request_context = self.get_request_context(page_workers=page_workers)
+            data = utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1)
+            span, = self.get_spans('canvas_sdk.get_all_list_data')
+            self.assertEqual(span.attributes['canvas.page_count'], 3, page_workers)
+            self.assertEqual(span.attributes['code.function'], 'list_enrollments_courses')
+            self.assertGreater(span.attributes['canvas.bytes'], len(str(data)) // 2)
+            self.assertTrue(span.ended)
+            self.assertEqual(len(self.get_spans('GET ')), 3, page_workers)
+
+    def test_get_next_span(self):
+        """
+        Test that get_next records one span for all the pages it fetches, with their count and size
+        """
+        request_context = self.get_request_context()
+        response = enrollments.list_enrollments_courses(request_context, 1)
+        responses = list(utils.get_next(request_context, response))
+        span, = self.get_spans('canvas_sdk.get_next')
+        self.assertEqual(span.attributes['canvas.page_count'], 2)
+        self.assertEqual(span.attributes['canvas.bytes'], sum(len(r.content) for r in responses))
+        self.assertTrue(span.ended)
+
+    def test_list_span_records_failure(self):
+        """
+        Test that a failed page is recorded on the span of the list, which is ended all the same
+        """
+        request_context = self.get_request_context()
+        self.server.fail_next(500)
+        with self.assertRaises(CanvasAPIError):
+            utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1)
+        span, = self.get_spans('canvas_sdk.get_all_list_data')
+        self.assertTrue(span.ended)
+        self.assertEqual(len(span.exceptions), 1)
+
+    def test_no_spans_without_tracer(self):
+        """
+        Test that no spans are recorded for a context without a tracer
+        """
+        request_context = RequestContext('token', self.server.base_api_url, per_page=10)
+        self.assertEqual(len(utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1)), 25)
+        self.assertEqual(self.tracer.spans, [])
+
+    def test_get_tracer_requires_opentelemetry(self):
+        """
+        Test that get_tracer raises ImportError when opentelemetry isn't installed
+        """
+        with self.assertRaises(ImportError):
+            tracing.get_tracer()
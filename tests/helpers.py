@@ -0,0 +1,26 @@
+import unittest
+
+from canvas_sdk.client import RequestContext
+from canvas_sdk.testing import FakeCanvasServer
+
+
+class FakeCanvasServerTestCase(unittest.TestCase):
+
+    """
+    Base class of the tests that make requests to a FakeCanvasServer: start_server starts a server that is stopped
+    when the test ends, and get_request_context returns a context that calls it without waiting between retries
+    """
+
+    # The arguments of the servers and request contexts of the tests, overridden by the keyword arguments of
+    # start_server and get_request_context
+    server_defaults = {}
+    context_defaults = {'backoff': None}
+
+    def start_server(self, **kwargs):
+        server = FakeCanvasServer(**dict(self.server_defaults, **kwargs))
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def get_request_context(self, server, **kwargs):
+        return RequestContext('token', server.base_api_url, **dict(self.context_defaults, **kwargs))
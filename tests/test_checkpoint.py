@@ -0,0 +1,100 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from canvas_sdk import utils
+from canvas_sdk.checkpoint import Checkpoint, FileCheckpoint
+from canvas_sdk.client import RequestContext
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import enrollments
+from canvas_sdk.testing import FakeCanvasServer
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'crawl.json')
+
+    def test_checkpoint_hands_states_to_callback(self):
+        """
+        Test that a Checkpoint in memory starts from its state and hands each saved state to on_save
+        """
+        states = []
+        checkpoint = Checkpoint(state={'next_url': 'a'}, on_save=states.append)
+        self.assertEqual(checkpoint.load(), {'next_url': 'a'})
+        checkpoint.save({'next_url': 'b'})
+        checkpoint.clear()
+        self.assertEqual(states, [{'next_url': 'b'}, None])
+        self.assertIsNone(checkpoint.load())
+
+    def test_file_checkpoint_persists_and_removes_state(self):
+        """
+        Test that a FileCheckpoint writes its state to its file, leaves no temporary file and removes it on clear
+        """
+        checkpoint = FileCheckpoint(self.path)
+        self.assertIsNone(checkpoint.load())
+        checkpoint.save({'next_url': 'b', 'item_count': 10})
+        with open(self.path) as checkpoint_file:
+            self.assertEqual(json.load(checkpoint_file), {'next_url': 'b', 'item_count': 10})
+        self.assertEqual(FileCheckpoint(self.path).load(), {'next_url': 'b', 'item_count': 10})
+        self.assertEqual(os.listdir(self.directory), ['crawl.json'])
+        checkpoint.clear()
+        self.assertFalse(os.path.exists(self.path))
+
+
+class TestIterListDataWithCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'crawl.json')
+        self.server = FakeCanvasServer(enrollments_per_course=45, bookmarks=True)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.request_context = RequestContext('token', self.server.base_api_url, per_page=10, backoff=None)
+
+    def crawl(self, **kwargs):
+        return utils.iter_list_data_with_checkpoint(
+            self.request_context, FileCheckpoint(self.path), enrollments.list_enrollments_courses, 1, **kwargs)
+
+    def test_crawl_resumes_after_failure(self):
+        """
+        Test that a crawl that fails part way is resumed from the page after the last one finished, and that the
+        checkpoint is cleared once the crawl completes
+        """
+        items = self.crawl()
+        user_ids = [next(items)['user_id'] for _ in range(25)]
+        self.server.fail_next(500)
+        with self.assertRaises(CanvasAPIError):
+            user_ids.extend(item['user_id'] for item in items)
+        state = FileCheckpoint(self.path).load()
+        self.assertEqual(state['item_count'], 30)
+        self.assertEqual(state['page_count'], 3)
+        self.server.reset_stats()
+        user_ids = user_ids[:state['item_count']] + [item['user_id'] for item in self.crawl()]
+        self.assertEqual(user_ids, list(range(1000, 1045)))
+        self.assertEqual(self.server.stats['requests'], 2)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_crawl_with_prefetched_pages(self):
+        """
+        Test that a crawl with prefetch_pages yields every item once and clears its checkpoint
+        """
+        self.request_context.prefetch_pages = 2
+        self.assertEqual([item['user_id'] for item in self.crawl()], list(range(1000, 1045)))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_checkpoint_of_another_crawl_raises_value_error(self):
+        """
+        Test that resuming from the checkpoint of a crawl with other arguments raises ValueError
+        """
+        items = self.crawl()
+        for _ in range(11):
+            next(items)
+        items.close()
+        with self.assertRaises(ValueError):
+            next(self.crawl(state='active'))
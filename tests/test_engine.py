@@ -0,0 +1,200 @@
+import inspect
+import unittest
+from unittest import mock
+
+from mock import patch
+from canvas_sdk import engine
+from canvas_sdk.client import RequestContext
+from canvas_sdk.engine import Endpoint, build_methods
+
+
+class TestEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.req_ctx.base_api_url = 'http://base/url/api'
+        self.req_ctx.per_page = 10
+        self.req_ctx.prefetch_pages = None
+        self.endpoints = [
+            Endpoint(
+                'list_course_sections', 'GET', '/v1/courses/{course_id}/sections',
+                'course_id, include=None, per_page=None',
+                payload=('include[]', 'per_page'),
+                choices={'include': ('students', 'avatar_url')},
+                doc="""Returns the list of sections for this course."""),
+            Endpoint(
+                'copy_course_content', 'POST', '/v1/courses/{course_id}/course_copy',
+                'course_id, source_course, var_except=None, odd_=None',
+                payload=('source_course', 'except[]', ('odd[]', 'odd_'))),
+            Endpoint('delete_section', 'DELETE', '/v1/sections/{id}', 'id'),
+        ]
+        self.namespace = {'__name__': 'fake_methods'}
+        build_methods(self.endpoints, self.namespace)
+
+    def get_method(self, name):
+        return self.namespace['__getattr__'](name)
+
+    def test_methods_are_built_on_first_access(self):
+        """
+        Assert that methods are only compiled when they are first looked up, and only once
+        """
+        self.assertNotIn('list_course_sections', self.namespace)
+        method = self.get_method('list_course_sections')
+        self.assertIs(self.namespace['list_course_sections'], method)
+        self.assertIs(self.get_method('list_course_sections'), method)
+
+    def test_methods_have_signature_docstring_and_module_of_spec(self):
+        """
+        Assert that a built method looks like a function written out in the module
+        """
+        method = self.get_method('list_course_sections')
+        self.assertEqual(str(inspect.signature(method)),
+                         '(request_ctx, course_id, include=None, per_page=None, **request_kwargs)')
+        self.assertEqual(method.__doc__, 'Returns the list of sections for this course.')
+        self.assertEqual(method.__module__, 'fake_methods')
+        self.assertEqual(method.__name__, 'list_course_sections')
+
+    @patch('canvas_sdk.engine.client.get')
+    def test_method_calls_client_with_url_and_payload(self, mock_client_get):
+        """
+        Assert that the path is filled in and the payload holds the arguments that are not None
+        """
+        self.get_method('list_course_sections')(self.req_ctx, 1234, 'students', timeout=30)
+        mock_client_get.assert_called_once_with(
+            self.req_ctx, 'http://base/url/api/v1/courses/1234/sections',
+            payload={'include[]': 'students', 'per_page': 10}, timeout=30)
+
+    @patch('canvas_sdk.engine.client.post')
+    def test_method_maps_keyword_and_explicit_arguments_to_payload_keys(self, mock_client_post):
+        """
+        Assert that keyword payload keys come from var_ arguments and pairs name their argument
+        """
+        self.get_method('copy_course_content')(self.req_ctx, 1, 2, var_except=['quizzes'], odd_='x')
+        mock_client_post.assert_called_once_with(
+            self.req_ctx, 'http://base/url/api/v1/courses/1/course_copy',
+            payload={'source_course': 2, 'except[]': ['quizzes'], 'odd[]': 'x'})
+
+    @patch('canvas_sdk.engine.client.delete')
+    def test_method_without_payload_calls_client_without_payload(self, mock_client_delete):
+        """
+        Assert that endpoints without payload keys don't send a payload
+        """
+        self.get_method('delete_section')(self.req_ctx, 5)
+        mock_client_delete.assert_called_once_with(self.req_ctx, 'http://base/url/api/v1/sections/5')
+
+    @patch('canvas_sdk.engine.client.get')
+    def test_method_validates_choices(self, mock_client_get):
+        """
+        Assert that choices accept acceptable values and lists of them, and raise AttributeError otherwise
+        """
+        method = self.get_method('list_course_sections')
+        method(self.req_ctx, 1, ['students', 'avatar_url'])
+        with self.assertRaises(AttributeError):
+            method(self.req_ctx, 1, 'teachers')
+        with self.assertRaises(AttributeError):
+            method(self.req_ctx, 1, ['students', {'not': 'hashable'}])
+
+    def test_missing_arguments_raise_type_error(self):
+        """
+        Assert that the signature is enforced like any python function's
+        """
+        with self.assertRaises(TypeError):
+            self.get_method('delete_section')(self.req_ctx)
+
+    def test_module_functions_take_precedence_over_endpoints(self):
+        """
+        Assert that a function defined in the module isn't replaced by the endpoint of the same name
+        """
+        def delete_section(request_ctx, id, **request_kwargs):
+            pass
+        self.namespace['delete_section'] = delete_section
+        self.assertIs(self.get_method('delete_section'), delete_section)
+
+    def test_dir_and_all_list_methods(self):
+        """
+        Assert that the methods show up in dir() and star imports before they are built
+        """
+        self.namespace['helper'] = object()
+        self.assertIn('copy_course_content', self.namespace['__dir__']())
+        self.assertIn('iter_list_course_sections', self.namespace['__dir__']())
+        self.assertEqual(self.get_method('__all__'),
+                         ['copy_course_content', 'delete_section', 'helper', 'iter_list_course_sections',
+                          'list_course_sections'])
+
+    def test_iter_methods_only_for_paginated_endpoints(self):
+        """
+        Assert that iter_ methods are only built for the endpoints that return a paginated list
+        """
+        self.assertTrue(self.endpoints[0].paginated)
+        self.assertFalse(self.endpoints[1].paginated)
+        with self.assertRaises(AttributeError):
+            self.get_method('iter_copy_course_content')
+
+    def test_iter_method_has_signature_of_method(self):
+        """
+        Assert that an iter_ method has the signature and module of the method it iterates
+        """
+        method = self.get_method('iter_list_course_sections')
+        self.assertEqual(str(inspect.signature(method)),
+                         '(request_ctx, course_id, include=None, per_page=None, **request_kwargs)')
+        self.assertEqual(method.__module__, 'fake_methods')
+        self.assertIn('list_course_sections', method.__doc__)
+
+    @patch('canvas_sdk.engine.client.get')
+    def test_iter_method_streams_pages_with_max_per_page(self, mock_client_get):
+        """
+        Assert that the companion requests the largest pages, follows next links and makes no request until it is
+        iterated over
+        """
+        first_page = mock.MagicMock(links={'next': {'url': 'http://base/url/api/next'}})
+        first_page.json.return_value = [1, 2]
+        last_page = mock.MagicMock(links={})
+        last_page.json.return_value = [3]
+        mock_client_get.side_effect = [first_page, last_page]
+        self.req_ctx.json_decoder = None
+        items = self.get_method('iter_list_course_sections')(self.req_ctx, 1234, timeout=30)
+        mock_client_get.assert_not_called()
+        self.assertEqual(list(items), [1, 2, 3])
+        self.assertEqual(mock_client_get.call_args_list, [
+            mock.call(self.req_ctx, 'http://base/url/api/v1/courses/1234/sections', payload={'per_page': 100},
+                      timeout=30),
+            mock.call(self.req_ctx, 'http://base/url/api/next'),
+        ])
+
+    @patch('canvas_sdk.engine.client.get')
+    def test_iter_method_passes_per_page(self, mock_client_get):
+        """
+        Assert that an iter_ method passes per_page on to the method it iterates
+        """
+        mock_client_get.return_value.links = {}
+        mock_client_get.return_value.json.return_value = []
+        self.req_ctx.json_decoder = None
+        list(self.get_method('iter_list_course_sections')(self.req_ctx, 1, per_page=25))
+        mock_client_get.assert_called_once_with(
+            self.req_ctx, 'http://base/url/api/v1/courses/1/sections', payload={'per_page': 25})
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """
+        Assert that looking up a name that isn't an endpoint raises AttributeError
+        """
+        with self.assertRaises(AttributeError):
+            self.get_method('not_a_method')
+
+    def test_path_placeholder_without_argument_raises_value_error(self):
+        """
+        Assert that a path referencing an argument the method doesn't have is rejected when it is built
+        """
+        namespace = {'__name__': 'fake_methods'}
+        build_methods([Endpoint('get_user', 'GET', '/v1/users/{user_id}', 'id')], namespace)
+        with self.assertRaises(ValueError):
+            namespace['__getattr__']('get_user')
+
+    def test_get_argument_name(self):
+        """
+        Assert that parameter names are turned into valid python argument names
+        """
+        self.assertEqual(engine.get_argument_name('course[name]'), 'course_name')
+        self.assertEqual(engine.get_argument_name('include[]'), 'include')
+        self.assertEqual(engine.get_argument_name('except[]'), 'var_except')
+        self.assertEqual(engine.get_argument_name('module_item[completion_requirement][type]'),
+                         'module_item_completion_requirement_type')
@@ -0,0 +1,112 @@
+import importlib
+import inspect
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from mock import patch
+from canvas_sdk import methods
+from canvas_sdk.client import RequestContext
+from canvas_sdk.methods import accounts, analytics, enrollments
+from canvas_sdk.testing import FakeCanvasServer
+
+
+class TestMethods(unittest.TestCase):
+
+    def run_python(self, code):
+        """
+        Run code in a fresh interpreter, so that no method module has been imported yet, and return its output
+        """
+        return subprocess.check_output([sys.executable, '-c', code], universal_newlines=True).strip()
+
+    def test_import_of_package_loads_no_method_modules(self):
+        """
+        Assert that importing canvas_sdk.methods doesn't import any of the method modules
+        """
+        output = self.run_python(
+            "import sys, canvas_sdk.methods; print(sorted(m for m in sys.modules if m.startswith('canvas_sdk.methods.')))")
+        self.assertEqual(output, '[]')
+
+    def test_attribute_access_loads_only_that_module(self):
+        """
+        Assert that accessing a module as an attribute of the package imports it, and only it
+        """
+        output = self.run_python(
+            "import sys, canvas_sdk.methods; canvas_sdk.methods.courses.list_your_courses; "
+            "print(sorted(m for m in sys.modules if m.startswith('canvas_sdk.methods.')))")
+        self.assertEqual(output, "['canvas_sdk.methods.courses']")
+
+    def test_all_lists_every_method_module(self):
+        """
+        Assert that __all__ and dir() list the method modules
+        """
+        self.assertIn('courses', methods.__all__)
+        self.assertIn('sections', dir(methods))
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """
+        Assert that names that aren't method modules raise AttributeError
+        """
+        with self.assertRaises(AttributeError):
+            methods.not_a_module
+
+    def test_every_method_module_is_importable(self):
+        """
+        Assert that every module listed in __all__ imports on this version of Python
+        """
+        for name in methods.__all__:
+            importlib.import_module('canvas_sdk.methods.' + name)
+
+    def test_every_endpoint_builds(self):
+        """
+        Assert that the method of every endpoint spec in the method modules compiles, and that every paginated
+        method, the ones written out in the modules included, has an iter_ companion
+        """
+        for name in methods.__all__:
+            module = importlib.import_module('canvas_sdk.methods.' + name)
+            for endpoint in module.ENDPOINTS:
+                self.assertTrue(callable(getattr(module, endpoint.name)), endpoint.name)
+                if endpoint.paginated:
+                    self.assertTrue(callable(getattr(module, 'iter_' + endpoint.name)), endpoint.name)
+            for function_name, function in vars(module).items():
+                if (inspect.isfunction(function) and function.__module__ == module.__name__
+                        and not function_name.startswith('iter_')
+                        and 'per_page' in inspect.signature(function).parameters):
+                    self.assertTrue(callable(getattr(module, 'iter_' + function_name)), function_name)
+
+    def test_iter_method_of_written_out_method(self):
+        """
+        Assert that the iter_ method of a hand written method yields the items of every page
+        """
+        with FakeCanvasServer(accounts=150) as server:
+            request_context = RequestContext('token', server.base_api_url, backoff=None)
+            self.assertEqual(len(list(accounts.iter_list_accounts(request_context))), 150)
+            self.assertEqual(server.stats['requests'], 2)
+
+    def test_iter_method_stops_fetching_when_abandoned(self):
+        """
+        Assert that an iter_ companion fetches pages of the largest size, and no further pages once the caller
+        stops iterating
+        """
+        with FakeCanvasServer(enrollments_per_course=250) as server:
+            request_context = RequestContext('token', server.base_api_url, backoff=None)
+            user_ids = []
+            for enrollment in enrollments.iter_list_enrollments_courses(request_context, 1):
+                user_ids.append(enrollment['user_id'])
+                if len(user_ids) == 150:
+                    break
+            self.assertEqual(server.stats['requests'], 2)
+            self.assertEqual(len(list(enrollments.iter_list_enrollments_courses(request_context, 1))), 250)
+            self.assertEqual(server.stats['requests'], 5)
+
+    @patch('canvas_sdk.methods.analytics.client.get')
+    def test_get_course_level_assignment_data_sends_async_param(self, mock_client_get):
+        """
+        Assert that the var_async argument is sent as the async query parameter
+        """
+        req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        req_ctx.base_api_url = 'http://base/url/api'
+        analytics.get_course_level_assignment_data(req_ctx, 1234, var_async=True)
+        mock_client_get.assert_called_once_with(
+            req_ctx, 'http://base/url/api/v1/courses/1234/analytics/assignments', payload={'async': True})
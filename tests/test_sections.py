@@ -37,27 +37,27 @@ class TestSections(unittest.TestCase):
         mock_client_get.assert_called_once_with(
             mock.ANY, self.req_ctx.base_api_url + '/v1/courses/%s/sections' % self.course_id, payload=mock.ANY)
 
-    @patch('canvas_sdk.methods.sections.utils.validate_attr_is_acceptable')
     @patch('canvas_sdk.methods.sections.client.get')
-    def test_list_course_sections_calls_validate_attributes(self, mock_client_get, mock_validate):
+    def test_list_course_sections_validates_include(self, mock_client_get):
         """
-        Assert that validate_attr_is_acceptable called for include
+        Assert that include is validated against the acceptable values, and unacceptable values raise AttributeError
         """
-        include = 'students'
-        sections.list_course_sections(self.req_ctx, self.course_id, include)
-        mock_validate.assert_called_once_with(include, ('students', 'avatar_url'))
+        sections.list_course_sections(self.req_ctx, self.course_id, ['students', 'avatar_url'])
+        with self.assertRaises(AttributeError):
+            sections.list_course_sections(self.req_ctx, self.course_id, 'teachers')
+        self.assertEqual(mock_client_get.call_count, 1)
 
     @patch('canvas_sdk.methods.sections.utils.validate_attr_is_acceptable')
     @patch('canvas_sdk.methods.sections.client.get')
     def test_list_course_sections_get_called_with_default_values(self, mock_client_get, mock_validate):
         """
-        Assert that client 'get' called with default values for payload data
+        Assert that client 'get' called with default values for payload data, leaving out arguments that are None
         """
         # Per page should default to request_context's per_page value
         per_page_default = self.req_ctx.per_page
         sections.list_course_sections(self.req_ctx, self.course_id)
         mock_client_get.assert_called_once_with(
-            mock.ANY, mock.ANY, payload={'include[]': None, 'per_page': per_page_default})
+            mock.ANY, mock.ANY, payload={'per_page': per_page_default})
 
     @patch('canvas_sdk.methods.sections.utils.validate_attr_is_acceptable')
     @patch('canvas_sdk.methods.sections.client.get')
@@ -111,16 +111,11 @@ class TestSections(unittest.TestCase):
     @patch('canvas_sdk.methods.sections.client.post')
     def test_create_course_sections_post_called_with_default_values(self, mock_client_post):
         """
-        Assert that client 'post' called with default values for payload data
+        Assert that client 'post' called with default values for payload data, leaving out arguments that are None
         """
         sections.create_course_section(self.req_ctx, self.course_id, self.course_name)
         mock_client_post.assert_called_once_with(
-            mock.ANY, mock.ANY, payload={
-                'course_section[name]': self.course_name,
-                'course_section[sis_section_id]': None,
-                'course_section[start_at]': None,
-                'course_section[end_at]': None}
-        )
+            mock.ANY, mock.ANY, payload={'course_section[name]': self.course_name})
 
     @patch('canvas_sdk.methods.sections.client.post')
     def test_create_course_sections_post_called_with_user_arg_values(self, mock_client_post):
@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import timedelta
+
+from canvas_sdk.checkpoint import FileCheckpoint
+from canvas_sdk.client import RequestContext
+from canvas_sdk.methods import grade_change_log
+from canvas_sdk.sync import EventSync
+from canvas_sdk.testing import FakeCanvasServer
+
+
+class TestEventSync(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'grade_changes.json')
+        self.server = FakeCanvasServer(courses_per_account=2, events_per_course=250)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.request_context = RequestContext('token', self.server.base_api_url, per_page=50, backoff=None)
+        self.events = []
+
+    def get_sync(self, **kwargs):
+        return EventSync(self.request_context, self.events.extend, FileCheckpoint(self.path), **kwargs)
+
+    def test_first_sync_fetches_whole_history(self):
+        """
+        Test that the first sync of a query hands over its whole history and sets the cursor to the newest event
+        """
+        self.assertEqual(self.get_sync().sync(grade_change_log.query_by_course, 1), 250)
+        self.assertEqual(len(set(event['id'] for event in self.events)), 250)
+        cursor = self.get_sync().get_cursor(grade_change_log.query_by_course, 1)
+        self.assertEqual(cursor['created_at'], '2020-11-29T23:57:56Z')
+        self.assertEqual(self.server.stats['requests'], 5)
+
+    def test_next_sync_fetches_only_new_events(self):
+        """
+        Test that a sync asks for the events since the high-water mark less the overlap, hands over only the ones
+        it hasn't seen, including an event recorded late within the overlap, and advances the cursor
+        """
+        self.get_sync().sync(grade_change_log.query_by_course, 1)
+        synced = set(event['id'] for event in self.events)
+        del self.events[:]
+        self.server.reset_stats()
+        self.server.add_grade_change_events('2020-11-30T00:01:00Z', '2020-11-29T23:55:00Z', '2020-11-29T23:00:00Z')
+        sync = self.get_sync()
+        self.assertEqual(sync.sync(grade_change_log.query_by_course, 1), 2)
+        self.assertEqual([event['created_at'] for event in self.events],
+                         ['2020-11-30T00:01:00Z', '2020-11-29T23:55:00Z'])
+        self.assertFalse(synced & set(event['id'] for event in self.events))
+        self.assertEqual(self.server.stats['requests'], 1)
+        self.assertEqual(sync.get_cursor(grade_change_log.query_by_course, 1)['created_at'], '2020-11-30T00:01:00Z')
+        del self.events[:]
+        self.assertEqual(sync.sync(grade_change_log.query_by_course, 1), 0)
+        self.assertEqual(self.events, [])
+
+    def test_queries_have_their_own_cursors(self):
+        """
+        Test that each query is synced from its own cursor, and reset only forgets the cursor of its query
+        """
+        sync = self.get_sync(start_time='2020-11-29T00:00:00Z')
+        count = sync.sync(grade_change_log.query_by_course, 1)
+        self.assertTrue(0 < count < 250)
+        self.assertIsNone(sync.get_cursor(grade_change_log.query_by_course, 2))
+        self.assertEqual(sync.sync(grade_change_log.query_by_course, 2), count)
+        sync.reset(grade_change_log.query_by_course, 1)
+        self.assertIsNone(sync.get_cursor(grade_change_log.query_by_course, 1))
+        self.assertIsNotNone(sync.get_cursor(grade_change_log.query_by_course, 2))
+
+    def test_failed_sink_does_not_advance_cursor(self):
+        """
+        Test that a sync whose sink raises leaves the cursor as it was, so the next sync hands the events again
+        """
+        def sink(events):
+            raise IOError('store unavailable')
+
+        sync = EventSync(self.request_context, sink, FileCheckpoint(self.path), overlap=timedelta(seconds=0))
+        with self.assertRaises(IOError):
+            sync.sync(grade_change_log.query_by_course, 1)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(self.get_sync().sync(grade_change_log.query_by_course, 1), 250)
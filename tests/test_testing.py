@@ -0,0 +1,203 @@
+from itertools import chain
+
+from canvas_sdk import utils
+from canvas_sdk.client import RequestContext, Throttle
+from canvas_sdk.exceptions import CanvasAPIError, InvalidOAuthTokenError
+from canvas_sdk.methods import accounts, courses, enrollments, grade_change_log, submissions
+from canvas_sdk.testing import FakeCanvasServer
+from tests.helpers import FakeCanvasServerTestCase
+
+
+class TestFakeCanvasServer(FakeCanvasServerTestCase):
+    longMessage = True
+    server_defaults = {'courses_per_account': 3, 'enrollments_per_course': 25}
+
+    def test_single_objects(self):
+        """
+        Test that single objects are generated from their ids and that unknown ids are a 404
+        """
+        server = self.start_server()
+        request_context = self.get_request_context(server)
+        self.assertEqual(courses.get_single_course_courses(request_context, 2).json()['id'], 2)
+        self.assertEqual(accounts.get_single_account(request_context, 1).json()['name'], 'Account 1')
+        with self.assertRaises(CanvasAPIError) as context:
+            courses.get_single_course_courses(request_context, 4)
+        self.assertEqual(context.exception.status_code, 404)
+
+    def test_numbered_pages(self):
+        """
+        Test that lists are paginated with numbered pages and a last link
+        """
+        server = self.start_server()
+        request_context = self.get_request_context(server, per_page=10)
+        response = enrollments.list_enrollments_courses(request_context, 1)
+        self.assertEqual(len(response.json()), 10)
+        self.assertIn('page=2', response.links['next']['url'])
+        self.assertIn('per_page=10', response.links['next']['url'])
+        self.assertIn('page=3', response.links['last']['url'])
+        self.assertNotIn('prev', response.links)
+        self.assertEqual(len(utils.get_remaining_page_urls(response)), 2)
+
+    def test_get_all_list_data(self):
+        """
+        Test that every item is returned once, walking the next links or with page workers
+        """
+        server = self.start_server()
+        for page_workers in (None, 4):
+            request_context = self.get_request_context(server, per_page=10, page_workers=page_workers)
+            data = utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 2)
+            self.assertEqual([item['user_id'] for item in data], list(range(1025, 1050)), page_workers)
+
+    def test_bookmark_pages(self):
+        """
+        Test that bookmark cursors have no last link and are walked through next links
+        """
+        server = self.start_server(bookmarks=True)
+        request_context = self.get_request_context(server, per_page=10, page_workers=4)
+        response = enrollments.list_enrollments_courses(request_context, 1)
+        self.assertIn('page=bookmark', response.links['next']['url'])
+        self.assertNotIn('last', response.links)
+        data = utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1)
+        self.assertEqual(len(data), 25)
+        self.assertEqual(server.stats['requests'], 4)
+
+    def test_prefetched_bookmark_pages(self):
+        """
+        Test that bookmark pages fetched ahead are returned in order, streamed or all at once
+        """
+        server = self.start_server(bookmarks=True, enrollments_per_course=95)
+        request_context = self.get_request_context(server, per_page=10, prefetch_pages=3)
+        data = utils.get_all_list_data(request_context, enrollments.list_enrollments_courses, 1)
+        self.assertEqual([item['user_id'] for item in data], list(range(1000, 1095)))
+        items = list(utils.iter_list_data(request_context, enrollments.list_enrollments_courses, 1))
+        self.assertEqual(items, data)
+        self.assertEqual(server.stats['requests'], 20)
+
+    def test_grade_change_events(self):
+        """
+        Test that grade change events are listed newest first and filtered by time, both ends included
+        """
+        server = self.start_server(events_per_course=100)
+        request_context = self.get_request_context(server, per_page=100)
+        events = grade_change_log.query_by_course(request_context, 1).json()['events']
+        self.assertEqual(len(events), 100)
+        self.assertEqual(events, sorted(events, key=lambda event: event['created_at'], reverse=True))
+        start_time, end_time = events[60]['created_at'], events[40]['created_at']
+        response = grade_change_log.query_by_course(request_context, 1, start_time, end_time)
+        self.assertEqual(response.json()['events'], events[40:61])
+
+    def test_time_sharded_events(self):
+        """
+        Test that a time range fetched in concurrent windows yields every event once, in order if asked to
+        """
+        server = self.start_server(events_per_course=2000)
+        request_context = self.get_request_context(server, per_page=50)
+        response = grade_change_log.query_by_course(request_context, 1)
+        events = list(chain.from_iterable(
+            page.json()['events'] for page in chain([response], utils.get_next(request_context, response))))
+        self.assertEqual(len(events), 2000)
+        server.reset_stats()
+        ordered = list(utils.iter_time_sharded_list_data(
+            request_context, grade_change_log.query_by_course, '2020-09-01T00:00:00Z', '2020-12-01T00:00:00Z', 1))
+        self.assertEqual(ordered, events)
+        # Windows were split where the events are dense, beyond the 40 pages of a serial walk
+        self.assertGreater(server.stats['requests'], 40)
+        unordered = list(utils.iter_time_sharded_list_data(
+            request_context, grade_change_log.query_by_course, events[-1]['created_at'], events[0]['created_at'], 1,
+            windows=3, ordered=False))
+        self.assertEqual(sorted(event['id'] for event in unordered), sorted(event['id'] for event in events))
+
+    def test_time_sharded_events_stop_early(self):
+        """
+        Test that closing the iterator drops the windows that haven't started and stops the ones running
+        """
+        server = self.start_server(events_per_course=2000)
+        request_context = self.get_request_context(server, per_page=10)
+        items = utils.iter_time_sharded_list_data(
+            request_context, grade_change_log.query_by_course, '2020-09-01T00:00:00Z', '2020-12-01T00:00:00Z', 1,
+            max_workers=2)
+        self.assertEqual(len([next(items) for _ in range(15)]), 15)
+        items.close()
+        requests = server.stats['requests']
+        # Fetching all 2000 events takes at least 200 pages
+        self.assertLess(requests, 100)
+        self.assertEqual(server.stats['requests'], requests)
+
+    def test_submissions_filters(self):
+        """
+        Test that the submissions of a course can be filtered by student and assignment
+        """
+        server = self.start_server()
+        request_context = self.get_request_context(server, per_page=100)
+        data = utils.get_all_list_data(
+            request_context, submissions.list_submissions_for_multiple_assignments_courses, 1,
+            ['1000', '1001'], ['1', '2', '3'], None, None)
+        self.assertEqual(sorted((item['user_id'], item['assignment_id']) for item in data),
+                         [(user_id, assignment_id) for user_id in (1000, 1001) for assignment_id in (1, 2, 3)])
+
+    def test_fail_next_is_retried(self):
+        """
+        Test that injected errors are sent before the response and retried by the client
+        """
+        server = self.start_server()
+        server.fail_next(503, times=2, retry_after=0)
+        request_context = self.get_request_context(server, max_retries=2)
+        response = courses.get_single_course_courses(request_context, 1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(server.stats[503], 2)
+        self.assertEqual(server.stats['requests'], 3)
+
+    def test_fail_next_is_raised_without_retries(self):
+        """
+        Test that a status queued with fail_next is raised by a context that doesn't retry it
+        """
+        server = self.start_server()
+        server.fail_next(409)
+        with self.assertRaises(CanvasAPIError) as context:
+            courses.get_single_course_courses(self.get_request_context(server), 1)
+        self.assertEqual(context.exception.status_code, 409)
+
+    def test_error_rate(self):
+        """
+        Test that random errors are injected with the given probability and status codes
+        """
+        server = self.start_server(error_rate=1.0, error_codes=(502,), seed=1)
+        with self.assertRaises(CanvasAPIError) as context:
+            courses.get_single_course_courses(self.get_request_context(server, max_retries=1), 1)
+        self.assertEqual(context.exception.status_code, 502)
+        self.assertEqual(server.stats[502], 2)
+
+    def test_rate_limit(self):
+        """
+        Test that the rate limit headers count down and that requests are refused once the bucket is empty
+        """
+        server = self.start_server(rate_limit=2, refill_rate=0.001, request_cost=1)
+        throttle = Throttle(min_remaining=0, refill_rate=0.001)
+        request_context = self.get_request_context(server, throttle=throttle)
+        response = courses.get_single_course_courses(request_context, 1)
+        self.assertEqual(float(response.headers['X-Rate-Limit-Remaining']), 1.0)
+        self.assertEqual(float(response.headers['X-Request-Cost']), 1.0)
+        self.assertAlmostEqual(throttle.remaining, 1.0, places=2)
+        courses.get_single_course_courses(request_context, 1)
+        throttle.remaining = None  # Let the third request through to be refused
+        with self.assertRaises(CanvasAPIError) as context:
+            courses.get_single_course_courses(request_context, 1)
+        self.assertEqual(context.exception.status_code, 403)
+        self.assertIn('Rate Limit Exceeded', str(context.exception))
+
+    def test_auth_token(self):
+        """
+        Test that requests with the wrong token are refused with the 401 Canvas sends for invalid tokens
+        """
+        server = self.start_server(auth_token='secret')
+        with self.assertRaises(InvalidOAuthTokenError):
+            courses.get_single_course_courses(self.get_request_context(server), 1)
+        request_context = RequestContext('secret', server.base_api_url)
+        self.assertEqual(courses.get_single_course_courses(request_context, 1).status_code, 200)
+
+    def test_base_api_url_requires_start(self):
+        """
+        Test that base_api_url raises RuntimeError before the server is started
+        """
+        with self.assertRaises(RuntimeError):
+            FakeCanvasServer().base_api_url
@@ -1,3 +1,6 @@
+import datetime
+import threading
+import time
 import unittest
 from unittest import mock
 import requests
@@ -11,6 +14,10 @@ class TestUtils(unittest.TestCase):
     def setUp(self):
         self.path = '/v1/accounts'
         self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.req_ctx.page_workers = None
+        self.req_ctx.prefetch_pages = None
+        self.req_ctx.json_decoder = None
+        self.req_ctx.tracer = None
 
     def build_response_mock(self, links=None, json_data=None):
         """
@@ -156,6 +163,114 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(StopIteration):
             next(utils.get_next(self.req_ctx, result))
 
+    def build_pages_mock(self, count):
+        """
+        Build a chain of count paged response mocks, each linking to the next, and return them
+        """
+        responses = [self.build_response_mock(json_data=[page]) for page in range(count)]
+        for page, response in enumerate(responses[:-1]):
+            response.links = {'next': {'url': 'http://next/url/%d' % (page + 1)}}
+        return responses
+
+    def wait_for_calls(self, mock_client_get, count):
+        """
+        Wait up to a second for mock_client_get to have been called count times
+        """
+        deadline = time.time() + 1
+        while mock_client_get.call_count < count and time.time() < deadline:
+            time.sleep(0.005)
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_prefetch_next_yields_next_responses_in_order(self, mock_client_get):
+        """
+        Assert that prefetch_next yields the responses of the following pages in order
+        """
+        responses = self.build_pages_mock(4)
+        mock_client_get.side_effect = responses[1:]
+        self.assertEqual(list(utils.prefetch_next(self.req_ctx, responses[0], depth=2)), responses[1:])
+        self.assertEqual(mock_client_get.call_args_list, [
+            mock.call(self.req_ctx, 'http://next/url/%d' % page) for page in (1, 2, 3)])
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_prefetch_next_for_response_without_a_next_link_yields_nothing(self, mock_client_get):
+        """
+        Assert that prefetch_next yields nothing and fetches nothing for the last page
+        """
+        self.assertEqual(list(utils.prefetch_next(self.req_ctx, self.build_response_mock())), [])
+        self.assertFalse(mock_client_get.called)
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_prefetch_next_fetches_depth_pages_ahead(self, mock_client_get):
+        """
+        Assert that prefetch_next fetches the next pages before they are asked for, but no more than depth pages
+        beyond the one the caller holds
+        """
+        responses = self.build_pages_mock(6)
+        mock_client_get.side_effect = responses[1:]
+        pages = utils.prefetch_next(self.req_ctx, responses[0], depth=2)
+        self.assertIs(next(pages), responses[1])
+        self.wait_for_calls(mock_client_get, 3)
+        time.sleep(0.05)
+        self.assertEqual(mock_client_get.call_count, 3)
+        self.assertIs(next(pages), responses[2])
+        self.wait_for_calls(mock_client_get, 4)
+        self.assertEqual(mock_client_get.call_count, 4)
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_prefetch_next_stops_fetching_when_closed(self, mock_client_get):
+        """
+        Assert that prefetch_next fetches no more pages once the generator is closed
+        """
+        responses = self.build_pages_mock(6)
+        mock_client_get.side_effect = responses[1:]
+        pages = utils.prefetch_next(self.req_ctx, responses[0])
+        next(pages)
+        self.wait_for_calls(mock_client_get, 2)
+        pages.close()
+        time.sleep(0.05)
+        self.assertEqual(mock_client_get.call_count, 2)
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_prefetch_next_raises_errors_of_the_page_that_failed(self, mock_client_get):
+        """
+        Assert that an error fetching a page is raised when that page is reached
+        """
+        responses = self.build_pages_mock(3)
+        mock_client_get.side_effect = [responses[1], requests.exceptions.ConnectionError('lost')]
+        pages = utils.prefetch_next(self.req_ctx, responses[0])
+        self.assertIs(next(pages), responses[1])
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            next(pages)
+
+    @patch('canvas_sdk.utils.prefetch_next')
+    def test_get_all_list_data_prefetches_pages_with_prefetch_pages(self, mock_prefetch):
+        """
+        Assert that get_all_list_data fetches the next pages ahead when prefetch_pages is set
+        """
+        self.req_ctx.prefetch_pages = 3
+        mock_prefetch.return_value = iter([self.build_response_mock(json_data=['second'])])
+        mock_response = self.build_response_mock({'next': {'url': 'http://next/url/1'}}, json_data=['first'])
+        mock_function = mock.Mock(name='mock-function', return_value=mock_response)
+
+        self.assertEqual(utils.get_all_list_data(self.req_ctx, mock_function), ['first', 'second'])
+        mock_prefetch.assert_called_once_with(self.req_ctx, mock_response, 3)
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_iter_list_data_prefetches_pages_with_prefetch_pages(self, mock_client_get):
+        """
+        Assert that iter_list_data fetches the next page while the current one is consumed
+        """
+        self.req_ctx.prefetch_pages = 1
+        responses = self.build_pages_mock(3)
+        mock_client_get.side_effect = responses[1:]
+        mock_function = mock.Mock(name='mock-function', return_value=responses[0])
+
+        items = utils.iter_list_data(self.req_ctx, mock_function)
+        self.assertEqual(next(items), 0)
+        self.wait_for_calls(mock_client_get, 1)
+        self.assertEqual(mock_client_get.call_count, 1)
+        self.assertEqual(list(items), [1, 2])
+
     @patch('canvas_sdk.utils.get_next')
     def test_get_all_list_data_calls_function_parameter_with_context_args_and_kwargs(self, mock_next):
         """
@@ -266,6 +381,157 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(
             results, expected_json, "The json list of data returned by get_all function should be the fully concatenated list of json")
 
+    @patch('canvas_sdk.utils.get_next')
+    def test_get_all_list_data_decodes_pages_with_context_json_decoder(self, mock_next):
+        """
+        Assert that every page is decoded with the json decoder of the request context
+        """
+        self.req_ctx.json_decoder = lambda content: [content]
+        initial_response = self.build_response_mock({'next': {'url': 'next-url'}})
+        initial_response.content = b'page-1'
+        next_response = self.build_response_mock()
+        next_response.content = b'page-2'
+        mock_next.return_value = iter([next_response])
+        mock_function = mock.Mock(name='mock-function', return_value=initial_response)
+
+        result = utils.get_all_list_data(self.req_ctx, mock_function)
+        self.assertEqual(result, [b'page-1', b'page-2'])
+
+    def test_get_remaining_page_urls_computes_urls_from_numeric_last_link(self):
+        """
+        Assert that get_remaining_page_urls returns the urls from the "next" page through the "last"
+        page, keeping the other query parameters of the "next" link.
+        """
+        response = self.build_response_mock({
+            'next': {'url': 'http://canvas/api/v1/users?include%5B%5D=email&page=2&per_page=10'},
+            'last': {'url': 'http://canvas/api/v1/users?include%5B%5D=email&page=4&per_page=10'},
+        })
+        self.assertEqual(utils.get_remaining_page_urls(response), [
+            'http://canvas/api/v1/users?include%5B%5D=email&page=2&per_page=10',
+            'http://canvas/api/v1/users?include%5B%5D=email&page=3&per_page=10',
+            'http://canvas/api/v1/users?include%5B%5D=email&page=4&per_page=10',
+        ])
+
+    def test_get_remaining_page_urls_returns_none_for_bookmark_pages(self):
+        """
+        Assert that get_remaining_page_urls returns None for bookmark-style cursors or when there is
+        no "last" link.
+        """
+        bookmark_response = self.build_response_mock({
+            'next': {'url': 'http://canvas/api/v1/users?page=bookmark:WzEwXQ&per_page=10'},
+            'last': {'url': 'http://canvas/api/v1/users?page=bookmark:WzIwXQ&per_page=10'},
+        })
+        no_last_response = self.build_response_mock({
+            'next': {'url': 'http://canvas/api/v1/users?page=2&per_page=10'},
+        })
+        self.assertIsNone(utils.get_remaining_page_urls(bookmark_response))
+        self.assertIsNone(utils.get_remaining_page_urls(no_last_response))
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_pages_yields_responses_in_page_order(self, mock_client_get):
+        """
+        Assert that get_pages fetches every url and yields the responses in the order of the urls
+        """
+        mock_client_get.side_effect = lambda ctx, url: 'response-%s' % url
+        results = list(utils.get_pages(self.req_ctx, ['url1', 'url2', 'url3'], 2))
+        self.assertEqual(results, ['response-url1', 'response-url2', 'response-url3'])
+
+    @patch('canvas_sdk.utils.get_next')
+    @patch('canvas_sdk.utils.get_pages')
+    def test_get_all_list_data_fetches_numeric_pages_concurrently_with_page_workers(self, mock_pages, mock_next):
+        """
+        Assert that get_all_list_data fetches the remaining pages with get_pages when page_workers is set
+        and the response has a numeric "last" link, concatenating the results in page order.
+        """
+        self.req_ctx.page_workers = 4
+        mock_pages.return_value = iter([
+            self.build_response_mock(json_data=['second']),
+            self.build_response_mock(json_data=['third']),
+        ])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock({
+            'next': {'url': 'http://canvas/api/v1/users?page=2'},
+            'last': {'url': 'http://canvas/api/v1/users?page=3'},
+        }, json_data=['first'])
+
+        results = utils.get_all_list_data(self.req_ctx, mock_function)
+        self.assertEqual(results, ['first', 'second', 'third'])
+        mock_pages.assert_called_once_with(self.req_ctx, [
+            'http://canvas/api/v1/users?page=2', 'http://canvas/api/v1/users?page=3'], 4)
+        self.assertFalse(mock_next.called)
+
+    @patch('canvas_sdk.utils.get_next')
+    @patch('canvas_sdk.utils.get_pages')
+    def test_get_all_list_data_walks_next_links_for_bookmark_pages(self, mock_pages, mock_next):
+        """
+        Assert that get_all_list_data falls back to get_next when the pages can't be computed
+        """
+        self.req_ctx.page_workers = 4
+        mock_next.return_value = iter([self.build_response_mock(json_data=['second'])])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock({
+            'next': {'url': 'http://canvas/api/v1/users?page=bookmark:abc'},
+        }, json_data=['first'])
+
+        results = utils.get_all_list_data(self.req_ctx, mock_function)
+        self.assertEqual(results, ['first', 'second'])
+        self.assertFalse(mock_pages.called)
+
+    def test_iter_list_data_calls_function_parameter_with_context_args_and_kwargs(self):
+        """
+        Assert that iter_list_data calls function parameter with context, args, and kwargs
+        """
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[])
+        kwargs = {'kwarg1': 'val1'}
+
+        list(utils.iter_list_data(self.req_ctx, mock_function, 'arg1', **kwargs))
+        mock_function.assert_called_once_with(self.req_ctx, 'arg1', **kwargs)
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_iter_list_data_yields_items_across_pages(self, mock_client_get):
+        """
+        Assert that iter_list_data yields the individual json objects of every page, following the
+        "next" links of each response.
+        """
+        mock_client_get.side_effect = [
+            self.build_response_mock({'next': {'url': 'http://next/url/2'}}, json_data=[3, 4]),
+            self.build_response_mock(json_data=[5]),
+        ]
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(
+            {'next': {'url': 'http://next/url/1'}}, json_data=[1, 2])
+
+        self.assertEqual(list(utils.iter_list_data(self.req_ctx, mock_function)), [1, 2, 3, 4, 5])
+        mock_client_get.assert_has_calls([
+            mock.call(self.req_ctx, 'http://next/url/1'), mock.call(self.req_ctx, 'http://next/url/2')])
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_iter_list_data_fetches_next_page_only_when_current_page_is_consumed(self, mock_client_get):
+        """
+        Assert that iter_list_data doesn't request the next page until the items of the current page
+        have been yielded.
+        """
+        mock_client_get.return_value = self.build_response_mock(json_data=[3])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(
+            {'next': {'url': 'http://next/url/1'}}, json_data=[1, 2])
+
+        items = utils.iter_list_data(self.req_ctx, mock_function)
+        self.assertEqual([next(items), next(items)], [1, 2])
+        self.assertFalse(mock_client_get.called)
+        self.assertEqual(next(items), 3)
+        self.assertTrue(mock_client_get.called)
+
+    def test_iter_list_data_yields_non_list_json_as_single_item(self):
+        """
+        Assert that iter_list_data yields json that isn't a list as is
+        """
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data={'single': 'object'})
+
+        self.assertEqual(list(utils.iter_list_data(self.req_ctx, mock_function)), [{'single': 'object'}])
+
     def test_masquerade_returns_function_response(self):
         """
         Assert that result of call to masquerade is the API function response.
@@ -304,36 +570,181 @@ class TestUtils(unittest.TestCase):
         mock_function.assert_called_once_with(
             mock.ANY, params={'as_user_id': as_user_id, 'foo': 'bar'})
 
-    @patch('canvas_sdk.utils.get_all_list_data')
-    def test_get_count_calls_get_all_list_data_with_request_context_and_function(self, mock_get_all):
+    def build_list_function_mock(self):
         """
-        Assert that call to get_count makes a call to get_all_list_data with context and function
+        Return a mock of an SDK method of a paginated endpoint
         """
-        mock_function = mock.Mock(name='mock-function')
-        utils.get_count(self.req_ctx, mock_function)
-        mock_get_all.assert_called_once_with(self.req_ctx, mock_function)
+        def list_function(request_ctx, *args, per_page=None, **request_kwargs):
+            pass
+        return mock.create_autospec(list_function)
 
-    @patch('canvas_sdk.utils.get_all_list_data')
-    def test_get_count_calls_get_all_list_data_with_args_and_kwargs(self, mock_get_all):
+    def test_get_count_calls_function_with_args_kwargs_and_single_item_pages(self):
         """
-        Assert that call to get_count makes a call to get_all_list_data with args and kwargs
+        Assert that get_count calls the function with context, args and kwargs, requesting one item per page
         """
-        mock_function = mock.Mock(name='mock-function')
-        arg1, arg2 = 'arg1', 'arg2'
-        kwargs = {'kwarg1': 'val1', 'kwarg2': 'val2'}
+        mock_function = self.build_list_function_mock()
+        mock_function.return_value = self.build_response_mock(json_data=[1])
+        kwargs = {'kwarg1': 'val1', 'per_page': 50}
 
-        utils.get_count(self.req_ctx, mock_function, arg1, arg2, **kwargs)
-        mock_get_all.assert_called_once_with(mock.ANY, mock.ANY, arg1, arg2, **kwargs)
+        utils.get_count(self.req_ctx, mock_function, 'arg1', 'arg2', **kwargs)
+        mock_function.assert_called_once_with(self.req_ctx, 'arg1', 'arg2', kwarg1='val1', per_page=1)
 
-    @patch('canvas_sdk.utils.get_all_list_data')
-    def test_get_count_returns_length_of_get_all_list_data(self, mock_get_all):
+    def test_get_count_returns_length_of_single_page(self):
         """
-        Assert that call to get_count makes a call to get_all_list_data with args and kwargs
+        Assert that get_count returns the length of the json data when there are no further pages
         """
-        mock_get_all.return_value = [1, 2, 3, 4, 5]
-        mock_function = mock.Mock(name='mock-function')
+        mock_function = self.build_list_function_mock()
+        mock_function.return_value = self.build_response_mock(json_data=[])
+
+        self.assertEqual(utils.get_count(self.req_ctx, mock_function), 0)
+
+    @patch('canvas_sdk.utils.iter_list_data')
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_count_uses_last_page_number_for_numeric_pages(self, mock_client_get, mock_iter):
+        """
+        Assert that get_count derives the count from the "last" link and only fetches the last page
+        """
+        mock_client_get.return_value = self.build_response_mock(json_data=[{'id': 5}])
+        mock_function = self.build_list_function_mock()
+        mock_function.return_value = self.build_response_mock({
+            'next': {'url': 'http://canvas/api/v1/users?page=2&per_page=1'},
+            'last': {'url': 'http://canvas/api/v1/users?page=5&per_page=1'},
+        }, json_data=[{'id': 1}])
 
         result = utils.get_count(self.req_ctx, mock_function)
-        self.assertEqual(result, 5, "The result of get_count should match length of result set")
+        self.assertEqual(result, 5, "The result of get_count should be the number of single item pages")
+        mock_client_get.assert_called_once_with(self.req_ctx, 'http://canvas/api/v1/users?page=5&per_page=1')
+        self.assertFalse(mock_iter.called)
+
+    @patch('canvas_sdk.utils.iter_list_data')
+    def test_get_count_streams_results_for_bookmark_pages(self, mock_iter):
+        """
+        Assert that get_count falls back to counting the streamed results at the maximum page size when
+        pages can't be computed.
+        """
+        mock_iter.return_value = iter(['a', 'b', 'c'])
+        mock_function = self.build_list_function_mock()
+        mock_function.return_value = self.build_response_mock(
+            {'next': {'url': 'http://canvas/api/v1/users?page=bookmark:abc&per_page=1'}}, json_data=['a'])
 
+        result = utils.get_count(self.req_ctx, mock_function, 'arg1', kwarg1='val1')
+        self.assertEqual(result, 3, "The result of get_count should match length of result set")
+        mock_iter.assert_called_once_with(
+            self.req_ctx, mock_function, 'arg1', kwarg1='val1', per_page=utils.MAX_PER_PAGE)
 
+    @patch('canvas_sdk.utils.get_all_list_data')
+    def test_get_count_lists_all_results_of_functions_without_per_page(self, mock_get_all):
+        """
+        Assert that get_count doesn't pass per_page to a function without a per_page argument, and counts all of
+        its results instead
+        """
+        def list_function(request_ctx, course_id, **request_kwargs):
+            pass
+        mock_function = mock.create_autospec(list_function)
+        mock_get_all.return_value = ['a', 'b', 'c']
+        self.assertEqual(utils.get_count(self.req_ctx, mock_function, 1, params={'a': 'b'}), 3)
+        mock_get_all.assert_called_once_with(self.req_ctx, mock_function, 1, params={'a': 'b'})
+        self.assertFalse(mock_function.called)
+
+    def test_map_concurrent_calls_function_with_context_and_each_kwargs(self):
+        """
+        Assert that map_concurrent calls the function once per set of kwargs with the request context
+        """
+        mock_function = mock.Mock(name='mock-function', side_effect=lambda ctx, **kwargs: kwargs['user_id'])
+        results = list(utils.map_concurrent(self.req_ctx, mock_function, [{'user_id': i} for i in range(5)]))
+
+        self.assertEqual(mock_function.call_count, 5)
+        mock_function.assert_any_call(self.req_ctx, user_id=3)
+        self.assertEqual(sorted(r.response for r in results), [0, 1, 2, 3, 4])
+
+    def test_map_concurrent_yields_results_in_argument_order_when_ordered(self):
+        """
+        Assert that ordered results follow the order of the arguments even when later calls finish first
+        """
+        def function(ctx, delay):
+            time.sleep(delay)
+            return delay
+        delays = [0.05, 0.01, 0.03, 0, 0.02]
+        results = list(utils.map_concurrent(
+            self.req_ctx, function, [{'delay': d} for d in delays], max_workers=3, ordered=True))
+
+        self.assertEqual([r.kwargs['delay'] for r in results], delays)
+        self.assertEqual([r.response for r in results], delays)
+
+    def test_map_concurrent_returns_exceptions_per_item(self):
+        """
+        Assert that an exception raised by one call is returned with its kwargs and doesn't stop the others
+        """
+        error = ValueError('boom')
+
+        def function(ctx, user_id):
+            if user_id == 2:
+                raise error
+            return user_id
+        results = list(utils.map_concurrent(
+            self.req_ctx, function, [{'user_id': i} for i in range(4)], ordered=True))
+
+        self.assertEqual(results[2], utils.MapResult({'user_id': 2}, None, error))
+        self.assertEqual([r.response for r in results if r.error is None], [0, 1, 3])
+
+    def test_map_concurrent_caps_calls_in_flight(self):
+        """
+        Assert that no more than max_workers calls run at once and arguments are consumed lazily
+        """
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+
+        def function(ctx, user_id):
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+            time.sleep(0.01)
+            with lock:
+                state['running'] -= 1
+            return user_id
+        consumed = []
+
+        def kwargs():
+            for i in range(20):
+                consumed.append(i)
+                yield {'user_id': i}
+        results = utils.map_concurrent(self.req_ctx, function, kwargs(), max_workers=2)
+        next(results)
+        self.assertLess(len(consumed), 20, "Arguments should be consumed as calls complete")
+        self.assertEqual(len(list(results)), 19)
+        self.assertLessEqual(state['peak'], 2)
+
+    def test_parse_timestamp(self):
+        """
+        Assert that parse_timestamp reads ISO 8601 timestamps as UTC datetimes and rejects anything else
+        """
+        utc = datetime.timezone.utc
+        self.assertEqual(utils.parse_timestamp('2020-09-01T12:00:00Z'),
+                         datetime.datetime(2020, 9, 1, 12, tzinfo=utc))
+        self.assertEqual(utils.parse_timestamp('2020-09-01T06:00:00.5-06:00'),
+                         datetime.datetime(2020, 9, 1, 12, 0, 0, 500000, tzinfo=utc))
+        with self.assertRaises(ValueError):
+            utils.parse_timestamp('yesterday')
+
+    def test_format_timestamp(self):
+        """
+        Assert that format_timestamp writes datetimes in UTC to the second, treating naive ones as UTC
+        """
+        tzinfo = datetime.timezone(datetime.timedelta(hours=2))
+        self.assertEqual(utils.format_timestamp(datetime.datetime(2020, 9, 1, 14, 0, 0, 999, tzinfo=tzinfo)),
+                         '2020-09-01T12:00:00Z')
+        self.assertEqual(utils.format_timestamp(datetime.datetime(2020, 9, 1, 12)), '2020-09-01T12:00:00Z')
+
+    def test_get_time_windows_splits_range_into_windows_sharing_boundaries(self):
+        """
+        Assert that get_time_windows splits a range into consecutive windows and rejects a range that ends before it starts
+        """
+        windows = utils.get_time_windows('2020-09-01T00:00:00Z', '2020-09-01T00:00:10Z', 3)
+        self.assertEqual([(utils.format_timestamp(start), utils.format_timestamp(end)) for start, end in windows], [
+            ('2020-09-01T00:00:00Z', '2020-09-01T00:00:04Z'),
+            ('2020-09-01T00:00:04Z', '2020-09-01T00:00:08Z'),
+            ('2020-09-01T00:00:08Z', '2020-09-01T00:00:10Z'),
+        ])
+        self.assertEqual(len(utils.get_time_windows('2020-09-01T00:00:00Z', '2020-09-01T00:00:00Z', 3)), 1)
+        with self.assertRaises(ValueError):
+            utils.get_time_windows('2020-09-02T00:00:00Z', '2020-09-01T00:00:00Z', 3)